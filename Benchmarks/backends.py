@@ -0,0 +1,192 @@
+'''
+Zeitvergleich der Backends von pap (siehe pap.backend_einstellen()): misst die NumPy-Versionen und die mit Numba
+kompilierten Kerne aus pap._kerne auf denselben Eingaben.
+
+Gemessen werden _rundung(), _erste_ziffer(), _nachkommastelle(), vergleich() auf zufälligen Zahlen über den ganzen
+float-Bereich und auf Randfällen, außerdem formatieren() und vergleichstabelle_zeilen().
+Dass beide Backends bitgleich rechnen, prüft Tests/test_backends.py (python -m pytest Tests).
+
+Ausführen aus dem Hauptordner des Repositorys (braucht Numba):
+    python Benchmarks/backends.py
+    python Benchmarks/backends.py --anzahl 1000000
+'''
+
+
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import pap
+from pap import _kerne
+
+
+
+MESSUNGEN = 5
+
+
+
+
+
+
+# Eingabedaten
+
+def _zahlen(anzahl, seed = 0):
+    '''Zufällige Zahlen über den ganzen float-Bereich mit allen Randfällen vorne, shape = (anzahl,).'''
+
+    rng        = np.random.default_rng(seed)
+    potenzen   = 10.0**np.arange(-323, 309)
+    with np.errstate(over = 'ignore'):   # 3.95e308 wird inf, auch ein Randfall
+        randfälle = np.concatenate([
+            [0.0, -0.0, np.inf, -np.inf, np.nan, 5e-324, -5e-324, 2.2250738585072014e-308, 1.7976931348623157e308,
+             1.0, 3.95, 3.9499999999999997, 4.0, 0.3949999999999999, 0.395, 9.5, 9.999999999999998, 99.5],
+            potenzen, np.nextafter(potenzen, 0), np.nextafter(potenzen, np.inf), -potenzen,
+            3.95 * potenzen, np.nextafter(3.95 * potenzen, 0)])
+    zufall     = rng.choice([-1, 1], anzahl) * 10**rng.uniform(-320, 308, anzahl)
+    alltäglich = rng.lognormal(0, 3, anzahl) * rng.choice([-1, 1], anzahl)
+    zahlen     = np.where(rng.uniform(size = anzahl) < 0.5, zufall, alltäglich)
+    zahlen[:min(anzahl, randfälle.size)] = randfälle[:anzahl]
+    return zahlen
+
+
+
+
+def _messwerte(anzahl, seed = 0):
+    '''Endliche Werte aus vielen Größenordnungen mit relativen Fehlern von 0.01 % bis 100 %, shape = (2, anzahl).'''
+
+    rng    = np.random.default_rng(seed)
+    werte  = rng.choice([-1, 1], anzahl) * 10**rng.uniform(-30, 30, anzahl)
+    fehler = np.abs(werte) * 10**rng.uniform(-4, 0, anzahl)
+    fehler[rng.uniform(size = anzahl) < 0.05] = 0
+    return np.array([werte, fehler])
+
+
+
+
+def _vergleichswerte(anzahl, seed = 0):
+    '''werte für pap.vergleich(), shape = (4, anzahl), mit fehlenden Werten, Nullen und negativen Fehlern.'''
+
+    rng   = np.random.default_rng(seed)
+    werte = np.array([_zahlen(anzahl, seed + i) for i in range(4)])
+    werte = np.where(rng.uniform(size = (4, anzahl)) < 0.3, rng.lognormal(0, 1, (4, anzahl)), werte)
+    werte[:, rng.uniform(size = anzahl) < 0.05] = 0
+    werte[rng.uniform(size = (4, anzahl)) < 0.02] = np.nan
+    return werte
+
+
+
+
+
+
+# Fälle
+# Jeder Fall bekommt eine Anzahl und returned eine Funktion ohne Argumente, deren Ergebnis verglichen wird.
+
+def _fall_rundung(anzahl):
+    zahlen      = _zahlen(anzahl)
+    präzisionen = np.random.default_rng(1).integers(-330, 330, anzahl)
+    präzisionen[::3] = np.random.default_rng(2).integers(-5, 10, präzisionen[::3].size)
+    return lambda: pap._rundung(zahlen, präzisionen)
+
+
+def _fall_erste_ziffer(anzahl):
+    zahlen = _zahlen(anzahl)
+    return lambda: pap._erste_ziffer(zahlen)
+
+
+def _fall_nachkommastelle(anzahl):
+    zahlen = _zahlen(anzahl)
+    return lambda: [pap._nachkommastelle(zahlen, sig_stellen, sig_grenze)
+                    for sig_stellen, sig_grenze in [(1, 1.0), (1, 3.95), (2, 1.0), (3, 9.5)]]
+
+
+def _fall_vergleich(anzahl):
+    werte = _vergleichswerte(anzahl)
+    return lambda: [pap.vergleich(werte), pap.vergleich(werte, faktor = 1e-3)]
+
+
+def _fall_formatieren(anzahl):
+    werte, fehler = _messwerte(min(anzahl, 10**5))
+    return lambda: pap.formatieren(werte, fehler)
+
+
+def _fall_vergleichstabelle(anzahl):
+    anzahl = min(anzahl, 10**4)
+    werte  = np.concatenate([_messwerte(anzahl, 0), _messwerte(anzahl, 1)])
+    werte[np.random.default_rng(2).uniform(size = (4, anzahl)) < 0.02] = np.nan   # Fehlende Werte
+    return lambda: list(pap.vergleichstabelle_zeilen(werte, 'Vergleich', 'm', ausrichtung = 'liste'))
+
+
+
+FÄLLE = {'_rundung':           _fall_rundung,
+         '_erste_ziffer':      _fall_erste_ziffer,
+         '_nachkommastelle':   _fall_nachkommastelle,
+         'vergleich':          _fall_vergleich,
+         'formatieren':        _fall_formatieren,
+         'vergleichstabelle':  _fall_vergleichstabelle}
+
+
+
+
+
+
+# Messung
+
+def _mit_kernen(kerne, funktion):
+    '''Führt  funktion  mit den Kernen  kerne  aus (None: NumPy).'''
+
+    vorher = dict(pap._backend)
+    pap._backend['kerne'] = kerne
+    try:
+        with np.errstate(all = 'ignore'), pap.ausgabe('return'):
+            return funktion()
+    finally:
+        pap._backend.update(vorher)
+
+
+
+
+def _zeit(kerne, funktion):
+    _mit_kernen(kerne, funktion)   # Aufwärmen bzw. Kompilieren
+    zeiten = []
+    for _ in range(MESSUNGEN):
+        start = time.perf_counter()
+        _mit_kernen(kerne, funktion)
+        zeiten.append(time.perf_counter() - start)
+    return min(zeiten)
+
+
+
+
+def messen(anzahl):
+    '''Misst alle Fälle mit beiden Backends und printet eine Tabelle.'''
+
+    print(f'{"Fall":<20} {"Anzahl":>9}   {"NumPy [s]":>10}   {"Numba [s]":>10}   {"NumPy/Numba":>11}')
+    for name, fall in FÄLLE.items():
+        funktion = fall(anzahl)
+        numpy_zeit, numba_zeit = _zeit(None, funktion), _zeit(_kerne, funktion)
+        print(f'{name:<20} {anzahl:>9}   {numpy_zeit:>10.2e}   {numba_zeit:>10.2e}   {numpy_zeit / numba_zeit:>11.1f}',
+              flush = True)
+
+
+
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Zeitvergleich der Backends von pap')
+    parser.add_argument('--anzahl', type = int, default = 10**6, help = 'Elemente pro Fall (Standard 10^6)')
+    argumente = parser.parse_args()
+
+    if _kerne.numba is None:
+        print('Numba ist nicht installiert, es gibt nichts zu vergleichen.')
+        sys.exit(1)
+    messen(argumente.anzahl)
+
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+'''
+Benchmark von pap.chi_quadrat_p_wert() gegen die direkte Berechnung mit scipy.stats.chi2.
+
+Für verschiedene Anzahlen von χ^2-Werten und Freiheitsgraden wird die Zeit von  1 - chi2.cdf(),  chi2.sf()  
+und pap.chi_quadrat_p_wert() gemessen (jeweils die beste von mehreren Wiederholungen, mit schon erstellter 
+Tabelle) sowie der größte relative Fehler gegenüber  chi2.sf().
+
+Ausführen aus dem Hauptordner des Repositorys:
+    python Benchmarks/chi_quadrat_p_wert.py
+'''
+
+
+
+import os
+import sys
+import timeit
+
+import numpy as np
+from scipy.stats import chi2
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import pap
+
+
+
+WIEDERHOLUNGEN = 3
+ANZAHLEN       = [1, 100, 10**4, 10**6]
+FREIHEITSGRADE = [1, 5, 30, 300]
+
+
+
+def zeit(funktion, anzahl):
+    '''Beste Zeit pro Aufruf in Sekunden.'''
+    
+    aufrufe = max(1, 10**4 // anzahl)
+    return min(timeit.repeat(funktion, number = aufrufe, repeat = WIEDERHOLUNGEN)) / aufrufe
+
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f'{"Werte":>8} {"FG":>5}   {"1 - cdf":>10} {"sf":>10} {"pap":>10}   {"Speedup":>7}   {"max. rel. Fehler":>16}')
+    
+    for freiheitsgrad in FREIHEITSGRADE:
+        pap._chi2_tabelle(float(freiheitsgrad))   # Tabelle einmal vorab erstellen, wie im Dauerbetrieb
+        for anzahl in ANZAHLEN:
+            chi_quadrat = rng.chisquare(freiheitsgrad, anzahl)
+            
+            zeit_cdf = zeit(lambda: 1 - chi2.cdf(chi_quadrat, freiheitsgrad), anzahl)
+            zeit_sf  = zeit(lambda: chi2.sf(chi_quadrat, freiheitsgrad), anzahl)
+            zeit_pap = zeit(lambda: pap.chi_quadrat_p_wert(chi_quadrat, freiheitsgrad), anzahl)
+            
+            exakt  = chi2.sf(chi_quadrat, freiheitsgrad)
+            fehler = np.max(np.abs(pap.chi_quadrat_p_wert(chi_quadrat, freiheitsgrad) / exakt - 1))
+            print(f'{anzahl:>8} {freiheitsgrad:>5}   {zeit_cdf:>10.2e} {zeit_sf:>10.2e} {zeit_pap:>10.2e}   '
+                  f'{zeit_cdf / zeit_pap:>6.1f}x   {fehler:>16.1e}')
+    
+    print('\nZeiten in Sekunden pro Aufruf, Speedup gegenüber 1 - chi2.cdf().')
+    print(f'Geprüfte Toleranz der Tabellen: {pap.CHI2_TOLERANZ:.0e}')
+
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+'''
+Benchmark der Import-Zeit von pap, als Wächter für das Startzeit-Budget.
+
+In frischen Python-Prozessen wird die Zeit für  import numpy  und  import pap  gemessen (Median mehrerer
+Wiederholungen) und geprüft, dass  import pap  kein SciPy lädt. SciPy wird erst bei der ersten Funktion
+importiert, die es braucht (siehe  _VERZÖGERTE_IMPORTE  in pap/__init__.py).
+Liegt die Zeit über IMPORT_BUDGET oder wird SciPy doch geladen, endet das Skript mit Exit-Code 1.
+
+Ausführen aus dem Hauptordner des Repositorys:
+    python Benchmarks/import_zeit.py
+'''
+
+
+
+import os
+import statistics
+import subprocess
+import sys
+
+
+
+WIEDERHOLUNGEN = 10
+IMPORT_BUDGET  = 0.25   # Sekunden für  import pap,  inklusive NumPy
+HAUPTORDNER    = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+MESSUNG = '''
+import sys, time
+start = time.perf_counter()
+import {modul}
+zeit = time.perf_counter() - start
+print(zeit, any(name == 'scipy' or name.startswith('scipy.') for name in sys.modules))
+'''
+
+
+
+def messen(modul):
+    '''Median der Import-Zeit in Sekunden und ob dabei SciPy geladen wurde.'''
+
+    zeiten, scipy_geladen = [], False
+    for _ in range(WIEDERHOLUNGEN):
+        ausgabe = subprocess.run([sys.executable, '-c', MESSUNG.format(modul = modul)], cwd = HAUPTORDNER,
+                                 capture_output = True, text = True, check = True).stdout.split()
+        zeiten.append(float(ausgabe[0]))
+        scipy_geladen |= ausgabe[1] == 'True'
+    return statistics.median(zeiten), scipy_geladen
+
+
+
+def main():
+    subprocess.run([sys.executable, '-c', 'import pap'], cwd = HAUPTORDNER, check = True)   # __pycache__ anlegen
+
+    print(f'{"Modul":>8}   {"Zeit":>8}   SciPy geladen')
+    ergebnisse = {}
+    for modul in ['numpy', 'pap']:
+        ergebnisse[modul] = messen(modul)
+        zeit, scipy_geladen = ergebnisse[modul]
+        print(f'{modul:>8}   {zeit * 1e3:>6.1f} ms   {"ja" if scipy_geladen else "nein"}')
+
+    zeit, scipy_geladen = ergebnisse['pap']
+    print(f'\nBudget für import pap: {IMPORT_BUDGET * 1e3:.0f} ms')
+    if scipy_geladen:
+        print('FEHLER: import pap lädt SciPy.')
+    if zeit > IMPORT_BUDGET:
+        print('FEHLER: import pap überschreitet das Budget.')
+    if scipy_geladen or zeit > IMPORT_BUDGET:
+        sys.exit(1)
+
+
+
+if __name__ == '__main__':
+    main()
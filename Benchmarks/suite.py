@@ -0,0 +1,249 @@
+'''
+Benchmark-Suite der wichtigsten Funktionen von pap, über mehrere Eingabegrößen.
+
+Für jeden Fall und jede Größe werden die Zeit pro Aufruf (beste von WIEDERHOLUNGEN Messungen) und der
+zusätzliche Spitzen-Speicher eines Aufrufes (tracemalloc, erfasst auch die Arrays von NumPy) gemessen.
+Die Ergebnisse können als JSON gespeichert und zwischen zwei Versionen verglichen werden. Es wird nichts aus
+dem Netz geladen, die Eingabedaten sind mit festem Seed zufällig erzeugt.
+
+Ausführen aus dem Hauptordner des Repositorys:
+    python Benchmarks/suite.py --json ergebnisse_neu.json              # Alle Fälle, bis 10^7 Elemente
+    python Benchmarks/suite.py --max-größe 10000 --fälle resultat odr_fit
+    python Benchmarks/suite.py --vergleich ergebnisse_alt.json ergebnisse_neu.json
+'''
+
+
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+
+HAUPTORDNER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, HAUPTORDNER)
+import pap
+
+
+
+WIEDERHOLUNGEN = 3
+MESSDAUER      = 0.2   # Sekunden pro Wiederholung, danach richtet sich die Anzahl Aufrufe
+ELEMENTE       = [10, 10**3, 10**5, 10**7]
+VERGLEICHE     = [1, 10, 10**2, 10**3, 10**4]
+
+
+
+
+
+
+# Fälle
+# Jeder Fall bekommt eine Größe und returned eine Funktion ohne Argumente, die einmal gemessen wird.
+# Die Vorbereitung (Erzeugen der Eingabedaten) zählt nicht zur Messung.
+
+def _messwerte(anzahl, seed = 0):
+    '''Zufällige positive Werte mit Fehlern von 0.1 % bis 10 %, shape = (2, anzahl).'''
+
+    rng    = np.random.default_rng(seed)
+    werte  = rng.lognormal(0, 3, anzahl)
+    fehler = werte * 10**rng.uniform(-3, -1, anzahl)
+    return np.array([werte, fehler])
+
+
+
+
+def _fall_summen_fehler(anzahl):
+    fehler = np.random.default_rng(0).uniform(0, 1, (3, anzahl))
+    return lambda: pap.summen_fehler(fehler)
+
+
+def _fall_produkt_fehler(anzahl):
+    rng = np.random.default_rng(0)
+    produkt, rel_fehler = rng.uniform(1, 2, anzahl), rng.uniform(0, 0.1, (3, anzahl))
+    return lambda: pap.produkt_fehler(produkt, rel_fehler)
+
+
+def _fall_poly(anzahl):
+    x = np.linspace(-1, 1, anzahl)
+    parameter = np.array([0.5, -1.0, 2.0, 3.0])
+    return lambda: pap.func.poly(x, parameter)
+
+
+def _fall_rundung(anzahl):
+    werte, fehler = _messwerte(anzahl)
+    präzisionen   = -np.floor(np.log10(fehler)).astype(np.int64)
+    return lambda: pap._rundung(werte, präzisionen)
+
+
+def _fall_zahlen_ausrichtung(anzahl):
+    zahlen = pap.formatieren(*_messwerte(anzahl))[0].tolist()
+    return lambda: pap._zahlen_ausrichtung(zahlen)
+
+
+def _fall_resultat_strings(anzahl):
+    werte = _messwerte(anzahl).T
+    return lambda: pap.resultat_strings('Wert', werte, 'm', rel_fehler = True)
+
+
+def _fall_resultat(anzahl):
+    werte = _messwerte(anzahl).T
+
+    def aufrufe():
+        with pap.ausgabe(ziel = io.StringIO()):   # Der Ergebnis-String entsteht nur beim Printen.
+            for wert in werte:
+                pap.resultat('Wert', wert, 'm', rel_fehler = True)
+    return aufrufe
+
+
+def _fall_vergleich(anzahl):
+    werte = np.concatenate([_messwerte(anzahl, 0), _messwerte(anzahl, 1)])
+    return lambda: pap.vergleich(werte)
+
+
+def _fall_vergleichstabelle(anzahl):
+    werte = np.concatenate([_messwerte(anzahl, 0), _messwerte(anzahl, 1)])
+    return lambda: list(pap.vergleichstabelle_zeilen(werte, 'Vergleich', 'm', ausrichtung = 'liste'))
+
+
+def _fall_odr_fit(anzahl):
+    rng = np.random.default_rng(0)
+    x   = np.linspace(0, 10, anzahl)
+    messfehler = np.array([np.full(anzahl, 0.05), np.full(anzahl, 0.2)])
+    messpunkte = np.array([x + rng.normal(0, 0.05, anzahl), 2 * x + 1 + rng.normal(0, 0.2, anzahl)])
+    return lambda: pap.odr_fit(pap.func.lin, messpunkte, messfehler, [1, 0], print_resultate = False)
+
+
+def _fall_odr_fit_bins(anzahl):
+    rng = np.random.default_rng(0)
+    x   = np.linspace(0, 5, anzahl)
+    messfehler = np.array([np.full(anzahl, 0.01), np.full(anzahl, 0.1)])
+    messpunkte = np.array([x + rng.normal(0, 0.01, anzahl), 3 * np.exp(-0.7 * x) + rng.normal(0, 0.1, anzahl)])
+    return lambda: pap.odr_fit(pap.func.exp, messpunkte, messfehler, [1, -1], print_resultate = False, bins = 1000)
+
+
+
+
+# Name: (Funktion, Größen, Einheit der Größe)
+FÄLLE = {'summen_fehler':      (_fall_summen_fehler,      ELEMENTE,           'Elemente'),
+         'produkt_fehler':     (_fall_produkt_fehler,     ELEMENTE,           'Elemente'),
+         'func.poly':          (_fall_poly,               ELEMENTE,           'Elemente'),
+         '_rundung':           (_fall_rundung,            ELEMENTE,           'Elemente'),
+         '_zahlen_ausrichtung':(_fall_zahlen_ausrichtung, ELEMENTE[:-1],      'Strings'),
+         'resultat_strings':   (_fall_resultat_strings,   ELEMENTE[:-1],      'Resultate'),
+         'resultat':           (_fall_resultat,           [1, 10, 10**2, 10**3], 'Resultate'),
+         'vergleich':          (_fall_vergleich,          ELEMENTE,           'Vergleiche'),
+         'vergleichstabelle':  (_fall_vergleichstabelle,  VERGLEICHE,         'Vergleiche'),
+         'odr_fit':            (_fall_odr_fit,            ELEMENTE[:-1],      'Messpunkte'),
+         'odr_fit_bins':       (_fall_odr_fit_bins,       ELEMENTE[1:],       'Messpunkte')}
+
+
+
+
+
+
+# Messung
+
+def messen(funktion):
+    '''Beste Zeit pro Aufruf in Sekunden und zusätzlicher Spitzen-Speicher eines Aufrufes in Bytes.'''
+
+    start = time.perf_counter()
+    funktion()   # Aufwärmen, auch für Caches wie die χ^2-Tabellen
+    einzelzeit = time.perf_counter() - start
+
+    aufrufe = max(1, int(MESSDAUER / max(einzelzeit, 1e-9)))
+    zeit    = min(timeit.repeat(funktion, number = aufrufe, repeat = WIEDERHOLUNGEN)) / aufrufe
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    basis = tracemalloc.get_traced_memory()[0]
+    funktion()
+    speicher = tracemalloc.get_traced_memory()[1] - basis
+    tracemalloc.stop()
+
+    return zeit, speicher
+
+
+
+
+def _version():
+    '''Git-Commit des Repositorys (falls vorhanden), um Ergebnisdateien zuordnen zu können.'''
+
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], cwd = HAUPTORDNER,
+                              capture_output = True, text = True, check = True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+
+
+def suite(fälle = None, max_größe = None):
+    '''Führt die Benchmarks aus, printet eine Tabelle und returned die Ergebnisse als dict (JSON-tauglich).'''
+
+    ergebnisse = []
+    print(f'{"Fall":<20} {"Größe":>10}   {"Zeit [s]":>10}   {"Speicher [MB]":>13}')
+
+    with pap.ausgabe('return'):   # Nichts printen, aber alles berechnen
+        for name in fälle or FÄLLE:
+            fall, größen, einheit = FÄLLE[name]
+            for größe in größen:
+                if max_größe is not None and größe > max_größe:
+                    continue
+                zeit, speicher = messen(fall(größe))
+                ergebnisse.append({'fall': name, 'größe': größe, 'einheit': einheit,
+                                   'zeit': zeit, 'speicher': speicher})
+                print(f'{name:<20} {größe:>10}   {zeit:>10.2e}   {speicher / 2**20:>13.2f}', flush = True)
+
+    return {'version': _version(), 'python': platform.python_version(), 'numpy': np.__version__,
+            'plattform': platform.platform(), 'wiederholungen': WIEDERHOLUNGEN, 'ergebnisse': ergebnisse}
+
+
+
+
+def vergleichen(alt, neu):
+    '''Printet das Verhältnis neu/alt von Zeit und Speicher für alle Fälle und Größen, die in beiden vorkommen.'''
+
+    alte = {(e['fall'], e['größe']): e for e in alt['ergebnisse']}
+    print(f'Alt: {alt["version"]}   Neu: {neu["version"]}\n')
+    print(f'{"Fall":<20} {"Größe":>10}   {"Zeit neu/alt":>12}   {"Speicher neu/alt":>16}')
+    for e in neu['ergebnisse']:
+        a = alte.get((e['fall'], e['größe']))
+        if a is None:
+            continue
+        speicher = e['speicher'] / a['speicher']  if a['speicher']  else float('nan')
+        print(f'{e["fall"]:<20} {e["größe"]:>10}   {e["zeit"] / a["zeit"]:>12.2f}   {speicher:>16.2f}')
+
+
+
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Benchmark-Suite von pap')
+    parser.add_argument('--fälle', nargs = '+', choices = list(FÄLLE), help = 'nur diese Fälle messen')
+    parser.add_argument('--max-größe', type = int, help = 'größere Eingaben überspringen')
+    parser.add_argument('--json', help = 'Ergebnisse in diese Datei schreiben')
+    parser.add_argument('--vergleich', nargs = 2, metavar = ('ALT', 'NEU'),
+                        help = 'zwei JSON-Ergebnisdateien vergleichen, statt zu messen')
+    argumente = parser.parse_args()
+
+    if argumente.vergleich:
+        alt, neu = (json.load(open(datei, encoding = 'utf-8')) for datei in argumente.vergleich)
+        vergleichen(alt, neu)
+        return
+
+    ergebnisse = suite(argumente.fälle, argumente.max_größe)
+    if argumente.json:
+        with open(argumente.json, 'w', encoding = 'utf-8') as datei:
+            json.dump(ergebnisse, datei, indent = 1, ensure_ascii = False)
+
+
+
+if __name__ == '__main__':
+    main()
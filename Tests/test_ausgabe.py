@@ -0,0 +1,126 @@
+'''
+Tests der Ausgabe-Einstellung (siehe pap.ausgabe_einstellen()): Ein  with pap.ausgabe()-Block  gilt nur im
+eigenen Thread bzw. asyncio-Task, auch über ein  await  hinweg, und in pap.asynchron für die Aufrufe seiner Task.
+
+Ausführen aus dem Hauptordner des Repositorys:
+    python -m pytest Tests
+'''
+
+
+
+import asyncio
+import io
+import os
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import pap
+
+
+
+WERTE = np.array([3.3520e6, 0.4684e6])
+
+
+
+
+
+
+# Hilfsfunktionen
+
+def _resultat():
+    '''pap.resultat() returnt nur außerhalb von modus = 'print' die Zahlen, sonst None.'''
+
+    return pap.resultat('Arbeit', WERTE, 'MJ', faktor = 1e-6)
+
+
+
+
+
+
+# Tests
+
+def test_block_stellt_zurück():
+    with pap.ausgabe('return'):
+        assert _resultat() is not None
+        pap.ausgabe_einstellen('print', ziel = io.StringIO())   # Nur bis zum Ende des Blocks
+        assert _resultat() is None
+        assert pap._printen()
+    assert pap._ausgabe_jetzt() == {'modus': 'print', 'ziel': None}
+    with pytest.raises(ValueError):
+        pap.ausgabe('laut').__enter__()
+
+
+
+
+def test_tasks_getrennt():
+    async def still(start, ende):
+        with pap.ausgabe('still'):
+            start.set()
+            await ende.wait()   # Die andere Task läuft, während dieser Block offen ist
+            return _resultat()
+
+    async def ohne_block(start, ende):
+        await start.wait()
+        printen = pap._printen()
+        ende.set()
+        return printen
+
+    async def beide():
+        start, ende = asyncio.Event(), asyncio.Event()
+        return await asyncio.gather(still(start, ende), ohne_block(start, ende))
+
+    ergebnis_still, printen = asyncio.run(beide())
+    assert ergebnis_still is not None
+    assert printen
+
+
+
+
+def test_threads_getrennt():
+    im_block  = threading.Event()
+    ergebnis  = {}
+
+    def still():
+        with pap.ausgabe('still'):
+            im_block.set()
+            ergebnis['still'] = _resultat()
+
+    with pap.ausgabe(ziel = io.StringIO()):
+        thread = threading.Thread(target = still)
+        thread.start()
+        im_block.wait()
+        ergebnis['laut'] = _resultat()
+        thread.join()
+    assert ergebnis['still'] is not None and ergebnis['laut'] is None
+
+
+
+
+def test_asynchron_übernimmt_block():
+    pap.asynchron.einstellen('threads', max_gleichzeitig = 2)
+    im_block = threading.Event()
+
+    def nach_block():
+        im_block.wait()   # Rechnet, während die andere Task in ihrem with-Block ist
+        return _resultat()
+
+    async def still():
+        with pap.ausgabe('still'):
+            return await pap.asynchron.ausführen(nach_block)
+
+    async def laut(ziel):
+        with pap.ausgabe(ziel = ziel):
+            im_block.set()
+            await asyncio.sleep(0.2)
+
+    async def beide():
+        ziel = io.StringIO()
+        ergebnisse = await asyncio.gather(still(), laut(ziel))
+        return ergebnisse[0], ziel.getvalue()
+
+    ergebnis_still, geschrieben = asyncio.run(beide())
+    assert ergebnis_still is not None and geschrieben == ''
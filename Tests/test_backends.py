@@ -0,0 +1,210 @@
+'''
+Tests der Backends von pap (siehe pap.backend_einstellen()): Die Kerne aus pap._kerne müssen Bit für Bit
+dieselben Ergebnisse liefern wie die NumPy-Versionen.
+
+Geprüft werden _rundung(), _erste_ziffer(), _nachkommastelle(), vergleich() auf zufälligen Zahlen über den ganzen
+float-Bereich und auf Randfällen (0, ±inf, NaN, subnormale Zahlen, Zehnerpotenzen und ihre Nachbarn,
+Signifikanzgrenzen), außerdem die fertigen Strings von formatieren() und vergleichstabelle_zeilen().
+Die Kerne werden immer als normale Python-Funktionen geprüft, kompiliert nur, falls Numba installiert ist.
+Die Zeiten misst Benchmarks/backends.py.
+
+Ausführen aus dem Hauptordner des Repositorys:
+    python -m pytest Tests
+'''
+
+
+
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import pap
+from pap import _kerne
+
+
+
+PYTHON_ANZAHL = 5000    # Elemente für die Kerne als Python-Funktionen (langsam)
+NUMBA_ANZAHL  = 10**5
+
+
+
+
+
+
+# Eingabedaten
+
+def _zahlen(anzahl, seed = 0):
+    '''Zufällige Zahlen über den ganzen float-Bereich mit allen Randfällen vorne, shape = (anzahl,).'''
+
+    rng        = np.random.default_rng(seed)
+    potenzen   = 10.0**np.arange(-323, 309)
+    with np.errstate(over = 'ignore'):   # 3.95e308 wird inf, auch ein Randfall
+        randfälle = np.concatenate([
+            [0.0, -0.0, np.inf, -np.inf, np.nan, 5e-324, -5e-324, 2.2250738585072014e-308, 1.7976931348623157e308,
+             1.0, 3.95, 3.9499999999999997, 4.0, 0.3949999999999999, 0.395, 9.5, 9.999999999999998, 99.5],
+            potenzen, np.nextafter(potenzen, 0), np.nextafter(potenzen, np.inf), -potenzen,
+            3.95 * potenzen, np.nextafter(3.95 * potenzen, 0)])
+    zufall     = rng.choice([-1, 1], anzahl) * 10**rng.uniform(-320, 308, anzahl)
+    alltäglich = rng.lognormal(0, 3, anzahl) * rng.choice([-1, 1], anzahl)
+    zahlen     = np.where(rng.uniform(size = anzahl) < 0.5, zufall, alltäglich)
+    zahlen[:min(anzahl, randfälle.size)] = randfälle[:anzahl]
+    return zahlen
+
+
+
+
+def _messwerte(anzahl, seed = 0):
+    '''Endliche Werte aus vielen Größenordnungen mit relativen Fehlern von 0.01 % bis 100 %, shape = (2, anzahl).'''
+
+    rng    = np.random.default_rng(seed)
+    werte  = rng.choice([-1, 1], anzahl) * 10**rng.uniform(-30, 30, anzahl)
+    fehler = np.abs(werte) * 10**rng.uniform(-4, 0, anzahl)
+    fehler[rng.uniform(size = anzahl) < 0.05] = 0
+    return np.array([werte, fehler])
+
+
+
+
+def _vergleichswerte(anzahl, seed = 0):
+    '''werte für pap.vergleich(), shape = (4, anzahl), mit fehlenden Werten, Nullen und negativen Fehlern.'''
+
+    rng   = np.random.default_rng(seed)
+    werte = np.array([_zahlen(anzahl, seed + i) for i in range(4)])
+    werte = np.where(rng.uniform(size = (4, anzahl)) < 0.3, rng.lognormal(0, 1, (4, anzahl)), werte)
+    werte[:, rng.uniform(size = anzahl) < 0.05] = 0
+    werte[rng.uniform(size = (4, anzahl)) < 0.02] = np.nan
+    return werte
+
+
+
+
+
+
+# Fälle
+# Jeder Fall bekommt eine Anzahl und returned eine Funktion ohne Argumente, deren Ergebnis verglichen wird.
+
+def _fall_rundung(anzahl):
+    zahlen      = _zahlen(anzahl)
+    präzisionen = np.random.default_rng(1).integers(-330, 330, anzahl)
+    präzisionen[::3] = np.random.default_rng(2).integers(-5, 10, präzisionen[::3].size)
+    return lambda: pap._rundung(zahlen, präzisionen)
+
+
+def _fall_erste_ziffer(anzahl):
+    zahlen = _zahlen(anzahl)
+    return lambda: pap._erste_ziffer(zahlen)
+
+
+def _fall_nachkommastelle(anzahl):
+    zahlen = _zahlen(anzahl)
+    return lambda: [pap._nachkommastelle(zahlen, sig_stellen, sig_grenze)
+                    for sig_stellen, sig_grenze in [(1, 1.0), (1, 3.95), (2, 1.0), (3, 9.5)]]
+
+
+def _fall_vergleich(anzahl):
+    werte = _vergleichswerte(anzahl)
+    return lambda: [pap.vergleich(werte), pap.vergleich(werte, faktor = 1e-3)]
+
+
+def _fall_formatieren(anzahl):
+    werte, fehler = _messwerte(anzahl)
+    return lambda: pap.formatieren(werte, fehler)
+
+
+def _fall_vergleichstabelle(anzahl):
+    anzahl = min(anzahl, 10**4)
+    werte  = np.concatenate([_messwerte(anzahl, 0), _messwerte(anzahl, 1)])
+    werte[np.random.default_rng(2).uniform(size = (4, anzahl)) < 0.02] = np.nan   # Fehlende Werte
+    return lambda: list(pap.vergleichstabelle_zeilen(werte, 'Vergleich', 'm', ausrichtung = 'liste'))
+
+
+
+FÄLLE = {'_rundung':           _fall_rundung,
+         '_erste_ziffer':      _fall_erste_ziffer,
+         '_nachkommastelle':   _fall_nachkommastelle,
+         'vergleich':          _fall_vergleich,
+         'formatieren':        _fall_formatieren,
+         'vergleichstabelle':  _fall_vergleichstabelle}
+
+
+
+
+
+
+# Hilfsfunktionen
+
+def _bytes(ergebnis):
+    '''Alle Zahlen (inklusive NaN-Bits) bzw. Strings eines Ergebnisses als bytes.'''
+
+    if isinstance(ergebnis, (list, tuple)):
+        return b''.join(_bytes(teil) for teil in ergebnis)
+    if isinstance(ergebnis, str):
+        return ergebnis.encode()
+    ergebnis = np.asarray(ergebnis)
+    if ergebnis.dtype.kind in 'UO':
+        return '\x00'.join(map(str, ergebnis.ravel())).encode()
+    return np.ascontiguousarray(ergebnis).tobytes()
+
+
+
+
+def _python_kerne():
+    '''Die Kerne als normale Python-Funktionen, auch wenn Numba sie kompiliert hat.'''
+
+    return types.SimpleNamespace(
+        **{name: getattr(getattr(_kerne, name), 'py_func', getattr(_kerne, name))
+           for name in ['rundung', 'erste_ziffern', 'nachkommastellen', 'abweichungen']},
+        POTENZEN = _kerne.POTENZEN)
+
+
+
+
+def _mit_kernen(kerne, funktion):
+    '''Führt  funktion  mit den Kernen  kerne  aus (None: NumPy).'''
+
+    vorher = dict(pap._backend)
+    pap._backend['kerne'] = kerne
+    try:
+        with np.errstate(all = 'ignore'), pap.ausgabe('return'):
+            return funktion()
+    finally:
+        pap._backend.update(vorher)
+
+
+
+
+def _prüfen(kerne, fall, anzahl):
+    funktion = fall(anzahl)
+    assert _bytes(_mit_kernen(None, funktion)) == _bytes(_mit_kernen(kerne, funktion))
+
+
+
+
+
+
+# Tests
+
+@pytest.mark.parametrize('name', FÄLLE)
+def test_python_kerne(name):
+    _prüfen(_python_kerne(), FÄLLE[name], PYTHON_ANZAHL)
+
+
+
+
+@pytest.mark.parametrize('name', FÄLLE)
+def test_numba_kerne(name):
+    pytest.importorskip('numba')
+    _prüfen(_kerne, FÄLLE[name], NUMBA_ANZAHL)
+
+
+
+
+def test_backend_einstellen():
+    with pytest.raises(ValueError):
+        pap.backend_einstellen('fortran')
+    with pap.backend('numpy'):
+        assert pap._backend['kerne'] is None
@@ -0,0 +1,61 @@
+'''
+Tests des Fit-Caches (siehe pap.cache_einstellen()): Im Arbeitsspeicher bleiben höchstens
+CACHE_SPEICHER_ANZAHL Ergebnisse, egal ob sie gerechnet oder aus dem Cache-Ordner geladen wurden.
+
+Ausführen aus dem Hauptordner des Repositorys:
+    python -m pytest Tests
+'''
+
+
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import pap
+
+
+
+SPEICHER_ANZAHL = 4
+ANZAHL_FITS     = 10
+
+
+
+
+
+
+# Hilfsfunktionen
+
+def _fit(i):
+    '''Ein schneller linearer Fit, für jedes i mit anderen Messpunkten.'''
+
+    x = np.linspace(0, 10, 10)
+    messpunkte = np.array([x, (i + 1) * x + 1 + np.sin(x)])
+    messfehler = np.array([np.full(10, 0.1), np.full(10, 0.5)])
+    with pap.ausgabe('still'):
+        return pap.odr_fit(pap.func.lin, messpunkte, messfehler, [1, 0])
+
+
+
+
+
+
+# Tests
+
+def test_speicher_begrenzt(tmp_path, monkeypatch):
+    pytest.importorskip('scipy')
+    monkeypatch.setattr(pap, 'CACHE_SPEICHER_ANZAHL', SPEICHER_ANZAHL)
+
+    with pap.cache(str(tmp_path)):
+        gerechnet = [_fit(i) for i in range(ANZAHL_FITS)]
+        assert len(pap._cache['speicher']) == SPEICHER_ANZAHL
+
+        pap._cache['speicher'].clear()   # Alle weiteren Treffer kommen aus dem Cache-Ordner
+        geladen = [_fit(i) for i in range(ANZAHL_FITS)]
+        assert len(pap._cache['speicher']) == SPEICHER_ANZAHL
+
+    for (parameter, fehler), (parameter_geladen, fehler_geladen) in zip(gerechnet, geladen):
+        assert np.array_equal(parameter, parameter_geladen) and np.array_equal(fehler, fehler_geladen)
@@ -0,0 +1,90 @@
+'''
+Tests von pap.likelihood_fit() mit Untergrund: Die Fits müssen auch dann stimmen, wenn der Untergrund-Anteil nahe
+an 0 oder 1 liegt, dort wird der Gradient nach dem Anteil sehr groß und die Hesse-Matrix liegt an den Grenzen.
+
+Ausführen aus dem Hauptordner des Repositorys:
+    python -m pytest Tests
+'''
+
+
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import pap
+
+
+
+BEREICH = (0, 10)
+MU      = 3
+SIGMA   = 0.2
+
+
+
+
+
+
+# Eingabedaten
+
+def _werte(anzahl_signal, anzahl_untergrund, seed = 0):
+    '''Normalverteilte Werte (μ = 3, σ = 0.2) und gleichverteilter Untergrund in BEREICH, gemischt.'''
+
+    rng = np.random.default_rng(seed)
+    return rng.permutation(np.concatenate([rng.normal(MU, SIGMA, anzahl_signal),
+                                           rng.uniform(*BEREICH, anzahl_untergrund)]))
+
+
+
+
+def _fit(werte, parameter0, **kwargs):
+    with np.errstate(all = 'ignore'), pap.ausgabe('return'):
+        return pap.likelihood_fit(pap.func.gauss, werte, parameter0, bereich = BEREICH, untergrund = pap.func.konst,
+                                  print_resultate = False, **kwargs)
+
+
+
+
+
+
+# Tests
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_anteil_nahe_0(workers):
+    werte = _werte(20000, 20)
+    parameter, fehler = _fit(werte, [2.5, 0.5, 0.2], workers = workers)
+
+    assert np.all(np.isfinite(fehler)) and np.all(fehler > 0)
+    assert abs(parameter[0] - MU)    < 5 * fehler[0]
+    assert abs(parameter[1] - SIGMA) < 5 * fehler[1]
+    assert abs(parameter[2] - 20 / 20020) < 5 * fehler[2]
+    # Ohne Untergrund ändert der Anteil fast nichts, die Fehler sind die des Fits ohne Untergrund
+    with np.errstate(all = 'ignore'), pap.ausgabe('return'):
+        nur_gauss, nur_gauss_fehler = pap.likelihood_fit(pap.func.gauss, werte[np.abs(werte - MU) < 2], [2.5, 0.5],
+                                                         print_resultate = False)
+    assert np.allclose(fehler[:2], nur_gauss_fehler, rtol = 0.1)
+
+
+
+
+def test_anteil_0():
+    parameter, fehler = _fit(_werte(20000, 0), [2.5, 0.5, 0.2])
+
+    assert np.all(np.isfinite(fehler)) and np.all(fehler > 0)
+    assert abs(parameter[0] - MU)    < 5 * fehler[0]
+    assert abs(parameter[1] - SIGMA) < 5 * fehler[1]
+    assert 0 <= parameter[2] < 5 * fehler[2]
+
+
+
+
+def test_anteil_nahe_1():
+    parameter, fehler = _fit(_werte(200, 20000), [2.5, 0.5, 0.5])
+
+    assert np.all(np.isfinite(fehler)) and np.all(fehler > 0)
+    assert abs(parameter[0] - MU)    < 5 * fehler[0]
+    assert abs(parameter[1] - SIGMA) < 5 * fehler[1]
+    assert abs(parameter[2] - 20000 / 20200) < 5 * fehler[2]
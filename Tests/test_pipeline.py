@@ -0,0 +1,63 @@
+'''
+Tests von pap.pipeline.pipeline(): Jede erfolgreiche Datei bekommt ihren eigenen Bericht, auch wenn mehrere
+Dateien denselben Namen haben (andere Ordner oder andere Endung).
+
+Ausführen aus dem Hauptordner des Repositorys:
+    python -m pytest Tests
+'''
+
+
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import pap
+
+
+
+SPEZIFIKATION = {'titel': 'Gerade', 'funktion': 'lin', 'parameter0': [1, 0], 'parameter_namen': ['a', 'b']}
+
+
+
+
+
+
+# Eingabedaten
+
+def _messung(steigung):
+    '''Tabelle x, y, x_fehler, y_fehler einer Geraden mit der Steigung  steigung,  shape = (10, 4).'''
+
+    x = np.linspace(0, 10, 10)
+    return np.array([x, steigung * x + 1 + 0.1 * np.sin(x), np.full(10, 0.1), np.full(10, 0.5)]).T
+
+
+
+
+
+
+# Tests
+
+def test_gleiche_namen(tmp_path):
+    pytest.importorskip('scipy')
+    for ordner in ['a', 'b']:
+        os.makedirs(tmp_path / ordner)
+    dateien = [str(tmp_path / 'a' / 'lauf1.csv'), str(tmp_path / 'b' / 'lauf1.csv'), str(tmp_path / 'lauf1.npy'),
+               str(tmp_path / 'lauf2.csv')]
+    for steigung, datei in enumerate(dateien, 1):
+        if datei.endswith('.npy'):
+            np.save(datei, _messung(steigung))
+        else:
+            np.savetxt(datei, _messung(steigung), delimiter = ',')
+
+    berichte   = tmp_path / 'berichte'
+    ergebnisse = pap.pipeline.pipeline(dateien, SPEZIFIKATION, prozesse = 1, berichte = str(berichte))
+
+    namen = ['lauf1.txt', 'lauf1_2.txt', 'lauf1_3.txt', 'lauf2.txt']
+    assert sorted(os.listdir(berichte)) == namen
+    for ergebnis, name in zip(ergebnisse, namen):
+        assert ergebnis['bericht'] is not None
+        assert (berichte / name).read_text(encoding = 'utf-8') == ergebnis['bericht']
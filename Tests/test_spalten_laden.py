@@ -0,0 +1,81 @@
+'''
+Tests von pap.spalten_laden() und pap.messdaten_laden(): Negative Spaltennummern zählen wie bei NumPy vom Ende,
+Nummern außerhalb der Tabelle sind Eingabefehler, für .csv, .npy und .npz gleich.
+
+Ausführen aus dem Hauptordner des Repositorys:
+    python -m pytest Tests
+'''
+
+
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import pap
+
+
+
+FORMATE = ['.csv', '.npy', '.npz', '_komprimiert.npz']
+
+
+
+
+
+
+# Eingabedaten
+
+def _tabelle():
+    '''Tabelle der shape (5, 4), jeder Wert ist eindeutig (10 * Zeile + Spalte).'''
+
+    return 10.0 * np.arange(5)[:, None] + np.arange(4)
+
+
+
+
+def _datei(ordner, format):
+    datei = os.path.join(ordner, 'tabelle' + format)
+    if format == '.csv':
+        np.savetxt(datei, _tabelle(), delimiter = ',')
+    elif format == '.npy':
+        np.save(datei, _tabelle())
+    elif format == '.npz':
+        np.savez(datei, tabelle = _tabelle())
+    else:
+        np.savez_compressed(datei, tabelle = _tabelle())
+    return datei
+
+
+
+
+
+
+# Tests
+
+@pytest.mark.parametrize('format', FORMATE)
+def test_negative_spalten(tmp_path, format):
+    datei = _datei(tmp_path, format)
+
+    assert np.array_equal(pap.spalten_laden(datei, [0, -1]), _tabelle()[:, [0, 3]].T)
+    assert np.array_equal(pap.spalten_laden(datei, [-4, -2, 3]), _tabelle()[:, [0, 2, 3]].T)
+    messpunkte, messfehler = pap.messdaten_laden(datei, [1, 0, 3, -1])
+    assert np.array_equal(messpunkte, _tabelle()[:, [1, 0]].T)
+    assert np.array_equal(messfehler, _tabelle()[:, [3, 3]].T)
+
+
+
+
+@pytest.mark.parametrize('format', FORMATE)
+@pytest.mark.parametrize('spalten', [[0, 4], [-5, 0], [0, 1, 2, 100]])
+def test_spalten_außerhalb(tmp_path, format, spalten):
+    datei = _datei(tmp_path, format)
+
+    with pap.ausgabe('return'):
+        with pytest.raises(ValueError):
+            pap.spalten_laden(datei, spalten)
+        if len(spalten) == 4:
+            with pytest.raises(ValueError):
+                pap.messdaten_laden(datei, spalten)
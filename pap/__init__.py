@@ -43,6 +43,9 @@ Resultat-Darstellung und Vergleich:
         >>> pap.resultat('Arbeit', np.array([3.3520e6, 0.4684e6]), 'MJ', faktor = 1e-6)
           Arbeit: 3.4 +/- 0.5 MJ
           
+    * pap.resultat_strings()
+        erstellt die Strings von pap.resultat() für ganze Arrays von Ergebnissen auf einmal, ohne zu printen.
+        
     * pap.vergleichstabelle()
         printet einen wissenschaftlichen Vergleich von fehlerbehafteten experimentellen und 
         theoretischen Werten in Tabellenform. 
@@ -67,13 +70,44 @@ Resultat-Darstellung und Vergleich:
                rel       -6.6 %              -       
                sig        2.3 σ            4.5 σ      
 
+    * pap.vergleich()
+        berechnet nur die Abweichungen von pap.vergleichstabelle() als strukturiertes Array, 
+        ohne Darstellung, auch für Millionen von Vergleichen.
+        
+    * pap.vergleichsmatrix()
+        vergleicht N Messwerte mit M Theoriewerten auf einmal (N×M-Matrix der Abweichungen) 
+        und bestimmt zu jedem Messwert die am besten passende Theorie.
+        
+    * pap.formatieren()
+        rundet und formatiert ganze Arrays von Werten mit Fehlern auf einmal zu Strings, 
+        nach denselben Regeln wie pap.vergleichstabelle().
+        
+    * pap.vergleichstabelle_zeilen()  und  pap.vergleichstabelle_schreiben()
+        erstellen sehr große Vergleichstabellen seitenweise, als Generator von Zeilen bzw. 
+        direkt in eine Datei, optional mit Umbruch auf eine maximale Zeilenbreite. 
+        Jede Seite wiederholt die Kopfzeilen, bei ausrichtung = 'liste' sind die Spalten aller Seiten gleich breit.
+        
+    * pap.exportieren()  mit  pap.vergleich_layout()  bzw.  pap.resultat_layout()
+        exportiert Vergleiche und Ergebnisse als CSV, LaTeX-tabular, Markdown oder HTML.
+        Das Layout wird einmal berechnet und kann in beliebig viele Formate exportiert werden.
+
         
 Fits und Chi^2-Tests:
+    * pap.messdaten_laden()  und  pap.spalten_laden()
+        laden Messtabellen aus CSV-, .npy- und .npz-Dateien direkt in der Form, die pap.odr_fit() bzw. 
+        pap.vergleichstabelle() brauchen, ohne unnötige Kopien (.npy/.npz werden nur eingeblendet).
+    
     * pap.odr_fit()
         fittet Funktionen ähnlich wie SciPys curve_fit() nur mit Berücksichtigung des x-Fehlers, 
         was wichtig wird, wenn dieser der dominante Fehler ist. 
         Diese Funktion benutzt direkt SciPys odr-Paket, ist aber wesentlich einfacher 
         zu bedienen.
+        Sehr große Datensätze lassen sich mit  bins  vor dem Fit auf gewichtete Mittelwerte reduzieren, 
+        optional mit  verfeinern = True  gefolgt von einem schnellen Fit an alle Punkte.
+    
+    * pap.cache_einstellen()  und  pap.cache()
+        speichern die Ergebnisse von pap.odr_fit() in einem Ordner (.npz), sodass derselbe Fit auf denselben 
+        Daten beim nächsten Mal, auch in einem neuen Prozess, nur noch geladen statt gerechnet wird.
     
     * pap.chi_quadrat_test()  und  pap.chi_quadrat_odr()
         führen einen χ^2-Test zu Bestimmung der Güte des Fits durch.
@@ -87,6 +121,57 @@ Fits und Chi^2-Tests:
           χ^2_reduziert         = 2.79
           Fitwahrscheinlichkeit = 2.5%
           
+    * pap.chi_quadrat_tests()  und  pap.chi_quadrat_odr_tests()
+        machen dasselbe für viele Fits auf einmal und returnen die Ergebnisse als Arrays.
+        
+    * pap.chi_quadrat_p_wert()
+        berechnet p-Werte von χ^2-Tests mit zwischengespeicherten Tabellen pro Freiheitsgrad, 
+        um ein Vielfaches schneller als scipy.stats.chi2.
+          
+    * pap.histogramm_fit()
+        histogrammiert (auch stückweise eingelesene) ungebinnte Messwerte, fittet eine Gaußverteilung 
+        mit Poisson-Fehlern an und gibt deren Halbwertsbreite an.
+
+    * pap.poisson_fit()
+        fittet Funktionen per Poisson-Likelihood an Histogramme, auch bei kleinen Zählraten und leeren Bins.
+
+    * pap.likelihood_fit()
+        fittet Gauß- oder Exponentialverteilungen (optional mit Untergrund) direkt an ungebinnte Messwerte.
+
+    * pap.diagnose
+        untersucht die normierten Residuen (Pulls) von Fits, auch von vielen Fits auf einmal: 
+        Runs-Test, Autokorrelation, Ljung-Box-Test, Schiefe, Wölbung und Jarque-Bera-Test
+        (mehr Infos im Docstring von pap.diagnose). Die Residuen von pap.odr_fit() gibt es mit
+        output_residuen = True.
+          
+        
+Ausgabe:
+    * pap.ausgabe_einstellen()  und  pap.ausgabe()
+        stellen für das ganze Paket ein, ob geprintet ('print') oder nur die Zahlen returned werden 
+        ('return' bzw. 'still'), und wohin geschrieben wird. 
+        Außer bei 'print' lösen Eingabefehler einen ValueError aus. Ein with pap.ausgabe()-Block gilt nur 
+        im eigenen Thread bzw. asyncio-Task.
+        
+    * pap.profil_einstellen()  und  pap.profil()
+        zählen Aufrufe, Zeit und Eingabegrößen aller pap-Funktionen (bei pap.odr_fit() auch die ODR-Iterationen),
+        um langsame Auswertungen zu untersuchen. Export mit pap.profil_statistik() bzw. pap.profil_json().
+        Auch über die Umgebungsvariable PAP_PROFIL=1 einschaltbar, ausgeschaltet kostet es nichts.
+        
+    * pap.backend_einstellen()  und  pap.backend()
+        lassen die elementweisen Rundungs- und Abweichungs-Rechnungen (pap.vergleich(), pap.vergleichstabelle(), 
+        pap.formatieren(), ...) als mit Numba JIT-kompilierte Schleifen laufen, falls Numba installiert ist. 
+        Die Ergebnisse sind bitgleich zu denen mit NumPy. Auch über die Umgebungsvariable PAP_BACKEND=numba.
+        
+    * pap.pipeline  und  python -m pap
+        werten viele Messdateien (CSV) nach einer Vorschrift in JSON parallel auf mehreren Prozessen aus:
+        Einlesen, Fehlerfortpflanzung, pap.odr_fit(), χ^2-Test und Bericht. Ergebnis ist eine Zusammenfassung 
+        mit einer Zeile pro Datei und die Zeiten jeder Stufe (mehr Infos im Docstring von pap.pipeline).
+        
+    * pap.asynchron
+        enthält async-Varianten von pap.odr_fit() und weiteren Funktionen für Programme mit asyncio (zB. Services).
+        Gerechnet wird in einem Thread- oder Prozess-Pool, mit Zeitlimit, Abbruch und begrenzter Anzahl 
+        gleichzeitiger Rechnungen (mehr Infos im Docstring von pap.asynchron).
+        
         
 Grundlegende Fitfunktionen:
     (mehr Infos im Docstring von pap.func)
@@ -106,13 +191,57 @@ Grundlegende Fitfunktionen:
 
 # Alle benötigten Pakete
 
+import collections.abc
+import contextlib
+import contextvars
+import csv
+import functools
+import hashlib
+import html
+import importlib
+import io
+import json
+import os
+import sys
+import time
+import types
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from numpy import array as arr
-from scipy.stats import chi2
-from scipy import odr
 
 from pap import func   # Ermöglicht es, direkt pap.func-Funktionen zu nutzen wenn nur `import pap` ausgeführt wurde.
 
+# SciPy braucht allein fast eine Sekunde zum Importieren, obwohl es nur für Fits und χ^2-Tests gebraucht wird.
+# Deshalb importieren die Funktionen ihre SciPy-Teile erst beim Aufruf selbst (danach kommen sie aus sys.modules), 
+# und schwere Untermodule werden erst beim ersten Zugriff über __getattr__() geladen.
+_VERZÖGERTE_IMPORTE = {'diagnose': ('pap.diagnose', None), 
+                       'pipeline': ('pap.pipeline', None), 
+                       'asynchron': ('pap.asynchron', None), 
+                       'chi2':     ('scipy.stats', 'chi2'), 
+                       'odr':      ('scipy.odr', None), 
+                       'optimize': ('scipy.optimize', None)}
+
+
+
+def __getattr__(name):
+    '''Lädt  pap.diagnose  und die früher hier importierten SciPy-Teile erst beim ersten Zugriff.'''
+    
+    if name not in _VERZÖGERTE_IMPORTE:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    
+    modul_name, attribut = _VERZÖGERTE_IMPORTE[name]
+    modul = importlib.import_module(modul_name)
+    wert  = modul  if attribut is None  else getattr(modul, attribut)
+    globals()[name] = wert   # Danach ohne __getattr__()
+    return wert
+
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_VERZÖGERTE_IMPORTE))
+
   
 
 
@@ -122,1690 +251,4836 @@ from pap import func   # Ermöglicht es, direkt pap.func-Funktionen zu nutzen we
 
 ZIFFERN = ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9')
 
+PARALLEL_SCHWELLE = 2**20   # Ab so vielen Elementen lohnt sich das Aufteilen auf mehrere Threads.
+BLOCKGRÖSSE       = 2**18   # Elemente pro Block bei blockweisen Berechnungen (begrenzt Zwischenspeicher).
 
+CHI2_TOLERANZ        = 1e-10   # Maximaler relativer Fehler der interpolierten χ^2-p-Werte
+CHI2_TABELLEN_P_MIN  = 1e-15   # Kleinere p-Werte werden exakt berechnet.
+CHI2_TABELLEN_ANZAHL = 64      # So viele Tabellen (Freiheitsgrade) werden höchstens im Speicher gehalten.
+CHI2_TABELLE_AB      = 1000    # Ab so vielen Werten pro Freiheitsgrad lohnt sich die Tabelle.
 
 
 
 
-# Fehlerrechnung
 
-def summen_fehler(fehler_array):
+
+# Ausgabe
+
+AUSGABE_MODI = ('print', 'return', 'still')
+_ausgabe     = {'modus': 'print', 'ziel': None}   # Gilt für das ganze Paket, ziel = None heißt sys.stdout.
+_ausgabe_block = contextvars.ContextVar('pap_ausgabe', default = None)
+# Einstellung eines  with pap.ausgabe()-Blocks,  gilt nur im Kontext des Blocks (Thread bzw. asyncio-Task).
+
+
+
+def ausgabe_einstellen(modus = 'print', ziel = None):
     '''
-    Quadratische Addition der Fehler einer Summe
+    Legt fest, was alle Funktionen von pap mit ihren Ausgaben machen, zB. um in großen Auswertungen das Printen 
+    abzuschalten oder die Ausgaben in eine Datei umzuleiten.
     
-    Die Form dieser Summe soll sein  wert1 + wert2 + ... + wertn.
-    fehler_array soll eine Form haben wie  [fehler_wert1, ..., fehler_wertn].
+    
+    Argumente
+    ---------
+    modus : str, optional
+        'print'  - (Standard) Alles wird wie gewohnt in  ziel  geschrieben. Eingabefehler werden geprintet
+                   und die Funktion returnt None.
+        'return' - Nichts wird geschrieben. Funktionen, die sonst nur printen, returnen stattdessen ihr 
+                   Ergebnis als Zahlen: pap.resultat() (gerundete_werte, nachkommastellen),
+                   pap.vergleichstabelle() das Ergebnis von pap.vergleich(),
+                   pap.chi_quadrat_test() und pap.chi_quadrat_odr() [χ^2_reduziert, Fitwahrscheinlichkeit].
+                   Die Strings gibt es mit pap.resultat_strings() bzw. pap.vergleichstabelle_zeilen().
+                   Eingabefehler lösen einen ValueError aus.
+        'still'  - Wie 'return', nichts wird geschrieben oder als String dargestellt, für maximalen Durchsatz.
+    
+    ziel : file-like, optional
+        Alles mit einer  write()-Methode, zB. eine geöffnete Datei oder io.StringIO(). Standardmäßig sys.stdout.
+        Jede Funktion schreibt ihre gesamte Ausgabe mit einem einzigen  write().
+    
+    
+    Beispiel
+    --------
+    >>> pap.ausgabe_einstellen('return')
+    >>> pap.resultat('Arbeit', np.array([3.3520e6, 0.4684e6]), 'MJ', faktor = 1e-6)
+    (array([3.4, 0.5]), 1)
+    >>> pap.ausgabe_einstellen()   # Zurück zum Standard
     '''
     
-    return np.linalg.norm(fehler_array, axis = 0)
+    
+    _ausgabe_prüfen(modus, ziel)
+    if _ausgabe_block.get() is not None:   # In einem with pap.ausgabe()-Block nur bis zu dessen Ende
+        _ausgabe_block.set({'modus': modus, 'ziel': ziel})
+    else:
+        _ausgabe['modus'] = modus
+        _ausgabe['ziel']  = ziel
 
 
 
 
-def produkt_fehler(produkt, rel_fehler_array):
+@contextlib.contextmanager
+def ausgabe(modus = 'print', ziel = None):
     '''
-    Quadratische Addition der relativen Fehler eines Produktes (optional inkl. Potenzen)
+    Wie pap.ausgabe_einstellen(), aber nur innerhalb eines with-Blocks. Danach gilt wieder die vorherige Einstellung.
+    Die Einstellung gilt nur im eigenen Thread bzw. asyncio-Task, andere Threads und Tasks, die gleichzeitig 
+    laufen (zB. während eines  await  im Block), behalten ihre.
     
-    Die Form dieses Produktes soll sein  wert1**n1 * wert2**n2 * ... * wertn**nn.
-    fehler_array soll eine Form haben wie  [relativer_fehler_wert1, ..., relativer_fehler_wertn]
-    mit  relativer_fehler_wert1 = n1 * fehler_wert1 / wert1,  wobei  n1  dessen Potenz ist.
     
-    Wenn produkt = 1 gewählt wird, erhält man den relativen Fehler.
+    Beispiel
+    --------
+    >>> with pap.ausgabe('still'):
+    ...     for messung in messungen:
+    ...         parameter, fehler = pap.odr_fit(pap.func.lin, *messung, [1, 0])
+    
+    >>> with open('protokoll.txt', 'w') as datei, pap.ausgabe(ziel = datei):
+    ...     pap.vergleichstabelle(werte, 'Vergleich')
     '''
     
-    relativer_fehler = np.linalg.norm(rel_fehler_array, axis = 0)
-    return np.abs(produkt) * relativer_fehler
+    
+    _ausgabe_prüfen(modus, ziel)
+    token = _ausgabe_block.set({'modus': modus, 'ziel': ziel})
+    try:
+        yield
+    finally:
+        _ausgabe_block.reset(token)
 
 
 
 
+def _ausgabe_prüfen(modus, ziel):
+    '''Löst einen ValueError aus, falls  modus  oder  ziel  ungültig sind.'''
+    
+    if not modus in AUSGABE_MODI:
+        raise ValueError(f'modus = {modus!r}, modus kann nur folgende Strings sein: {list(AUSGABE_MODI)}')
+    if ziel is not None and not hasattr(ziel, 'write'):
+        raise ValueError(f'ziel = {ziel!r} hat keine write()-Methode.')
 
 
-# Statistik
 
-def std(*args, **kwargs):
-    '''
-    Experimenteller Fehler des Einzelwertes
-    
-    Die Funktion ist identisch zu np.std() inkl. aller Argumente, 
-    außer dass ddof = 1 gesetzt wird wenn nicht spezifisch angegeben.
-    Wenn σ die Varianz einer Werteverteilung X mit N Werten ist, dann wird also im Normalfall berechnet
-    std = sqrt(σ(X) / (N - 1)).
-    '''
+
+def _ausgabe_jetzt():
+    '''Die gerade gültige Ausgabe-Einstellung {'modus', 'ziel'}: die des with pap.ausgabe()-Blocks, sonst die globale.'''
     
-    if not ('ddof' in kwargs):
-        kwargs['ddof'] = 1
-    return np.std(*args, **kwargs)
+    block = _ausgabe_block.get()
+    return block  if block is not None  else _ausgabe
 
 
 
 
-def mittel(*args, **kwargs):
-    '''
-    Mittelwert
-    
-    Die Funktion ist identisch zu np.mean() inkl. aller Argumente
-    und dient nur besseren Lesbarkeit inmitten von anderen pap-Funktionen.
-    '''
+def _printen():
+    '''Gibt an, ob überhaupt etwas ausgegeben wird (modus = 'print').'''
     
-    return np.mean(*args, **kwargs)
+    return _ausgabe_jetzt()['modus'] == 'print'
 
 
 
 
-def mittel_fehler(*args, **kwargs):
+def _ausgeben(zeilen):
     '''
-    Experimenteller Fehler des Mittelwertes
-    
-    Die Funktion berechnet std(X) / sqrt(N) von einer Werteverteilung X mit N Werten.
-    Dabei ist std() = pap.std() also der Experimentelle Fehler des Einzelwertes.
-    Somit lassen sich genau die gleichen Argumente wie in np.std() einsetzen.
+    Schreibt die Zeilen (ohne '\\n') mit einem einzigen  write()  in das eingestellte Ziel, genau so wie sie 
+    print() einzeln geprintet hätte. Tut nichts, falls nicht modus = 'print'.
     '''
     
-    
-    werte = args[0]
-    shape = np.shape(werte)
-    if shape == (0,):   # Verhindert Fehlermeldung falls werte == []
-        return np.nan
-    
-    if 'axis' in kwargs and kwargs['axis'] != None:   
-        # Zweite Bedingung im if-Satz nötig, wenn man explizit axis = None angibt.
-        achsen        = kwargs['axis']
-        shape_rest    = (shape[achsen]  if type(achsen) == int  
-                         else arr([shape[i] for i in achsen]))
-        anzahl_zahlen = np.prod(shape_rest)
-    else:
-        anzahl_zahlen = np.product(shape)
-    
-    
-    fehler_des_mittelwertes = std(*args, **kwargs) / np.sqrt(anzahl_zahlen)
-    return fehler_des_mittelwertes
+    if not _printen():
+        return
+    ziel = _ausgabe_jetzt()['ziel']
+    ziel = ziel  if ziel is not None  else sys.stdout
+    ziel.write('\n'.join(zeilen) + '\n')
 
 
 
 
-def fwhm(sigma):
+def _eingabefehler(*zeilen):
     '''
-    Halbwertsbreite (Full Width Half Mean):
-    FWHM = 2 sqrt(2 ln(2)) * σ
+    Meldet einen Eingabefehler: Bei modus = 'print' werden die Zeilen geprintet und None returned 
+    (damit man  return _eingabefehler(...)  schreiben kann), sonst wird ein ValueError ausgelöst.
     '''
     
-    return 2 * np.sqrt(2 * np.log(2)) * sigma
+    if _printen():
+        _ausgeben(zeilen)
+        return None
+    raise ValueError('\n'.join(zeilen).strip())
 
 
 
 
 
 
-# Ergebnisse anzeigen
+# Profil
 
-def _rundung_einzel(wert, präzision):
+PROFIL_VARIABLE = 'PAP_PROFIL'   # Umgebungsvariable, die das Profil schon beim Importieren einschaltet
+PROFIL_AUSNAHMEN = ('ausgabe_einstellen', 'ausgabe', 'profil_einstellen', 'profil', 'profil_statistik', 
+                    'profil_json', 'profil_zurücksetzen', 'cache_einstellen', 'cache', 'cache_leeren', 
+                    'backend_einstellen', 'backend')
+_profil = {'aktiv': False, 'statistik': {}, 'originale': {}}
+
+
+
+def profil_einstellen(aktiv = True):
     '''
-    Die Rundung mit einem Array von Nachkommastellen  (präzisionen)  funktioniert deshalb, da in rekursiven
-    for-Loops die Arrays in einzelne Elemente aufgebrochen werden, welche dann gerundet werden.
-    
-    
-    Argumente (sollten schon durch  _rundung()  passend gemacht worden sein.)
-    ---------
-    werte : np.ndarray (number_like), number_like
+    Schaltet das Profil ein oder aus. Solange es eingeschaltet ist, wird für jede öffentliche Funktion von pap 
+    (nicht die von pap.func und pap.diagnose) gezählt, wie oft sie aufgerufen wurde, wie lange sie insgesamt 
+    gebraucht hat und wie viele Elemente ihre Array-Argumente hatten. Für pap.odr_fit() kommen die Anzahl 
+    ODR-Iterationen und Funktionsauswertungen dazu. Die Ergebnisse gibt es mit pap.profil_statistik() und 
+    pap.profil_json().
     
-    präzisionen : np.ndarray (int), int
-    
-    
-    Output
-    ------
-    wert_gerundet : np.ndarray (number_like), number_like
-        Mit Pythons  round()  auf nächste gerade Ziffer gerundet (symmetrisches Runden).
-        Form und Elemente sonst gleich wie  werte.
-    '''
+    Beim Einschalten werden die Funktionen im Modul durch messende Hüllen ersetzt, beim Ausschalten wieder 
+    durch die Originale. Ausgeschaltet kostet das Profil also nichts. Die Zeiten schließen Aufrufe anderer 
+    pap-Funktionen mit ein (pap.resultat() enthält zB. die Zeit von pap.resultat_strings()), bei Generatoren 
+    wie pap.vergleichstabelle_zeilen() wird nur das Erstellen gemessen.
     
+    Mit der Umgebungsvariable  PAP_PROFIL=1  ist das Profil schon ab  import pap  eingeschaltet.
     
     
-    anzahl_dimensionen = np.ndim(wert)   # Entsprechend viele Rekursionen werden stattfinden.
+    Argumente
+    ---------
+    aktiv : bool, optional
     
-    # Eigentliche Rundung
-    if anzahl_dimensionen == 0:
-        wert_gerundet = round(wert, präzision)
     
-    # Aufrufen von  _rundung_einzel()  um in einem for-Loop die Elemente von werte abzuarbeiten.
-    elif anzahl_dimensionen > 0:
-        wert_form = np.shape(wert)
-        wert_gerundet = np.zeros(wert_form)
-        for i in range(wert_form[0]):
-            wert_gerundet[i] = _rundung_einzel(wert[i], präzision[i])
-            
-    return wert_gerundet   # Die gesammelten gerundeten Werte werden als Ergebnis zur vorigen Funktion
-                           # zurückgeschickt.
+    Beispiel
+    --------
+    >>> pap.profil_einstellen()
+    >>> parameter, fehler = pap.odr_fit(pap.func.lin, messpunkte, messfehler, [1, 0], print_resultate = False)
+    >>> pap.profil_statistik()['odr_fit']
+    {'aufrufe': 1, 'zeit': 0.00021, 'elemente': 42, 'odr_iterationen': 5, 'odr_auswertungen': 28}
+    >>> pap.profil_einstellen(False)
+    '''
     
     
+    if aktiv == _profil['aktiv']:
+        return
     
+    modul = globals()
+    if aktiv:
+        for name, funktion in list(modul.items()):
+            if (name.startswith('_') or name in PROFIL_AUSNAHMEN or not callable(funktion) 
+                    or getattr(funktion, '__module__', None) != __name__ or isinstance(funktion, type)):
+                continue
+            _profil['originale'][name] = funktion
+            modul[name] = _profil_hülle(name, funktion)
+    else:
+        modul.update(_profil['originale'])
+        _profil['originale'].clear()
+    _profil['aktiv'] = bool(aktiv)
+
 
-def _rundung(werte, präzisionen):
+
+
+@contextlib.contextmanager
+def profil(aktiv = True):
     '''
-    Rundet  werte  auf ihre jeweilige Anzahl Nachkommastellen  (präzisionen).
-    Im Gegensatz zu  np.round()  kann diese Funktion  werte  mit ganzen Arrays von Nachkommastellen runden.
-    Für Details zum Rundungsprozess siehe  _rundung_einzel().
-    
+    Wie pap.profil_einstellen(), aber nur innerhalb eines with-Blocks. Die Statistik bleibt danach erhalten.
     
-    Argumente
-    ---------
-    werte : np.ndarray (number_like), number_like
-        Kann beliebige Form haben und auch Einzelwert sein.
     
-    präzisionen : np.ndarray (int), int
-        Muss gleiche Form wie  werte  haben oder int sein.
+    Beispiel
+    --------
+    >>> with pap.profil():
+    ...     for messung in messungen:
+    ...         pap.odr_fit(pap.func.lin, *messung, [1, 0], print_resultate = False)
+    >>> pap.profil_json('profil.json')
+    '''
     
     
-    Output
-    ------
-    "wert_gerundet" : np.ndarray (number_like), number_like
-        Mit Pythons  round()  auf nächste gerade Ziffer gerundet (symmetrisches Runden).
-        Form und Elemente sonst gleich wie  werte.
-    '''
+    vorher = _profil['aktiv']
+    profil_einstellen(aktiv)
+    try:
+        yield
+    finally:
+        profil_einstellen(vorher)
+
+
+
+
+def _profil_hülle(name, funktion):
+    '''Hülle um  funktion,  die Aufrufe, Zeit und Elemente in  _profil['statistik'][name]  zählt.'''
     
+    @functools.wraps(funktion)
+    def hülle(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return funktion(*args, **kwargs)
+        finally:
+            zeit      = time.perf_counter() - start
+            statistik = _profil['statistik'].setdefault(name, {'aufrufe': 0, 'zeit': 0.0, 'elemente': 0})
+            statistik['aufrufe']  += 1
+            statistik['zeit']     += zeit
+            statistik['elemente'] += sum(_profil_elemente(arg) for arg in (*args, *kwargs.values()))
     
+    return hülle
+
+
+
+
+def _profil_elemente(argument):
+    '''Anzahl Elemente eines Arrays, Länge einer Liste oder eines Tupels, sonst 0.'''
     
-    # Überprüfung und Anpassung der Argumente
-    präzisionen = arr(präzisionen)  # Falls Einzelwert
-    if präzisionen.dtype != int:
-        print('präzisionen darf nur Integers enthalten!')
-        print('Die Anzahl Stellen, auf die gerundet wird, kann nur ganzzahlig sein.')
-    
-    if np.shape(werte) != np.shape(präzisionen):
-        if np.ndim(präzisionen) == 0:   # Falls  präzisionen  Einzelwert, dann wird
-                                        # daraus ein Array derselben Form wie  werte  gemacht.
-            präzisionen = np.full(np.shape(werte), präzisionen)
-        else:
-            print('werte und präzisionen müssen die gleiche np.shape haben!')
-            print('np.shape(werte) =', np.shape(werte))
-            print('np.shape(präzisionen) =', np.shape(präzisionen))
+    if isinstance(argument, np.ndarray):
+        return argument.size
+    if isinstance(argument, (list, tuple)):
+        return len(argument)
+    return 0
+
+
+
+
+def _profil_zählen(name, **zähler):
+    '''Addiert zusätzliche Zähler (zB. ODR-Iterationen) zur Statistik von  name.  Nur bei aktivem Profil aufrufen.'''
     
+    statistik = _profil['statistik'].setdefault(name, {'aufrufe': 0, 'zeit': 0.0, 'elemente': 0})
+    for zähler_name, wert in zähler.items():
+        statistik[zähler_name] = statistik.get(zähler_name, 0) + wert
+
+
+
+
+def profil_statistik():
+    '''
+    Returned die bisher gesammelte Statistik des Profils als dict (Kopie):
+    {funktionsname: {'aufrufe': int, 'zeit': float (Sekunden), 'elemente': int, ...}, ...}
+    '''
     
-    # Eigentlicher Rundungsprozess
-    return _rundung_einzel(werte, präzisionen)
+    return {name: dict(statistik) for name, statistik in _profil['statistik'].items()}
 
 
 
 
-def _größenordnung(zahlen, art = int):
+def profil_json(datei = None):
     '''
-    Bestimmt elementweise die Größenordnungen eines Arrays von Zahlen und gibt sie als int- oder float-Array 
-    zurück. 
-    0 bekommt die Größenordnung 0.
+    Exportiert die Statistik des Profils als JSON, sortiert nach Gesamtzeit.
     
     
     Argumente
     ---------
-    zahlen : np.ndarray (number_like)
-        
-    art : type, optional
-        Darf nur sein:
-        int   - größenordnungen-Array wird aus np.int64-Zahlen bestehen, zB. 0.048 -> -2
-        
-        float - größenordnungen-Array wird aus np.float64-Zahlen bestehen. zB. 0.048 -> -2.0
-        
-        
-    Output
-    ------
-    größenordnungen : np.ndarray  (np.int64 oder np.float64)
-        np.shape(größenordnungen) = np.shape(zahlen)
+    datei : str, file-like, optional
+        Dateiname oder alles mit einer  write()-Methode. Ohne  datei  wird der Text returned.
     '''
     
     
+    statistik = dict(sorted(profil_statistik().items(), key = lambda eintrag: -eintrag[1]['zeit']))
+    text      = json.dumps(statistik, indent = 1, ensure_ascii = False)
     
-    if art == int:
-        art = 'int64'
-    elif art == float:
-        art = 'float64'
-    
-    # Nullen werden kompatibel gemacht.
-    einsen            = np.ones(np.shape(zahlen))   # 1 hat Größenordnung 0 (welches auch 0 hier haben soll).
-    zahlen_kompatibel = np.where(zahlen == 0, einsen, zahlen)
+    if datei is None:
+        return text
+    if isinstance(datei, str):
+        with open(datei, 'w', encoding = 'utf-8') as datei_offen:
+            datei_offen.write(text)
+    else:
+        datei.write(text)
+
+
+
+
+def profil_zurücksetzen():
+    '''Löscht die bisher gesammelte Statistik des Profils.'''
     
-    return arr(np.floor(np.log10(np.abs(zahlen_kompatibel))), dtype = art)
+    _profil['statistik'].clear()
+
+
 
 
 
 
-def _erste_ziffer(zahlen, art = float):
+# Fit-Cache
+
+CACHE_MAX_GRÖSSE       = 2**28   # Bytes, die der Cache-Ordner standardmäßig höchstens belegt (256 MiB)
+CACHE_SPEICHER_ANZAHL  = 256     # So viele zuletzt benutzte Fits werden zusätzlich im Arbeitsspeicher gehalten.
+CACHE_FORMAT           = 1       # Erhöhen, wenn sich der Inhalt der .npz-Dateien ändert.
+_cache = {'ordner': None, 'max_größe': CACHE_MAX_GRÖSSE, 'speicher': {}}
+
+
+
+def cache_einstellen(ordner = None, max_größe = CACHE_MAX_GRÖSSE):
     '''
-    Bestimmt elementweise die erste Ziffer eines Arrays von Zahlen wenn art = int, aber
-    wenn art = float, wird die Zahl nur auf Größenordnung null gebracht.
+    Schaltet den Cache für pap.odr_fit() ein (oder mit  ordner = None  aus). Ein Fit mit derselben Funktion, 
+    denselben Messpunkten, Messfehlern, Startparametern und demselben Funktionstyp wird dann nicht neu 
+    gerechnet, sondern aus  ordner  geladen, auch in einem neuen Python-Prozess. Jedes Ergebnis (Parameter, 
+    Fehler, Kovarianz, χ^2, Residuen und die Fit-Zusammenfassung) liegt als eigene .npz-Datei im Ordner, 
+    benannt nach dem Hash der Eingaben. Die zuletzt benutzten Ergebnisse werden außerdem im Arbeitsspeicher 
+    gehalten, sodass ein Treffer nur Mikrosekunden dauert.
+    
+    Die Funktion wird über Modul, Name, Bytecode (inklusive Konstanten), Standardwerte und die Inhalte ihrer 
+    Closures und der von ihr benutzten globalen Variablen erkannt, aufgerufene Funktionen genauso. Lässt sich 
+    etwas davon nicht eindeutig erkennen (zB. beliebige Objekte), wird für diese Funktion nicht gecacht.
+    Module (zB. np) werden nur über ihren Namen erkannt.
     
     
     Argumente
     ---------
-    zahlen : np.ndarray (number_like)
+    ordner : str, optional
+        Wird bei Bedarf erstellt.
     
-    art : type, optional
-        Darf nur sein:
-        int   - ziffern-Array wird aus np.int64-Zahlen bestehen, zB. 239.78 -> 2
-        
-        float - ziffern-Array wird aus np.float64-Zahlen bestehen, zB. 239.78 -> 2.3978 
-        
+    max_größe : int, optional
+        Wird der Ordner nach dem Speichern größer (in Bytes), werden die am längsten nicht benutzten 
+        Ergebnisse gelöscht.
     
-    Output
-    ------
-    ziffern : np.ndarray  (np.int64 oder np.float64)
-        np.shape(ziffern) = np.shape(zahlen)
+    
+    Beispiel
+    --------
+    >>> pap.cache_einstellen('.pap_cache')
+    >>> parameter, fehler = pap.odr_fit(pap.func.lin, messpunkte, messfehler, [1, 0])   # Rechnet und speichert
+    >>> parameter, fehler = pap.odr_fit(pap.func.lin, messpunkte, messfehler, [1, 0])   # Aus dem Cache
     '''
     
     
+    if ordner is not None:
+        os.makedirs(ordner, exist_ok = True)
+    if ordner != _cache['ordner']:
+        _cache['speicher'].clear()
+    _cache['ordner']    = ordner
+    _cache['max_größe'] = max_größe
+
+
+
+
+@contextlib.contextmanager
+def cache(ordner, max_größe = CACHE_MAX_GRÖSSE):
+    '''
+    Wie pap.cache_einstellen(), aber nur innerhalb eines with-Blocks. Danach gilt wieder die vorherige Einstellung.
     
-    größenordnungen = _größenordnung(zahlen, art = float)
-    ziffern         = np.abs(zahlen / 10**größenordnungen)
     
-    if art == float:
-        return ziffern
-    if art == int:
-        return np.int_(ziffern)
+    Beispiel
+    --------
+    >>> with pap.cache('.pap_cache'):
+    ...     parameter, fehler = pap.odr_fit(pap.func.lin, messpunkte, messfehler, [1, 0])
+    '''
     
     
+    vorher = (_cache['ordner'], _cache['max_größe'])
+    cache_einstellen(ordner, max_größe)
+    try:
+        yield
+    finally:
+        cache_einstellen(*vorher)
+
+
+
+
+def cache_leeren():
+    '''Löscht alle gespeicherten Fit-Ergebnisse im eingestellten Cache-Ordner und im Arbeitsspeicher.'''
     
+    _cache['speicher'].clear()
+    if _cache['ordner'] is None:
+        return
+    for eintrag in os.scandir(_cache['ordner']):
+        if eintrag.name.endswith('.npz'):
+            os.remove(eintrag.path)
 
-def _nachkommastelle(zahlen, sig_stellen = 1, sig_grenze = 1.0):
+
+
+
+def _cache_schlüssel(funktion, funktionstyp, *arrays):
+    '''
+    SHA-256-Hash (hex) der Identität von  funktion,  des  funktionstyp  und des Inhalts (und der shape) der  arrays,
+    oder None, falls sich  funktion  nicht eindeutig erkennen lässt.
     '''
-    Berechnet elementweise die Anzahl der Nachkommastellen, auf die eine Zahl gerundet werden soll, 
-    abhängig davon wie viele signifikante Stellen zugelassen werden und davon wo die Signifikanz-Grenze liegt.
-    Mehr Details unter "Berechnung".
-    
     
-    Argumente
-    ---------
-    zahlen : np.ndarray (number_like)
-    
-    sig_stellen : int, optional
-        Nur Zahlen >= 1 sinnvoll
+    identität = _funktion_identität(funktion)
+    if identität is None:
+        return None
+    prüfsumme = hashlib.sha256(f'{CACHE_FORMAT}|{funktionstyp}|'.encode())
+    prüfsumme.update(identität)
+    for array in arrays:
+        array = np.ascontiguousarray(array, dtype = np.float64)
+        prüfsumme.update(repr(array.shape).encode())
+        prüfsumme.update(array.tobytes())
+    return prüfsumme.hexdigest()
+
+
+
+
+def _funktion_identität(funktion, gesehen = None):
+    '''
+    Bytes, die eine Funktion über Modul, Name, Bytecode, Konstanten, Standardwerte und die Inhalte ihrer 
+    Closures und der benutzten globalen Variablen kennzeichnen (rekursiv, siehe  _wert_identität()).
+    None, falls sich etwas davon nicht eindeutig als Bytes darstellen lässt.
+    '''
     
-    sig_grenze : int, float, optional
-        Nur Zahlen >= 1 und < 10 sinnvoll
+    if isinstance(funktion, (types.BuiltinFunctionType, np.ufunc)):   # Über den Namen eindeutig
+        return f'{getattr(funktion, "__module__", "")}.{funktion.__name__}'.encode()
+    if not isinstance(funktion, types.FunctionType):   # zB. Methoden oder Objekte mit __call__()
+        return None
     
+    gesehen = set()  if gesehen is None  else gesehen
+    if id(funktion) in gesehen:   # Rekursion
+        return f'rekursiv:{funktion.__qualname__}'.encode()
+    gesehen.add(id(funktion))
     
-    Output
-    ------
-    nachkommastellen : np.ndarray (np.float64)
-        np.shape(nachkommastellen) = np.shape(zahlen)
+    code  = funktion.__code__
+    zellen = []
+    for zelle in funktion.__closure__ or ():
+        try:
+            zellen.append(zelle.cell_contents)
+        except ValueError:   # Noch leere Zelle
+            zellen.append('<leer>')
+    globale = {name: funktion.__globals__[name] for name in sorted(_code_namen(code)) 
+               if name in funktion.__globals__}
     
+    teile = [f'{funktion.__module__}.{funktion.__qualname__}'.encode(), 
+             _wert_identität(code, gesehen), _wert_identität(funktion.__defaults__, gesehen), 
+             _wert_identität(funktion.__kwdefaults__, gesehen), _wert_identität(zellen, gesehen), 
+             _wert_identität(globale, gesehen)]
+    if None in teile:
+        return None
+    return b'|'.join(teile)
+
+
+
+
+def _code_namen(code):
+    '''Alle Namen (co_names) eines Code-Objekts und der darin definierten Funktionen.'''
     
-    Berechnung
-    ----------
-    Rundet man eine Zahl wissenschaftlich, dann will man sie auf eine bestimmte Anzahl signifikanter Stellen 
-    runden, zB. bei Fehlerwerten auf oft nur eine: 1.389342 -> 1.
-    Stur auf eine signifikante Stelle zu runden wird aber bei Zahlen mit kleinen ersten Ziffern problematisch
-    wie in oberem Beispiel. Der gerundete Wert könnte zwischen 0.5 und 1.5 liegen, wodurch man einen unnötig 
-    großen Darstellungsfehler introduziert.
-    Um dieses Problem zu beheben, wurde eine Signifikanzgrenze eingeführt. Ist die erste Ziffer des zu 
-    rundenden Wertes kleiner als diese Grenze, wird der Wert mit einer signifikanten Stelle mehr gerundet.
+    namen = set(code.co_names)
+    for konstante in code.co_consts:
+        if isinstance(konstante, types.CodeType):
+            namen |= _code_namen(konstante)
+    return namen
+
+
+
+
+def _wert_identität(wert, gesehen):
+    '''
+    Bytes, die  wert  für den Cache-Schlüssel eindeutig und in jedem Prozess gleich kennzeichnen, oder None.
+    Zahlen, Strings, numerische Arrays, Container davon, Code, Funktionen, Module und Klassen sind möglich.
+    '''
     
-    Beispiel 1: Sei die Signifikanzgrenze sig_grenze = 4 (Darstellungsfehler max. 1/8)
-                und die normale Anzahl signifikanter Stellen sig_stellen = 1.
-    0.002458 -> 0.0025 (nachkommastelle =  4)
-    828.003  -> 800    (nachkommastelle = -2)
-    4.001    -> 4      (nachkommastelle =  0)
-    3.999    -> 4.0    (nachkommastelle =  1)
-    3.949    -> 3.9    (nachkommastelle =  1)
-    1.034    -> 1.0    (nachkommastelle =  1)
-    0.928    -> 0.9    (nachkommastelle =  1)
-    0.434    -> 0.4    (nachkommastelle =  1)
-    0.394    -> 0.39   (nachkommastelle =  2)
+    if wert is None or isinstance(wert, (bool, int, float, complex, str, bytes, np.generic)):
+        if isinstance(wert, np.generic) and wert.dtype.hasobject:
+            return None
+        return f'{type(wert).__name__}:{wert!r}'.encode()
     
-    Beispiel 2: Will man bei oberen Beispielen vermeiden, dass sowohl 4 als auch 4.0 auftauchen,
-    kann man sig_grenze = 3.95 wählen. Dann ergibt sich
-    4.000 -> 4
-    3.999 -> 4
-    3.950 -> 4
-    3.949 -> 3.9
-    '''
+    if isinstance(wert, np.ndarray):
+        if wert.dtype.hasobject:
+            return None
+        return f'ndarray:{wert.dtype.str}:{wert.shape}:'.encode() + np.ascontiguousarray(wert).tobytes()
     
+    if isinstance(wert, (tuple, list, set, frozenset, dict)):
+        if isinstance(wert, dict):
+            elemente = [_wert_identität(paar, gesehen) for paar in wert.items()]
+        else:
+            elemente = [_wert_identität(element, gesehen) for element in wert]
+        if None in elemente:
+            return None
+        if not isinstance(wert, (tuple, list)):   # Reihenfolge hängt vom Hash ab, der sich pro Prozess ändert.
+            elemente.sort()
+        return f'{type(wert).__name__}:{len(elemente)}('.encode() + b','.join(elemente) + b')'
     
-    über_der_grenze      = _erste_ziffer(zahlen) >= sig_grenze
-    sig_stellen_normal   = np.full(np.shape(zahlen), sig_stellen)
-    signifikante_stellen = np.where(über_der_grenze, sig_stellen_normal, sig_stellen_normal + 1)
-    größenordnungen      = _größenordnung(zahlen, art = float)
+    if isinstance(wert, types.CodeType):   # repr() enthält die Speicheradresse, deshalb einzeln.
+        konstanten = _wert_identität(wert.co_consts, gesehen)
+        if konstanten is None:
+            return None
+        return b'code:' + wert.co_code + b'|' + konstanten + b'|' + repr(wert.co_names).encode()
     
-    nachkommastellen     = -größenordnungen + signifikante_stellen - 1
-    return nachkommastellen
+    if isinstance(wert, types.ModuleType):
+        return f'modul:{wert.__name__}'.encode()
+    if isinstance(wert, type):
+        return f'klasse:{wert.__module__}.{wert.__qualname__}'.encode()
+    if callable(wert):
+        return _funktion_identität(wert, gesehen)
+    return None
 
 
 
 
-def _negativ_wird_null(array):
+def _cache_laden(schlüssel):
+    '''
+    Lädt ein Fit-Ergebnis aus dem Arbeitsspeicher oder dem Cache-Ordner. 
+    Output: Objekt mit denselben Attributen wie  scipy.odr.Output,  die odr_fit() braucht, oder None.
     '''
-    "Rampenfunktion": Die Werte von array, die negativ sind, werden durch 0 ersetzt.
     
+    datei    = os.path.join(_cache['ordner'], schlüssel + '.npz')
+    ergebnis = _cache['speicher'].get(schlüssel)
+    if ergebnis is None:
+        try:
+            with np.load(datei, allow_pickle = False) as inhalt:
+                ergebnis = _cache_ergebnis({name: inhalt[name] for name in inhalt.files})
+        except (OSError, ValueError, KeyError):   # Fehlt, gerade gelöscht oder unvollständig
+            return None
+    _im_speicher(schlüssel, ergebnis)
     
-    Argument
-    --------
-    array : np.ndarray (number_like)
-    '''
+    try:
+        os.utime(datei)   # Änderungszeit = letzte Benutzung, für das Löschen der ältesten Ergebnisse
+    except OSError:
+        pass
+    # Kopien, damit Änderungen an den returnten Arrays den Cache nicht verändern
+    return types.SimpleNamespace(**{name: wert.copy()  if isinstance(wert, np.ndarray)  else wert 
+                                    for name, wert in vars(ergebnis).items()})
+
+
+
+
+def _cache_ergebnis(inhalt):
+    '''Macht aus dem Inhalt einer Cache-Datei ein Objekt mit den Attributen und  pprint()  von scipy.odr.Output.'''
+    
+    ergebnis = types.SimpleNamespace(**inhalt)
+    ergebnis.sum_square = float(ergebnis.sum_square)
+    text = str(ergebnis.pprint_text)
+    ergebnis.pprint = lambda: print(text)
+    return ergebnis
+
+
+
+
+def _cache_speichern(schlüssel, ergebnis):
+    '''Speichert ein Fit-Ergebnis (scipy.odr.Output) im Cache-Ordner und im Arbeitsspeicher.'''
+    
+    with contextlib.redirect_stdout(io.StringIO()) as pprint_text:
+        ergebnis.pprint()
+    inhalt = {'beta': ergebnis.beta, 'sd_beta': ergebnis.sd_beta, 'cov_beta': ergebnis.cov_beta, 
+              'sum_square': ergebnis.sum_square, 'delta': ergebnis.delta, 'eps': ergebnis.eps, 
+              'iwork': ergebnis.iwork, 'pprint_text': pprint_text.getvalue().removesuffix('\n')}
     
+    # Erst in eine temporäre Datei, damit parallele Prozesse nie eine halbe Datei lesen.
+    datei     = os.path.join(_cache['ordner'], schlüssel + '.npz')
+    temporär  = f'{datei}.{os.getpid()}.tmp'
+    with open(temporär, 'wb') as datei_offen:
+        np.savez_compressed(datei_offen, **inhalt)
+    os.replace(temporär, datei)
     
-    nullen = np.full(np.shape(array), 0)
-    return np.where(array > 0, array, nullen)
+    _im_speicher(schlüssel, _cache_ergebnis(inhalt))
+    _cache_aufräumen()
+
 
 
+
+def _im_speicher(schlüssel, ergebnis):
+    '''Legt ein Ergebnis als zuletzt benutztes in den Arbeitsspeicher, höchstens CACHE_SPEICHER_ANZAHL bleiben.'''
     
+    speicher = _cache['speicher']
+    speicher.pop(schlüssel, None)
+    speicher[schlüssel] = ergebnis   # Ans Ende, also zuletzt benutzt
+    while len(speicher) > CACHE_SPEICHER_ANZAHL:
+        del speicher[next(iter(speicher))]   # dict behält die Reihenfolge, vorne liegt das älteste
+
+
+
+
+def _cache_aufräumen():
+    '''Löscht die am längsten nicht benutzten Ergebnisse, bis der Cache-Ordner höchstens max_größe belegt.'''
     
-def _istbool(wert, bool_wert:bool):
-    '''
-    Überprüft ob wert wirklich bool_wert (True oder False) ist und nicht nur 1 oder 0.
-    '''
+    einträge = []
+    for eintrag in os.scandir(_cache['ordner']):
+        if eintrag.name.endswith('.npz'):
+            try:
+                info = eintrag.stat()
+            except OSError:
+                continue
+            einträge.append((info.st_mtime, info.st_size, eintrag.path))
     
-    return (wert == bool_wert and isinstance(wert, bool))
+    größe = sum(eintrag[1] for eintrag in einträge)
+    for _, dateigröße, pfad in sorted(einträge):
+        if größe <= _cache['max_größe']:
+            break
+        try:
+            os.remove(pfad)
+        except OSError:
+            pass
+        größe -= dateigröße
 
 
 
-def _listen_transponieren(listen_matrix):
+
+
+
+# Backend
+
+BACKENDS         = ('numpy', 'numba')
+BACKEND_VARIABLE = 'PAP_BACKEND'   # Umgebungsvariable, die das Backend schon beim Importieren einstellt
+_backend = {'name': 'numpy', 'kerne': None}   # kerne: das Modul pap._kerne, wenn mit Numba gerechnet wird
+
+
+
+def backend_einstellen(backend = 'numba'):
     '''
-    Transponiert eine Liste, die eine Form wie ein 2D np.ndarray hat.
+    Legt fest, womit die elementweisen Hilfsfunktionen der Darstellung (Rundung, Nachkommastellen, erste 
+    Ziffer) und die Abweichungen von pap.vergleich() bzw. pap.vergleichstabelle() rechnen. Mit Numba laufen 
+    sie als JIT-kompilierte Schleifen ohne Zwischen-Arrays (siehe pap._kerne), was sich bei großen Tabellen 
+    lohnt. Beide Backends liefern bitgleiche Ergebnisse.
+    
+    Der erste Aufruf jedes Kerns kompiliert ihn (einmalig etwa eine Sekunde, danach aus __pycache__).
     
     
     Argumente
     ---------
-    listen_matrix : list
-        Muss aus einer Liste von N Listen, welche alle M Elemente haben, bestehen.
-        Also "shape"(listen_matrix) = (N, M).
+    backend : str, optional
+        'numba' - (Standard) JIT-kompilierte Kerne, falls Numba installiert ist. Sonst bleibt es mit einer 
+                  Warnung bei 'numpy'.
+        'numpy' - Die vektorisierten NumPy-Versionen, so wie ohne Einstellung.
     
     
     Output
     ------
-    tranxponierte_matrix : list
-        "shape"(transponierte_maxtrix) = (M, N)
+    backend : str
+        Das tatsächlich eingestellte Backend.
+    
+    
+    Beispiel
+    --------
+    >>> pap.backend_einstellen('numba')
+    'numba'
+    >>> pap.vergleichstabelle_schreiben('vergleich.txt', werte, 'Vergleich', ausrichtung = 'liste')
     '''
     
     
+    if not backend in BACKENDS:
+        raise ValueError(f'backend = {backend!r}, backend kann nur folgende Strings sein: {list(BACKENDS)}')
     
-    transponierte_matrix = []
-    for i in range(len(listen_matrix[0])):
-        zeile = []
-        for j in range(len(listen_matrix)):
-            zeile.append(listen_matrix[j][i])
-        transponierte_matrix.append(zeile)
+    kerne = None
+    if backend == 'numba':
+        from pap import _kerne
+        if _kerne.numba is None:
+            warnings.warn('Numba ist nicht installiert, pap rechnet weiter mit NumPy.', stacklevel = 2)
+            backend = 'numpy'
+        else:
+            kerne = _kerne
     
-    return transponierte_matrix
+    _backend['name']  = backend
+    _backend['kerne'] = kerne
+    return backend
 
 
 
 
-def _füllen(string, index = 0,  menge = 1, füllzeichen = ' '):
+@contextlib.contextmanager
+def backend(backend = 'numba'):
     '''
-    fügt eine bestimmte Menge an Füllzeichen an eine bestimmte Position eines Strings.
-    Ähnlich zu Pythons .format()-Methode, wo der String eine festgelegte Breite haben soll und mit entsprechend
-    vielen Füllzeichen aufgefüllt wird. Hier kann man stattdessen die Anzahl der Füllzeichen festlegen und auch
-    die genaue Einsetz-Position.
-    
-    
-    Argumente
-    ---------
-    string : str
-    
-    index : int, str, optional
-        Position im string, wo die füllzeichen eingefügt werden sollen
-        Wenn type(index) == str, dann darf index nur sein:
-        index = 'links'    (= 0) -> füllzeichen ganz links einfügen
-        
-        index = 'rechts'   (= len(string)) -> füllzeichen ganz rechts einfügen
+    Wie pap.backend_einstellen(), aber nur innerhalb eines with-Blocks. Danach gilt wieder die vorherige Einstellung.
     
-    menge : int, optional
-        Anzahl gewünschter füllzeichen
     
-    füllzeichen : str, optional
+    Beispiel
+    --------
+    >>> with pap.backend('numba'):
+    ...     ergebnis = pap.vergleich(werte)
+    '''
     
     
-    Output
-    ------
-    string_neu : str
+    vorher = dict(_backend)
+    backend_einstellen(backend)
+    try:
+        yield
+    finally:
+        _backend.update(vorher)
+
+
+
+
+
+        
+        
+# Fehlerrechnung
+
+def summen_fehler(fehler_array):
     '''
+    Quadratische Addition der Fehler einer Summe
     
+    Die Form dieser Summe soll sein  wert1 + wert2 + ... + wertn.
+    fehler_array soll eine Form haben wie  [fehler_wert1, ..., fehler_wertn].
+    '''
     
-    if index == 'rechts':
-        index = len(string)
-    elif index == 'links':
-        index = 0
-        
-    string_neu = string[:index] + füllzeichen * menge + string[index:]
-    return string_neu
+    return np.linalg.norm(fehler_array, axis = 0)
 
 
 
 
-def _entfernen(string, index, länge = 1):
+def produkt_fehler(produkt, rel_fehler_array):
     '''
-    entfernt eine bestimmte Anzahl (länge) Zeichen von einem String ab einem bestimmten Index.
+    Quadratische Addition der relativen Fehler eines Produktes (optional inkl. Potenzen)
     
+    Die Form dieses Produktes soll sein  wert1**n1 * wert2**n2 * ... * wertn**nn.
+    fehler_array soll eine Form haben wie  [relativer_fehler_wert1, ..., relativer_fehler_wertn]
+    mit  relativer_fehler_wert1 = n1 * fehler_wert1 / wert1,  wobei  n1  dessen Potenz ist.
     
-    Argumente
-    ---------
-    string : str
+    Wenn produkt = 1 gewählt wird, erhält man den relativen Fehler.
+    '''
     
-    index : int, optional
-        Nur index >= 0 sinnvoll.
+    relativer_fehler = np.linalg.norm(rel_fehler_array, axis = 0)
+    return np.abs(produkt) * relativer_fehler
 
-    länge : int, optional
-        Nur länge >= 0 sinnvoll.
-        
-    
-    Output
-    ------
-    string_output : str
+
+
+
+
+
+# Statistik
+
+def _anzahl_workers(workers):
+    '''
+    Übersetzt das  workers-Argument der Statistik-Funktionen in eine Anzahl Threads.
+    workers = -1 (oder eine andere Zahl < 1) bedeutet: so viele Threads wie CPU-Kerne.
     '''
     
+    if workers is None or workers < 1:
+        return os.cpu_count() or 1
+    return int(workers)
+
+
+
+
+def _momente_block(block, achse):
+    '''
+    Berechnet die Teilmomente eines Blocks von Werten entlang  achse:
+    Anzahl n, Mittelwert und Summe der quadrierten Abweichungen vom Mittelwert (M2).
+    Wird in einem Thread ausgeführt, numpy gibt dabei den GIL frei.
+    '''
     
-    return string[:index] + string[(index + länge):]
+    n          = block.size if achse is None else block.shape[achse]
+    mittelwert = np.mean(block, axis = achse, keepdims = True)
+    m2         = np.sum((block - mittelwert)**2, axis = achse, keepdims = True)
+    return n, mittelwert, m2
 
 
 
 
-def _zentrieren_rechts(string, länge_gewünscht, füllzeichen = ' '):
+def _std_parallel(werte, achse, ddof, workers):
+    '''
+    Experimenteller Fehler des Einzelwertes, berechnet auf mehreren Threads.
+    
+    werte  wird entlang  achse  (bzw. der ersten Achse bei achse = None) in Blöcke aufgeteilt, deren Teilmomente 
+    parallel berechnet und danach exakt zusammengeführt werden (paarweise Formel von Chan et al.):
+    n  = Σ n_i
+    μ  = Σ n_i μ_i / n
+    M2 = Σ M2_i + Σ n_i (μ_i - μ)^2
+    std = sqrt(M2 / (n - ddof))
     '''
-    arbeitet so wie '{:^{width}'.format(string, width = länge_gewünscht), mit dem Unterschied dass .format bei 
-    einer ungeraden Anzahl Füllzeichen, den string ein bisschen nach links anordnet:    'Hi' -> ' Hi  '
-    Diese Funktion ordnet in einem solchen Fall den string ein bisschen nach rechts an: 'Hi' -> '  Hi '
-    Ist die Anzahl Füllzeichen gerade, benehmen sich beide Funktionen gleich:           'Hi' -> '  Hi  '
     
-    Argumente
-    ---------
-    string : str
     
-    länge_gewunscht : int
+    if achse is None and werte.flags.c_contiguous:
+        werte = werte.reshape(-1)   # View, damit auch bei kurzer erster Achse genug Blöcke entstehen.
+    teil_achse    = 0 if achse is None else achse
+    anzahl_blöcke = min(4 * workers, werte.shape[teil_achse])   # Mehr Blöcke als Threads für gleichmäßige Last
+    blöcke        = np.array_split(werte, anzahl_blöcke, axis = teil_achse)   # Views, keine Kopien
     
-    füllzeichen : str, optional
+    with ThreadPoolExecutor(max_workers = workers) as pool:
+        momente = list(pool.map(lambda block: _momente_block(block, achse), blöcke))
     
+    anzahlen    = arr([n for n, _, _ in momente], dtype = np.float64)
+    mittelwerte = [mittelwert for _, mittelwert, _ in momente]
+    n           = np.sum(anzahlen)
+    mittelwert  = sum(n_i * mittelwert_i for n_i, mittelwert_i in zip(anzahlen, mittelwerte)) / n
+    m2          = sum(m2_i for _, _, m2_i in momente)
+    m2          = m2 + sum(n_i * (mittelwert_i - mittelwert)**2 for n_i, mittelwert_i in zip(anzahlen, mittelwerte))
     
-    Output
-    ------
-    string_zentriert : str
+    ergebnis = np.sqrt(m2 / (n - ddof))
+    if werte.dtype.kind == 'f':   # Wie bei np.std() behalten floats ihren dtype, alles andere wird np.float64.
+        ergebnis = ergebnis.astype(werte.dtype, copy = False)
+    if achse is None:
+        return ergebnis.reshape(())[()]
+    return np.squeeze(ergebnis, axis = achse)
+
+
+
+
+def std(*args, workers = 1, **kwargs):
     '''
+    Experimenteller Fehler des Einzelwertes
     
+    Die Funktion ist identisch zu np.std() inkl. aller Argumente, 
+    außer dass ddof = 1 gesetzt wird wenn nicht spezifisch angegeben.
+    Wenn σ die Varianz einer Werteverteilung X mit N Werten ist, dann wird also im Normalfall berechnet
+    std = sqrt(σ(X) / (N - 1)).
     
-    länge_string = len(string)
-    if länge_gewünscht <= länge_string:
-        return string
-    else:
-        füll_länge        = länge_gewünscht - länge_string
-        füll_länge_links  = int(np.ceil(füll_länge / 2))
-        füll_länge_rechts = int(np.floor(füll_länge / 2))
-        string_zentriert  = füllzeichen * füll_länge_links + string + füllzeichen * füll_länge_rechts
-        return string_zentriert
+    Mit  workers > 1  (oder workers = -1 für alle CPU-Kerne) werden sehr große Arrays in Blöcke aufgeteilt und 
+    auf mehreren Threads berechnet. Für kleine Arrays (< PARALLEL_SCHWELLE Elemente) oder Argumente, die 
+    dabei nicht unterstützt werden (zB. out, where, dtype), wird einfach np.std() benutzt.
+    '''
     
+    if not ('ddof' in kwargs):
+        kwargs['ddof'] = 1
     
+    if workers != 1 and len(args) == 1 and set(kwargs) <= {'axis', 'ddof'}:
+        werte = np.asarray(args[0])
+        achse = kwargs.get('axis')
+        if (werte.size >= PARALLEL_SCHWELLE and not np.iscomplexobj(werte) 
+            and (achse is None or isinstance(achse, (int, np.integer)))):
+            achse = None if achse is None else int(achse) % werte.ndim
+            return _std_parallel(werte, achse, kwargs['ddof'], _anzahl_workers(workers))
     
+    return np.std(*args, **kwargs)
 
-def _zahlen_ausrichtung(zahlen_liste):
+
+
+
+def mittel(*args, **kwargs):
     '''
-    wandelt eine Liste unterschiedlich langer Zahlenstrings in eine Lister gleichlanger Zahlenstrings um,
-    die nach Komma ('.'), Größenordnung ('e') und Einheit (zB. ' %') ausgerichtet sind, siehe "Beispiel".
+    Mittelwert
     
+    Die Funktion ist identisch zu np.mean() inkl. aller Argumente
+    und dient nur besseren Lesbarkeit inmitten von anderen pap-Funktionen.
+    '''
     
-    Argumente
-    ---------
-    zahlen_liste : list  (str)
-        Unterstützte Arten von Strings sind:
-        * int- und float-Strings (auch mit 'e')
-        * solche Strings mit einem Leerzeichen und Einheit hinten dran (zB. '1.4e-3 %')
-        * einzelne Zeichen (zB. '-')
-        * leere Strings
-        
-    
-    Output
-    ------
-    zahlen_liste : list  (str)
-        
+    return np.mean(*args, **kwargs)
+
+
+
+
+def mittel_fehler(*args, **kwargs):
+    '''
+    Experimenteller Fehler des Mittelwertes
     
-    Beispiel
-    --------
-    >>> pap._zahlenausrichtung(['23.3',
-    ...                         '2.940e12',
-    ...                         '-94',
-    ...                         '2030 %'
-    ...                         '-6.19e-3'
-    ...                         '-',
-    ...                         ''])
-    ['   23.3       ',
-     '    2.940e12  ',
-     '  -94         ',
-     '-2030        %',
-     '   -6.19 e-3  ',
-     '      -       ',
-     '              ']
+    Die Funktion berechnet std(X) / sqrt(N) von einer Werteverteilung X mit N Werten.
+    Dabei ist std() = pap.std() also der Experimentelle Fehler des Einzelwertes.
+    Somit lassen sich genau die gleichen Argumente wie in np.std() einsetzen, 
+    inklusive  workers  für die parallele Berechnung (siehe pap.std()).
     '''
     
     
-    # Vorbearbeitung der Liste
-    anzahl_strings    = len(zahlen_liste)
-    if anzahl_strings == 0:
-        return zahlen_liste
+    werte = args[0]
+    shape = np.shape(werte)
+    if shape == (0,):   # Verhindert Fehlermeldung falls werte == []
+        return np.nan
     
-    ''' Nur Zahlenstrings können ausgerichtet werden, deshalb werden alle anderen
-    herausgeplückt.'''
-    test_zahl    = [any(x in string for x in ZIFFERN) 
-                    for string in zahlen_liste]
-    nicht_zahlen = [(i, zahlen_liste.pop(i))  for i in reversed(range(anzahl_strings))  
-                    if not test_zahl[i]] [::-1]
-    ''' Pflückt alle nicht-Zahlen von hinten nach vorne aus der zahlen_liste um deren richtige Indices zu 
-    bewahren.'''
+    if 'axis' in kwargs and kwargs['axis'] != None:   
+        # Zweite Bedingung im if-Satz nötig, wenn man explizit axis = None angibt.
+        achsen        = kwargs['axis']
+        shape_rest    = (shape[achsen]  if type(achsen) == int  
+                         else arr([shape[i] for i in achsen]))
+        anzahl_zahlen = np.prod(shape_rest)
+    else:
+        anzahl_zahlen = np.prod(shape)
     
     
-    # Ausrichten der Zahlenstrings
-    if len(zahlen_liste) != 0:
+    fehler_des_mittelwertes = std(*args, **kwargs) / np.sqrt(anzahl_zahlen)
+    return fehler_des_mittelwertes
 
-        '''Die Zahlenstrings werden in 9 Bereiche unterteilt:
-        minus, vor_komma, komma, nach_komma, e, e-, nach_e, text und ende.
-        String-Bsp: '-23.383e-10 %' '''
-        anzahl_strings       = len(zahlen_liste)
-        anzahl_bereiche = 9 
-        indices         = np.int_(np.zeros((anzahl_strings, anzahl_bereiche)))
-        längen_strings  = [len(string) for string in zahlen_liste]
-        
-
-        '''Nach allen diesen Zeichen unten werden die Strings ausgerichtet. Insbesondere sollen '.' und 'e' 
-        alle vertikal übereinander sfein.'''
-        test_minus   = ['-'  in string[0] for string in zahlen_liste]
-        test_komma   = ['.'  in string    for string in zahlen_liste]
-        test_e       = ['e'  in string    for string in zahlen_liste]
-        test_e_minus = ['e-' in string    for string in zahlen_liste]
-        test_text    = [' '  in string    for string in zahlen_liste]
-        
-        
-        '''Hier werden die Anfangs-Indices aller 9 Bereiche bestimmt. Ist ein Bereich nicht vorhanden, bekommt 
-        er den Index des nachfolgenden Bereiches. Deshalb werden die Indices vom hintersten Bereich vorwärts
-        bestimmt.'''
-        for i in range(anzahl_strings):
-            indices[i][-1] = längen_strings[i]   # ende
-            if test_text[i]:
-                indices[i][7] = zahlen_liste[i].find(' ')
-            else:
-                indices[i][7] = indices[i][-1]
-            if test_e[i]:
-                indices[i][4] = zahlen_liste[i].find('e')
-                if test_e_minus[i]:
-                    indices[i][5] = zahlen_liste[i].find('e-') + 1
-                    indices[i][6] = indices[i][5] + 1
-                else: 
-                    indices[i][5:7] = [indices[i][4] + 1] * 2
-            else:
-                indices[i][4:7] = [indices[i][7]] * 3
-            if test_komma[i]:
-                indices[i][2] = zahlen_liste[i].find('.')
-                indices[i][3] = indices[i][2] + 1
-            else:
-                indices[i][2:4] = [indices[i][4]] * 2
-            if test_minus[i]:
-                indices[i][1] = 1
-            else:
-                indices[i][1] = 0
 
-        
-        '''Aus allen Indices werden die Längen der einzelnen Bereiche bestimmt und daraus die Menge an
-        Füllung, die benötigt wird. Diese wird schließlich bei allen Strings an der richtigen Stelle#
-        eingefügt.'''
-        längen      = (indices.T[1:] - indices.T[:-1]).T   
-            # Längen der Bereiche, sortiert nach Bereich, np.shape(längen) = (anzahl_bereiche, anzahl_strings)
-        längen_max  = np.max(längen, axis = 0)   # Maximum-Länge jedes Bereiches
-        längen_diff = längen_max[np.newaxis:] - längen     
-            # Anzahl benötigte Leerzeichen um jeden Bereich bis zur Max-Länge aufzufüllen.
 
-        ## Einfügen der Füllungen
-        längen_auswahl  = [7, 6, 5, 4, 3, 2, 1, 0]
-        indices_auswahl = [7, 5, 5, 4, 4, 2, 0, 0]   
-        '''Dies ist wie folgt zu lesen: Bereich text (7) wird als erstes aufgefüllt. Bereiche e- (5) und 
-        nach-e (6) bleiben zusammen und es wird der Platz 5 zwischen dem 'e' und dem '-' aufgefüllt. 
-        Auch der Platz 4 zwischen Bereichen e (4) und nach-komma (3) wird gefüllt. Das gleiche gilt für
-        Platz 0 vor Bereichen minus (0), vor-komma (1) und komma (2). Fehlt im Zahlenstring irgendeiner
-        dieser Bereiche wird sein Platz ebenso gefüllt.'''
-        for i in range(anzahl_strings):
-            for j in range(len(längen_auswahl)):
-                zahlen_liste[i] = _füllen(zahlen_liste[i], menge = längen_diff[i][längen_auswahl[j]], 
-                                          index = indices[i][indices_auswahl[j]])
-    
-        
-        # Nachbearbeitung bei Sonderfällen
-        '''Wenn Minuszeichen vorhanden sind, wird überall ein Leerzeichen an Füllung deswegen eingebracht.
-        Da die Minuszeichen aber bei ihren Zahlen bleiben, kann es passieren, dass eine ganze Spalte an 
-        Leerzeichen existiert (all(...)). Dieser wird hier entfernt, da überflüssig.'''
-        test_leerzeichen = [' ' in string[0] for string in zahlen_liste]
-        test_e_leer      = ['e ' in string if 'e' in string else True for string in zahlen_liste]
-        if all(test_leerzeichen):
-            for i in range(anzahl_strings):
-                zahlen_liste[i] = zahlen_liste[i][1:]
-        if all(test_e_leer) and any(test_e):
-            index_e_string = test_e.index(True)
-            index_nach_e   = zahlen_liste[index_e_string].index('e') + 1
-            zahlen_liste   = [_entfernen(string, index_nach_e) for string in zahlen_liste]
-        
-        
-        länge_gesamt = len(zahlen_liste[0])
-    else:   # Falls keine Zahlenstrings in zahlen_liste vorhanden
-        länge_gesamt = max([len(string) for i, string in nicht_zahlen])
+
+def fwhm(sigma):
+    '''
+    Halbwertsbreite (Full Width Half Mean):
+    FWHM = 2 sqrt(2 ln(2)) * σ
+    '''
     
+    return 2 * np.sqrt(2 * np.log(2)) * sigma
+
+
+
+
+
+
+# Ergebnisse anzeigen
+
+def _zehnerpotenzen(anzahl):
+    '''
+    Tabelle der Zehnerpotenzen 10^0 ... 10^(anzahl - 1), genau so berechnet wie in numpys eigener Rundung 
+    (power_of_ten() in numpy/core/src/multiarray/calculation.c), damit  _rundung_einzel()  bitgenau dieselben 
+    Ergebnisse wie np.round() liefert, auch wo 10^n nicht exakt als float darstellbar ist.
+    '''
     
-    # Zentrierte nicht-Zahlenstrings werden wieder in die Liste eingefügt.
-    for index, string in nicht_zahlen:
-        zahlen_liste.insert(index, _zentrieren_rechts(string, länge_gesamt))
-            
-            
-    return zahlen_liste
+    potenzen = [1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8]
+    potenz   = 1e9
+    while len(potenzen) < anzahl:
+        potenzen.append(potenz)
+        potenz *= 10.
+    return arr(potenzen[:anzahl])
 
 
+ZEHNERPOTENZEN = _zehnerpotenzen(400)   # Ab 10^309 inf, genau wie bei numpy.
 
-def _plus_minus(string_liste):
+
+
+
+def _rundung_einzel(werte, präzisionen):
     '''
-    entscheidet, welche Strings in einer Liste von Strings mit einem Plus-Minus-Zeichen versehen werden 
-    sollen und welche nicht. Diese Funktion ergibt nur als direkte Hilfsfunktion von pap.vergleichstabelle()
-    Sinn.
+    Rundet alle Elemente von  werte  gleichzeitig auf ihre jeweilige Anzahl Nachkommastellen, ohne Python-Loop.
+    Es wird elementweise genau das gemacht, was np.round() (und Pythons round() auf numpy-Zahlen) für eine 
+    einzelne Präzision macht:
+    präzision >= 0:  np.rint(wert * 10^präzision) / 10^präzision
+    präzision <  0:  np.rint(wert / 10^-präzision) * 10^-präzision
     
     
-    Argumente
+    Argumente (sollten schon durch  _rundung()  passend gemacht worden sein.)
     ---------
-    string_liste : list  (str) 
+    werte : np.ndarray (np.float64)
+    
+    präzisionen : np.ndarray (int), gleiche shape wie  werte
     
     
     Output
     ------
-    plus_minus : list  (str)
+    werte_gerundet : np.ndarray (np.float64)
+        Auf nächste gerade Ziffer gerundet (symmetrisches Runden).
+        Form und Elemente sonst gleich wie  werte.
     '''
     
     
-    plus_minus = []
-    for string in string_liste:
-        if string == '':   # Falls string leer ist.
-            plus_minus.append('')
-        elif all([zeichen == ' ' for zeichen in string]):   # Falls string nur aus Leerzeichen besteht.
-            plus_minus.append('   ')
-        else:
-            plus_minus.append(' ± ')   # Falls string aus mehr besteht.
-    
-    return plus_minus
+    kerne = _backend['kerne']
+    if kerne is not None:
+        gerundet = kerne.rundung(np.ravel(werte), np.ravel(präzisionen), ZEHNERPOTENZEN)
+        return gerundet.reshape(np.shape(werte))
     
+    potenzen = np.take(ZEHNERPOTENZEN, np.abs(präzisionen), mode = 'clip')
+    positiv  = präzisionen >= 0
+    with np.errstate(invalid = 'ignore', over = 'ignore'):   # inf und nan bleiben wie bei np.round() erhalten.
+        skaliert = np.where(positiv, werte * potenzen, werte / potenzen)
+        gerundet = np.rint(skaliert)
+        return np.where(positiv, gerundet / potenzen, gerundet * potenzen)
 
-    
-    
-def resultat(titel, werte, einheit = '', faktor = 1, nachkommastellen = None, rel_fehler = False):
+
+
+
+def _rundung(werte, präzisionen, output_präzisionen = False):
     '''
-    Printet ein schön formatiertes Ergebnis mit 
-    Titel, definierter Präzision, evt. +/- Fehler, Einheit und evt. relativen Fehler.
+    Rundet  werte  auf ihre jeweilige Anzahl Nachkommastellen  (präzisionen).
+    Im Gegensatz zu  np.round()  kann diese Funktion  werte  mit ganzen Arrays von Nachkommastellen runden.
+    Für Details zum Rundungsprozess siehe  _rundung_einzel().
     
     
     Argumente
     ---------
-    titel : str
-    
-    werte : number_like, np.ndarray (1D, mit number_like Elementen)
-        Darf die Formen haben 
-        ein_wert, np.array([ein_wert]),
-        np.array([ein_wert, sein_fehler]) oder 
-        np.array([ein_wert, sys_fehler, stat_fehler]).
-    
-    einheit : str
-    
-    faktor : number_like, optional
-        Ermöglicht Anpassung an Größenordnung und Einheit.
+    werte : np.ndarray (number_like), number_like
+        Kann beliebige Form haben und auch Einzelwert sein.
     
-    nachkommastellen : int, optional
-        Siehe "Rundung des Ergebnisses".
+    präzisionen : np.ndarray (int), int
+        Muss gleiche Form wie  werte  haben oder int sein. Ganzzahlige floats (zB. von  _nachkommastelle())
+        werden als int übernommen, andere floats ergeben einen ValueError.
     
-    rel_fehler : bool, number_like, optional
-        darf False sein     (aus),
-             True sein      (wenn Fehler vorhanden und ein_wert != 0,
-                             dann wird dieser als sein_fehler / ein_wert bzw. als
-                             (quadratische summe von sys- und stat_fehler) / ein_wert
-                             berechnet.), oder
-             eine Zahl sein (Einheit Prozent; diese wird dann direkt angegeben)
+    output_präzisionen : bool, optional
+        Bei  True  werden auch die präzisionen als int-Array in der Form von  werte  returned.
     
     
-    Beispiele
-    ---------
-    >>> pap.resultat('Abweichung', 0.30304, '%', faktor = 1e2, nachkommastellen = 0)
-      Abweichung: 30 %
+    Output
+    ------
+    "wert_gerundet" : np.ndarray (np.float64), np.float64
+        Auf nächste gerade Ziffer gerundet (symmetrisches Runden).
+        Form und Elemente sonst gleich wie  werte.
     
-    >>> pap.resultat('Arbeit', np.array([3.35e6, 0.46e6]), 'MJ', faktor = 1e-6)
-      Arbeit: 3.4 +/- 0.5 MJ
+    präzisionen : np.ndarray (np.int64), optional
+    '''
     
-    >>> pap.resultat('Beschleunigung', np.array([9.8493, 0.0424, 0.1235]), 'm/s^2')
-      Beschleunigung: 9.85 +/- 0.04(sys) +/- 0.12 (stat) m/s^2
     
     
-    mit relativem Fehler:
+    # Überprüfung und Anpassung der Argumente
+    werte       = np.asarray(werte, dtype = np.float64)
+    präzisionen = np.asarray(präzisionen)
+    if präzisionen.dtype.kind not in 'iu':
+        präzisionen_int = np.rint(präzisionen)
+        if np.any(präzisionen_int != präzisionen):
+            raise ValueError('präzisionen darf nur ganze Zahlen enthalten! '
+                             'Die Anzahl Stellen, auf die gerundet wird, kann nur ganzzahlig sein.')
+        präzisionen = präzisionen_int
+    präzisionen = np.broadcast_to(präzisionen.astype(np.int64), np.shape(werte))
+    # Falls  präzisionen  Einzelwert, wird daraus ein Array derselben Form wie  werte  gemacht.
+    # Bei unpassenden Formen gibt np.broadcast_to() eine Fehlermeldung.
     
-    >>> pap.resultat('Arbeit           ', np.array([3.3423, 0.4679]), 'J', rel_fehler = True)
-      Arbeit           : 342 +/- 5 J   (1.6 %)
     
-    >>> pap.resultat('Fehler der Arbeit', 0.4679, 'J', rel_fehler = 1.6)
-      Fehler der Arbeit: 5 J   (1.6 %)
-                    
+    # Eigentlicher Rundungsprozess
+    werte_gerundet = _rundung_einzel(werte, präzisionen)
+    if np.ndim(werte_gerundet) == 0:
+        werte_gerundet = werte_gerundet[()]   # Einzelwert statt 0D-Array
     
-    Rundung der Ergebnisse
-    ----------------------
-      * Gibt man die Zahl der Nachkommastellen manuell an, so wird nach ihr gerundet.
-        Dabei sind auch negative Werte erlaubt. Bei -1 z.B. wird 123 -> 120 gerundet.
-      * Ansonsten wird automatisch nach der ersten signifikanten Stelle des größten
-        Fehlers gerundet. z.B. [-123.33, -5.0, 0.02] wird zu "-123.3 +/- 5.0 +/- 0.0"
-        Ist der Betrag dieser Stelle aber < 4, dann wird auf zwei signifikante 
-        Stellen gerundet, d.h. 0.436 -> "0.4", aber 0.0392 -> "0.39"
-      * Gibt es kein Fehler, oder sind diese alle 0, dann wird automatisch
-        nachkommastellen = 16 gesetzt.
-      * Der relative Fehler wird stehts auf zwei signifikante Stellen gerundet.
+    if output_präzisionen:
+        return werte_gerundet, präzisionen
+    return werte_gerundet
+
+
+
+
+def _größenordnung(zahlen, art = int):
     '''
+    Bestimmt elementweise die Größenordnungen eines Arrays von Zahlen und gibt sie als int- oder float-Array 
+    zurück. 
+    0 bekommt die Größenordnung 0.
     
     
+    Argumente
+    ---------
+    zahlen : np.ndarray (number_like)
+        
+    art : type, optional
+        Darf nur sein:
+        int   - größenordnungen-Array wird aus np.int64-Zahlen bestehen, zB. 0.048 -> -2
+        
+        float - größenordnungen-Array wird aus np.float64-Zahlen bestehen. zB. 0.048 -> -2.0
+        
+        
+    Output
+    ------
+    größenordnungen : np.ndarray  (np.int64 oder np.float64)
+        np.shape(größenordnungen) = np.shape(zahlen)
+    '''
     
-    # Überprüfen und Korrigierung von werte
-    if type(werte) != np.ndarray:   # Falls werte nur eine Zahl ist, wird sie zum Array gemacht.
-        werte = arr([werte])
-    if len(werte) > 3:
-        print('Zu viele Elemente in werte! >:(')
-    
-    werte = werte * faktor   # Umrechnung der Resultate auf gewünschte Einheit oder Größenordnung
-    if len(werte) > 1:
-        werte[1:] = np.abs(werte[1:])   # Keine negativen Fehlerangaben
-        fehler = werte[1:]
-        
-        
-    # eventuelles Erstellen eines relativen Fehlers
-    if _istbool(rel_fehler, True):
-        if werte[0] == 0:   # Um einen divide-by-zero Fehler zu vermeiden.
-            rel_fehler = False
-        elif len(werte) == 1:   # Um einen divide-by-nothing Fehler zu vermeiden.
-            rel_fehler = False
-        elif len(werte) == 2:
-            rel_fehler = fehler[0] / werte[0] * 100   # [%], relativer Fehler
-        elif len(werte) == 3:
-            rel_fehler = summen_fehler(fehler) / werte[0] * 100   # [%], relativer Fehler des Gesamtfehlers
-    
-    if not _istbool(rel_fehler, False):
-        # falls rel_fehler eine Zahl ist, wird mit dieser weitergerechnet, bei False nicht. 
-        # In anderen Fällen ensteht hier gleich ein Fehler.
-        
-        # Rundung auf 2 signifikanten Stellen 
-        rel_fehler = np.abs(np.float64(rel_fehler))
-        if rel_fehler != 0:
-            größenordnung = np.int(np.floor(np.log10(rel_fehler)))
-            signifikante_stellen = 2
-            präzision = -größenordnung + signifikante_stellen - 1
-        else:
-            präzision = 2
-        rel_fehler = _rundung(rel_fehler, präzision)
-        
-        # Vorbereitung des Relativer-Fehler-Strings
-        präzision = _negativ_wird_null(präzision)   # Keine negativen Werte für format(prec=) erlaubt.
-        if rel_fehler != 0:
-            if größenordnung > -5:   # Sehr kleine Werte sehen besser mit e aus.
-                rel_fehler_string = '   ({:.{prec}f} %)'.format(rel_fehler, prec = präzision)
-            else:
-                rel_fehler_string = '   ({:.1f}e{} %)'.format(rel_fehler * 10**(-größenordnung),
-                                                              größenordnung, prec = präzision)
-        else:
-            rel_fehler_string = f'   ({rel_fehler} %)'
-    
-    else:
-        rel_fehler_string = ''
-        
-    
-    # Bestimmung der Präzision des Ergebnisses   
-    if nachkommastellen == None:
-        if len(werte) > 1:
-            größter_fehler = np.max(fehler)
-            if größter_fehler != 0:
-                größenordnung = np.int(np.floor(np.log10(größter_fehler)))
-                signifikante_stellen = (1 if größter_fehler / 10**größenordnung >= 4.0
-                                        else 2)   # Hier der 4.0-Cutoff
-                nachkommastellen = -größenordnung + signifikante_stellen - 1
-            else:
-                nachkommastellen = 8   # Da Fehler = 0   
-        else:
-            nachkommastellen = 8   # Da kein Fehler vorhanden.
     
     
-    # Rundung entsprechend der signifikante Stelle oder der eigenen Vorgabe
-    wertepaar = _rundung(werte, nachkommastellen)
-    nachkommastellen = _negativ_wird_null(nachkommastellen)   # Keine negativen Werte für 
-                                                              # format(prec=) erlaubt.
+    if art == int:
+        art = 'int64'
+    elif art == float:
+        art = 'float64'
     
+    # Nullen werden kompatibel gemacht.
+    einsen            = np.ones(np.shape(zahlen))   # 1 hat Größenordnung 0 (welches auch 0 hier haben soll).
+    zahlen_kompatibel = np.where(zahlen == 0, einsen, zahlen)
     
-    # Print des Ergebnis-Strings
-    if len(werte) == 1:
-        print(titel + ': {:.{prec}f} {}{}'
-              .format(*wertepaar, einheit, rel_fehler_string, prec = nachkommastellen))
-    elif len(werte) == 2:
-        print(titel + ': {:.{prec}f} +/- {:.{prec}f} {}{}'
-              .format(*wertepaar, einheit, rel_fehler_string, prec = nachkommastellen))
-    elif len(werte) == 3:
-        print(titel + ': {:.{prec}f} +/- {:.{prec}f}(sys) +/- {:.{prec}f}(stat) {}{}'
-              .format(*wertepaar, einheit, rel_fehler_string, prec = nachkommastellen))
+    return arr(np.floor(np.log10(np.abs(zahlen_kompatibel))), dtype = art)
 
 
-        
-        
-def vergleichstabelle(werte, titel = '', einheit = '', größen = '', faktor = 1, ausrichtung = 'blöcke', 
-                      beschreibung = 'standard'):
+
+
+def _logarithmen(zahlen):
+    '''
+    np.log10(|zahlen|)  als 1D-Array für die Kerne in pap._kerne. Der Logarithmus kommt immer von NumPy, 
+    damit beide Backends dieselben Größenordnungen bestimmen (die Kerne ersetzen log10(0) selbst durch 0).
     '''
-    Printet einen wissenschaftlichen Vergleich von fehlerbehafteten experimentellen und theoretischen Werten in 
-    Tabellenform. 
-    Berechnet und angezeigt werden zusätzlich absolute und relative sowie sigma-Abweichungen.
-    Die Werte sind zur besseren Vergleichbarkeit in ±-Darstellung, nach Komma und Exponent ausgerichten als auch 
-    gerundet entsprechend der Größe ihrer Fehler (siehe "Berechnung und Rundung").
-    
-    Die Vergleiche können sowohl nebeneinander als 'blöcke' dargestellt werden als auch untereinander als 'liste'.
-    Einheit sowie Überschriften der einzelnen Vergleiche (größen) können auch angegeben werden.
-    Randfälle sowie "div-by-0"-Probleme und fehlende Werte (None) werden automatisch hantiert.
-    Ein Überblick der Darstellungsoptionen ist in "Beispiele" zu finden.
     
+    with np.errstate(divide = 'ignore'):
+        return np.log10(np.abs(np.ravel(zahlen)))
 
 
+
+
+def _erste_ziffer(zahlen, art = float, größenordnungen = None):
+    '''
+    Bestimmt elementweise die erste Ziffer eines Arrays von Zahlen wenn art = int, aber
+    wenn art = float, wird die Zahl nur auf Größenordnung null gebracht.
+    
+    
     Argumente
     ---------
-    werte : np.ndarray (1D/2D, mit number_like oder None Elementen)
-        Darf folgende Formen haben:
-        * shape = (4, 0), np.array([ex_wert, ex_fehler, theo_wert, theo_fehler ])
-        * shape = (4, N), np.array([ex_liste, ex_fehler_liste, theo_liste, theo_fehler_liste]) mit  Listenlänge N, 
-                          N = Anzahl der Wertvergleiche, die gemacht werden sollen.
+    zahlen : np.ndarray (number_like)
+    
+    art : type, optional
+        Darf nur sein:
+        int   - ziffern-Array wird aus np.int64-Zahlen bestehen, zB. 239.78 -> 2
         
-        Art der Werte:
-        Die Elemene dürfen reellwertige Zahlen sein (int, bool oder numpy-Äquivalente) oder None sein.
-        Ein Fehler-Wert, der None ist, wird als 0 interpretiert. Ein ex-/theo_wert der None ist, wird als fehlende Zahl 
-        interpretiert und es wird kein Vergleich durchgeführt, siehe "Beispiele".
+        float - ziffern-Array wird aus np.float64-Zahlen bestehen, zB. 239.78 -> 2.3978 
+    
+    größenordnungen : np.ndarray (np.float64), optional
+        Schon berechnete  _größenordnung(zahlen, art = float),  damit log10 nicht zweimal berechnet wird.
         
-    titel : str, optional
-        Tabellentitel, unbearbeitet
     
-    einheit : str, optional
-        Wird in der oberen linken Zelle als Einheit der verglichen Werte gekennzeichnet sein.
+    Output
+    ------
+    ziffern : np.ndarray  (np.int64 oder np.float64)
+        np.shape(ziffern) = np.shape(zahlen)
+    '''
     
-    größen : str, array_like (1D, mit str Elementen), optional
-        Überschriften für jeden Vergleich. Werden je nach Ausrichtung in der Titelzeile bzw. -spalte des 
-        jeweiligen Vergleichs angezeigt.
-        Darf folgende Formen haben:
-        * str                   - einzelne Überschrift
-        * Liste bis Länge N     - bis zu eine Überschrift für jeden Vergleich. Bei weniger Überschriften 
-                                  bekommen die letzten Vergleiche keine Überschrift.
-        * Liste von Länge N + 1 - nur möglich, wenn einheit nicht angegeben. Erster String der Liste 
-                                  ersetzt einheit und die Kennzeichnung 'Einheit' bzw. '[...]'. Die 
-                                  restlichen Strings sind die jeweiligen Vergleichsüberschriften.
     
-    faktor : number_like, optional
-        wird multipliziert mit allen Werten. Falls die angegebene Einheit (oder Größenordnung) nicht die ist, in der 
-        gerechnet wurde.
     
-    ausrichtung : str, optional
-        Darf nur sein:
-        'blöcke'  - Vergleiche nebeneinander als "Blöcke".
-        
-        'liste'   - Vergleiche übereinander als Liste von Zeilen.
+    kerne = _backend['kerne']
+    if kerne is not None and größenordnungen is None:
+        zahlen  = np.asarray(zahlen, dtype = np.float64)
+        ziffern = kerne.erste_ziffern(np.ravel(zahlen), _logarithmen(zahlen), kerne.POTENZEN)
+        ziffern = ziffern.reshape(np.shape(zahlen))
+    else:
+        if größenordnungen is None:
+            größenordnungen = _größenordnung(zahlen, art = float)
+        ziffern = np.abs(zahlen / 10**größenordnungen)
+    
+    if art == float:
+        return ziffern
+    if art == int:
+        return np.int_(ziffern)
     
-    beschreibung : str, optional
-        meint die Überschriften wie "Wert experimentell", "Abweichung absolut" etc.
-        Darf nur sein:
-        'standard' - Überschriften in voller Länge, zB. "Abweichung sigma"
-        
-        'knapp'    - Überschriften abgekürzt, zB. "Abw. sig"
-        
-        
     
-    Beispiele
-    ---------
-    * Gewöhnlicher Vergleich:
-    >>> titel = 'Literaturvergleich Fallbeschleunigung'
-    >>> werte = arr([9.634, 0.274, 9.810, 5e-4])
-    >>> vergleichstabelle(werte, titel, einheit = 'm/s^2')
-      Literaturvergleich Fallbeschleunigung
-  
-             Einheit    m/s^2                         
-      ------------------------   --------------
-      Wert       experimentell    3.45  ± 0.10 
-                 theoretisch      3.690 ± 0.005
-      Abweichung absolut         -0.24  ± 0.11 
-                 relativ             -6.6 %    
-                 sigma                2.3 σ    
-  
     
-    * Knappe Beschreibung
-      + "div-by-0"
-    >>> werte  = np.array([[3.446, 0.00204], [0.105, 0.00045], [3.69, 0], [5e-3, 0]])
-    >>> größen = ['Boden', 'Orbit']
-    >>> vergleichstabelle(werte, titel, einheit = 'm/s^2', größen = größen, beschreibung = 'knapp')
-      Literaturvergleich Fallbeschleunigung
-      
-       [m/s^2]       Boden             Orbit     
-      --------   --------------   ---------------
-      Wert exp    3.45  ± 0.10    0.0020 ± 0.0004
-           the    3.690 ± 0.005   0.0    ± 0.0   
-      Abw. abs   -0.24  ± 0.11    0.0020 ± 0.0004
-           rel       -6.6 %              -       
-           sig        2.3 σ            4.5 σ      
 
+def _nachkommastelle(zahlen, sig_stellen = 1, sig_grenze = 1.0):
+    '''
+    Berechnet elementweise die Anzahl der Nachkommastellen, auf die eine Zahl gerundet werden soll, 
+    abhängig davon wie viele signifikante Stellen zugelassen werden und davon wo die Signifikanz-Grenze liegt.
+    Mehr Details unter "Berechnung".
     
-    * Listenansicht
-      + stark variierende Größenordnungen
-      + fehlende Werte
-    >>> titel  = 'Erneute Messungen der Strahlenexposition'
-    >>> werte  = np.array([[0.039, 5.392,  7372.038, 0.299, 4703822.612, 345.384], 
-                           [0.018, 0.385,   274.340, 0.070,   53891.349,  18.239], 
-                           [0.031, 5.408, 10381.949, 0.285, 8239403.217,    None], 
-                           [0.012, 0.094,    93.911, 0.033,    3495.384,   None]])
-    >>> größen = ['Ort A', 'Ort B', 'Ort C', 'Ort D', 'Ort E', 'Ort F (neu)']
-    >>> vergleichstabelle(werte, titel, einheit = 'µS/h', ausrichtung = 'liste', größen = größen)
-      Erneute Messungen der Strahlenexposition
-  
-        Einheit   |                       Wert                       |                  Abweichung                  
-         µS/h     |     experimentell      |       theoretisch       |         absolut         | relativ  |  sigma  
-      --------------------------------------------------------------------------------------------------------------
-      Ort A       |    0.039   ±     0.018 |     0.031    ±    0.012 |     0.008   ±     0.022 |  26    % |  0.37  σ
-      Ort B       |    5.39    ±     0.38  |     5.41     ±    0.09  |    -0.0     ±     0.4   |  -0.30 % |  0.040 σ
-      Ort C       | 7370       ±   270     | 10380        ±   90     | -3010       ±   290     | -29    % | 10     σ
-      Ort D       |    0.30    ±     0.07  |     0.285    ±    0.033 |     0.01    ±     0.08  |   4.9  % |  0.18  σ
-      Ort E       |    4.70 e6 ± 50000     |     8.2394e6 ± 3500     |    -3.54 e6 ± 50000     | -43    % | 65     σ
-      Ort F (neu) |  345       ±    18     |                         |                         |          |         
-      
     
-    * Listenansicht knapp
-      + größen[0] ersetzt einheit
-    >>> titel  = 'Vergleich der Viskositäten nach Stokes bzw. Hagen-Poiseuille'
-    >>> werte  = arr([[1.2515, 1.3855, 1.4089], [0.0239, 0.0156, 0.0227], 
-                      [1.4000, 1.4000, 1.6480], [0.0010, 0.0010, 0.0005]])
-    >>> größen = ['Adiabatenkoeffizient', 'Clément-Desormes Luft', 'Rüchhardt        Luft', 'Rüchhardt        Argon']
-    >>> vergleichstabelle(werte, titel, größen = größen, ausrichtung = 'liste', beschreibung = 'knapp')
-      Vergleich der Viskositäten nach Stokes bzw. Hagen-Poiseuille
-  
-                             |              Wert               |                Abw.               
-       Adiabatenkoeffizient  |      exp      |       the       |      abs       |   rel   |   sig  
-      ---------------------------------------------------------------------------------------------
-      Clément-Desormes Luft  | 1.252 ± 0.024 | 1.4000 ± 0.0010 | -0.148 ± 0.024 | -11   % |  6.2  σ
-      Rüchhardt        Luft  | 1.386 ± 0.016 | 1.4000 ± 0.0010 | -0.014 ± 0.016 |  -1.0 % |  0.93 σ
-      Rüchhardt        Argon | 1.409 ± 0.023 | 1.6480 ± 0.0005 | -0.239 ± 0.023 | -15   % | 11    σ
+    Argumente
+    ---------
+    zahlen : np.ndarray (number_like)
+    
+    sig_stellen : int, optional
+        Nur Zahlen >= 1 sinnvoll
+    
+    sig_grenze : int, float, optional
+        Nur Zahlen >= 1 und < 10 sinnvoll
+    
+    
+    Output
+    ------
+    nachkommastellen : np.ndarray (np.float64)
+        np.shape(nachkommastellen) = np.shape(zahlen)
+    
+    
+    Berechnung
+    ----------
+    Rundet man eine Zahl wissenschaftlich, dann will man sie auf eine bestimmte Anzahl signifikanter Stellen 
+    runden, zB. bei Fehlerwerten auf oft nur eine: 1.389342 -> 1.
+    Stur auf eine signifikante Stelle zu runden wird aber bei Zahlen mit kleinen ersten Ziffern problematisch
+    wie in oberem Beispiel. Der gerundete Wert könnte zwischen 0.5 und 1.5 liegen, wodurch man einen unnötig 
+    großen Darstellungsfehler introduziert.
+    Um dieses Problem zu beheben, wurde eine Signifikanzgrenze eingeführt. Ist die erste Ziffer des zu 
+    rundenden Wertes kleiner als diese Grenze, wird der Wert mit einer signifikanten Stelle mehr gerundet.
+    
+    Beispiel 1: Sei die Signifikanzgrenze sig_grenze = 4 (Darstellungsfehler max. 1/8)
+                und die normale Anzahl signifikanter Stellen sig_stellen = 1.
+    0.002458 -> 0.0025 (nachkommastelle =  4)
+    828.003  -> 800    (nachkommastelle = -2)
+    4.001    -> 4      (nachkommastelle =  0)
+    3.999    -> 4.0    (nachkommastelle =  1)
+    3.949    -> 3.9    (nachkommastelle =  1)
+    1.034    -> 1.0    (nachkommastelle =  1)
+    0.928    -> 0.9    (nachkommastelle =  1)
+    0.434    -> 0.4    (nachkommastelle =  1)
+    0.394    -> 0.39   (nachkommastelle =  2)
+    
+    Beispiel 2: Will man bei oberen Beispielen vermeiden, dass sowohl 4 als auch 4.0 auftauchen,
+    kann man sig_grenze = 3.95 wählen. Dann ergibt sich
+    4.000 -> 4
+    3.999 -> 4
+    3.950 -> 4
+    3.949 -> 3.9
+    '''
+    
+    
+    kerne = _backend['kerne']
+    if kerne is not None:
+        zahlen = np.asarray(zahlen, dtype = np.float64)
+        nachkommastellen = kerne.nachkommastellen(np.ravel(zahlen), _logarithmen(zahlen), kerne.POTENZEN, 
+                                                  float(sig_stellen), float(sig_grenze))
+        return nachkommastellen.reshape(np.shape(zahlen))
+    
+    größenordnungen      = _größenordnung(zahlen, art = float)   # Nur einmal berechnet, auch für die erste Ziffer.
+    über_der_grenze      = _erste_ziffer(zahlen, größenordnungen = größenordnungen) >= sig_grenze
+    sig_stellen_normal   = np.full(np.shape(zahlen), sig_stellen)
+    signifikante_stellen = np.where(über_der_grenze, sig_stellen_normal, sig_stellen_normal + 1)
+    
+    nachkommastellen     = -größenordnungen + signifikante_stellen - 1
+    return nachkommastellen
 
 
 
-    Berechnung und Rundung
-    ----------------------
-    Die Vergleichswerte werden wie folgt berechnet:
-    * abweichung_abs        = wert_ex - wert_theo
-    * abweichung_abs_fehler = np.sqrt(wert_ex_fehler**2 + wert_theo_fehler**2)
-    * abweichung_rel        = abweichung_abs / wert_theo
-    * abweichung_sig        = abweichung_abs / abweichung_abs_fehler
-    * Bei einem "div-by-0"-Fall wird der entsprechende Vergleichswert mit '-' ersetzt.
+
+def _zahlen_strings(zahlen, nachkommastellen):
+    '''
+    Rundet  zahlen  auf ihre  nachkommastellen  und wandelt sie alle auf einmal in Strings um.
+    Zahlen ab der Größenordnung 10^5 bzw. 10^-5 werden in Exponentenschreibweise dargestellt, zB. '4.70e6'.
+    Statt für jede Zahl einzeln Präzision und Format zu bestimmen, werden alle Zahlen mit gleichem Format 
+    zusammen umgewandelt. Es gibt meist nur wenige verschiedene Formate.
     
-    Art der Rundung: symmetrisches Runden
-    * gerundet wird mit Pythons round()
-    * Im Gegensatz zum Schulrunden wird bei 5 nicht immer aufgerundet sondern zur nächsten geraden Zahl.
-    * Bsp.: 10.5 -> 10,  11.5 -> 12,    2.5 -> 2,  3.5 -> 4
-    * Beim Runden von vielen Zahlen reduziert dies den systematischen Fehler, der durchs Runden entsteht.
     
-    Gerundet wird nach der Größe des Fehlers:
-    * Dieser wird auf eine signifikante Stelle gerundet, wenn die erste Ziffer größer als 3 ist.
-      - Wenn die erste Ziffer kleiner ist, wird auf zwei signifikante Stellen gerundet.
-      - Ist der Fehler 0, dann wird auf eine Nachkommastelle gerundet.
-    * Die Absolutzahl wird auf ebenso viele Nachkommastellen wie ihr Fehler gerundet
-      - Also, '123.46 ± 0.04' aber '123.456 ± 0.039'
-    * relative und sigma Abweichung werden immer auf zwei signifikante Stellen gerundet.
-      - Wenn eine 0 ist, sieht das so aus: '0.00 %'
-    * Rundung ohne Komma ist auch möglich: '1624.2 ± 59.9' -> '1600 ± 60'
-
-    Ausrichtung der Zahlen erfolgt nach Komma und Exponent:
-    * Zahlen ab der Größenordnung 10^5 bzw. 10^-5 werden in Exponententenschreibweise dargestellt, zB. '1.38e-23'
-      - Deren Kommas werden um Platz zu sparen genau wie die anderen Kommas ausgerichtet.
-    * Minuszeichen bleiben an ihren Zahlen haften.
-    Beispiel:
-    '   -3.28   e18'
-    '49200         '
-    '  -58.07023   '
-    '    0.0034    '
-    '    2.933  e-9'
+    Argumente
+    ---------
+    zahlen : np.ndarray (number_like)
+    
+    nachkommastellen : np.ndarray (int), int
+        Muss gleiche Form wie  zahlen  haben oder int sein.
+    
+    
+    Output
+    ------
+    zahlen_strings : np.ndarray (str)
+        np.shape(zahlen_strings) = np.shape(zahlen)
     '''
+    
+    
+    gerundet, nachkommastellen = _rundung(zahlen, nachkommastellen, output_präzisionen = True)
+    gerundet        = np.asarray(gerundet)
+    größenordnungen = _größenordnung(gerundet)
+    
+    exponent    = np.abs(größenordnungen) >= 5
+    präzisionen = np.where(exponent, nachkommastellen + größenordnungen, _negativ_wird_null(nachkommastellen))
+    darstellung = gerundet.copy()
+    for größenordnung in np.unique(größenordnungen[exponent]):
+        auswahl = exponent & (größenordnungen == größenordnung)
+        darstellung[auswahl] = gerundet[auswahl] * 10**(-float(größenordnung))   
+        # Pythons 10**x statt numpys, um bitgleich mit der bisherigen Darstellung zu bleiben.
+    
+    zahlen_strings = np.empty(np.shape(gerundet), dtype = object)
+    for präzision in np.unique(präzisionen):
+        auswahl = präzisionen == präzision
+        format_string = f'%.{präzision}f'
+        zahlen_strings[auswahl] = [format_string % zahl for zahl in darstellung[auswahl].tolist()]
+    if np.any(exponent):
+        zahlen_strings[exponent] = zahlen_strings[exponent] + 'e' + größenordnungen[exponent].astype(str)
+    
+    return zahlen_strings.astype(str)
 
 
 
-    # Überprüfen der Argumente
-    werte_typ = type(werte)
-    if werte_typ != np.ndarray:
-        print(f'Eingabefehler: type(werte) = {werte_typ}')
-        print('werte muss ein numpy Array sein.\n')
-        return
-    werte_shape = np.shape(werte)
-    if (not len(werte_shape) in [1, 2]) or werte_shape[0] != 4:
-            print(f'Eingabefehler: shape(werte) = {werte_shape}')
-            print('werte muss die shape  (4, n) mit n = 0, 1, 2, ...  haben.\n')
-            return
-    
-    titel_typ = type(titel) 
-    if titel_typ != str:
-        print(f'Eingabefehler: type(titel) = {titel_typ}')
-        print('titel muss ein String sein.\n')
-        return
-    
-    einheit_typ = type(einheit)
-    if einheit_typ  != str:
-        print(f'Eingabefehler: type(einheit) = {einheit_typ}')
-        print('einheit muss ein String sein.\n')
-        return
+
+def formatieren(werte, fehler = None, sig_stellen = 1, sig_grenze = 3.95):
+    '''
+    Rundet und formatiert ganze Arrays von fehlerbehafteten Werten auf einmal zu Strings, nach denselben Regeln
+    wie pap.vergleichstabelle(): Die Fehler werden auf  sig_stellen  signifikante Stellen gerundet (eine mehr, 
+    falls ihre erste Ziffer kleiner als  sig_grenze  ist) und die Werte auf ebenso viele Nachkommastellen.
+    Sehr große oder kleine Zahlen werden in Exponentenschreibweise dargestellt.
     
-    # größen siehe: "# Vorbereitung Größenliste"
     
-    ausrichtung_optionen = ['blöcke', 'liste']
-    if not ausrichtung in ausrichtung_optionen:
-        print(f'Eingabefehler: ausrichtung = {ausrichtung}')
-        print(f'ausrichtung kann nur folgende Strings sein: {ausrichtung_optionen}\n')
-        return
+    Argumente
+    ---------
+    werte : np.ndarray (number_like), number_like
     
-    beschreibung_optionen = ['standard', 'knapp']
-    if not beschreibung in beschreibung_optionen:
-        print(f'Eingabefehler: beschreibung = {beschreibung}')
-        print(f'beschreibung kann nur folgende Strings sein: {beschreibung_optionen}\n')
-        return
+    fehler : np.ndarray (number_like), number_like, optional
+        Gleiche Form wie  werte. Fehlt  fehler, werden die  werte  selbst auf  sig_stellen  signifikante Stellen 
+        gerundet (so wie die relativen und sigma-Abweichungen in pap.vergleichstabelle()).
     
+    sig_stellen : int, optional
+        Nur Zahlen >= 1 sinnvoll
     
+    sig_grenze : int, float, optional
+        Nur Zahlen >= 1 und < 10 sinnvoll. Siehe "Berechnung" in  _nachkommastelle().
     
-    # Vorbearbeitung der Argumente
-    if np.shape(werte) == (4,):   
-        werte = arr(werte, ndmin = 2).T   # Jeder Wert muss aus Formatierungsgründen eine eigene Liste werden
     
+    Output
+    ------
+    werte_strings : np.ndarray (str)
     
-    ## Auslese von None-Elementen im Werte-Array
-    ### Ersetzung von None-Werten durch Nullen um berechenbar zu bleiben
-    test_kein_wert = werte == None   # Bool-Array, wo None-Elemente in werte mit True markiert sind.
-    none_stellen   = np.where(test_kein_wert)   # entsprechende Indices
-    nullen         = np.zeros(np.shape(werte))
-    werte          = arr(np.where(test_kein_wert, nullen, werte), dtype = np.float64)
+    fehler_strings : np.ndarray (str), nur falls  fehler  angegeben
     
-    ### Speichern der Positionen von None-Werten in jew. ex und theo um später dort den Vergleich löschen
-    ex_none   = []
-    theo_none = []
-    for i in range(len(none_stellen[0])):
-        if none_stellen[0][i] == 0:
-            ex_none.append(none_stellen[1][i])
-        if none_stellen[0][i] == 2:
-            theo_none.append(none_stellen[1][i])
-    alle_none = ex_none + theo_none
-
     
-    ## Wichtige Konstanten
-    anzahl_vergleiche = np.shape(werte)[1]
-    anzahl_zahlen = 8    # Anzahl Zahlen, die in einem Vergleich vorkommen
-    anzahl_vergleichswerte = 5  # Anzahl (fehlerbehafteter) Werte, die in einem Vergleich vorkommen
+    Beispiel
+    --------
+    >>> pap.formatieren(np.array([123.456, 4703822.6, 0.0312]), np.array([0.039, 53891.3, 0.0012]))
+    (array(['123.456', '4.70e6', '0.0312'], dtype='<U7'), array(['0.039', '50000', '0.0012'], dtype='<U6'))
+    '''
     
     
-    ## Vorbereitung der zu verrechnenden Werte
-    werte = werte * faktor   # Umrechnung auf gewünschte Größenordnung bzw. Einheit
-    werte[1::2] = np.abs(werte[1::2])      # Keine negativen Fehlerwerte
-    ex, ex_fehler, theo, theo_fehler = werte
+    werte = np.asarray(werte, dtype = np.float64)
+    if fehler is None:
+        nachkommastellen = _nachkommastelle(werte, sig_stellen = sig_stellen, sig_grenze = sig_grenze)
+        return _zahlen_strings(werte, nachkommastellen)
     
+    fehler           = np.abs(np.asarray(fehler, dtype = np.float64))
+    nachkommastellen = _nachkommastelle(fehler, sig_stellen = sig_stellen, sig_grenze = sig_grenze)
+    zahlen_strings   = _zahlen_strings(arr([werte, fehler]), arr([nachkommastellen, nachkommastellen]))
+    return zahlen_strings[0], zahlen_strings[1]
 
-    ## Vorberarbeitung der Größen(-liste)
-    größe0 = None   # Wird String im Falle, dass erster Wert von Größen als einheit interpretiert wird.
-    if not type(größen) in [str, list]:
-        größen = list(größen)
-    if len(größen) == 0: # Falls größen leer
-        if einheit == '':
-            überschriften = []   # Überschriften-Zeile muss nicht geprintet werden
-        else:
-            fehlende_größen = [''] * anzahl_vergleiche
-            überschriften = [*fehlende_größen]
-    elif type(größen) == str:
-        fehlende_größen = [''] * (anzahl_vergleiche - 1)
-        überschriften = [größen, *fehlende_größen]
-    elif len(größen) < anzahl_vergleiche:
-        fehlende_größen = [''] * (anzahl_vergleiche - len(größen))
-        überschriften = [*größen, *fehlende_größen]
-    elif len(größen) == anzahl_vergleiche:
-        überschriften = größen
-    elif len(größen) - 1 == anzahl_vergleiche and einheit == '':
-        größe0 = größen.pop(0)
-        überschriften = größen
-    else:
-        if anzahl_vergleiche == 1:
-            print((f'Eingabefehler: len(größen) = {len(größen)}, aber es findet nur {anzahl_vergleiche} Vergleich ' 
-                    'statt.'))
-        else:
-            print((f'Eingabefehler: len(größen) = {len(größen)}, aber es finden nur {anzahl_vergleiche} Vergleiche '
-                    'statt.'))
-        print('Es darf höchstens so viele Größen wie Vergleiche geben.')
-        print('(Ausnahme: einheit = \'\' und len(größen) = anzahl_vergleiche + 1,')
-        print(' dann wird der erste Wert als einheit interpretiert)\n')
-        return
-        
 
-        
-    # Berechnung und Rundung
-    ## Ausrechnen der Abweichungen
-    abweichung_abs        = ex - theo
-    abweichung_abs_fehler = summen_fehler(arr([theo_fehler, ex_fehler]))
-    abweichung_rel        = arr([abweichung_abs[i] / theo[i] * 100  if theo[i] != 0  else 0 
-                                 for i in range(anzahl_vergleiche)])   
-                                 # [%], div-by-0-crash wird hier verhindert und später mit '-' ersetzt.
-    abweichung_sig        = arr([np.abs(abweichung_abs[i] / abweichung_abs_fehler[i])  
-                                 if abweichung_abs_fehler[i] != 0  else 0  for i in range(anzahl_vergleiche)])
-                                 # hier ebenso
+
+
+def _negativ_wird_null(array):
+    '''
+    "Rampenfunktion": Die Werte von array, die negativ sind, werden durch 0 ersetzt.
     
     
-    ## Bestimmung der Nachkommastellen
-    werte_absolut = arr([ex, theo, abweichung_abs])
-    werte_fehler  = arr([ex_fehler, theo_fehler, abweichung_abs_fehler])
-    werte_relativ = arr([abweichung_rel, abweichung_sig])
+    Argument
+    --------
+    array : np.ndarray (number_like)
+    '''
     
-    ### Berechnung der Anzahl der Nachkommastellen des gerundeten Wertes
-    nachkommastellen_fehler  = _nachkommastelle(werte_fehler, sig_grenze = 3.95) 
-    '''Cutoff, ab dem nur noch eine signifikante Stelle angezeigt wird, soll eigentlich 4.0 sein, 
-    aber aufgerundete Werte sollen auch als '4', nicht '4.0' dargestellet werden.'''
-    nachkommastellen_absolut = nachkommastellen_fehler   
-                               # Die Rundung der Absolutwerte orientiert sich an der Größe ihrer Fehlerwerte.
-    nachkommastellen_relativ = _nachkommastelle(werte_relativ, sig_stellen = 2, sig_grenze = 1.0)  
-                               # Hier immer 2 signifikante Stellen.
     
-    ### Bildung eines nachkommastellen-Arrays mit shape = (anzahl_zahlen, anzahl_vergleiche)
-    nachkommastellen = []
-    for i in range(3):
-        nachkommastellen.append(nachkommastellen_absolut[i])
-        nachkommastellen.append(nachkommastellen_fehler[i])
-    nachkommastellen.extend(nachkommastellen_relativ)
-    nachkommastellen = np.array(nachkommastellen, dtype = int)
+    nullen = np.full(np.shape(array), 0)
+    return np.where(array > 0, array, nullen)
+
+
     
     
-    ## Rundung aller Werte
-    alle_werte          = arr([ex, ex_fehler, theo, theo_fehler, abweichung_abs, abweichung_abs_fehler,
-                               abweichung_rel, abweichung_sig])   # shape = (anzahl_zahlen, anzahl_vergleiche)
-    alle_werte_gerundet = _rundung(alle_werte, nachkommastellen)   # zahlen-Array
-    größenordnungen     = _größenordnung(alle_werte_gerundet)    # int-Array
-    
-    
-    ## Darstellung der einzelnen Werte 
-    '''Umwandlung der Zahlen zu String unter berücksichtigung von Rundung und Größenordnung'''
-    alle_werte_strings = []
-    for i in range(anzahl_zahlen):
-        zahlen_strings = []
-        for j in range(anzahl_vergleiche):
-            if np.abs(größenordnungen[i][j]) < 5:   # Darstellung direkt als gerundete Zahl
-                nachkommastelle = _negativ_wird_null(nachkommastellen[i][j])
-                wert_string     = '{:.{prec}f}'.format(alle_werte_gerundet[i][j], prec = nachkommastelle)
-            else:   # Sehr große oder kleine Werte werden, entsprechend gerundet, in Exponentdarstelung dargestellt.
-                größenordnung = größenordnungen[i][j]
-                wert_gestutzt = alle_werte_gerundet[i][j] * 10**(-float(größenordnung))
-                präzision     = nachkommastellen[i][j] + größenordnung
-                wert_string   = '{:.{prec}f}e{}'.format(wert_gestutzt, größenordnung, prec = präzision)
-            zahlen_strings.append(wert_string)
-        alle_werte_strings.append(zahlen_strings)
+def _istbool(wert, bool_wert:bool):
+    '''
+    Überprüft ob wert wirklich bool_wert (True oder False) ist und nicht nur 1 oder 0.
+    '''
     
-    ## Löschen des Vergleichs, falls ex- oder theo-Werte None waren, da Vergleich dann sinnlos.
-    alle_werte_strings = arr(alle_werte_strings).T  # shape = (anzahl_vergleiche, anzahl_zahlen)
-    for i in range(anzahl_vergleiche):
-        if i in ex_none:
-            alle_werte_strings[i][0:2] = ['', '']
-        if i in theo_none:
-            alle_werte_strings[i][2:4] = ['', '']
-        if i in alle_none:   # alle_none = ex_none or theo_none
-            alle_werte_strings[i][4:8] = ['', '', '', '']   
-                                         # Fehlt irgendein Wert, werden alle Abweichungs-Werte gelöscht.
+    return (wert == bool_wert and isinstance(wert, bool))
 
 
-                
-    # Formatierung der Werte zu schönen, gut lesbaren Vergleichen
-    if ausrichtung == 'blöcke':
-        alle_vergleiche = []
-        '''Wird alle Vergleichswerte als fertig ausgerichtete Strings enthalten, welche einheitliche Länge haben.'''
-        for i in range(anzahl_vergleiche):
-            strings_einzelwerte = alle_werte_strings[i]
 
-            # Anpassen der Absolutzahlen aneinander
-            strings_absolut = list(strings_einzelwerte[[0, 2, 4]])
-            strings_absolut = _zahlen_ausrichtung(strings_absolut)
+def _listen_transponieren(listen_matrix):
+    '''
+    Transponiert eine Liste, die eine Form wie ein 2D np.ndarray hat.
+    
+    
+    Argumente
+    ---------
+    listen_matrix : list
+        Muss aus einer Liste von N Listen, welche alle M Elemente haben, bestehen.
+        Also "shape"(listen_matrix) = (N, M).
+    
+    
+    Output
+    ------
+    tranxponierte_matrix : list
+        "shape"(transponierte_maxtrix) = (M, N)
+    '''
+    
+    
+    
+    transponierte_matrix = []
+    for i in range(len(listen_matrix[0])):
+        zeile = []
+        for j in range(len(listen_matrix)):
+            zeile.append(listen_matrix[j][i])
+        transponierte_matrix.append(zeile)
+    
+    return transponierte_matrix
 
-            # Anpassen der Fehlerzahlen aneinander
-            strings_fehler = list(strings_einzelwerte[[1, 3, 5]])
-            strings_fehler = _zahlen_ausrichtung(strings_fehler)
 
-            # Zusammenstellen des Vergleichs
-            plus_minus = _plus_minus(strings_absolut)
-            strings_plusminus = [strings_absolut[j] + plus_minus[j] + strings_fehler[j]
-                                 for j in range(len(strings_absolut))]
-            
-            # Darstellen der relativen und sigma-Abweichungen
-            string_rel, string_sig = [strings_einzelwerte[6] + ' %', strings_einzelwerte[7] + ' σ']
-            
-            # Anpassung der Relativwerte bei bestimmten Randfällen
-            if string_rel[0] == '-':   # Falls die Zahl negativ ist, soll die sigma-Zahl ein extra ' ' vorne bekommen.
-                string_sig = _füllen(string_sig, index = 0)
-            if theo[i] == 0:   # Statt div-by-0 oder unsinnigem Wert wird die rel. Abweichung einfach als '-' angegeben.
-                string_rel = '-'
-            if abweichung_abs_fehler[i] == 0:   # Gleiches gilt für die sigma-Abweichung
-                string_sig = '-'
-            if i in alle_none:   # Falls ex oder theo fehlt, werden die unsinnigen Abweichungszahlen gelöscht.
-                string_rel = ''
-                string_sig = ''
-            
-            # Mittige Ausrichtung aller Strings zu einem Block von gleichmäßiger Breite
-            strings_vergleich = [*strings_plusminus, string_rel, string_sig]
-            breite_block = max([len(string) for string in strings_vergleich])
-            strings_vergleich = [_zentrieren_rechts(string, breite_block) for string in strings_vergleich] 
-            
-            alle_vergleiche.append(strings_vergleich)
-            
-    elif ausrichtung == 'liste':
-        alle_werte_strings = alle_werte_strings.T   # shape = (anzahl_zahlen, anzahl_vergleiche)
-        
-        
-        # Anpassen und Zusammenfügen von Vergleichszahlen zu Absolutwerten
-        zahlen_absolut = [_zahlen_ausrichtung(list(zahlen)) for zahlen in alle_werte_strings[:6]]
-        '''Alle Elemente der 8 Vergleichszahlen (Listen von Strings) werden aneinander ausgerichtet, da sie in der
-        Tabelle als vertikale Liste dargestellt werden.'''
-        plus_minus = [_plus_minus(zahlen_absolut[i]) for i in range(0, len(zahlen_absolut), 2)]   # range = [0, 2, 4]
-        strings_absolut = [[zahlen_absolut[i][j] + plus_minus[i//2][j] + zahlen_absolut[i + 1][j] 
-                            for j in range(anzahl_vergleiche)] for i in range(0, len(zahlen_absolut), 2)]
-        
-        
-        # Anpassung der Relativwerte bei bestimmten Randfällen
-        '''Analog zu wie Randfälle im 'blöcke'-Abschnitt behandelt werden.'''
-        strings_rel = [alle_werte_strings[6][i]  + ' %'  if theo[i] != 0  else '-' for i in range(anzahl_vergleiche)]
-        strings_sig = [alle_werte_strings[7][i] + ' σ'  if abweichung_abs_fehler[i] != 0  else '-'  
-                       for i in range(anzahl_vergleiche)]
-        strings_rel = ['' if i in alle_none else strings_rel[i] for i in range(anzahl_vergleiche)]
-        strings_sig = ['' if i in alle_none else strings_sig[i] for i in range(anzahl_vergleiche)]
-        strings_rel = _zahlen_ausrichtung(strings_rel)
-        strings_sig = _zahlen_ausrichtung(strings_sig)
-        
-        alle_vergleiche = [*strings_absolut, strings_rel, strings_sig]   # "shape" = (anzahl_zahlen, anzahl_vergleiche)
+
+
+def _füllen(string, index = 0,  menge = 1, füllzeichen = ' '):
+    '''
+    fügt eine bestimmte Menge an Füllzeichen an eine bestimmte Position eines Strings.
+    Ähnlich zu Pythons .format()-Methode, wo der String eine festgelegte Breite haben soll und mit entsprechend
+    vielen Füllzeichen aufgefüllt wird. Hier kann man stattdessen die Anzahl der Füllzeichen festlegen und auch
+    die genaue Einsetz-Position.
+    
+    
+    Argumente
+    ---------
+    string : str
+    
+    index : int, str, optional
+        Position im string, wo die füllzeichen eingefügt werden sollen
+        Wenn type(index) == str, dann darf index nur sein:
+        index = 'links'    (= 0) -> füllzeichen ganz links einfügen
         
+        index = 'rechts'   (= len(string)) -> füllzeichen ganz rechts einfügen
     
+    menge : int, optional
+        Anzahl gewünschter füllzeichen
     
-    # Erstellen der fertigen Tabellenstrings
-    titel_strings = [titel, '']  if titel != ''  else  []   # Hinzufügen des Titels der Tabelle falls vorhanden
+    füllzeichen : str, optional
     
     
-    if ausrichtung == 'blöcke':
-        separator = '   '   # Was die Blöcke (Spalten) der Tabelle trennt.
+    Output
+    ------
+    string_neu : str
+    '''
+    
+    
+    if index == 'rechts':
+        index = len(string)
+    elif index == 'links':
+        index = 0
         
-        # Angleichen der Länge der Größenstrings (Blocküberschriften) mit der Breite der dazugehörigen Vergleichsblöcke
-        if überschriften != []:
-            breite_blöcke   = [max(len(alle_vergleiche[i][0]), len(überschriften[i])) for i in range(anzahl_vergleiche)]
-            überschriften   = ['{:^{width}}'.format(überschriften[i], width = breite_blöcke[i]) 
-                               for i in range(anzahl_vergleiche)]   
-                              # Überschriften werden links-zentriert auf die Blöcke.
-            alle_vergleiche = [['{:^{width}}'.format(vergleichswert, width = breite_blöcke[i]) 
-                                for vergleichswert in alle_vergleiche[i]] for i in range(anzahl_vergleiche)] 
-                              # Ebenso die Blöcke, falls diese schmaler als die Überschriften sind.
-            
-        # Erstellen vom "Einheiten und Beschreibungen"-Block (Vorspalte)
-        if beschreibung == 'standard':
-            beschreibung_liste = ['Wert       experimentell', '           theoretisch  ', 'Abweichung absolut      ', 
-                                  '           relativ      ', '           sigma        ']
-            if einheit != '':
-                einheit_string = f'Einheit    {einheit}'
-                überschuss     = len(einheit) - len('experimentell')
-                stelle         = 'rechts'   # Angabe, dass einheit_string später links ausgerichtet werden soll, 
-                                            # 'rechts' werden Leerzeichen eingefügt.
-                
-        elif beschreibung == 'knapp':
-            beschreibung_liste = ['Wert exp', '     the', 'Abw. abs', '     rel', '     sig']
-            if einheit != '':
-                einheit_string = f'[{einheit}]'
-                überschuss     = len(einheit_string) - len(beschreibung_liste[0])
-                stelle         = 'links'   # links vom einheit_string werden später Leerzeichen eingefügt.
-            
-        ## Ausrichtung der Vorspalte
-        if größe0 != None:  # Randfall: erster größen-String ersetzt einheit.
-            einheit_string = größe0
-            überschuss     = len(einheit_string) - len(beschreibung_liste[0])
-            stelle         = 'rechts'
-            
-        if einheit == '' and größe0 == None:   # Fall: keine einheit angegeben
-            einheit_string = ' ' * len(beschreibung_liste[0])
-        elif überschuss < 0:   # = falls einheit_string schmaler als Beschreibungsstrings
-            einheit_string = _füllen(einheit_string, stelle, menge = -überschuss)
-        elif überschuss > 0:   # = falls einheit_string breiter als Beschreibungsstrings
-            beschreibung_liste = [_füllen(string, index = stelle, menge = überschuss) for string in beschreibung_liste]
+    string_neu = string[:index] + füllzeichen * menge + string[index:]
+    return string_neu
 
-        
-        # Erstellen und Sammeln aller Überschriften-Strings
-        if überschriften != []:
-            überschriften.insert(0, einheit_string)
-            überschriften_string = separator.join(überschriften)   
-            titel_strings.append(überschriften_string)
-            
-        ## Erstellen der Linie, die Überschriften und Vergleiche trennt
-        alle_vergleiche = _listen_transponieren(alle_vergleiche)   # "shape" = (anzahl_vergleiche, anzahl_zahlen) 
-        blöcke_längen   = [len(vergleich) for vergleich in alle_vergleiche[0]]
-        blöcke_längen.insert(0, len(einheit_string))
-        oberlinie       = separator.join(['-' * länge for länge in blöcke_längen])   
-            # Die gestrichelte Oberlinie ist durch separator-Strings unterbrochen, d.h. jeder Block hat seine Linie.
-        titel_strings.append(oberlinie)
-        
-        # Erstellen aller Vergleich-Strings (alles unter der Oberlinie)
-        vergleich_strings = []
-        for i in range(anzahl_vergleichswerte):
-            vergleich_string = separator.join([beschreibung_liste[i], *alle_vergleiche[i]])
-            vergleich_strings.append(vergleich_string)
+
+
+
+def _entfernen(string, index, länge = 1):
+    '''
+    entfernt eine bestimmte Anzahl (länge) Zeichen von einem String ab einem bestimmten Index.
     
     
-    if ausrichtung == 'liste':
-        separator = ' | '   # Was die Spalten der Tabelle voneinander trennt.
-        
-        if beschreibung == 'standard':
-            beschreibung_liste = [['Wert', 'Abweichung'], 
-                                  ['experimentell', 'theoretisch', 'absolut', 'relativ', 'sigma']]
-            
-        elif beschreibung == 'knapp':
-            beschreibung_liste = [['Wert', 'Abw.'], ['exp', 'the', 'abs', 'rel', 'sig']]
-            if einheit != '':
-                einheit = f'[{einheit}]'
+    Argumente
+    ---------
+    string : str
+    
+    index : int, optional
+        Nur index >= 0 sinnvoll.
+
+    länge : int, optional
+        Nur länge >= 0 sinnvoll.
         
-        # Angleichen der Breite der Beschreibungen mit denen der Vergleichswertspalten
-        for i in range(anzahl_vergleichswerte):
-            differenz = len(beschreibung_liste[1][i]) - len(alle_vergleiche[i][0])
-            if differenz < 0:   # = vergleich ist breiter als beschreibung -> Beschreibungen werden "links-zentriert".
-                beschreibung_liste[1][i] = '{:^{width}}'.format(beschreibung_liste[1][i], 
-                                                                width = len(alle_vergleiche[i][0]))
-            elif differenz > 0:    # = vergleich ist schmaler als beschreibung -> Vergleichsstrings werden rechtsbündig 
-                                   #   ausgerichtet.
-                alle_vergleiche[i] = [_füllen(string, 'links', menge = differenz) for string in alle_vergleiche[i]]
-       
-        ## 'Wert' wird zentriert auf die ex- und theo-Spalten. 
-        beschreibung_liste[0][0] = '{:^{width}}'.format(beschreibung_liste[0][0],   
-                                                        width = len(separator.join(beschreibung_liste[1][:2])))
-        ## 'Abweichung' bzw. 'Abw.' wird zentriert auf die abs-, rel- und sig-Spalten
-        beschreibung_liste[0][1] = '{:^{width}}'.format(beschreibung_liste[0][1], 
-                                                        width = len(separator.join(beschreibung_liste[1][2:])))
+    
+    Output
+    ------
+    string_output : str
+    '''
+    
+    
+    return string[:index] + string[(index + länge):]
+
+
+
+
+def _zentrieren_rechts(string, länge_gewünscht, füllzeichen = ' '):
+    '''
+    arbeitet so wie '{:^{width}'.format(string, width = länge_gewünscht), mit dem Unterschied dass .format bei 
+    einer ungeraden Anzahl Füllzeichen, den string ein bisschen nach links anordnet:    'Hi' -> ' Hi  '
+    Diese Funktion ordnet in einem solchen Fall den string ein bisschen nach rechts an: 'Hi' -> '  Hi '
+    Ist die Anzahl Füllzeichen gerade, benehmen sich beide Funktionen gleich:           'Hi' -> '  Hi  '
+    
+    Argumente
+    ---------
+    string : str
+    
+    länge_gewunscht : int
+    
+    füllzeichen : str, optional
+    
+    
+    Output
+    ------
+    string_zentriert : str
+    '''
+    
+    
+    länge_string = len(string)
+    if länge_gewünscht <= länge_string:
+        return string
+    else:
+        füll_länge        = länge_gewünscht - länge_string
+        füll_länge_links  = int(np.ceil(füll_länge / 2))
+        füll_länge_rechts = int(np.floor(füll_länge / 2))
+        string_zentriert  = füllzeichen * füll_länge_links + string + füllzeichen * füll_länge_rechts
+        return string_zentriert
+    
+    
+    
+
+def _zahlen_ausrichtung(zahlen_liste):
+    '''
+    wandelt eine Liste unterschiedlich langer Zahlenstrings in eine Lister gleichlanger Zahlenstrings um,
+    die nach Komma ('.'), Größenordnung ('e') und Einheit (zB. ' %') ausgerichtet sind, siehe "Beispiel".
+    
+    Jeder String wird nur einmal in seine Bereiche zerlegt, die Breite jedes Bereiches als Maximum über alle 
+    Strings bestimmt und jeder ausgerichtete String mit einem einzigen join zusammengesetzt. Dadurch wächst der 
+    Aufwand nur linear mit der Länge der Liste.
+    
+    
+    Argumente
+    ---------
+    zahlen_liste : list  (str)
+        Unterstützte Arten von Strings sind:
+        * int- und float-Strings (auch mit 'e')
+        * solche Strings mit einem Leerzeichen und Einheit hinten dran (zB. '1.4e-3 %')
+        * einzelne Zeichen (zB. '-')
+        * leere Strings
         
-        ## Vorbereiten und Ausrichten der Vorspalte
-        if überschriften != []:  # Wenn falsch, bedeutet auch, dass einheit == '' ist.
-            if einheit == '' or beschreibung == 'knapp':
-                überschriften.insert(0, '')   # Leere erste Zelle
-            elif beschreibung == 'standard':   # Wenn einheit vorhanden und "Platz für ausführlichere Beschreibung"
-                überschriften.insert(0, 'Einheit')
-            if größe0 == None:
-                überschriften.insert(1, einheit)   # einsetzen vom Einheit-String
+    
+    Output
+    ------
+    zahlen_liste : list  (str)
+        
+    
+    Beispiel
+    --------
+    >>> pap._zahlenausrichtung(['23.3',
+    ...                         '2.940e12',
+    ...                         '-94',
+    ...                         '2030 %'
+    ...                         '-6.19e-3'
+    ...                         '-',
+    ...                         ''])
+    ['   23.3       ',
+     '    2.940e12  ',
+     '  -94         ',
+     '-2030        %',
+     '   -6.19 e-3  ',
+     '      -       ',
+     '              ']
+    '''
+    
+    
+    # Vorbearbeitung der Liste
+    anzahl_strings = len(zahlen_liste)
+    if anzahl_strings == 0:
+        return zahlen_liste
+    
+    ''' Nur Zahlenstrings können ausgerichtet werden, alle anderen werden am Ende zentriert.'''
+    test_zahl = [any(x in string for x in ZIFFERN) 
+                 for string in zahlen_liste]
+    zahlen    = [string for string, ist_zahl in zip(zahlen_liste, test_zahl) if ist_zahl]
+    
+    
+    # Ausrichten der Zahlenstrings
+    if len(zahlen) != 0:
+
+        '''Die Zahlenstrings werden in 9 Bereiche unterteilt:
+        minus, vor_komma, komma, nach_komma, e, e-, nach_e, text und ende.
+        String-Bsp: '-23.383e-10 %' 
+        Hier werden in einem Durchgang die Anfangs-Indices aller 9 Bereiche bestimmt. Ist ein Bereich nicht 
+        vorhanden, bekommt er den Index des nachfolgenden Bereiches.'''
+        indices = []
+        for string in zahlen:
+            ende = len(string)
+            text = string.find(' ')
+            if text == -1:
+                text = ende
+            e = string.find('e')
+            if e == -1:
+                e = e_minus = nach_e = text
+            elif 'e-' in string:
+                e_minus = string.find('e-') + 1
+                nach_e  = e_minus + 1
             else:
-                überschriften.insert(1, größe0)   # einsetzen der ersten Überschrift statt Einheit
-            
-            # Bestimmung und Vereinheitlichung der Breite der Vorspalte
-            überschrift_längen = [len(string) for string in überschriften]
-            überschriften_breite = max(überschrift_längen)
-            for i in range(2):   # Bearbeitung der ersten zwei Kopfzeilen 
-                einheit_string = '{:^{width}}'.format(überschriften.pop(0), width = überschriften_breite)
-                beschreibung_liste[i].insert(0, einheit_string)
-            überschriften = ['{:<{width}}'.format(string, width = überschriften_breite) for string in überschriften]
-                # Die einzelnen Überschriften (größen) werden linksbündig ausgerichtet
-            
+                e_minus = nach_e = e + 1
+            komma = string.find('.')
+            if komma == -1:
+                komma = nach_komma = e
+            else:
+                nach_komma = komma + 1
+            minus = 1  if string[0] == '-'  else 0
+            indices.append((0, minus, komma, nach_komma, e, e_minus, nach_e, text, ende))
+        indices = arr(indices)
         
-        # Erstellen und Sammeln aller Überschriften-Strings
-        for i in range(2):  # Erstellen und einfügen der beiden Kopfzeilen-Strings
-            beschreibung_string = separator.join(beschreibung_liste[i])
-            titel_strings.append(beschreibung_string)
-        oberlinie = '-' * len(beschreibung_string)
-        titel_strings.append(oberlinie)
         
-        # Erstellen aller Vergleich-Strings (alles unter der Oberlinie)
-        alle_vergleiche   = _listen_transponieren(alle_vergleiche)   # "shape" = (anzahl_vergleiche, anzahl_zahlen)
-        if überschriften != []:   # Einfügen der Vorspalte falls vorhanden
-            vergleich_liste = [[überschriften[i], *alle_vergleiche[i]] for i in range(anzahl_vergleiche)]
+        '''Aus allen Indices werden die Längen der einzelnen Bereiche bestimmt und daraus die Menge an
+        Füllung, die benötigt wird. Diese wird schließlich bei allen Strings an der richtigen Stelle
+        eingefügt.'''
+        längen      = np.diff(indices, axis = 1)   # shape = (anzahl_zahlen, anzahl_bereiche - 1)
+        längen_diff = (np.max(längen, axis = 0) - längen).tolist()
+            # Anzahl benötigte Leerzeichen um jeden Bereich bis zur Max-Länge aufzufüllen.
+        
+        '''Bereiche e- (5) und nach-e (6) bleiben zusammen und es wird der Platz zwischen dem 'e' und dem '-' 
+        aufgefüllt. Auch der Platz zwischen Bereichen nach-komma (3) und e (4) wird für beide gefüllt. Das gleiche 
+        gilt für den Platz vor Bereichen minus (0) und vor-komma (1), da Minuszeichen an ihren Zahlen haften 
+        bleiben sollen. Fehlt im Zahlenstring irgendeiner dieser Bereiche wird sein Platz ebenso gefüllt.'''
+        ausgerichtet = []
+        for string, (_, _, komma, _, e, e_minus, _, text, _), füllung in zip(zahlen, indices.tolist(), 
+                                                                           längen_diff):
+            ausgerichtet.append(''.join([' ' * (füllung[0] + füllung[1]), string[:komma], 
+                                         ' ' * füllung[2],                string[komma:e], 
+                                         ' ' * (füllung[3] + füllung[4]), string[e:e_minus], 
+                                         ' ' * (füllung[5] + füllung[6]), string[e_minus:text], 
+                                         ' ' * füllung[7],                string[text:]]))
+        
+        
+        # Nachbearbeitung bei Sonderfällen
+        '''Wenn Minuszeichen vorhanden sind, wird überall ein Leerzeichen an Füllung deswegen eingebracht.
+        Da die Minuszeichen aber bei ihren Zahlen bleiben, kann es passieren, dass eine ganze Spalte an 
+        Leerzeichen existiert (all(...)). Dieser wird hier entfernt, da überflüssig.'''
+        if all(string[0] == ' ' for string in ausgerichtet):
+            ausgerichtet = [string[1:] for string in ausgerichtet]
+        test_e = ['e' in string for string in ausgerichtet]
+        if any(test_e) and all('e ' in string for string, hat_e in zip(ausgerichtet, test_e) if hat_e):
+            index_nach_e = ausgerichtet[test_e.index(True)].index('e') + 1
+            ausgerichtet = [_entfernen(string, index_nach_e) for string in ausgerichtet]
+        
+        
+        länge_gesamt = len(ausgerichtet[0])
+    else:   # Falls keine Zahlenstrings in zahlen_liste vorhanden
+        ausgerichtet = []
+        länge_gesamt = max([len(string) for string in zahlen_liste])
+    
+    
+    # Zentrierte nicht-Zahlenstrings werden wieder an ihrer Stelle eingefügt.
+    ausgerichtet = iter(ausgerichtet)
+    return [next(ausgerichtet)  if ist_zahl  else _zentrieren_rechts(string, länge_gesamt)
+            for string, ist_zahl in zip(zahlen_liste, test_zahl)]
+
+
+
+def _ausrichtung_maße(strings, gruppengröße):
+    '''
+    Bestimmt vektorisiert die Maße, aus denen _ausrichtung_breite() die Breite berechnet, die 
+    _zahlen_ausrichtung() für jede Gruppe von  gruppengröße  aufeinanderfolgenden Strings ergeben würde, 
+    ohne die Strings auszurichten.
+    
+    
+    Argumente
+    ---------
+    strings : np.ndarray (1D, str)
+    
+    gruppengröße : int
+    
+    
+    Output
+    ------
+    maße : np.ndarray (int), shape = (anzahl_gruppen, 8)
+        Pro Gruppe die maximalen Längen der Bereiche minus + vor_komma, komma, nach_komma, e, e- + nach_e und 
+        text (siehe _zahlen_ausrichtung()), ob es Zahlenstrings gibt (0 oder 1) und die Länge des längsten 
+        Strings ohne Ziffern.
+    '''
+    
+    
+    ist_zahl = np.zeros(strings.shape, dtype = bool)
+    for ziffer in ZIFFERN:
+        ist_zahl |= np.char.find(strings, ziffer) != -1
+    
+    # Anfangs-Indices der Bereiche wie in _zahlen_ausrichtung()
+    ende  = np.char.str_len(strings)
+    text  = np.char.find(strings, ' ')
+    text  = np.where(text == -1, ende, text)
+    e     = np.char.find(strings, 'e')
+    hat_e = e != -1
+    e     = np.where(hat_e, e, text)
+    e_minus    = np.where(hat_e, e + 1, text)
+    komma      = np.char.find(strings, '.')
+    nach_komma = np.where(komma == -1, e, komma + 1)
+    komma      = np.where(komma == -1, e, komma)
+    
+    '''Minuszeichen (vor_komma) und e- (nach_e) haften an ihren Zahlen, dort bestimmt die längste Kombination die 
+    Breite. Das entspricht genau den Leerzeichen-Spalten, die _zahlen_ausrichtung() am Ende wieder entfernt.'''
+    längen = np.stack([komma, nach_komma - komma, e - nach_komma, e_minus - e, text - e_minus, ende - text, 
+                       np.ones(strings.shape, dtype = int), ende], axis = 1)
+    längen[~ist_zahl, :7] = 0
+    längen[ist_zahl, 7]   = 0
+    return np.maximum.reduceat(längen, np.arange(0, len(strings), gruppengröße), axis = 0)
+
+
+
+
+def _ausrichtung_breite(maße):
+    '''Breite der Strings von _zahlen_ausrichtung() für jede Gruppe aus den Maßen von _ausrichtung_maße().'''
+    
+    return np.where(maße[:, 6] == 1, np.maximum(np.sum(maße[:, :6], axis = 1), maße[:, 7]), maße[:, 7])
+    # Ohne Zahlenstrings werden alle Strings nur zentriert.
+
+
+
+
+def _plus_minus(string_liste):
+    '''
+    entscheidet, welche Strings in einer Liste von Strings mit einem Plus-Minus-Zeichen versehen werden 
+    sollen und welche nicht. Diese Funktion ergibt nur als direkte Hilfsfunktion von pap.vergleichstabelle()
+    Sinn.
+    
+    
+    Argumente
+    ---------
+    string_liste : list  (str) 
+    
+    
+    Output
+    ------
+    plus_minus : list  (str)
+    '''
+    
+    
+    plus_minus = []
+    for string in string_liste:
+        if string == '':   # Falls string leer ist.
+            plus_minus.append('')
+        elif all([zeichen == ' ' for zeichen in string]):   # Falls string nur aus Leerzeichen besteht.
+            plus_minus.append('   ')
         else:
-            vergleich_liste = alle_vergleiche
-        vergleich_strings = [separator.join(vergleich) for vergleich in vergleich_liste]
+            plus_minus.append(' ± ')   # Falls string aus mehr besteht.
+    
+    return plus_minus
+    
+
+    
+    
+VERGLEICH_FELDER = ('ex', 'ex_fehler', 'theo', 'theo_fehler', 
+                    'abweichung_abs', 'abweichung_abs_fehler', 'abweichung_rel', 'abweichung_sig')
+VERGLEICH_DTYPE  = np.dtype([(feld, np.float64) for feld in VERGLEICH_FELDER])
+
+
+
+
+def _fehlend_zu_nan(werte):
+    '''
+    Macht aus einem Array mit fehlenden Werten (NaN, maskiert oder None in einem object-Array) ein 
+    np.float64-Array, in dem alle fehlenden Werte NaN sind.
+    '''
+    
+    fehlend = np.ma.getmaskarray(werte)
+    werte   = np.ma.getdata(werte)
+    if werte.dtype == object:
+        fehlend = fehlend | (werte == None)
+    return np.where(fehlend, np.nan, werte).astype(np.float64)
+
+
+
+
+def vergleich(werte, faktor = 1):
+    '''
+    Berechnet die Abweichungen zwischen fehlerbehafteten experimentellen und theoretischen Werten, ohne etwas 
+    darzustellen. Das ist der Rechenteil von pap.vergleichstabelle() und eignet sich auch für Millionen von 
+    Vergleichen, da alles vektorisiert berechnet wird und keine Strings erstellt werden.
+    
+    
+    Argumente
+    ---------
+    werte : np.ndarray (1D/2D, number_like), np.ma.MaskedArray
+        Form wie bei pap.vergleichstabelle(): (4,) oder (4, N), also 
+        np.array([ex_liste, ex_fehler_liste, theo_liste, theo_fehler_liste]).
+        
+        Fehlende Werte dürfen NaN, maskiert oder None (in einem object-Array) sein. Ein fehlender Fehler-Wert 
+        wird als 0 interpretiert. Fehlt ein ex- oder theo-Wert, sind dieser Wert, sein Fehler und alle 
+        Abweichungen des Vergleichs NaN.
+    
+    faktor : number_like, optional
+        wird multipliziert mit allen Werten.
+    
+    
+    Output
+    ------
+    ergebnis : np.ndarray (structured, dtype = pap.VERGLEICH_DTYPE), shape = (N,)
+        Felder (alle np.float64):
+        'ex', 'ex_fehler', 'theo', 'theo_fehler',
+        'abweichung_abs', 'abweichung_abs_fehler',
+        'abweichung_rel'  - [%], NaN falls theo = 0
+        'abweichung_sig'  - NaN falls abweichung_abs_fehler = 0
+    
+    
+    Beispiel
+    --------
+    >>> werte    = np.array([[3.446, 0.00204], [0.105, 0.00045], [3.69, np.nan], [5e-3, 0]])
+    >>> ergebnis = pap.vergleich(werte)
+    >>> ergebnis['abweichung_sig']
+    array([2.1867..., nan])
+    '''
+    
+    
+    
+    # Überprüfen der Argumente
+    werte_shape = np.shape(werte)
+    if (not len(werte_shape) in [1, 2]) or werte_shape[0] != 4:
+        return _eingabefehler(f'Eingabefehler: shape(werte) = {werte_shape}',
+                              'werte muss die shape  (4, n) mit n = 0, 1, 2, ...  haben.\n')
+    
+    
+    # Erkennen fehlender Werte
+    werte = arr(_fehlend_zu_nan(werte), ndmin = 2)
+    if werte_shape == (4,):
+        werte = werte.T   # Jeder Wert wird eine eigene Liste
+    fehlend = np.isnan(werte)
+    
+    
+    # Vorbereitung der zu verrechnenden Werte
+    werte[fehlend] = 0   # Damit alles berechenbar bleibt, fehlende Vergleiche werden am Ende mit NaN ersetzt.
+    werte          = werte * faktor   # Umrechnung auf gewünschte Größenordnung bzw. Einheit
+    werte[1::2]    = np.abs(werte[1::2])   # Keine negativen Fehlerwerte
+    ex, ex_fehler, theo, theo_fehler = werte
+    
+    
+    # Ausrechnen der Abweichungen
+    if _backend['kerne'] is not None:
+        abweichung_abs, abweichung_abs_fehler, abweichung_rel, abweichung_sig = \
+            _backend['kerne'].abweichungen(ex, ex_fehler, theo, theo_fehler)
+    else:
+        abweichung_abs        = ex - theo
+        abweichung_abs_fehler = summen_fehler(arr([theo_fehler, ex_fehler]))
+        abweichung_rel        = np.divide(abweichung_abs, theo, out = np.full(np.shape(theo), np.nan), 
+                                          where = theo != 0) * 100   # [%]
+        abweichung_sig        = np.abs(np.divide(abweichung_abs, abweichung_abs_fehler, 
+                                                 out = np.full(np.shape(theo), np.nan), 
+                                                 where = abweichung_abs_fehler != 0))
+    
+    
+    # Zusammenstellen des Ergebnisses
+    ergebnis = np.empty(np.shape(ex), dtype = VERGLEICH_DTYPE)
+    for feld, zahlen in zip(VERGLEICH_FELDER, [ex, ex_fehler, theo, theo_fehler, abweichung_abs, 
+                                               abweichung_abs_fehler, abweichung_rel, abweichung_sig]):
+        ergebnis[feld] = zahlen
+    
+    ex_fehlt, theo_fehlt = fehlend[0], fehlend[2]
+    ergebnis[['ex', 'ex_fehler']][ex_fehlt]     = (np.nan, np.nan)
+    ergebnis[['theo', 'theo_fehler']][theo_fehlt] = (np.nan, np.nan)
+    for feld in VERGLEICH_FELDER[4:]:
+        ergebnis[feld][ex_fehlt | theo_fehlt] = np.nan
+    
+    return ergebnis
+
+
+
+
+def vergleichsmatrix(ex_werte, theo_werte, faktor = 1):
+    '''
+    Vergleicht jeden von N experimentellen Werten mit jedem von M theoretischen Werten (zB. verschiedenen Modellen
+    oder Parametersätzen) in einer einzigen vektorisierten Rechnung, statt pap.vergleich() in einer Schleife
+    aufzurufen. Zusätzlich wird zu jedem Messwert die am besten passende Theorie bestimmt.
+    
+    
+    Argumente
+    ---------
+    ex_werte : np.ndarray (number_like), shape = (2, N) oder (N,)
+        np.array([ex_liste, ex_fehler_liste]), ohne Fehler-Liste sind alle Fehler 0.
+        Fehlende Werte wie bei pap.vergleich().
+    
+    theo_werte : np.ndarray (number_like), shape = (2, M) oder (M,)
+        np.array([theo_liste, theo_fehler_liste]), ebenso.
+    
+    faktor : number_like, optional
+        wird multipliziert mit allen Werten.
+    
+    
+    Output
+    ------
+    matrix : np.ndarray (structured, dtype = pap.VERGLEICH_DTYPE), shape = (N, M)
+        matrix[i, j]  ist der Vergleich von Messwert i mit Theorie j, Felder wie bei pap.vergleich().
+    
+    beste : np.ndarray (int), shape = (N,)
+        Index der Theorie mit der kleinsten sigma-Abweichung für jeden Messwert. Bei Fehler 0 zählt eine exakte 
+        Übereinstimmung als beste, sonst werden nur Vergleiche mit sigma-Abweichung berücksichtigt.
+        -1, falls kein Vergleich des Messwertes eine sigma-Abweichung hat.
+    
+    
+    Beispiel
+    --------
+    >>> ex_werte   = np.array([[9.81, 9.69, 9.93], [0.02, 0.05, 0.04]])
+    >>> theo_werte = np.array([[9.78, 9.83], [0.01, 0.01]])   # zB. Äquator und Pol
+    >>> matrix, beste = pap.vergleichsmatrix(ex_werte, theo_werte)
+    >>> matrix['abweichung_sig']
+    array([[1.3416..., 0.8944...],
+           [1.7650..., 2.7456...],
+           [3.6380..., 2.4253...]])
+    >>> beste
+    array([1, 0, 1])
+    >>> matrix[np.arange(len(beste)), beste]   # Die besten Vergleiche selbst
+    '''
+    
+    
+    
+    # Überprüfen der Argumente
+    paare = []
+    for name, werte in [('ex_werte', ex_werte), ('theo_werte', theo_werte)]:
+        werte_shape = np.shape(werte)
+        if not (len(werte_shape) == 1 or (len(werte_shape) == 2 and werte_shape[0] == 2)):
+            return _eingabefehler(f'Eingabefehler: shape({name}) = {werte_shape}',
+                                  f'{name} muss die shape  (2, n)  oder  (n,)  mit n = 0, 1, 2, ...  haben.\n')
+        werte = _fehlend_zu_nan(werte)
+        if len(werte_shape) == 1:   # Ohne Fehler
+            werte = arr([werte, np.zeros(werte_shape)])
+        paare.append(werte)
+    ex_paar, theo_paar = paare
+    anzahl_ex, anzahl_theo = ex_paar.shape[1], theo_paar.shape[1]
+    
+    
+    # Alle Kombinationen als eine lange Liste von Vergleichen, siehe pap.vergleich()
+    werte  = np.concatenate([np.repeat(ex_paar, anzahl_theo, axis = 1), np.tile(theo_paar, (1, anzahl_ex))])
+    matrix = vergleich(werte, faktor).reshape(anzahl_ex, anzahl_theo)
+    
+    
+    # Beste Theorie je Messwert
+    güte = np.where(np.isnan(matrix['abweichung_sig']) & (matrix['abweichung_abs'] == 0), 0, 
+                    matrix['abweichung_sig'])   # Exakte Übereinstimmung ohne Fehler
+    güte = np.where(np.isnan(güte), np.inf, güte)
+    beste = np.argmin(güte, axis = 1)  if anzahl_theo > 0  else np.zeros(anzahl_ex, dtype = int)
+    beste[np.all(np.isinf(güte), axis = 1)] = -1
+    
+    return matrix, beste
+
+
+
+
+def _resultat_präzisionen(werte, nachkommastellen = None):
+    '''
+    Bestimmt für jede Zeile von  werte  die Nachkommastellen nach den Regeln von pap.resultat():
+    Erste signifikante Stelle des größten Fehlers (zwei Stellen, falls diese < 4 ist), ohne Fehler 8.
+    
+    
+    Argumente
+    ---------
+    werte : np.ndarray (2D, np.float64), shape = (N, 1), (N, 2) oder (N, 3)
+        Jede Zeile ist  [ein_wert, *fehler]  wie bei pap.resultat().
+    
+    nachkommastellen : int, np.ndarray (int), optional
+        Manuelle Vorgabe, wird nur auf die shape (N,) gebracht.
+    
+    
+    Output
+    ------
+    nachkommastellen : np.ndarray (int), shape = (N,)
+    '''
+    
+    
+    if nachkommastellen is not None:
+        return np.broadcast_to(np.asarray(nachkommastellen, dtype = int), (len(werte),)).copy()
+    
+    nachkommastellen = np.full(len(werte), 8)   # Da kein Fehler vorhanden bzw. Fehler = 0
+    if werte.shape[1] > 1:
+        größter_fehler  = np.max(werte[:, 1:], axis = 1)
+        mit_fehler      = größter_fehler != 0
+        größter_fehler  = größter_fehler[mit_fehler]
+        größenordnungen = np.floor(np.log10(größter_fehler)).astype(int)
+        erste_ziffern   = np.empty(len(größter_fehler))
+        for größenordnung in np.unique(größenordnungen).tolist():
+            auswahl = größenordnungen == größenordnung
+            erste_ziffern[auswahl] = größter_fehler[auswahl] / 10**größenordnung   # Pythons 10**x wie bisher
+        signifikante_stellen = np.where(erste_ziffern >= 4.0, 1, 2)   # Hier der 4.0-Cutoff
+        nachkommastellen[mit_fehler] = -größenordnungen + signifikante_stellen - 1
+    return nachkommastellen
+
+
+
+
+def _resultat_zahlen(werte, nachkommastellen = None):
+    '''
+    Rundet und formatiert alle Zeilen von  werte  (siehe _resultat_präzisionen()) auf einmal wie pap.resultat().
+    
+    
+    Output
+    ------
+    zahlen_strings : np.ndarray (str), np.shape(zahlen_strings) = np.shape(werte)
+    '''
+    
+    
+    präzisionen = _resultat_präzisionen(werte, nachkommastellen)
+    gerundet    = np.asarray(_rundung(werte, np.repeat(präzisionen[:, None], werte.shape[1], axis = 1)))
+    präzisionen = _negativ_wird_null(präzisionen)   # Keine negativen Werte für format(prec=) erlaubt.
+    
+    zahlen_strings = np.empty(werte.shape, dtype = object)
+    for präzision in np.unique(präzisionen).tolist():
+        auswahl = präzisionen == präzision
+        format_string = f'%.{präzision}f'
+        zahlen_strings[auswahl] = [[format_string % zahl for zahl in zeile] for zeile in gerundet[auswahl].tolist()]
+    return zahlen_strings.astype(str)
+
+
+
+
+def _rel_fehler_strings(rel_fehler):
+    '''
+    Rundet relative Fehler [%] auf zwei signifikante Stellen und formatiert sie wie pap.resultat(), 
+    zB. '   (1.6 %)'. NaN steht für keinen relativen Fehler und wird zu ''.
+    
+    
+    Argumente
+    ---------
+    rel_fehler : np.ndarray (1D, np.float64)
+    
+    
+    Output
+    ------
+    rel_fehler_strings : list (str)
+    '''
+    
+    
+    rel_fehler  = np.abs(rel_fehler)
+    vorhanden   = ~np.isnan(rel_fehler)
+    nicht_null  = vorhanden & (rel_fehler != 0)
+    
+    # Rundung auf 2 signifikanten Stellen 
+    größenordnungen = np.zeros(len(rel_fehler), dtype = int)
+    größenordnungen[nicht_null] = np.floor(np.log10(rel_fehler[nicht_null]))
+    präzisionen = np.where(nicht_null, -größenordnungen + 2 - 1, 2)
+    gerundet    = np.asarray(_rundung(np.where(vorhanden, rel_fehler, 0), präzisionen))
+    präzisionen = _negativ_wird_null(präzisionen)
+    
+    rel_fehler_strings = []
+    for wert, präzision, größenordnung, ist_vorhanden, ist_nicht_null in zip(
+            gerundet.tolist(), präzisionen.tolist(), größenordnungen.tolist(), vorhanden, nicht_null):
+        if not ist_vorhanden:
+            rel_fehler_strings.append('')
+        elif not ist_nicht_null:
+            rel_fehler_strings.append(f'   ({wert} %)')
+        elif größenordnung > -5:   # Sehr kleine Werte sehen besser mit e aus.
+            rel_fehler_strings.append('   ({:.{prec}f} %)'.format(wert, prec = präzision))
+        else:
+            rel_fehler_strings.append('   ({:.1f}e{} %)'.format(wert * 10**(-größenordnung), größenordnung))
+    return rel_fehler_strings
+
+
+
+
+def resultat(titel, werte, einheit = '', faktor = 1, nachkommastellen = None, rel_fehler = False):
+    '''
+    Printet ein schön formatiertes Ergebnis mit 
+    Titel, definierter Präzision, evt. +/- Fehler, Einheit und evt. relativen Fehler.
+    
+    
+    Argumente
+    ---------
+    titel : str
+    
+    werte : number_like, np.ndarray (1D, mit number_like Elementen)
+        Darf die Formen haben 
+        ein_wert, np.array([ein_wert]),
+        np.array([ein_wert, sein_fehler]) oder 
+        np.array([ein_wert, sys_fehler, stat_fehler]).
+    
+    einheit : str
+    
+    faktor : number_like, optional
+        Ermöglicht Anpassung an Größenordnung und Einheit.
+    
+    nachkommastellen : int, optional
+        Siehe "Rundung des Ergebnisses".
+    
+    rel_fehler : bool, number_like, optional
+        darf False sein     (aus),
+             True sein      (wenn Fehler vorhanden und ein_wert != 0,
+                             dann wird dieser als sein_fehler / ein_wert bzw. als
+                             (quadratische summe von sys- und stat_fehler) / ein_wert
+                             berechnet.), oder
+             eine Zahl sein (Einheit Prozent; diese wird dann direkt angegeben)
+    
+    
+    Output
+    ------
+    Nur falls nicht modus = 'print' (siehe pap.ausgabe_einstellen()), sonst None.
+    
+    gerundete_werte : np.ndarray (1D, np.float64)
+        werte * faktor  gerundet wie im Ergebnis-String, Fehler positiv.
+    
+    nachkommastellen : int
+        Die benutzten Nachkommastellen, siehe "Rundung der Ergebnisse".
+    
+    
+    Beispiele
+    ---------
+    >>> pap.resultat('Abweichung', 0.30304, '%', faktor = 1e2, nachkommastellen = 0)
+      Abweichung: 30 %
+    
+    >>> pap.resultat('Arbeit', np.array([3.35e6, 0.46e6]), 'MJ', faktor = 1e-6)
+      Arbeit: 3.4 +/- 0.5 MJ
+    
+    >>> pap.resultat('Beschleunigung', np.array([9.8493, 0.0424, 0.1235]), 'm/s^2')
+      Beschleunigung: 9.85 +/- 0.04(sys) +/- 0.12 (stat) m/s^2
+    
+    
+    mit relativem Fehler:
+    
+    >>> pap.resultat('Arbeit           ', np.array([3.3423, 0.4679]), 'J', rel_fehler = True)
+      Arbeit           : 342 +/- 5 J   (1.6 %)
+    
+    >>> pap.resultat('Fehler der Arbeit', 0.4679, 'J', rel_fehler = 1.6)
+      Fehler der Arbeit: 5 J   (1.6 %)
+                    
+    
+    Rundung der Ergebnisse
+    ----------------------
+      * Gibt man die Zahl der Nachkommastellen manuell an, so wird nach ihr gerundet.
+        Dabei sind auch negative Werte erlaubt. Bei -1 z.B. wird 123 -> 120 gerundet.
+      * Ansonsten wird automatisch nach der ersten signifikanten Stelle des größten
+        Fehlers gerundet. z.B. [-123.33, -5.0, 0.02] wird zu "-123.3 +/- 5.0 +/- 0.0"
+        Ist der Betrag dieser Stelle aber < 4, dann wird auf zwei signifikante 
+        Stellen gerundet, d.h. 0.436 -> "0.4", aber 0.0392 -> "0.39"
+      * Gibt es kein Fehler, oder sind diese alle 0, dann wird automatisch
+        nachkommastellen = 16 gesetzt.
+      * Der relative Fehler wird stehts auf zwei signifikante Stellen gerundet.
+    '''
+    
+    
+    
+    # Überprüfen und Korrigierung von werte
+    if type(werte) != np.ndarray:   # Falls werte nur eine Zahl ist, wird sie zum Array gemacht.
+        werte = arr([werte])
+    if werte.ndim != 1 or len(werte) == 0:
+        return _eingabefehler(f'Eingabefehler: shape(werte) = {werte.shape}',
+                              'werte muss eine Zahl oder ein 1D-Array mit 1 bis 3 Elementen sein.\n')
+    if len(werte) > 3:
+        return _eingabefehler('Zu viele Elemente in werte! >:(')
+    
+    if not _printen():   # Nur die gerundeten Zahlen und ihre Nachkommastellen
+        werte      = np.array(werte, dtype = np.float64) * faktor
+        werte[1:]  = np.abs(werte[1:])   # Keine negativen Fehlerangaben
+        präzision  = _resultat_präzisionen(werte[np.newaxis], nachkommastellen)
+        gerundet   = np.asarray(_rundung(werte, np.full(len(werte), präzision[0])))
+        return gerundet, int(präzision[0])
+    
+    # Print des Ergebnis-Strings, berechnet wird er wie alle anderen in pap.resultat_strings().
+    ergebnis_strings = resultat_strings(titel, werte[np.newaxis], einheit, faktor, nachkommastellen, rel_fehler)
+    if ergebnis_strings is None:   # Eingabefehler, schon geprintet
+        return
+    _ausgeben([ergebnis_strings[0]])
+
+
+
+
+def resultat_strings(titel, werte, einheit = '', faktor = 1, nachkommastellen = None, rel_fehler = False):
+    '''
+    Erstellt die Ergebnis-Strings von pap.resultat() für viele Ergebnisse auf einmal, ohne sie zu printen. 
+    Rundung und Formatierung aller Zeilen passiert gemeinsam (vektorisiert), was bei tausenden Ergebnissen 
+    um ein Vielfaches schneller ist als pap.resultat() in einer Schleife.
+    
+    
+    Argumente
+    ---------
+    titel : str, list (str)
+        Ein Titel für alle oder einer pro Ergebnis.
+    
+    werte : np.ndarray (number_like), shape = (N,), (N, 1), (N, 2) oder (N, 3)
+        Jede Zeile ist  ein_wert,  [ein_wert, sein_fehler]  oder  [ein_wert, sys_fehler, stat_fehler]
+        wie bei pap.resultat().
+    
+    einheit : str
+    
+    faktor : number_like, optional
+    
+    nachkommastellen : int, np.ndarray (int), optional
+        Eine Vorgabe für alle oder eine pro Ergebnis. Siehe "Rundung der Ergebnisse" in pap.resultat().
+    
+    rel_fehler : bool, number_like, np.ndarray (bool oder number_like), optional
+        Wie bei pap.resultat(), für alle Ergebnisse gleich oder eines pro Ergebnis. 
+        In einem Array von Zahlen bedeutet NaN keinen relativen Fehler.
+    
+    
+    Output
+    ------
+    strings : list (str), Länge N
+    
+    
+    Beispiel
+    --------
+    >>> werte = np.array([[9.8493, 0.0424], [9.7712, 0.0031], [0, 0.26]])
+    >>> pap.resultat_strings(['g_1', 'g_2', 'g_3'], werte, 'm/s^2', rel_fehler = True)
+    ['g_1: 9.85 +/- 0.04 m/s^2   (0.43 %)', 'g_2: 9.7712 +/- 0.0031 m/s^2   (0.032 %)', 'g_3: 0.00 +/- 0.26 m/s^2']
+    '''
+    
+    
+    
+    # Überprüfen und Korrigierung von werte
+    werte = np.array(werte, dtype = np.float64, ndmin = 1)
+    if werte.ndim == 1:
+        werte = werte.reshape(-1, 1)
+    anzahl = len(werte)
+    if werte.ndim != 2 or not werte.shape[1] in [1, 2, 3]:
+        return _eingabefehler(f'Eingabefehler: shape(werte) = {werte.shape}',
+                              'werte muss die shape  (N,), (N, 1), (N, 2) oder (N, 3)  haben.\n')
+    titel = [titel] * anzahl   if isinstance(titel, str)  else list(titel)
+    
+    werte        = werte * faktor   # Umrechnung der Resultate auf gewünschte Einheit oder Größenordnung
+    werte[:, 1:] = np.abs(werte[:, 1:])   # Keine negativen Fehlerangaben
+    
+    
+    # eventuelles Erstellen der relativen Fehler, NaN heißt kein relativer Fehler.
+    if isinstance(rel_fehler, bool):
+        rel_fehler = np.full(anzahl, rel_fehler)
+    rel_fehler = np.asarray(rel_fehler)
+    if rel_fehler.dtype == bool:
+        berechnen  = rel_fehler & (werte[:, 0] != 0) & (werte.shape[1] > 1)
+        # Um divide-by-zero und divide-by-nothing Fehler zu vermeiden.
+        rel_fehler = np.full(anzahl, np.nan)
+        if werte.shape[1] > 1:
+            gesamtfehler = summen_fehler(werte[berechnen, 1:].T)   # Bei nur einem Fehler ist das dieser.
+            rel_fehler[berechnen] = gesamtfehler / werte[berechnen, 0] * 100   # [%]
+    rel_fehler_strings = _rel_fehler_strings(np.broadcast_to(np.asarray(rel_fehler, dtype = np.float64), 
+                                                             (anzahl,)))
+    
+    
+    # Rundung entsprechend der signifikante Stelle oder der eigenen Vorgabe
+    zahlen_strings = _resultat_zahlen(werte, nachkommastellen).tolist()
+    
+    
+    # Zusammensetzen der Ergebnis-Strings
+    if werte.shape[1] == 1:
+        vorlage = '{}: {} {}{}'
+    elif werte.shape[1] == 2:
+        vorlage = '{}: {} +/- {} {}{}'
+    else:
+        vorlage = '{}: {} +/- {}(sys) +/- {}(stat) {}{}'
+    return [vorlage.format(titel[i], *zahlen_strings[i], einheit, rel_fehler_strings[i]) for i in range(anzahl)]
+
+
+
+
+def _überschriften(größen, einheit, anzahl_vergleiche):
+    '''
+    Macht aus dem  größen-Argument von pap.vergleichstabelle() die Liste der Überschriften jedes Vergleichs.
+    
+    
+    Output
+    ------
+    überschriften : list (str)
+        Leer, falls keine Überschriften-Zeile nötig ist, sonst Länge  anzahl_vergleiche.
+    
+    größe0 : str, None
+        Wird String im Falle, dass erster Wert von größen als einheit interpretiert wird.
+    
+    Bei einer falschen Anzahl größen wird eine Fehlermeldung geprintet und None returned.
+    '''
+    
+    
+    größe0 = None
+    if not type(größen) in [str, list]:
+        größen = list(größen)
+    if len(größen) == 0: # Falls größen leer
+        if einheit == '':
+            überschriften = []   # Überschriften-Zeile muss nicht geprintet werden
+        else:
+            fehlende_größen = [''] * anzahl_vergleiche
+            überschriften = [*fehlende_größen]
+    elif type(größen) == str:
+        fehlende_größen = [''] * (anzahl_vergleiche - 1)
+        überschriften = [größen, *fehlende_größen]
+    elif len(größen) < anzahl_vergleiche:
+        fehlende_größen = [''] * (anzahl_vergleiche - len(größen))
+        überschriften = [*größen, *fehlende_größen]
+    elif len(größen) == anzahl_vergleiche:
+        überschriften = list(größen)
+    elif len(größen) - 1 == anzahl_vergleiche and einheit == '':
+        größe0 = größen[0]
+        überschriften = größen[1:]
+    else:
+        if anzahl_vergleiche == 1:
+            fehler_zeile = (f'Eingabefehler: len(größen) = {len(größen)}, aber es findet nur {anzahl_vergleiche} '
+                            'Vergleich statt.')
+        else:
+            fehler_zeile = (f'Eingabefehler: len(größen) = {len(größen)}, aber es finden nur {anzahl_vergleiche} '
+                            'Vergleiche statt.')
+        return _eingabefehler(fehler_zeile,
+                              'Es darf höchstens so viele Größen wie Vergleiche geben.',
+                              '(Ausnahme: einheit = \'\' und len(größen) = anzahl_vergleiche + 1,',
+                              ' dann wird der erste Wert als einheit interpretiert)\n')
+    
+    return überschriften, größe0
+
+
+
+
+def vergleichstabelle(werte, titel = '', einheit = '', größen = '', faktor = 1, ausrichtung = 'blöcke', 
+                      beschreibung = 'standard'):
+    '''
+    Printet einen wissenschaftlichen Vergleich von fehlerbehafteten experimentellen und theoretischen Werten in 
+    Tabellenform. 
+    Berechnet und angezeigt werden zusätzlich absolute und relative sowie sigma-Abweichungen.
+    Die Werte sind zur besseren Vergleichbarkeit in ±-Darstellung, nach Komma und Exponent ausgerichten als auch 
+    gerundet entsprechend der Größe ihrer Fehler (siehe "Berechnung und Rundung").
+    
+    Die Vergleiche können sowohl nebeneinander als 'blöcke' dargestellt werden als auch untereinander als 'liste'.
+    Einheit sowie Überschriften der einzelnen Vergleiche (größen) können auch angegeben werden.
+    Ist nicht modus = 'print' (siehe pap.ausgabe_einstellen()), wird nach dem Überprüfen der Argumente nur 
+    pap.vergleich(werte, faktor) returned, die Zeilen gibt es mit pap.vergleichstabelle_zeilen().
+    Randfälle sowie "div-by-0"-Probleme und fehlende Werte (None) werden automatisch hantiert.
+    Ein Überblick der Darstellungsoptionen ist in "Beispiele" zu finden.
+    
+
+
+    Argumente
+    ---------
+    werte : np.ndarray (1D/2D, mit number_like oder None Elementen)
+        Darf folgende Formen haben:
+        * shape = (4, 0), np.array([ex_wert, ex_fehler, theo_wert, theo_fehler ])
+        * shape = (4, N), np.array([ex_liste, ex_fehler_liste, theo_liste, theo_fehler_liste]) mit  Listenlänge N, 
+                          N = Anzahl der Wertvergleiche, die gemacht werden sollen.
+        
+        Art der Werte:
+        Die Elemene dürfen reellwertige Zahlen sein (int, bool oder numpy-Äquivalente) oder None sein.
+        Ein Fehler-Wert, der None ist, wird als 0 interpretiert. Ein ex-/theo_wert der None ist, wird als fehlende Zahl 
+        interpretiert und es wird kein Vergleich durchgeführt, siehe "Beispiele".
+        Statt None dürfen fehlende Werte auch NaN oder maskiert (np.ma.MaskedArray) sein.
+        Die Berechnung der Abweichungen übernimmt pap.vergleich().
+        
+    titel : str, optional
+        Tabellentitel, unbearbeitet
+    
+    einheit : str, optional
+        Wird in der oberen linken Zelle als Einheit der verglichen Werte gekennzeichnet sein.
+    
+    größen : str, array_like (1D, mit str Elementen), optional
+        Überschriften für jeden Vergleich. Werden je nach Ausrichtung in der Titelzeile bzw. -spalte des 
+        jeweiligen Vergleichs angezeigt.
+        Darf folgende Formen haben:
+        * str                   - einzelne Überschrift
+        * Liste bis Länge N     - bis zu eine Überschrift für jeden Vergleich. Bei weniger Überschriften 
+                                  bekommen die letzten Vergleiche keine Überschrift.
+        * Liste von Länge N + 1 - nur möglich, wenn einheit nicht angegeben. Erster String der Liste 
+                                  ersetzt einheit und die Kennzeichnung 'Einheit' bzw. '[...]'. Die 
+                                  restlichen Strings sind die jeweiligen Vergleichsüberschriften.
+    
+    faktor : number_like, optional
+        wird multipliziert mit allen Werten. Falls die angegebene Einheit (oder Größenordnung) nicht die ist, in der 
+        gerechnet wurde.
+    
+    ausrichtung : str, optional
+        Darf nur sein:
+        'blöcke'  - Vergleiche nebeneinander als "Blöcke".
+        
+        'liste'   - Vergleiche übereinander als Liste von Zeilen.
+    
+    beschreibung : str, optional
+        meint die Überschriften wie "Wert experimentell", "Abweichung absolut" etc.
+        Darf nur sein:
+        'standard' - Überschriften in voller Länge, zB. "Abweichung sigma"
+        
+        'knapp'    - Überschriften abgekürzt, zB. "Abw. sig"
+        
+        
+    
+    Beispiele
+    ---------
+    * Gewöhnlicher Vergleich:
+    >>> titel = 'Literaturvergleich Fallbeschleunigung'
+    >>> werte = arr([9.634, 0.274, 9.810, 5e-4])
+    >>> vergleichstabelle(werte, titel, einheit = 'm/s^2')
+      Literaturvergleich Fallbeschleunigung
+  
+             Einheit    m/s^2                         
+      ------------------------   --------------
+      Wert       experimentell    3.45  ± 0.10 
+                 theoretisch      3.690 ± 0.005
+      Abweichung absolut         -0.24  ± 0.11 
+                 relativ             -6.6 %    
+                 sigma                2.3 σ    
+  
+    
+    * Knappe Beschreibung
+      + "div-by-0"
+    >>> werte  = np.array([[3.446, 0.00204], [0.105, 0.00045], [3.69, 0], [5e-3, 0]])
+    >>> größen = ['Boden', 'Orbit']
+    >>> vergleichstabelle(werte, titel, einheit = 'm/s^2', größen = größen, beschreibung = 'knapp')
+      Literaturvergleich Fallbeschleunigung
+      
+       [m/s^2]       Boden             Orbit     
+      --------   --------------   ---------------
+      Wert exp    3.45  ± 0.10    0.0020 ± 0.0004
+           the    3.690 ± 0.005   0.0    ± 0.0   
+      Abw. abs   -0.24  ± 0.11    0.0020 ± 0.0004
+           rel       -6.6 %              -       
+           sig        2.3 σ            4.5 σ      
+
+    
+    * Listenansicht
+      + stark variierende Größenordnungen
+      + fehlende Werte
+    >>> titel  = 'Erneute Messungen der Strahlenexposition'
+    >>> werte  = np.array([[0.039, 5.392,  7372.038, 0.299, 4703822.612, 345.384], 
+                           [0.018, 0.385,   274.340, 0.070,   53891.349,  18.239], 
+                           [0.031, 5.408, 10381.949, 0.285, 8239403.217,    None], 
+                           [0.012, 0.094,    93.911, 0.033,    3495.384,   None]])
+    >>> größen = ['Ort A', 'Ort B', 'Ort C', 'Ort D', 'Ort E', 'Ort F (neu)']
+    >>> vergleichstabelle(werte, titel, einheit = 'µS/h', ausrichtung = 'liste', größen = größen)
+      Erneute Messungen der Strahlenexposition
+  
+        Einheit   |                       Wert                       |                  Abweichung                  
+         µS/h     |     experimentell      |       theoretisch       |         absolut         | relativ  |  sigma  
+      --------------------------------------------------------------------------------------------------------------
+      Ort A       |    0.039   ±     0.018 |     0.031    ±    0.012 |     0.008   ±     0.022 |  26    % |  0.37  σ
+      Ort B       |    5.39    ±     0.38  |     5.41     ±    0.09  |    -0.0     ±     0.4   |  -0.30 % |  0.040 σ
+      Ort C       | 7370       ±   270     | 10380        ±   90     | -3010       ±   290     | -29    % | 10     σ
+      Ort D       |    0.30    ±     0.07  |     0.285    ±    0.033 |     0.01    ±     0.08  |   4.9  % |  0.18  σ
+      Ort E       |    4.70 e6 ± 50000     |     8.2394e6 ± 3500     |    -3.54 e6 ± 50000     | -43    % | 65     σ
+      Ort F (neu) |  345       ±    18     |                         |                         |          |         
+      
+    
+    * Listenansicht knapp
+      + größen[0] ersetzt einheit
+    >>> titel  = 'Vergleich der Viskositäten nach Stokes bzw. Hagen-Poiseuille'
+    >>> werte  = arr([[1.2515, 1.3855, 1.4089], [0.0239, 0.0156, 0.0227], 
+                      [1.4000, 1.4000, 1.6480], [0.0010, 0.0010, 0.0005]])
+    >>> größen = ['Adiabatenkoeffizient', 'Clément-Desormes Luft', 'Rüchhardt        Luft', 'Rüchhardt        Argon']
+    >>> vergleichstabelle(werte, titel, größen = größen, ausrichtung = 'liste', beschreibung = 'knapp')
+      Vergleich der Viskositäten nach Stokes bzw. Hagen-Poiseuille
+  
+                             |              Wert               |                Abw.               
+       Adiabatenkoeffizient  |      exp      |       the       |      abs       |   rel   |   sig  
+      ---------------------------------------------------------------------------------------------
+      Clément-Desormes Luft  | 1.252 ± 0.024 | 1.4000 ± 0.0010 | -0.148 ± 0.024 | -11   % |  6.2  σ
+      Rüchhardt        Luft  | 1.386 ± 0.016 | 1.4000 ± 0.0010 | -0.014 ± 0.016 |  -1.0 % |  0.93 σ
+      Rüchhardt        Argon | 1.409 ± 0.023 | 1.6480 ± 0.0005 | -0.239 ± 0.023 | -15   % | 11    σ
+
+
+
+    Berechnung und Rundung
+    ----------------------
+    Die Vergleichswerte werden wie folgt berechnet:
+    * abweichung_abs        = wert_ex - wert_theo
+    * abweichung_abs_fehler = np.sqrt(wert_ex_fehler**2 + wert_theo_fehler**2)
+    * abweichung_rel        = abweichung_abs / wert_theo
+    * abweichung_sig        = abweichung_abs / abweichung_abs_fehler
+    * Bei einem "div-by-0"-Fall wird der entsprechende Vergleichswert mit '-' ersetzt.
+    
+    Art der Rundung: symmetrisches Runden
+    * gerundet wird mit Pythons round()
+    * Im Gegensatz zum Schulrunden wird bei 5 nicht immer aufgerundet sondern zur nächsten geraden Zahl.
+    * Bsp.: 10.5 -> 10,  11.5 -> 12,    2.5 -> 2,  3.5 -> 4
+    * Beim Runden von vielen Zahlen reduziert dies den systematischen Fehler, der durchs Runden entsteht.
+    
+    Gerundet wird nach der Größe des Fehlers:
+    * Dieser wird auf eine signifikante Stelle gerundet, wenn die erste Ziffer größer als 3 ist.
+      - Wenn die erste Ziffer kleiner ist, wird auf zwei signifikante Stellen gerundet.
+      - Ist der Fehler 0, dann wird auf eine Nachkommastelle gerundet.
+    * Die Absolutzahl wird auf ebenso viele Nachkommastellen wie ihr Fehler gerundet
+      - Also, '123.46 ± 0.04' aber '123.456 ± 0.039'
+    * relative und sigma Abweichung werden immer auf zwei signifikante Stellen gerundet.
+      - Wenn eine 0 ist, sieht das so aus: '0.00 %'
+    * Rundung ohne Komma ist auch möglich: '1624.2 ± 59.9' -> '1600 ± 60'
+
+    Ausrichtung der Zahlen erfolgt nach Komma und Exponent:
+    * Zahlen ab der Größenordnung 10^5 bzw. 10^-5 werden in Exponententenschreibweise dargestellt, zB. '1.38e-23'
+      - Deren Kommas werden um Platz zu sparen genau wie die anderen Kommas ausgerichtet.
+    * Minuszeichen bleiben an ihren Zahlen haften.
+    Beispiel:
+    '   -3.28   e18'
+    '49200         '
+    '  -58.07023   '
+    '    0.0034    '
+    '    2.933  e-9'
+    '''
+
+
+
+    if not _printen():   # Nur die Zahlen, Eingabefehler lösen trotzdem einen ValueError aus.
+        if _vergleichstabelle_prüfen(werte, titel, einheit, größen, ausrichtung, beschreibung) is not None:
+            return vergleich(werte, faktor)
+        return
+    
+    alle_strings = _vergleichstabelle_zeilen(werte, titel, einheit, größen, faktor, ausrichtung, beschreibung)
+    if alle_strings is None:   # Eingabefehler, schon geprintet
+        return
+    
+    # Printen der Tabelle
+    _ausgeben([*alle_strings, ''])   # '' zum Separieren von nachfolgenden Prints.
+
+
+
+
+def _vergleichstabelle_prüfen(werte, titel, einheit, größen, ausrichtung, beschreibung):
+    '''
+    Überprüft die Argumente von pap.vergleichstabelle() (siehe dort) und bereitet die Größen vor.
+    Returned  (überschriften, größe0)  wie _überschriften(), bei Eingabefehlern None.
+    '''
+    
+    
+    # Überprüfen der Argumente
+    werte_typ = type(werte)
+    if not isinstance(werte, np.ndarray):
+        return _eingabefehler(f'Eingabefehler: type(werte) = {werte_typ}',
+                              'werte muss ein numpy Array sein.\n')
+    werte_shape = np.shape(werte)
+    if (not len(werte_shape) in [1, 2]) or werte_shape[0] != 4:
+            return _eingabefehler(f'Eingabefehler: shape(werte) = {werte_shape}',
+                                  'werte muss die shape  (4, n) mit n = 0, 1, 2, ...  haben.\n')
+    
+    titel_typ = type(titel) 
+    if titel_typ != str:
+        return _eingabefehler(f'Eingabefehler: type(titel) = {titel_typ}',
+                              'titel muss ein String sein.\n')
+    
+    einheit_typ = type(einheit)
+    if einheit_typ  != str:
+        return _eingabefehler(f'Eingabefehler: type(einheit) = {einheit_typ}',
+                              'einheit muss ein String sein.\n')
+    
+    ausrichtung_optionen = ['blöcke', 'liste']
+    if not ausrichtung in ausrichtung_optionen:
+        return _eingabefehler(f'Eingabefehler: ausrichtung = {ausrichtung}',
+                              f'ausrichtung kann nur folgende Strings sein: {ausrichtung_optionen}\n')
+    
+    beschreibung_optionen = ['standard', 'knapp']
+    if not beschreibung in beschreibung_optionen:
+        return _eingabefehler(f'Eingabefehler: beschreibung = {beschreibung}',
+                              f'beschreibung kann nur folgende Strings sein: {beschreibung_optionen}\n')
+    
+    # größen
+    anzahl_vergleiche = 1  if np.ndim(werte) == 1  else np.shape(werte)[1]
+    return _überschriften(größen, einheit, anzahl_vergleiche)
+
+
+
+
+def _vergleichstabelle_zeilen(werte, titel, einheit, größen, faktor, ausrichtung, beschreibung, breiten = None):
+    '''
+    Erstellt alle Zeilen einer Tabelle von pap.vergleichstabelle() als Liste von Strings, ohne sie zu printen.
+    Argumente siehe dort. Bei Eingabefehlern wird die Fehlermeldung geprintet und None returned.
+    
+    breiten  (nur 'liste'): Mindestbreiten  (vorspalte, [5 Spalten])  von _liste_breiten(), damit alle Seiten 
+    von pap.vergleichstabelle_zeilen() gleich breite Spalten haben.
+    '''
+    
+    
+    
+    # Überprüfen der Argumente und Vorberarbeitung der Größen(-liste)
+    überschriften_größe0 = _vergleichstabelle_prüfen(werte, titel, einheit, größen, ausrichtung, beschreibung)
+    if überschriften_größe0 is None:   # Eingabefehler, schon geprintet
+        return
+    überschriften, größe0 = überschriften_größe0
+    
+    
+    
+    # Berechnung der Abweichungen (siehe pap.vergleich())
+    ergebnis = vergleich(werte, faktor)
+    
+    ## Positionen fehlender ex- und theo-Werte, um später dort den Vergleich zu löschen
+    ex_fehlt        = np.isnan(ergebnis['ex'])
+    theo_fehlt      = np.isnan(ergebnis['theo'])
+    vergleich_fehlt = ex_fehlt | theo_fehlt
+    
+    ## Ersetzung der NaN-Werte durch Nullen um darstellbar zu bleiben
+    ex, ex_fehler, theo, theo_fehler, abweichung_abs, abweichung_abs_fehler, abweichung_rel, abweichung_sig = \
+        [np.nan_to_num(ergebnis[feld]) for feld in VERGLEICH_FELDER]
+    # div-by-0-Fälle (NaN) bei abweichung_rel und _sig werden so 0 und später mit '-' ersetzt.
+    
+    
+    ## Wichtige Konstanten
+    anzahl_vergleiche = len(ergebnis)
+    anzahl_zahlen = 8    # Anzahl Zahlen, die in einem Vergleich vorkommen
+    anzahl_vergleichswerte = 5  # Anzahl (fehlerbehafteter) Werte, die in einem Vergleich vorkommen
+    
+
+
+        
+    # Rundung
+    ## Bestimmung der Nachkommastellen
+    werte_absolut = arr([ex, theo, abweichung_abs])
+    werte_fehler  = arr([ex_fehler, theo_fehler, abweichung_abs_fehler])
+    werte_relativ = arr([abweichung_rel, abweichung_sig])
+    
+    ### Berechnung der Anzahl der Nachkommastellen des gerundeten Wertes
+    nachkommastellen_fehler  = _nachkommastelle(werte_fehler, sig_grenze = 3.95) 
+    '''Cutoff, ab dem nur noch eine signifikante Stelle angezeigt wird, soll eigentlich 4.0 sein, 
+    aber aufgerundete Werte sollen auch als '4', nicht '4.0' dargestellet werden.'''
+    nachkommastellen_absolut = nachkommastellen_fehler   
+                               # Die Rundung der Absolutwerte orientiert sich an der Größe ihrer Fehlerwerte.
+    nachkommastellen_relativ = _nachkommastelle(werte_relativ, sig_stellen = 2, sig_grenze = 1.0)  
+                               # Hier immer 2 signifikante Stellen.
+    
+    ### Bildung eines nachkommastellen-Arrays mit shape = (anzahl_zahlen, anzahl_vergleiche)
+    nachkommastellen = []
+    for i in range(3):
+        nachkommastellen.append(nachkommastellen_absolut[i])
+        nachkommastellen.append(nachkommastellen_fehler[i])
+    nachkommastellen.extend(nachkommastellen_relativ)
+    nachkommastellen = np.array(nachkommastellen, dtype = int)
+    
+    
+    ## Rundung und Darstellung aller Werte
+    alle_werte          = arr([ex, ex_fehler, theo, theo_fehler, abweichung_abs, abweichung_abs_fehler,
+                               abweichung_rel, abweichung_sig])   # shape = (anzahl_zahlen, anzahl_vergleiche)
+    alle_werte_strings  = _zahlen_strings(alle_werte, nachkommastellen)
+    
+    ## Löschen des Vergleichs, falls ex- oder theo-Werte None waren, da Vergleich dann sinnlos.
+    alle_werte_strings = alle_werte_strings.T  # shape = (anzahl_vergleiche, anzahl_zahlen)
+    alle_werte_strings[ex_fehlt, 0:2]        = ''
+    alle_werte_strings[theo_fehlt, 2:4]      = ''
+    alle_werte_strings[vergleich_fehlt, 4:8] = ''   # Fehlt irgendein Wert, werden alle Abweichungs-Werte gelöscht.
+
+
+                
+    # Formatierung der Werte zu schönen, gut lesbaren Vergleichen
+    if ausrichtung == 'blöcke':
+        alle_vergleiche = []
+        '''Wird alle Vergleichswerte als fertig ausgerichtete Strings enthalten, welche einheitliche Länge haben.'''
+        for i in range(anzahl_vergleiche):
+            strings_einzelwerte = alle_werte_strings[i]
+
+            # Anpassen der Absolutzahlen aneinander
+            strings_absolut = list(strings_einzelwerte[[0, 2, 4]])
+            strings_absolut = _zahlen_ausrichtung(strings_absolut)
+
+            # Anpassen der Fehlerzahlen aneinander
+            strings_fehler = list(strings_einzelwerte[[1, 3, 5]])
+            strings_fehler = _zahlen_ausrichtung(strings_fehler)
+
+            # Zusammenstellen des Vergleichs
+            plus_minus = _plus_minus(strings_absolut)
+            strings_plusminus = [strings_absolut[j] + plus_minus[j] + strings_fehler[j]
+                                 for j in range(len(strings_absolut))]
+            
+            # Darstellen der relativen und sigma-Abweichungen
+            string_rel, string_sig = [strings_einzelwerte[6] + ' %', strings_einzelwerte[7] + ' σ']
+            
+            # Anpassung der Relativwerte bei bestimmten Randfällen
+            if string_rel[0] == '-':   # Falls die Zahl negativ ist, soll die sigma-Zahl ein extra ' ' vorne bekommen.
+                string_sig = _füllen(string_sig, index = 0)
+            if theo[i] == 0:   # Statt div-by-0 oder unsinnigem Wert wird die rel. Abweichung einfach als '-' angegeben.
+                string_rel = '-'
+            if abweichung_abs_fehler[i] == 0:   # Gleiches gilt für die sigma-Abweichung
+                string_sig = '-'
+            if vergleich_fehlt[i]:   # Falls ex oder theo fehlt, werden die unsinnigen Abweichungszahlen gelöscht.
+                string_rel = ''
+                string_sig = ''
+            
+            # Mittige Ausrichtung aller Strings zu einem Block von gleichmäßiger Breite
+            strings_vergleich = [*strings_plusminus, string_rel, string_sig]
+            breite_block = max([len(string) for string in strings_vergleich])
+            strings_vergleich = [_zentrieren_rechts(string, breite_block) for string in strings_vergleich] 
+            
+            alle_vergleiche.append(strings_vergleich)
+            
+    elif ausrichtung == 'liste':
+        alle_werte_strings = alle_werte_strings.T   # shape = (anzahl_zahlen, anzahl_vergleiche)
+        
+        
+        # Anpassen und Zusammenfügen von Vergleichszahlen zu Absolutwerten
+        zahlen_absolut = [_zahlen_ausrichtung(list(zahlen)) for zahlen in alle_werte_strings[:6]]
+        '''Alle Elemente der 8 Vergleichszahlen (Listen von Strings) werden aneinander ausgerichtet, da sie in der
+        Tabelle als vertikale Liste dargestellt werden.'''
+        plus_minus = [_plus_minus(zahlen_absolut[i]) for i in range(0, len(zahlen_absolut), 2)]   # range = [0, 2, 4]
+        strings_absolut = [[zahlen_absolut[i][j] + plus_minus[i//2][j] + zahlen_absolut[i + 1][j] 
+                            for j in range(anzahl_vergleiche)] for i in range(0, len(zahlen_absolut), 2)]
+        
+        
+        # Anpassung der Relativwerte bei bestimmten Randfällen
+        '''Analog zu wie Randfälle im 'blöcke'-Abschnitt behandelt werden.'''
+        strings_rel = [alle_werte_strings[6][i]  + ' %'  if theo[i] != 0  else '-' for i in range(anzahl_vergleiche)]
+        strings_sig = [alle_werte_strings[7][i] + ' σ'  if abweichung_abs_fehler[i] != 0  else '-'  
+                       for i in range(anzahl_vergleiche)]
+        strings_rel = ['' if vergleich_fehlt[i] else strings_rel[i] for i in range(anzahl_vergleiche)]
+        strings_sig = ['' if vergleich_fehlt[i] else strings_sig[i] for i in range(anzahl_vergleiche)]
+        strings_rel = _zahlen_ausrichtung(strings_rel)
+        strings_sig = _zahlen_ausrichtung(strings_sig)
+        
+        alle_vergleiche = [*strings_absolut, strings_rel, strings_sig]   # "shape" = (anzahl_zahlen, anzahl_vergleiche)
+        
+        if breiten != None:   # Rechtsbündig auf die gemeinsamen Spaltenbreiten aller Seiten
+            alle_vergleiche = [[_füllen(string, 'links', menge = breite - len(spalte[0])) for string in spalte]
+                               if breite > len(spalte[0])  else spalte
+                               for spalte, breite in zip(alle_vergleiche, breiten[1])]
+        
+    
+    
+    # Erstellen der fertigen Tabellenstrings
+    titel_strings = [titel, '']  if titel != ''  else  []   # Hinzufügen des Titels der Tabelle falls vorhanden
+    
+    
+    if ausrichtung == 'blöcke':
+        separator = '   '   # Was die Blöcke (Spalten) der Tabelle trennt.
+        
+        # Angleichen der Länge der Größenstrings (Blocküberschriften) mit der Breite der dazugehörigen Vergleichsblöcke
+        if überschriften != []:
+            breite_blöcke   = [max(len(alle_vergleiche[i][0]), len(überschriften[i])) for i in range(anzahl_vergleiche)]
+            überschriften   = ['{:^{width}}'.format(überschriften[i], width = breite_blöcke[i]) 
+                               for i in range(anzahl_vergleiche)]   
+                              # Überschriften werden links-zentriert auf die Blöcke.
+            alle_vergleiche = [['{:^{width}}'.format(vergleichswert, width = breite_blöcke[i]) 
+                                for vergleichswert in alle_vergleiche[i]] for i in range(anzahl_vergleiche)] 
+                              # Ebenso die Blöcke, falls diese schmaler als die Überschriften sind.
+            
+        # Erstellen vom "Einheiten und Beschreibungen"-Block (Vorspalte)
+        if beschreibung == 'standard':
+            beschreibung_liste = ['Wert       experimentell', '           theoretisch  ', 'Abweichung absolut      ', 
+                                  '           relativ      ', '           sigma        ']
+            if einheit != '':
+                einheit_string = f'Einheit    {einheit}'
+                überschuss     = len(einheit) - len('experimentell')
+                stelle         = 'rechts'   # Angabe, dass einheit_string später links ausgerichtet werden soll, 
+                                            # 'rechts' werden Leerzeichen eingefügt.
+                
+        elif beschreibung == 'knapp':
+            beschreibung_liste = ['Wert exp', '     the', 'Abw. abs', '     rel', '     sig']
+            if einheit != '':
+                einheit_string = f'[{einheit}]'
+                überschuss     = len(einheit_string) - len(beschreibung_liste[0])
+                stelle         = 'links'   # links vom einheit_string werden später Leerzeichen eingefügt.
+            
+        ## Ausrichtung der Vorspalte
+        if größe0 != None:  # Randfall: erster größen-String ersetzt einheit.
+            einheit_string = größe0
+            überschuss     = len(einheit_string) - len(beschreibung_liste[0])
+            stelle         = 'rechts'
+            
+        if einheit == '' and größe0 == None:   # Fall: keine einheit angegeben
+            einheit_string = ' ' * len(beschreibung_liste[0])
+        elif überschuss < 0:   # = falls einheit_string schmaler als Beschreibungsstrings
+            einheit_string = _füllen(einheit_string, stelle, menge = -überschuss)
+        elif überschuss > 0:   # = falls einheit_string breiter als Beschreibungsstrings
+            beschreibung_liste = [_füllen(string, index = stelle, menge = überschuss) for string in beschreibung_liste]
+
+        
+        # Erstellen und Sammeln aller Überschriften-Strings
+        if überschriften != []:
+            überschriften.insert(0, einheit_string)
+            überschriften_string = separator.join(überschriften)   
+            titel_strings.append(überschriften_string)
+            
+        ## Erstellen der Linie, die Überschriften und Vergleiche trennt
+        alle_vergleiche = _listen_transponieren(alle_vergleiche)   # "shape" = (anzahl_vergleiche, anzahl_zahlen) 
+        blöcke_längen   = [len(vergleich) for vergleich in alle_vergleiche[0]]
+        blöcke_längen.insert(0, len(einheit_string))
+        oberlinie       = separator.join(['-' * länge for länge in blöcke_längen])   
+            # Die gestrichelte Oberlinie ist durch separator-Strings unterbrochen, d.h. jeder Block hat seine Linie.
+        titel_strings.append(oberlinie)
+        
+        # Erstellen aller Vergleich-Strings (alles unter der Oberlinie)
+        vergleich_strings = []
+        for i in range(anzahl_vergleichswerte):
+            vergleich_string = separator.join([beschreibung_liste[i], *alle_vergleiche[i]])
+            vergleich_strings.append(vergleich_string)
+    
+    
+    if ausrichtung == 'liste':
+        separator = ' | '   # Was die Spalten der Tabelle voneinander trennt.
+        
+        if beschreibung == 'standard':
+            beschreibung_liste = [['Wert', 'Abweichung'], 
+                                  ['experimentell', 'theoretisch', 'absolut', 'relativ', 'sigma']]
+            
+        elif beschreibung == 'knapp':
+            beschreibung_liste = [['Wert', 'Abw.'], ['exp', 'the', 'abs', 'rel', 'sig']]
+            if einheit != '':
+                einheit = f'[{einheit}]'
+        
+        # Angleichen der Breite der Beschreibungen mit denen der Vergleichswertspalten
+        for i in range(anzahl_vergleichswerte):
+            differenz = len(beschreibung_liste[1][i]) - len(alle_vergleiche[i][0])
+            if differenz < 0:   # = vergleich ist breiter als beschreibung -> Beschreibungen werden "links-zentriert".
+                beschreibung_liste[1][i] = '{:^{width}}'.format(beschreibung_liste[1][i], 
+                                                                width = len(alle_vergleiche[i][0]))
+            elif differenz > 0:    # = vergleich ist schmaler als beschreibung -> Vergleichsstrings werden rechtsbündig 
+                                   #   ausgerichtet.
+                alle_vergleiche[i] = [_füllen(string, 'links', menge = differenz) for string in alle_vergleiche[i]]
+       
+        ## 'Wert' wird zentriert auf die ex- und theo-Spalten. 
+        beschreibung_liste[0][0] = '{:^{width}}'.format(beschreibung_liste[0][0],   
+                                                        width = len(separator.join(beschreibung_liste[1][:2])))
+        ## 'Abweichung' bzw. 'Abw.' wird zentriert auf die abs-, rel- und sig-Spalten
+        beschreibung_liste[0][1] = '{:^{width}}'.format(beschreibung_liste[0][1], 
+                                                        width = len(separator.join(beschreibung_liste[1][2:])))
+        
+        ## Vorbereiten und Ausrichten der Vorspalte
+        if überschriften != []:  # Wenn falsch, bedeutet auch, dass einheit == '' ist.
+            if einheit == '' or beschreibung == 'knapp':
+                überschriften.insert(0, '')   # Leere erste Zelle
+            elif beschreibung == 'standard':   # Wenn einheit vorhanden und "Platz für ausführlichere Beschreibung"
+                überschriften.insert(0, 'Einheit')
+            if größe0 == None:
+                überschriften.insert(1, einheit)   # einsetzen vom Einheit-String
+            else:
+                überschriften.insert(1, größe0)   # einsetzen der ersten Überschrift statt Einheit
+            
+            # Bestimmung und Vereinheitlichung der Breite der Vorspalte
+            überschrift_längen = [len(string) for string in überschriften]
+            überschriften_breite = max(überschrift_längen)
+            if breiten != None:   # Gemeinsame Breite der Vorspalte aller Seiten
+                überschriften_breite = max(überschriften_breite, breiten[0])
+            for i in range(2):   # Bearbeitung der ersten zwei Kopfzeilen 
+                einheit_string = '{:^{width}}'.format(überschriften.pop(0), width = überschriften_breite)
+                beschreibung_liste[i].insert(0, einheit_string)
+            überschriften = ['{:<{width}}'.format(string, width = überschriften_breite) for string in überschriften]
+                # Die einzelnen Überschriften (größen) werden linksbündig ausgerichtet
+            
+        
+        # Erstellen und Sammeln aller Überschriften-Strings
+        for i in range(2):  # Erstellen und einfügen der beiden Kopfzeilen-Strings
+            beschreibung_string = separator.join(beschreibung_liste[i])
+            titel_strings.append(beschreibung_string)
+        oberlinie = '-' * len(beschreibung_string)
+        titel_strings.append(oberlinie)
+        
+        # Erstellen aller Vergleich-Strings (alles unter der Oberlinie)
+        alle_vergleiche   = _listen_transponieren(alle_vergleiche)   # "shape" = (anzahl_vergleiche, anzahl_zahlen)
+        if überschriften != []:   # Einfügen der Vorspalte falls vorhanden
+            vergleich_liste = [[überschriften[i], *alle_vergleiche[i]] for i in range(anzahl_vergleiche)]
+        else:
+            vergleich_liste = alle_vergleiche
+        vergleich_strings = [separator.join(vergleich) for vergleich in vergleich_liste]
+    
+    return [*titel_strings, *vergleich_strings]
+
+
+
+
+def _liste_breiten(werte, faktor, überschriften, seitengröße):
+    '''
+    Vorlauf für das 'liste'-Layout von pap.vergleichstabelle_zeilen(): Bestimmt die Spaltenbreiten der 
+    breitesten Seite nur aus den gerundeten Zahlen (pap.vergleich() und pap.formatieren()), ohne Zeilen zu 
+    erstellen. Gerechnet wird in Blöcken ganzer Seiten, damit der Speicherbedarf nicht mit der Anzahl 
+    Vergleiche wächst.
+    
+    
+    Output
+    ------
+    breiten : tuple
+        (Breite der Vorspalte, [Breite der 5 Vergleichsspalten ohne Kopfzeilen])
+    '''
+    
+    
+    breiten = np.zeros(5, dtype = int)
+    block   = seitengröße * max(1, 10**4 // seitengröße)
+    for anfang in range(0, werte.shape[1], block):
+        ergebnis = vergleich(werte[:, anfang:anfang + block], faktor)
+        ex_fehlt, theo_fehlt = np.isnan(ergebnis['ex']), np.isnan(ergebnis['theo'])
+        vergleich_fehlt      = ex_fehlt | theo_fehlt
+        ex, ex_fehler, theo, theo_fehler, abweichung_abs, abweichung_abs_fehler, abweichung_rel, abweichung_sig = \
+            [np.nan_to_num(ergebnis[feld]) for feld in VERGLEICH_FELDER]
+        
+        # Gleiche Rundung und Darstellung wie in _vergleichstabelle_zeilen()
+        strings_absolut, strings_fehler = formatieren(arr([ex, theo, abweichung_abs]), 
+                                                      arr([ex_fehler, theo_fehler, abweichung_abs_fehler]))
+        strings_rel, strings_sig = formatieren(arr([abweichung_rel, abweichung_sig]), 
+                                               sig_stellen = 2, sig_grenze = 1.0)
+        strings_rel = np.where(theo != 0, np.char.add(strings_rel, ' %'), '-')
+        strings_sig = np.where(abweichung_abs_fehler != 0, np.char.add(strings_sig, ' σ'), '-')
+        for i, fehlt in enumerate([ex_fehlt, theo_fehlt, vergleich_fehlt]):
+            strings_absolut[i][fehlt] = ''
+            strings_fehler[i][fehlt]  = ''
+        strings_rel[vergleich_fehlt] = ''
+        strings_sig[vergleich_fehlt] = ''
+        
+        # Breiten jeder Seite, die Spalten ex, theo und abs bestehen aus Wert, ' ± ' und Fehler.
+        spalten = [_ausrichtung_breite(_ausrichtung_maße(strings, seitengröße)) 
+                   for strings in [*strings_absolut, *strings_fehler, strings_rel, strings_sig]]
+        seiten_breiten = [spalten[i] + np.where(spalten[i] > 0, 3, 0) + spalten[i + 3] for i in range(3)]
+        seiten_breiten.extend(spalten[6:])
+        breiten = np.maximum(breiten, [np.max(seiten_breite) for seiten_breite in seiten_breiten])
+    
+    vorspalte = max([len(überschrift) for überschrift in überschriften], default = 0)
+    return vorspalte, breiten.tolist()
+
+
+
+
+def _vergleichstabelle_seiten(werte, titel, einheit, größen, faktor, ausrichtung, beschreibung, 
+                              seitengröße, breite):
+    '''
+    Generator, der eine Tabelle von pap.vergleichstabelle() Seite für Seite als Listen von Zeilen erstellt.
+    Jede Seite umfasst  seitengröße  Vergleiche. Im 'blöcke'-Layout wird jede Seite außerdem in Abschnitte 
+    zerteilt, die nicht breiter als  breite  Zeichen sind. Im 'liste'-Layout bekommen alle Seiten die 
+    Spaltenbreiten aus _liste_breiten(). Argumente siehe pap.vergleichstabelle_zeilen().
+    '''
+    
+    
+    # Überprüfen der Argumente, die für alle Seiten gleich sind
+    werte_shape = np.shape(werte)
+    if (not len(werte_shape) in [1, 2]) or werte_shape[0] != 4:
+        return _eingabefehler(f'Eingabefehler: shape(werte) = {werte_shape}',
+                              'werte muss die shape  (4, n) mit n = 0, 1, 2, ...  haben.\n')
+    if len(werte_shape) == 1:
+        werte = werte.reshape(4, 1)
+    if seitengröße < 1:
+        return _eingabefehler(f'Eingabefehler: seitengröße = {seitengröße}',
+                              'seitengröße muss mindestens 1 sein.\n')
+    
+    anzahl_vergleiche    = werte.shape[1]
+    überschriften_größe0 = _überschriften(größen, einheit, anzahl_vergleiche)
+    if überschriften_größe0 is None:
+        return
+    überschriften, größe0 = überschriften_größe0
+    
+    breiten = None
+    if ausrichtung == 'liste' and anzahl_vergleiche > seitengröße:
+        breiten = _liste_breiten(werte, faktor, überschriften, seitengröße)
+    
+    if titel != '':
+        yield [titel, '']
+    
+    
+    # Erstellen der Seiten
+    for anfang in range(0, anzahl_vergleiche, seitengröße):
+        ende = min(anfang + seitengröße, anzahl_vergleiche)
+        
+        ## Größen der Seite im selben Sinne wie für die ganze Tabelle
+        if überschriften == []:
+            seiten_größen = ''
+        elif größe0 != None:
+            seiten_größen = [größe0, *überschriften[anfang:ende]]
+        else:
+            seiten_größen = überschriften[anfang:ende]
+        
+        zeilen = _vergleichstabelle_zeilen(werte[:, anfang:ende], '', einheit, seiten_größen, faktor, 
+                                           ausrichtung, beschreibung, breiten)
+        if zeilen is None:   # Eingabefehler, schon geprintet
+            return
+        
+        if ausrichtung == 'liste' or breite == None:
+            yield [*zeilen, '']
+            continue
+        
+        ## Umbrechen der Blöcke: Die Spaltenbreiten lassen sich an der Oberlinie ablesen.
+        separator  = '   '
+        oberlinie  = zeilen[1]  if überschriften != []  else zeilen[0]
+        breiten    = [len(linie) for linie in oberlinie.split(separator)]
+        kanten     = np.cumsum([breiten[0]] + [len(separator) + b for b in breiten[1:]]).tolist()
+        vorspalte  = kanten[0]
+        
+        abschnitt_anfang = 1   # Index des ersten Blocks im aktuellen Abschnitt
+        for block in range(1, len(breiten) + 1):
+            letzter_block  = block == len(breiten)
+            zu_breit       = (not letzter_block and block > abschnitt_anfang
+                              and vorspalte + kanten[block] - kanten[abschnitt_anfang - 1] > breite)
+            if zu_breit or letzter_block:
+                abschnitt_ende = block  if zu_breit  else len(breiten)
+                von, bis = kanten[abschnitt_anfang - 1], kanten[abschnitt_ende - 1]
+                yield [zeile[:vorspalte] + zeile[von:bis] for zeile in zeilen] + ['']
+                abschnitt_anfang = abschnitt_ende
+
+
+
+
+def vergleichstabelle_zeilen(werte, titel = '', einheit = '', größen = '', faktor = 1, ausrichtung = 'blöcke', 
+                             beschreibung = 'standard', seitengröße = 50, breite = None):
+    '''
+    Generator-Variante von pap.vergleichstabelle() für sehr viele Vergleiche: Die Tabelle wird Seite für Seite 
+    erstellt und Zeile für Zeile zurückgegeben, statt alles auf einmal zu berechnen und zu printen. 
+    So ist die erste Seite sofort da und der Speicherbedarf hängt nur von der  seitengröße  ab.
+    
+    Jede Seite ist eine eigene Tabelle, die Kopfzeilen werden auf jeder Seite wiederholt. Die Zahlen sind 
+    innerhalb einer Seite untereinander ausgerichtet. Im 'liste'-Layout haben alle Seiten dieselben 
+    Spaltenbreiten, diese bestimmt ein schneller Vorlauf über die gerundeten Zahlen der ganzen Tabelle.
+    Seiten und Abschnitte sind durch eine leere Zeile getrennt, der Titel kommt nur einmal ganz oben.
+    
+    
+    Argumente
+    ---------
+    werte, titel, einheit, größen, faktor, ausrichtung, beschreibung :
+        Wie bei pap.vergleichstabelle().
+    
+    seitengröße : int, optional
+        Anzahl Vergleiche pro Seite.
+    
+    breite : int, optional
+        Nur für ausrichtung = 'blöcke': Maximale Breite einer Zeile in Zeichen. Blöcke, die nicht mehr 
+        daneben passen, werden in einem weiteren Abschnitt darunter dargestellt (mit gleicher Vorspalte).
+        Ein einzelner Block, der breiter ist, wird nicht zerschnitten.
+        Standardmäßig wird nicht umgebrochen.
+    
+    
+    Output
+    ------
+    Generator (str), jede Tabellenzeile ohne '\\n'.
+    
+    
+    Beispiel
+    --------
+    >>> werte = np.random.normal(1, 0.1, (4, 10000))
+    >>> for zeile in pap.vergleichstabelle_zeilen(werte, 'Viele Vergleiche', ausrichtung = 'liste'):
+    ...     print(zeile)
+    '''
+    
+    for seite in _vergleichstabelle_seiten(werte, titel, einheit, größen, faktor, ausrichtung, beschreibung,
+                                           seitengröße, breite):
+        yield from seite
+
+
+
+
+def vergleichstabelle_schreiben(datei, werte, titel = '', einheit = '', größen = '', faktor = 1, 
+                                ausrichtung = 'blöcke', beschreibung = 'standard', seitengröße = 50, breite = None):
+    '''
+    Schreibt eine Tabelle von pap.vergleichstabelle() seitenweise in  datei, zB. um große Vergleiche direkt
+    auf die Festplatte zu schreiben. Pro Seite wird  datei.write()  nur einmal aufgerufen. Wie bei 
+    pap.vergleichstabelle_zeilen() werden die Kopfzeilen auf jeder Seite wiederholt.
+    
+    
+    Argumente
+    ---------
+    datei : file-like, str
+        Alles mit einer  write()-Methode, zB. eine geöffnete Datei, sys.stdout oder io.StringIO().
+        Bei einem str wird eine Datei mit diesem Namen (UTF-8) erstellt bzw. überschrieben.
+    
+    Alle anderen Argumente wie bei pap.vergleichstabelle_zeilen().
+    
+    
+    Beispiel
+    --------
+    >>> pap.vergleichstabelle_schreiben('vergleich.txt', werte, 'Viele Vergleiche', breite = 120)
+    '''
+    
+    if isinstance(datei, str):
+        with open(datei, 'w', encoding = 'utf-8') as datei_offen:
+            vergleichstabelle_schreiben(datei_offen, werte, titel, einheit, größen, faktor, ausrichtung, 
+                                        beschreibung, seitengröße, breite)
+        return
+    
+    for seite in _vergleichstabelle_seiten(werte, titel, einheit, größen, faktor, ausrichtung, beschreibung,
+                                           seitengröße, breite):
+        datei.write('\n'.join(seite) + '\n')
+
+
+        
+        
+        
+# Tabellen exportieren
+
+EXPORT_ENDUNGEN = {'.csv': 'csv', '.tex': 'latex', '.md': 'markdown', '.html': 'html', '.htm': 'html'}
+# Aus diesen Dateiendungen erkennt pap.exportieren() das Format.
+
+
+
+def resultat_layout(titel, werte, einheit = '', faktor = 1, nachkommastellen = None, tabellen_titel = ''):
+    '''
+    Erstellt das Layout einer Tabelle mehrerer Ergebnisse, gerundet wie bei pap.resultat(), 
+    zum Export mit pap.exportieren().
+    
+    
+    Argumente
+    ---------
+    titel : list (str)
+        Ein Titel pro Ergebnis (Zeile).
+    
+    werte : np.ndarray (number_like), shape = (N,), (N, 2) oder (N, 3)
+        Jede Zeile ist  ein_wert,  [ein_wert, sein_fehler]  oder  [ein_wert, sys_fehler, stat_fehler].
+    
+    einheit : str, optional
+    
+    faktor : number_like, optional
+    
+    nachkommastellen : int, np.ndarray (int), optional
+        Siehe "Rundung der Ergebnisse" in pap.resultat().
+    
+    tabellen_titel : str, optional
+    
+    
+    Output
+    ------
+    layout : dict
+        Siehe pap.exportieren().
+    
+    
+    Beispiel
+    --------
+    >>> layout = pap.resultat_layout(['Arbeit', 'Energie'], np.array([[3.35e6, 0.46e6], [1.2e6, 0.03e6]]), 
+    ...                              'MJ', faktor = 1e-6)
+    >>> print(pap.exportieren(layout, format = 'markdown'))
+    | Größe   | Wert [MJ]     |
+    |---------|---------------|
+    | Arbeit  | 3.4 ± 0.5     |
+    | Energie | 1.200 ± 0.030 |
+    '''
+    
+    
+    werte = np.array(werte, dtype = np.float64, ndmin = 1) * faktor
+    if werte.ndim == 1:
+        werte = werte.reshape(-1, 1)
+    if werte.ndim != 2 or not werte.shape[1] in [1, 2, 3] or len(titel) != len(werte):
+        return _eingabefehler(f'Eingabefehler: shape(werte) = {werte.shape}, len(titel) = {len(titel)}',
+                              'werte muss die shape  (N,), (N, 2) oder (N, 3)  haben, mit  N = len(titel).\n')
+    werte[:, 1:] = np.abs(werte[:, 1:])   # Keine negativen Fehlerangaben
+    
+    
+    # Rundung wie bei pap.resultat(), aber für alle Zeilen auf einmal
+    strings = _resultat_zahlen(werte, nachkommastellen)
+    
+    
+    # Spalten
+    einheit_zusatz = f' [{einheit}]'  if einheit != ''  else ''
+    spalten        = [('Größe', arr(titel, dtype = str), None)]
+    if werte.shape[1] == 3:
+        spalten += [('Wert' + einheit_zusatz, strings[:, 0], None), 
+                    ('sys. Fehler' + einheit_zusatz, strings[:, 1], None),
+                    ('stat. Fehler' + einheit_zusatz, strings[:, 2], None)]
+    elif werte.shape[1] == 2:
+        spalten += [('Wert' + einheit_zusatz, strings[:, 0], strings[:, 1])]
+    else:
+        spalten += [('Wert' + einheit_zusatz, strings[:, 0], None)]
+    
+    return {'titel': tabellen_titel, 'spalten': spalten, 'textspalten': 1}
+
+
+
+
+def vergleich_layout(werte, titel = '', einheit = '', größen = '', faktor = 1):
+    '''
+    Erstellt das Layout einer Tabelle von pap.vergleichstabelle() zum Export mit pap.exportieren(). 
+    Jeder Vergleich wird eine Zeile, gerundet wird genau wie in pap.vergleichstabelle().
+    
+    
+    Argumente
+    ---------
+    Wie bei pap.vergleichstabelle().
+    
+    
+    Output
+    ------
+    layout : dict
+        Siehe pap.exportieren().
+    
+    
+    Beispiel
+    --------
+    >>> werte  = np.array([[3.446, 0.00204], [0.105, 0.00045], [3.69, 0], [5e-3, 0]])
+    >>> layout = pap.vergleich_layout(werte, 'Fallbeschleunigung', 'm/s^2', ['Boden', 'Orbit'])
+    >>> pap.exportieren(layout, 'vergleich.tex')
+    >>> pap.exportieren(layout, 'vergleich.csv')
+    '''
+    
+    
+    ergebnis = vergleich(werte, faktor)
+    if ergebnis is None:   # Eingabefehler, schon geprintet
+        return
+    anzahl_vergleiche = len(ergebnis)
+    überschriften_größe0 = _überschriften(größen, einheit, anzahl_vergleiche)
+    if überschriften_größe0 is None:
+        return
+    überschriften, größe0 = überschriften_größe0
+    
+    
+    # Rundung und Darstellung wie in pap.vergleichstabelle()
+    ex_fehlt        = np.isnan(ergebnis['ex'])
+    theo_fehlt      = np.isnan(ergebnis['theo'])
+    vergleich_fehlt = ex_fehlt | theo_fehlt
+    ex, ex_fehler, theo, theo_fehler, abweichung_abs, abweichung_abs_fehler, abweichung_rel, abweichung_sig = \
+        [np.nan_to_num(ergebnis[feld]) for feld in VERGLEICH_FELDER]
+    
+    werte_strings, fehler_strings = formatieren(arr([ex, theo, abweichung_abs]), 
+                                                arr([ex_fehler, theo_fehler, abweichung_abs_fehler]))
+    relativ_strings = formatieren(arr([abweichung_rel, abweichung_sig]), sig_stellen = 2, sig_grenze = 1.0)
+    
+    ## Randfälle wie in pap.vergleichstabelle()
+    relativ_strings[0][theo == 0]                  = '-'
+    relativ_strings[1][abweichung_abs_fehler == 0] = '-'
+    for strings in [werte_strings, fehler_strings]:
+        strings[0][ex_fehlt]        = ''
+        strings[1][theo_fehlt]      = ''
+        strings[2][vergleich_fehlt] = ''
+    relativ_strings[:, vergleich_fehlt] = ''
+    
+    
+    # Spalten
+    einheit_zusatz = f' [{einheit}]'  if einheit != ''  else ''
+    spalten = []
+    textspalten = 0
+    if any(überschrift != '' for überschrift in überschriften) or größe0 != None:
+        textspalten = 1
+        spalten.append((größe0  if größe0 != None  else 'Größe', 
+                        arr(überschriften or [''] * anzahl_vergleiche, dtype = str), None))
+    spalten += [('experimentell' + einheit_zusatz, werte_strings[0], fehler_strings[0]),
+                ('theoretisch' + einheit_zusatz, werte_strings[1], fehler_strings[1]),
+                ('Abweichung absolut' + einheit_zusatz, werte_strings[2], fehler_strings[2]),
+                ('Abweichung relativ [%]', relativ_strings[0], None),
+                ('Abweichung [σ]', relativ_strings[1], None)]
+    
+    return {'titel': titel, 'spalten': spalten, 'textspalten': textspalten}
+
+
+
+
+def _layout_zellen(layout, plus_minus, zahl = lambda string: string, text = lambda string: string, 
+                   zahlenzelle = lambda string: string):
+    '''
+    Setzt die Spalten eines Layouts zu Zeilen von Zellen zusammen, Wert und Fehler verbunden mit  plus_minus.
+    zahl  wird auf jeden Wert/Fehler der Zahlenspalten angewendet, text  auf die Zellen der Textspalten 
+    (zB. für Escaping) und  zahlenzelle  auf jede fertige, nicht leere Zelle der Zahlenspalten.
+    
+    
+    Output
+    ------
+    kopf : list (str)
+    
+    zeilen : list (list (str))
+    '''
+    
+    
+    kopf   = [überschrift for überschrift, _, _ in layout['spalten']]
+    spalten_strings = []
+    for i, (_, werte_strings, fehler_strings) in enumerate(layout['spalten']):
+        if i < layout['textspalten']:
+            spalten_strings.append([text(wert) for wert in werte_strings.tolist()])
+            continue
+        werte_strings = [zahl(wert) if wert != '' else '' for wert in werte_strings.tolist()]
+        if fehler_strings is not None:
+            werte_strings = [wert + plus_minus + zahl(fehler)  if wert != '' and fehler != ''  else wert 
+                             for wert, fehler in zip(werte_strings, fehler_strings.tolist())]
+        werte_strings = [zahlenzelle(wert) if wert != '' else '' for wert in werte_strings]
+        spalten_strings.append(werte_strings)
+    
+    return kopf, [list(zeile) for zeile in zip(*spalten_strings)]
+
+
+
+
+def _export_csv(layout):
+    '''Eine Spalte pro Wert und pro Fehler, ohne Titel, damit die Datei direkt wieder einlesbar ist.'''
+    
+    puffer = io.StringIO()
+    schreiber = csv.writer(puffer, lineterminator = '\n')
+    
+    kopf, spalten = [], []
+    for überschrift, werte_strings, fehler_strings in layout['spalten']:
+        kopf.append(überschrift)
+        spalten.append(werte_strings)
+        if fehler_strings is not None:
+            kopf.append(überschrift + ' Fehler')
+            spalten.append(fehler_strings)
+    schreiber.writerow(kopf)
+    schreiber.writerows(arr(spalten, dtype = str).T.tolist())
+    return puffer.getvalue()
+
+
+
+
+def _latex_text(string):
+    '''Maskiert Sonderzeichen von LaTeX in Text.'''
+    
+    ersetzungen = {'\\': r'\textbackslash{}', '&': r'\&', '%': r'\%', '$': r'\$', '#': r'\#', '_': r'\_', 
+                   '{': r'\{', '}': r'\}', '~': r'\textasciitilde{}', '^': r'\textasciicircum{}', 'σ': r'$\sigma$'}
+    return ''.join(ersetzungen.get(zeichen, zeichen) for zeichen in string)
+
+
+
+
+def _latex_zahl(string):
+    '''Zahl im Mathe-Modus, Exponentenschreibweise als Zehnerpotenz, zB. '4.70e6' -> '4.70 \\cdot 10^{6}'.'''
+    
+    if 'e' in string:
+        mantisse, exponent = string.split('e')
+        return f'{mantisse} \\cdot 10^{{{exponent}}}'
+    return string
+
+
+
+
+def _export_latex(layout):
+    '''tabular-Umgebung, mit Titel als caption einer table-Umgebung.'''
+    
+    kopf, zeilen = _layout_zellen(layout, r' \pm ', _latex_zahl, _latex_text, lambda string: f'${string}$')
+    
+    ausrichtung = 'l' + 'c' * (len(kopf) - 1)
+    zeilen_strings = [' & '.join(zeile) + r' \\' for zeile in zeilen]
+    tabelle = [rf'\begin{{tabular}}{{{ausrichtung}}}', r'\hline', 
+               ' & '.join(_latex_text(überschrift) for überschrift in kopf) + r' \\', r'\hline',
+               *zeilen_strings, r'\hline', r'\end{tabular}']
+    if layout['titel'] != '':
+        tabelle = [r'\begin{table}[h]', r'\centering', rf'\caption{{{_latex_text(layout["titel"])}}}', 
+                   *tabelle, r'\end{table}']
+    return '\n'.join(tabelle) + '\n'
+
+
+
+
+def _export_markdown(layout):
+    '''Pipe-Tabelle mit ausgerichteten Spalten, Titel fett darüber.'''
+    
+    kopf, zeilen = _layout_zellen(layout, ' ± ', text = lambda string: string.replace('|', r'\|'))
+    kopf   = [überschrift.replace('|', r'\|') for überschrift in kopf]
+    breiten = [max([len(überschrift)] + [len(zeile[i]) for zeile in zeilen]) for i, überschrift in enumerate(kopf)]
+    
+    def zeile_string(zellen):
+        return '| ' + ' | '.join(f'{zelle:<{breite}}' for zelle, breite in zip(zellen, breiten)) + ' |'
+    
+    tabelle = [zeile_string(kopf), '|' + '|'.join('-' * (breite + 2) for breite in breiten) + '|',
+               *[zeile_string(zeile) for zeile in zeilen]]
+    if layout['titel'] != '':
+        tabelle = [f'**{layout["titel"]}**', '', *tabelle]
+    return '\n'.join(tabelle) + '\n'
+
+
+
+
+def _export_html(layout):
+    '''<table> mit Titel als <caption>.'''
+    
+    kopf, zeilen = _layout_zellen(layout, ' &plusmn; ', html.escape, html.escape)
+    tabelle = ['<table>']
+    if layout['titel'] != '':
+        tabelle.append(f'  <caption>{html.escape(layout["titel"])}</caption>')
+    tabelle.append('  <thead>')
+    tabelle.append('    <tr>' + ''.join(f'<th>{html.escape(überschrift)}</th>' for überschrift in kopf) + '</tr>')
+    tabelle += ['  </thead>', '  <tbody>']
+    tabelle += ['    <tr>' + ''.join(f'<td>{zelle}</td>' for zelle in zeile) + '</tr>' for zeile in zeilen]
+    tabelle += ['  </tbody>', '</table>']
+    return '\n'.join(tabelle) + '\n'
+
+
+
+
+_EXPORTE = {'csv': _export_csv, 'latex': _export_latex, 'markdown': _export_markdown, 'html': _export_html}
+
+
+
+def exportieren(layout, datei = None, format = None):
+    '''
+    Stellt ein Tabellen-Layout von pap.vergleich_layout() oder pap.resultat_layout() als CSV, LaTeX (tabular),
+    Markdown oder HTML dar. Da Rundung und Formatierung schon im Layout stecken, kann ein Layout ohne Mehraufwand 
+    in mehrere Formate exportiert werden. In eine Datei wird alles mit einem einzigen  write()  geschrieben.
+    
+    
+    Argumente
+    ---------
+    layout : dict
+        {'titel': str, 'spalten': [(überschrift, werte_strings, fehler_strings), ...], 'textspalten': int},
+        werte_strings und fehler_strings sind gleich lange np.ndarrays (str), fehler_strings darf None sein.
+        Die ersten  textspalten  Spalten enthalten Text (zB. Namen der Größen), alle anderen Zahlen.
+    
+    datei : str, file-like, optional
+        Dateiname oder alles mit einer  write()-Methode. Ohne  datei  wird der Text returned.
+    
+    format : str, optional
+        'csv', 'latex', 'markdown' oder 'html'. Wird sonst an der Dateiendung erkannt 
+        (.csv, .tex, .md, .html).
+    
+    
+    Output
+    ------
+    text : str, nur falls keine  datei  angegeben
+    
+    
+    Beispiel
+    --------
+    >>> layout = pap.vergleich_layout(werte, 'Fallbeschleunigung', 'm/s^2', ['Boden', 'Orbit'])
+    >>> for endung in ['csv', 'tex', 'md', 'html']:
+    ...     pap.exportieren(layout, f'vergleich.{endung}')
+    '''
+    
+    
+    if format == None and isinstance(datei, str):
+        format = EXPORT_ENDUNGEN.get(os.path.splitext(datei)[1].lower())
+    if not format in _EXPORTE:
+        return _eingabefehler(f'Eingabefehler: format = {format!r}, datei = {datei!r}',
+                              f'format muss eines von {list(_EXPORTE)} sein oder an der Dateiendung erkennbar sein.\n')
+    
+    text = _EXPORTE[format](layout)
+    
+    if datei is None:
+        return text
+    if isinstance(datei, str):
+        with open(datei, 'w', encoding = 'utf-8', newline = '') as datei_offen:
+            datei_offen.write(text)
+    else:
+        datei.write(text)
+
+
+
+
+
+
+
+# Messdaten laden
+
+def spalten_laden(datei, spalten, trennzeichen = ',', kopfzeilen = 0, schlüssel = None, spaltenweise = False):
+    '''
+    Lädt ausgewählte Spalten einer Messtabelle als Array der shape (len(spalten), N), also zB. direkt in der 
+    Form von  messpunkte  für pap.odr_fit() oder  werte  für pap.vergleichstabelle(). Dabei wird nichts 
+    unnötig kopiert:
+    * .csv (und andere Textdateien): Der C-Parser von NumPy liest die Datei in einem Durchgang und wandelt 
+      nur die ausgewählten Spalten in Zahlen um. Das Ergebnis ist eine transponierte Ansicht der gelesenen 
+      Tabelle, ohne weitere Kopie.
+    * .npy: Die Datei wird nur in den Speicher eingeblendet (memory mapping), gelesen wird erst beim Zugriff.
+    * .npz: Unkomprimierte Arrays (np.savez()) werden ebenso eingeblendet, komprimierte einmal entpackt.
+    Bei .npy und .npz ist das Ergebnis eine Ansicht (view, nur lesbar), falls die Spalten gleichmäßige Abstände 
+    haben (zB. (0, 1, 2, 3) oder (4, 2)), sonst eine einzige Kopie der ausgewählten Spalten.
+    
+    
+    Argumente
+    ---------
+    datei : str
+        Dateiname, das Format wird an der Endung erkannt (.npy, .npz, alles andere als Text).
+    
+    spalten : list (int, str)
+        Spaltennummern oder Spaltennamen, in der gewünschten Reihenfolge. Negative Nummern zählen vom Ende 
+        (-1: letzte Spalte). Namen stehen bei Textdateien in der ersten Kopfzeile, bei .npy/.npz sind es die 
+        Feldnamen eines strukturierten Arrays.
+    
+    trennzeichen : str, optional
+        Nur für Textdateien.
+    
+    kopfzeilen : int, optional
+        Nur für Textdateien: Anzahl Zeilen am Anfang, die keine Zahlen enthalten.
+    
+    schlüssel : str, optional
+        Nur für .npz: Name des Arrays, bei nur einem Array nicht nötig.
+    
+    spaltenweise : bool, optional
+        Nur für .npy/.npz: Bei  True  ist jede Zeile des gespeicherten Arrays eine Messgröße 
+        (shape = (anzahl_spalten, N)), zB. nach  np.save(datei, np.array([x, y, x_fehler, y_fehler])).
+    
+    
+    Output
+    ------
+    werte : np.ndarray (np.float64 bzw. Typ der Datei), shape = (len(spalten), N)
+    
+    
+    Beispiel
+    --------
+    >>> werte = pap.spalten_laden('vergleich.csv', ['g_exp', 'g_exp_fehler', 'g_lit', 'g_lit_fehler'], kopfzeilen = 1)
+    >>> pap.vergleichstabelle(werte, 'Fallbeschleunigung', 'm/s^2')
+    '''
+    
+    
+    tabelle, indizes = _tabelle_öffnen(datei, spalten, trennzeichen, kopfzeilen, schlüssel, spaltenweise)
+    if tabelle is None:
+        return None
+    return _spalten_ansicht(tabelle, indizes)
+
+
+
+
+def messdaten_laden(datei, spalten = (0, 1, 2, 3), trennzeichen = ',', kopfzeilen = 0, schlüssel = None, 
+                    spaltenweise = False):
+    '''
+    Lädt Messpunkte und Messfehler direkt in der Form, die pap.odr_fit() braucht. Wie pap.spalten_laden(), 
+    nur dass  messpunkte  und  messfehler  immer Ansichten derselben einmal gelesenen Tabelle sind 
+    (zwei Spalten haben immer einen gleichmäßigen Abstand).
+    
+    
+    Argumente
+    ---------
+    datei : str
+    
+    spalten : list (int, str), optional
+        Spalten von  x_werte, y_werte, x_fehler, y_fehler,  standardmäßig die ersten vier.
+    
+    Übrige Argumente siehe pap.spalten_laden().
+    
+    
+    Output
+    ------
+    messpunkte : np.ndarray, shape = (2, N)
+        np.array([x_werte, y_werte])
+    
+    messfehler : np.ndarray, shape = (2, N)
+        np.array([x_fehler, y_fehler])
+    
+    
+    Beispiel
+    --------
+    >>> messpunkte, messfehler = pap.messdaten_laden('feder.csv', ['F', 's', 'F_fehler', 's_fehler'], kopfzeilen = 1)
+    >>> parameter, fehler = pap.odr_fit(pap.func.lin, messpunkte, messfehler, [1, 0])
+    '''
+    
+    
+    if len(spalten) != 4:
+        return _eingabefehler(f'Eingabefehler: spalten = {spalten!r}', 
+                              'spalten muss genau 4 Spalten angeben: x, y, x_fehler, y_fehler.\n')
+    
+    tabelle, indizes = _tabelle_öffnen(datei, spalten, trennzeichen, kopfzeilen, schlüssel, spaltenweise)
+    if tabelle is None:
+        return None
+    return _spalten_ansicht(tabelle, indizes[:2]), _spalten_ansicht(tabelle, indizes[2:])
+
+
+
+
+def _tabelle_öffnen(datei, spalten, trennzeichen, kopfzeilen, schlüssel, spaltenweise):
+    '''
+    Öffnet die Tabelle einer Datei als 2D-Array der shape (N, anzahl_spalten), ohne sie zu kopieren.
+    Output: tabelle, indizes  (Position jeder gewünschten Spalte in  tabelle),  bzw. (None, None) bei Eingabefehlern.
+    '''
+    
+    endung = os.path.splitext(datei)[1].lower()
+    
+    if endung not in ('.npy', '.npz'):
+        # Namen aus der ersten Kopfzeile, Anzahl Spalten aus der ersten Datenzeile
+        with open(datei, encoding = 'utf-8') as datei_offen:
+            zeilen = [datei_offen.readline() for _ in range(kopfzeilen + 1)]
+        namen          = [name.strip() for name in zeilen[0].split(trennzeichen)]  if kopfzeilen > 0  else []
+        anzahl_spalten = len(zeilen[-1].split(trennzeichen))  if zeilen[-1].strip()  else None
+        nummern = _spalten_nummern(spalten, namen, anzahl_spalten, datei)
+        if nummern is None:
+            return None, None
+        
+        # Nur die benötigten Spalten parsen, jede nur einmal, in der Reihenfolge ihres ersten Auftretens.
+        gelesen = list(dict.fromkeys(nummern))
+        tabelle = np.loadtxt(datei, delimiter = trennzeichen, skiprows = kopfzeilen, usecols = gelesen, 
+                             comments = None, ndmin = 2)
+        return tabelle, [gelesen.index(nummer) for nummer in nummern]
+    
+    if endung == '.npy':
+        array = np.load(datei, mmap_mode = 'r')
+    else:
+        array = _npz_einblenden(datei, schlüssel)
+        if array is None:
+            return None, None
+    
+    namen = []
+    if array.dtype.names is not None:   # Strukturiertes Array: Felder sind die Spalten
+        from numpy.lib import recfunctions
+        namen = list(array.dtype.names)
+        array = recfunctions.structured_to_unstructured(array, copy = False)
+    elif spaltenweise:
+        array = array.T
+    if array.ndim != 2:
+        return None, _eingabefehler(f'Eingabefehler: Das Array in {datei} hat die shape {array.shape}, '
+                                    'gebraucht wird eine 2D-Tabelle.\n')
+    
+    nummern = _spalten_nummern(spalten, namen, array.shape[1], datei)
+    if nummern is None:
+        return None, None
+    return array, nummern
+
+
+
+
+def _spalten_nummern(spalten, namen, anzahl_spalten, datei):
+    '''
+    Übersetzt Spaltennamen (str) mit Hilfe der Liste  namen  in Spaltennummern 0 bis anzahl_spalten - 1, negative 
+    Nummern zählen wie bei NumPy vom Ende. Unbekannte Namen oder Nummern außerhalb der Tabelle: None.
+    Bei  anzahl_spalten = None  (Datei ohne Datenzeilen) werden die Nummern nicht geprüft.
+    '''
+    
+    nummern = []
+    for spalte in spalten:
+        if isinstance(spalte, str):
+            if spalte not in namen:
+                return _eingabefehler(f'Eingabefehler: Die Spalte {spalte!r} gibt es nicht, vorhanden sind {namen}.\n')
+            spalte = namen.index(spalte)
+        nummer = int(spalte)
+        if anzahl_spalten is not None:
+            if not -anzahl_spalten <= nummer < anzahl_spalten:
+                return _eingabefehler(f'Eingabefehler: spalten = {spalten!r}, die Tabelle in {datei} hat nur '
+                                      f'{anzahl_spalten} Spalten {namen}.\n')
+            nummer %= anzahl_spalten   # Negative Nummern würden in _spalten_ansicht() vor der Tabelle lesen
+        nummern.append(nummer)
+    return nummern
+
+
+
+
+def _spalten_ansicht(tabelle, indizes):
+    '''
+    Spalten  indizes  von  tabelle  (shape = (N, anzahl_spalten)) als Array der shape (len(indizes), N).
+    Bei gleichmäßigen Abständen der Spalten ist das eine Ansicht mit passenden Strides, sonst eine Kopie.
+    '''
+    
+    abstände = np.diff(indizes)
+    if len(indizes) > 1 and not np.all(abstände == abstände[0]):
+        return tabelle[:, indizes].T
+    
+    abstand = int(abstände[0])  if len(indizes) > 1  else 0
+    erste   = tabelle[:, indizes[0]]
+    return np.lib.stride_tricks.as_strided(erste, shape = (len(indizes), len(tabelle)), 
+                                           strides = (abstand * tabelle.strides[1], tabelle.strides[0]), 
+                                           writeable = False)
+
+
+
+
+def _npz_einblenden(datei, schlüssel):
+    '''
+    Blendet ein unkomprimiertes Array einer .npz-Datei in den Speicher ein (np.load() kann das nur für .npy), 
+    indem die Position seiner Daten in der zip-Datei bestimmt wird. Komprimierte Arrays werden normal geladen.
+    '''
+    
+    import struct
+    import zipfile
+    
+    with zipfile.ZipFile(datei) as archiv:
+        arrays = [name.removesuffix('.npy') for name in archiv.namelist()]
+        if schlüssel is None and len(arrays) == 1:
+            schlüssel = arrays[0]
+        if schlüssel not in arrays:
+            return _eingabefehler(f'Eingabefehler: schlüssel = {schlüssel!r}, in {datei} gibt es die Arrays {arrays}.\n')
+        info = archiv.getinfo(schlüssel + '.npy')
+    
+    if info.compress_type != zipfile.ZIP_STORED:
+        with np.load(datei) as inhalt:
+            return inhalt[schlüssel]
+    
+    with open(datei, 'rb') as datei_offen:
+        datei_offen.seek(info.header_offset)
+        lokaler_kopf = datei_offen.read(30)   # Lokaler Dateikopf im zip-Format, danach Name und Extrafeld
+        namenslänge, extralänge = struct.unpack('<HH', lokaler_kopf[26:30])
+        datei_offen.seek(info.header_offset + 30 + namenslänge + extralänge)
+        version = np.lib.format.read_magic(datei_offen)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(datei_offen)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(datei_offen)
+        position = datei_offen.tell()
+    
+    return np.memmap(datei, dtype = dtype, mode = 'r', offset = position, shape = shape, 
+                     order = 'F'  if fortran  else 'C')
+
+
+
+
+
+
+
+# Funktionen fitten und χ^2-Tests machen
+        
+def _funktion_kompatibel(funktion, funktionstyp):
+    '''
+    Macht aus einer Fitfunktion mit einer der Argumente-Reihenfolgen von  funktionstyp  (siehe pap.odr_fit())
+    eine Funktion der Form  funktion_kompatibel(parameter, x),  wie sie scipy.odr und die Likelihood-Fits brauchen.
+    Funktioniert genauso für die Ableitungen aus pap.func.ABLEITUNGEN.
+    '''
+    
+    def funktion_kompatibel(parameter, x):
+        if funktionstyp == 'x, *p':
+            return funktion(x, *parameter)
+        elif funktionstyp == 'x, p_list':
+            return funktion(x, parameter)
+        elif funktionstyp == 'p_list, x':
+            return funktion(parameter, x)
+        else:
+            return _eingabefehler('funktionstyp ist falsch angegeben. >:(')
+    
+    return funktion_kompatibel
+
+
+
+
+def odr_fit(funktion, messpunkte, messfehler, parameter0, 
+            print_resultate = True, output_chi_test = False, funktionstyp = 'x, *p', output_residuen = False,
+            bins = None, verfeinern = False):
+    '''
+    Orthogonal Distance Regression - Fittet eine 1D-Funktion an fehlerbehaftete Messdaten an. Im Gegensatz 
+    zu curve_fit() aus scipy.stats werden hier auch Fehler in der x-Achse berücksichtigt. Eigentlich wird 
+    hier nur das scipy.odr-Paket in einer einfach zu bedienenden aber optionsärmeren Funktion verpackt.
+    
+    Optional werden die Fit-Resultate angezeigt und returned, ebenso ein optionaler χ^2-Test.
+    Mit pap.cache_einstellen() werden schon gerechnete Fits aus einem Cache-Ordner geladen statt neu gerechnet.
+    Sehr große Datensätze (glatte Kurven aus Millionen Punkten) können mit  bins  vor dem Fit auf wenige 
+    gemittelte Punkte reduziert werden, siehe  Reduktion.
+    
+    
+    Argumente
+    ---------
+    funktion : function
+        Erlaubt sind mathematische |R -> |R Funktionen. Folgende Argumente-Reihenfolgen sind unterstützt:
+        funktion(x, *parameter)  also bspw. pap.func.quad(x, a, b, c)
+        funktion(x, parameter)   parameter : array_like
+        funktion(parameter, x)   parameter : array_like
+        Der verwendete Typ muss unter  funktionstyp  angegeben werden.
+    
+    messpunkte : np.array (2D, mit number_like Elementen)
+        Form: np.array([x_werte_liste, y_werte_liste])
+    
+    messfehler : np.array (2D, mit number_like Elementen > 0)
+        Form: np.array([x_fehler_liste, y_fehler_liste])
+    
+    Natürlich müssen alle vier Listen gleich lang sein.
+    
+    parameter0 : array_like (1D, mit number_like Elementen)
+        Erste Schätzung, für was die gefitteten Parameter sein sollen.
+        Achtung! Eine schlechte Schätzung kann dazu führen, dass der Fit schief läuft.
+    
+    print_resultate : bool, optional
+        Bei  True  wird eine Zusammenfassung der Fitergebnisse geprintet (pprint() aus scipy.odr),
+        siehe  Beispiele  und  Bedeutung des Fit-Resultates.
+        Bei  False  wird nichts geprintet.
+    
+    output_chi_test : bool, string, optional
+        Bei  False  wird der χ^2-Wert des Fits nicht returned,
+        bei  True  schon.
+        Bei  'print'  wird ein χ^2-Test direkt ausgeführt und geprintet (pap.chi_quadrat_odr()),
+        siehe  Beispiele  und Dokumentation von  pap.chi_quadrat_odr()
+    
+    funktionstyp : string, optional
+        Ist standardmäßig auf  'x, *p',  also die Form  funktion(x, *parameter)  eingestellt.
+        Wähle  'x, p_list'  für Form  funktion(x, parameter)
+        oder   'p_list, x'  für Form  funktion(parameter, x).
+    
+    output_residuen : bool, optional
+        Bei  True  werden zusätzlich die Residuen des Fits in x- und y-Richtung returned, 
+        zB. für  pap.diagnose.odr_diagnose().
+    
+    bins : int, optional
+        Gibt es mehr Messpunkte, werden sie vor dem Fit nach x sortiert in  bins  gleich volle Bins 
+        zusammengefasst und nur die gemittelten Punkte gefittet, siehe  Reduktion.
+        Standardmäßig wird nichts reduziert.
+    
+    verfeinern : bool, optional
+        Nur mit  bins:  Bei  True  wird danach noch einmal an alle Messpunkte gefittet, ausgehend von den 
+        Parametern des reduzierten Fits. Alle Outputs gehören dann zum vollen Fit.
+    
+    
+    Output
+    ------
+    parameter : np.array (1D, float Elemente)
+        Liste der Parameter der gefitteten Funktion
+    
+    paramter_fehler : np.array (1D, float Elemente)
+        Liste von deren 1σ-Fehlern (Standardabweichungen)
+    
+    chi_quadrat_liste : list, optional
+        Besteht aus 
+        chi_quadrat : float, 
+        anzahl_messwerte : int,
+        anzahl_parameter : int
+        Kann man direkt in  pap.chi_quadrat_odr()  einfügen, siehe  Beispiele.
+    
+    residuen : np.array (2D, float Elemente), optional
+        Form: np.array([delta, eps]), die Abstände der Fitpunkte von den Messpunkten in x- und y-Richtung
+        (Fitpunkt - Messpunkt). Kommt immer als letztes Output-Argument.
+        Bei einem reduzierten Fit ohne  verfeinern  gehören χ^2, anzahl_messwerte und residuen zu den 
+        gemittelten Punkten (anzahl_messwerte = bins).
+        
+    
+    Beispiele
+    ---------
+    Hier werden sowohl Fit-Resultate als auch χ^2-Wert angezeigt:
+    >>> messpunkte = np.array([[0.9, 2.3, 4.5], [-2.0, -4.3, -8.6]])
+    >>> messfehler = np.array([[0.1, 0.05, 0.08], [0.1, 0.4, 0.3]])
+    >>> parameter_schätz  = [-2]
+    >>> parameter, parameter_fehler = pap.odr_fit(pap.func.prop, messpunkte, messfehler, 
+                                                  parameter_schätz,output_chi_test = 'print')
+      Ergebnisse des ODR-Fits:
+
+      Beta: [-1.93158386]
+      Beta Std Error: [0.05977981]
+      Beta Covariance: [[0.00435563]]
+      Residual Variance: 0.8204606240877614
+      Inverse Condition #: 1.0
+      Reason(s) for Halting:
+        Sum of squares convergence
+
+
+      Ergebnisse des χ^2-Tests:
+
+      χ^2_reduziert         = 0.82
+      Fitwahrscheinlichkeit = 44.0%
+    
+    
+    Hier ohne Prints aber mit χ^2-Output:
+    >>> output = pap.odr_fit(pap.func.poly, messpunkte, messfehler, parameter_schätz, 
+                             print_resultate = False, output_chi_test = True, funktionstyp = 'x, p_list')
+    >>> parameter, parameter_fehler, chi_quadrat_liste = output
+    
+    Damit kann man dann den χ^2-Test separat ausführen:
+    >>> pap.chi_quadrat_odr(*chi_quadrat_liste)
+      Ergebnisse des χ^2-Tests:
+
+      χ^2_reduziert         = 0.82
+      Fitwahrscheinlichkeit = 44.0%
+    
+    
+    Bedeutung des Fit-Resultates
+    ----------------------------
+      * "Beta" und "Beta Std Error" sind jeweils die Parameter und deren 1σ-Fehler der gefitteten 
+        Funktion. Sie heißen im Output  parameter  und  parameter_fehler.
+      * "Beta Covariance" ist die Kovarianz-Matrix der Parameter.
+      * "Residual Variance" ist der reduzierte χ^2-Wert des Fits. Er taucht auch im Ergebnis des χ^2-Testes
+        auf.
+      * "Reason(s) for Halting" kann Gründe angeben, warum ein Fit schiefgelaufen ist. 
+        "Sum of squares convergence" bedeutet, dass die Optimierfunktion auf einen bestimmten Wert 
+        konvergiert ist. Bedeutet aber nicht notwendigerweise, dass die die gefunden Parameter sinnvoll 
+        sind, dies sieht man besser mit einem Plot.
+    
+    
+    Reduktion
+    ---------
+    Der Aufwand von ODRPACK wächst mit der Anzahl Messpunkte. Mit  bins  werden die nach x sortierten Punkte 
+    in Gruppen aufeinanderfolgender Punkte geteilt und jede Gruppe durch ihren gewichteten Mittelwert ersetzt:
+    x und y werden beide mit den Gewichten 1/σ_y^2 gemittelt (dieselben Gewichte, damit der gemittelte Punkt 
+    bei geraden Kurvenstücken auf der Kurve bleibt), ihre Fehler werden mit pap.summen_fehler() fortgepflanzt.
+    Das ist nur gut, solange sich die Kurve innerhalb eines Bins kaum krümmt, also bei glatten Kurven und 
+    genug Bins. Sonst verschiebt die Mittelung die Punkte etwas von der Kurve weg, was  verfeinern = True 
+    korrigiert: Der zweite Fit an alle Punkte braucht dank der guten Startparameter nur wenige Iterationen.
+    
+    >>> parameter, parameter_fehler = pap.odr_fit(pap.func.exp, messpunkte, messfehler, [1, -1], 
+                                                  bins = 1000, verfeinern = True)
+    '''
+    
+    
+    
+    # Überprüfen und Anpassen der Argumente
+    x_werte,  y_werte  = messpunkte
+    x_fehler, y_fehler = messfehler
+    
+    if messfehler[messfehler == 0].size != 0:
+        return _eingabefehler('messfehler darf keine Fehler enthalten, die 0 sind!')
+    if bins is not None and (not isinstance(bins, (int, np.integer)) or bins < 1):
+        return _eingabefehler(f'Eingabefehler: bins = {bins!r}', 'bins muss eine ganze Zahl >= 1 sein.')
+    
+    funktion_kompatibel = _funktion_kompatibel(funktion, funktionstyp)
+    reduziert = bins is not None and bins < np.shape(messpunkte)[1]
+    
+    
+    # Berechnung des Fits (oder Laden aus dem Cache)
+    schlüssel = None
+    ergebnis  = None
+    if _cache['ordner'] is not None:
+        reduktion = [arr([bins, verfeinern])]  if reduziert  else []
+        schlüssel = _cache_schlüssel(funktion, funktionstyp, messpunkte, messfehler, parameter0, *reduktion)
+        ergebnis  = _cache_laden(schlüssel)  if schlüssel is not None  else None
+        if ergebnis is not None and _profil['aktiv']:
+            _profil_zählen('odr_fit', cache_treffer = 1)
+    
+    if ergebnis is None:
+        if reduziert:
+            punkte, fehler = _messpunkte_binnen(messpunkte, messfehler, bins)
+            ergebnis = _odr_rechnen(funktion_kompatibel, punkte, fehler, parameter0)
+            if verfeinern:
+                ergebnis = _odr_rechnen(funktion_kompatibel, messpunkte, messfehler, ergebnis.beta)
+        else:
+            ergebnis = _odr_rechnen(funktion_kompatibel, messpunkte, messfehler, parameter0)
+        if schlüssel is not None:
+            _cache_speichern(schlüssel, ergebnis)
+    
+    
+    # Einstellen des Outputs und Print-Inhaltes
+    return_list = []
+    return_list.append(ergebnis.beta)
+    return_list.append(ergebnis.sd_beta)
+    
+    ausgabe_zeilen = []
+    if print_resultate == True and _printen():
+        with contextlib.redirect_stdout(io.StringIO()) as pprint_text:
+            ergebnis.pprint()
+        titel = (f'Ergebnisse des ODR-Fits (auf {bins} Bins reduziert):\n'  if reduziert and not verfeinern  
+                 else 'Ergebnisse des ODR-Fits:\n')
+        ausgabe_zeilen += [titel, pprint_text.getvalue().removesuffix('\n')]
+        
+    if output_chi_test != False:
+        chi_quadrat = ergebnis.sum_square
+        anzahl_messwerte = bins  if reduziert and not verfeinern  else np.shape(messpunkte)[1]
+        anzahl_parameter = len(ergebnis.beta)
+        chi_test_list = [chi_quadrat, anzahl_messwerte, anzahl_parameter]
+        if output_chi_test == True:
+            return_list.append(chi_test_list)
+        elif output_chi_test == 'print' and _printen():
+            ausgabe_zeilen += ['\n', *_chi_quadrat_zeilen(*chi_test_list)[2]]
+    
+    if output_residuen:
+        return_list.append(arr([ergebnis.delta, ergebnis.eps]))
+    
+    if ausgabe_zeilen:
+        _ausgeben(ausgabe_zeilen)
+    return return_list
+
+
+        
+        
+def _odr_rechnen(funktion_kompatibel, messpunkte, messfehler, parameter0):
+    '''Ein ODR-Fit mit scipy.odr, gezählt im Profil (pap.profil_einstellen()).'''
+    
+    from scipy import odr
+    modell_funktion = odr.Model(funktion_kompatibel)
+    messdaten       = odr.RealData(*messpunkte, *messfehler)
+    regression      = odr.ODR(messdaten, modell_funktion, beta0 = parameter0)
+    ergebnis        = regression.run()
+    if _profil['aktiv']:
+        _profil_zählen('odr_fit', **_odr_zähler(ergebnis))
+    return ergebnis
+
+
+
+
+def _messpunkte_binnen(messpunkte, messfehler, anzahl_bins):
+    '''
+    Reduziert die Messpunkte von pap.odr_fit() auf  anzahl_bins  gewichtete Mittelwerte (siehe "Reduktion" im 
+    Docstring von pap.odr_fit()). Die nach x sortierten Punkte werden auf gleich volle Bins aufgeteilt, bei 
+    Rest haben die letzten Bins einen Punkt weniger. Als Matrix (ein Bin pro Zeile, aufgefüllt mit Gewicht 0)
+    lassen sich alle Bins auf einmal mitteln und die Fehler mit pap.summen_fehler() fortpflanzen.
+    
+    
+    Output
+    ------
+    messpunkte, messfehler : np.ndarray (2D, np.float64), shape = (2, anzahl_bins)
+    '''
+    
+    
+    anzahl   = np.shape(messpunkte)[1]
+    pro_bin  = -(-anzahl // anzahl_bins)   # Aufgerundet
+    rest     = anzahl_bins * pro_bin - anzahl   # So viele Bins haben einen Punkt weniger.
+    belegt   = np.ones((anzahl_bins, pro_bin), dtype = bool)
+    belegt[anzahl_bins - rest:, -1] = False
+    
+    reihenfolge = np.argsort(messpunkte[0], kind = 'stable')
+    def als_matrix(werte):
+        matrix = np.zeros((anzahl_bins, pro_bin))
+        matrix[belegt] = werte[reihenfolge]
+        return matrix
+    
+    x_werte,  y_werte  = (als_matrix(np.asarray(werte, dtype = np.float64)) for werte in messpunkte)
+    x_fehler, y_fehler = (als_matrix(np.asarray(fehler, dtype = np.float64)) for fehler in messfehler)
+    gewichte = np.divide(1, y_fehler**2, out = np.zeros_like(y_fehler), where = belegt)
+    summe    = gewichte.sum(axis = 1)
+    
+    punkte = arr([(gewichte * x_werte).sum(axis = 1), (gewichte * y_werte).sum(axis = 1)]) / summe
+    fehler = arr([summen_fehler((gewichte * x_fehler).T), summen_fehler((gewichte * y_fehler).T)]) / summe
+    return punkte, fehler
+
+
+
+
+def _odr_zähler(ergebnis):
+    '''
+    Anzahl Iterationen und Funktionsauswertungen eines ODR-Fits aus dessen  iwork-Array.
+    Deren Lage hängt von der Anzahl Parameter ab (ODRPACK, DIWINF), hier für 1D-x- und 1D-y-Werte wie in odr_fit().
+    '''
+    
+    anzahl_parameter = len(ergebnis.beta)
+    iterationen, auswertungen = ergebnis.iwork[2 * anzahl_parameter + 15 : 2 * anzahl_parameter + 17]
+    return {'odr_iterationen': int(iterationen), 'odr_auswertungen': int(auswertungen)}
+
+
+
+
+def _chi_quadrat_zeilen(chi_quadrat, anzahl_messwerte, anzahl_parameter):
+    '''
+    Berechnet χ^2_reduziert und die Fitwahrscheinlichkeit und die Zeilen, mit denen sie als schönes Ergebnis 
+    geprintet werden.
+    '''
+    
+    chi_quadrat_reduziert, fit_wahrscheinlichkeit = [float(zahl) for zahl in 
+        chi_quadrat_odr_tests(chi_quadrat, anzahl_messwerte, anzahl_parameter)]
+    
+    zeilen = ['Ergebnisse des χ^2-Tests:\n',
+              f"χ^2_reduziert         = {chi_quadrat_reduziert:.2f}",
+              f"Fitwahrscheinlichkeit = {fit_wahrscheinlichkeit:.1f}%"]
+    return chi_quadrat_reduziert, fit_wahrscheinlichkeit, zeilen
+
+
+
+
+def _chi_quadrat_ausgabe(chi_quadrat, anzahl_messwerte, anzahl_parameter):
+    '''
+    Printet das Ergebnis des χ^2-Tests bzw. returnt [χ^2_reduziert, Fitwahrscheinlichkeit [%]], 
+    je nach pap.ausgabe_einstellen().
+    '''
+    
+    chi_quadrat_reduziert, fit_wahrscheinlichkeit, zeilen = _chi_quadrat_zeilen(chi_quadrat, anzahl_messwerte, 
+                                                                                anzahl_parameter)
+    if _printen():
+        _ausgeben(zeilen)
+        return
+    return [chi_quadrat_reduziert, fit_wahrscheinlichkeit]
+        
+
+        
+        
+def chi_quadrat_test(fit_werte, werte, werte_fehler, anzahl_parameter): 
+    '''
+    Printet den χ^2_reduziert-Wert und die Fitwahrscheinlichkeit.
+    
+    
+    Argumente
+    ---------
+    fit_werte : np.array (1D, number_like)
+        die Werte, die die Fitfunktion ausgibt, also  fit_werte = fit_func(x_werte, *parameter)
+    
+    werte : np.array (1D, number_like)
+        y-Werte der Messdaten
+    
+    werte_fehler : np.array (1D, number_like)
+        y-Fehler der Messdaten
+    
+    anzahl_parameter : int (> 0)
+        Anzahl Parameter der Fitfunktion
+        
+        
+    Beispiel
+    --------
+    >>> x_werte = np.array([-8, -5.5, -1.2, 1, 1.4, 3.2, 4.5])
+    >>> y_werte = np.array([40, 20.8, 3.1, 0.5, 1.5, 3, 6])
+    >>> y_fehler = np.array([0.5, 0.73, 0.42, 0.23, 0.23, 0.41, 0.44])
+    >>> fitparameter = [0.46721214, -1.01681483, 1.45102103]
+    >>> pap.chi_quadrat_test(pap.func.quad(x_werte, *fitparameter), y_werte, y_fehler, 3)
+      Ergebnisse des χ^2-Tests:
+
+      χ^2_reduziert         = 2.79
+      Fitwahrscheinlichkeit = 2.5%
+    '''
+    
+    
+    chi_quadrat = np.sum(((fit_werte - werte) / werte_fehler)**2)
+    
+    return _chi_quadrat_ausgabe(chi_quadrat, len(werte), anzahl_parameter)
+    
+    
+    
+ 
+def chi_quadrat_odr(chi_quadrat, anzahl_messwerte, anzahl_parameter):
+    '''
+    Printet den χ^2_reduziert-Wert und die Fitwahrscheinlichkeit für einen ODR-Fit (siehe pap.odr_fit()).
+    Die drei Input-Argumente kann man sich von der pap.odr_fit-Funktion mithilfe der Angabe
+    output_chi_test = True  als drittes Output-Argument geben lassen.
+    
+    
+    Argumente
+    ---------
+    chi_quadrat : float (> 0)
+    
+    anzahl_messwerte : int (> 0)
+
+    anzahl_parameter : int (> 0)
+    
+    
+    Beispiel
+    --------
+    >>> parameter, parameter_fehler, chi_test_liste = pap.odr_fit(... Argumente ..., output_chi_liste = True)
+      ... Geprintetes Ergebnis vom ODR-Fit ...
+    >>> pap.chi_quadrat_odr(*chi_test_liste)
+      Ergebnisse des χ^2-Tests:
+      
+      χ^2_reduziert         = 0.82
+      Fitwahrscheinlichkeit = 44.0%
+    '''
+    
+    
+    return _chi_quadrat_ausgabe(chi_quadrat, anzahl_messwerte, anzahl_parameter)
+   
+
+
+
+
+def _chi2_tabelle_bauen(freiheitsgrade, schritt):
+    '''
+    Stützstellen der Funktion  log(chi2.sf(x))  über  t = sqrt(x)  in gleichmäßigen Schritten, mit den exakten 
+    Ableitungen, als Koeffizienten kubischer Hermite-Polynome pro Intervall.
+    '''
+    
+    from scipy.stats import chi2
+    
+    t_max = np.sqrt(chi2.isf(CHI2_TABELLEN_P_MIN, freiheitsgrade))
+    t     = np.arange(int(np.ceil(t_max / schritt)) + 2) * schritt
+    x     = t**2
+    log_p = chi2.logsf(x, freiheitsgrade)
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        ableitung = -np.exp(chi2.logpdf(x, freiheitsgrade) - log_p) * 2 * t   # d log(sf) / dt
+    ableitung[0] = -np.sqrt(2 / np.pi)  if freiheitsgrade == 1  else 0   # Grenzwert bei t = 0
+    
+    p0, m0 = log_p[:-1], schritt * ableitung[:-1]
+    p1, m1 = log_p[1:],  schritt * ableitung[1:]
+    koeffizienten = np.stack([p0, m0, -3*p0 - 2*m0 + 3*p1 - m1, 2*p0 + m0 - 2*p1 + m1], axis = 1)
+    return koeffizienten, t_max
+
+
+
+
+def _chi2_tabelle_auswerten(tabelle, chi_quadrat):
+    '''Wertet eine Tabelle von _chi2_tabelle() aus, nur für  0 <= chi_quadrat < t_max^2.'''
+    
+    schritt, koeffizienten = tabelle[0], tabelle[1]
+    u = np.sqrt(chi_quadrat) / schritt
+    i = np.minimum(u.astype(np.intp), len(koeffizienten) - 1)
+    s = u - i
+    k = koeffizienten[i]
+    log_p = ((k[:, 3] * s + k[:, 2]) * s + k[:, 1]) * s + k[:, 0]   # Horner-Schema
+    return np.exp(log_p)
+
+
+
+
+@functools.lru_cache(maxsize = CHI2_TABELLEN_ANZAHL)
+def _chi2_tabelle(freiheitsgrade):
+    '''
+    Erstellt (einmal pro Freiheitsgrad, danach aus dem Cache) eine Interpolationstabelle für  chi2.sf().
+    Die Schrittweite wird so lange halbiert, bis der größte relative Fehler zwischen den Stützstellen 
+    (gemessen an den Intervallmitten und -vierteln gegen die exakte Funktion) unter CHI2_TOLERANZ liegt.
+    
+    
+    Output
+    ------
+    tabelle : tuple
+        (schritt, koeffizienten, t_max, fehlerschranke)
+    '''
+    
+    from scipy.stats import chi2
+    
+    schritt = 0.04
+    while True:
+        koeffizienten, t_max = _chi2_tabelle_bauen(freiheitsgrade, schritt)
+        test_t  = (np.arange(len(koeffizienten) - 1)[:, None] + arr([0.25, 0.5, 0.75])).ravel() * schritt
+        test_t  = test_t[test_t < t_max]
+        exakt   = chi2.sf(test_t**2, freiheitsgrade)
+        fehler  = np.max(np.abs(_chi2_tabelle_auswerten((schritt, koeffizienten), test_t**2) / exakt - 1))
+        if fehler < CHI2_TOLERANZ or schritt < 1e-4:
+            return schritt, koeffizienten, t_max, fehler
+        schritt /= 2
+
+
+
+
+def chi_quadrat_p_wert(chi_quadrat, freiheitsgrade):
+    '''
+    Berechnet die Wahrscheinlichkeit, ein mindestens so großes χ^2 zu erhalten (p-Wert,  chi2.sf()), 
+    für beliebig viele χ^2-Werte mit wenigen verschiedenen Freiheitsgraden deutlich schneller als scipy.stats.
+    
+    Für jeden Freiheitsgrad wird beim ersten Gebrauch eine Interpolationstabelle erstellt und danach im 
+    Speicher gehalten (die letzten CHI2_TABELLEN_ANZAHL). Ihr relativer Fehler wird beim Erstellen gegen die 
+    exakte Funktion geprüft und liegt unter CHI2_TOLERANZ (siehe Benchmarks/chi_quadrat_p_wert.py). Im äußersten Ausläufer (p < CHI2_TABELLEN_P_MIN) und für kleine Mengen von Werten wird 
+    exakt mit  scipy.special.chdtrc()  gerechnet, ohne den Aufwand von scipy.stats.
+    
+    
+    Argumente
+    ---------
+    chi_quadrat : np.ndarray (number_like), number_like
+    
+    freiheitsgrade : np.ndarray (number_like), number_like
+        Wird mit  chi_quadrat  gebroadcastet. Keine Freiheitsgrade (<= 0) ergeben NaN.
+    
+    
+    Output
+    ------
+    p_wert : np.ndarray (np.float64)
+        Gleiche shape wie  chi_quadrat  und  freiheitsgrade  zusammen, Werte zwischen 0 und 1 (nicht %).
+    
+    
+    Beispiel
+    --------
+    >>> chi_quadrat = np.random.chisquare(18, 10**6)
+    >>> p_werte     = pap.chi_quadrat_p_wert(chi_quadrat, 18)   # Etwa 3-5 mal schneller als chi2.sf()
+    '''
+    
+    
+    chi_quadrat    = np.maximum(np.asarray(chi_quadrat, dtype = np.float64), 0)   # χ^2 < 0 gibt es nicht.
+    freiheitsgrade = np.asarray(freiheitsgrade, dtype = np.float64)
+    
+    if freiheitsgrade.ndim == 0:   # Häufigster Fall: ein Freiheitsgrad für alle, ohne Auswahl-Masken.
+        return _chi2_p_wert_gruppe(np.ravel(chi_quadrat), float(freiheitsgrade)).reshape(chi_quadrat.shape)
+    
+    chi_quadrat, freiheitsgrade = np.broadcast_arrays(chi_quadrat, freiheitsgrade)
+    p_wert = np.full(chi_quadrat.shape, np.nan)
+    for freiheitsgrad in np.unique(freiheitsgrade[freiheitsgrade > 0]).tolist():
+        auswahl = freiheitsgrade == freiheitsgrad
+        p_wert[auswahl] = _chi2_p_wert_gruppe(chi_quadrat[auswahl], freiheitsgrad)
+    return p_wert
+
+
+
+
+def _chi2_p_wert_gruppe(chi_quadrat, freiheitsgrad):
+    '''p-Werte für ein 1D-Array  chi_quadrat  (>= 0 oder NaN) mit gemeinsamem  freiheitsgrad.'''
+    
+    from scipy.special import chdtrc, erfc
+    
+    if not freiheitsgrad > 0:   # Auch NaN
+        return np.full(len(chi_quadrat), np.nan)
+    if len(chi_quadrat) < CHI2_TABELLE_AB or freiheitsgrad != int(freiheitsgrad):
+        # Für wenige Werte lohnt sich keine Tabelle, bei gebrochenen Freiheitsgraden ist log(sf) bei 0 nicht glatt.
+        if freiheitsgrad == 1:   # Exakt und viel schneller als chdtrc()
+            return erfc(np.sqrt(chi_quadrat / 2))
+        return chdtrc(freiheitsgrad, chi_quadrat)
+    
+    schritt, koeffizienten, t_max, _ = _chi2_tabelle(freiheitsgrad)
+    in_tabelle = chi_quadrat < t_max**2   # NaN und Ausläufer exakt
+    if np.all(in_tabelle):
+        return _chi2_tabelle_auswerten((schritt, koeffizienten), chi_quadrat)
+    p_wert = np.empty(len(chi_quadrat))
+    p_wert[in_tabelle]  = _chi2_tabelle_auswerten((schritt, koeffizienten), chi_quadrat[in_tabelle])
+    p_wert[~in_tabelle] = chdtrc(freiheitsgrad, chi_quadrat[~in_tabelle])
+    return p_wert
+
+
+
+
+def chi_quadrat_odr_tests(chi_quadrat, anzahl_messwerte, anzahl_parameter):
+    '''
+    Berechnet χ^2_reduziert und die Fitwahrscheinlichkeit für viele Fits auf einmal, ohne zu printen. 
+    Die vektorisierte Variante von pap.chi_quadrat_odr(), zB. für zehntausende Fits.
+    
+    Die Fitwahrscheinlichkeit wird mit pap.chi_quadrat_p_wert() (also  chi2.sf()) berechnet, was im Gegensatz zu 
+    1 - chi2.cdf()  auch sehr kleine Wahrscheinlichkeiten noch genau angibt, statt sie auf 0 zu runden.
+    
+    
+    Argumente
+    ---------
+    chi_quadrat : np.ndarray (number_like), number_like
+    
+    anzahl_messwerte : np.ndarray (int), int
+    
+    anzahl_parameter : np.ndarray (int), int
+        Alle drei werden gegeneinander gebroadcastet.
+    
+    
+    Output
+    ------
+    chi_quadrat_reduziert : np.ndarray (np.float64)
+        NaN, falls es keine Freiheitsgrade gibt.
+    
+    fit_wahrscheinlichkeit : np.ndarray (np.float64), [%]
+    
+    
+    Beispiel
+    --------
+    >>> pap.chi_quadrat_odr_tests(np.array([20., 150., 400.]), 20, 2)
+    [array([ 1.11111111,  8.33333333, 22.22222222]), array([3.32819679e+01, 7.43226429e-21, 9.15079015e-72])]
+    '''
+    
+    
+    chi_quadrat, anzahl_messwerte, anzahl_parameter = np.broadcast_arrays(
+        np.asarray(chi_quadrat, dtype = np.float64), anzahl_messwerte, anzahl_parameter)
+    freiheitsgrade = np.asarray(anzahl_messwerte - anzahl_parameter, dtype = np.float64)
+    freiheitsgrade[freiheitsgrade <= 0] = np.nan   # Ohne Freiheitsgrade ist der Test sinnlos.
+    
+    chi_quadrat_reduziert  = chi_quadrat / freiheitsgrade
+    fit_wahrscheinlichkeit = chi_quadrat_p_wert(chi_quadrat, freiheitsgrade) * 100
+    return [chi_quadrat_reduziert, fit_wahrscheinlichkeit]
+
+
+
+
+def chi_quadrat_tests(fit_werte, werte, werte_fehler, anzahl_parameter):
+    '''
+    Führt χ^2-Tests für viele Fits auf einmal durch, ohne zu printen. Die vektorisierte Variante von 
+    pap.chi_quadrat_test(): Jede Zeile ist ein Fit, siehe auch pap.chi_quadrat_odr_tests().
+    
+    
+    Argumente
+    ---------
+    fit_werte : np.ndarray (2D, number_like), shape = (anzahl_fits, anzahl_messwerte)
+        Die Werte der jeweiligen Fitfunktion.
+    
+    werte : np.ndarray (2D, number_like)
+        y-Werte der Messdaten, gleiche shape. NaN markiert fehlende Messwerte, zB. wenn die Fits 
+        unterschiedlich viele Messwerte haben. Diese zählen nicht mit.
+    
+    werte_fehler : np.ndarray (2D oder 1D, number_like)
+        y-Fehler der Messdaten, muss sich auf die shape von  werte  broadcasten lassen.
+    
+    anzahl_parameter : np.ndarray (1D, int), int
+        Anzahl Parameter der Fitfunktion(en)
+    
+    
+    Output
+    ------
+    chi_quadrat_reduziert : np.ndarray (1D, np.float64)
+    
+    fit_wahrscheinlichkeit : np.ndarray (1D, np.float64), [%]
+    
+    
+    Beispiel
+    --------
+    >>> x_werte   = np.linspace(0, 10, 20)
+    >>> fit_werte = np.array([pap.func.lin(x_werte, 2, 1), pap.func.lin(x_werte, 2.1, 0.8)])
+    >>> chi_reduziert, wahrscheinlichkeit = pap.chi_quadrat_tests(fit_werte, y_werte, y_fehler, 2)
+    '''
+    
+    
+    summanden   = ((np.asarray(fit_werte) - werte) / werte_fehler)**2
+    gültig      = ~np.isnan(summanden)
+    chi_quadrat = np.sum(summanden, axis = -1, where = gültig)
+    return chi_quadrat_odr_tests(chi_quadrat, np.sum(gültig, axis = -1), anzahl_parameter)
+
+
+
+
+def _histogramm_zählen(werte, bereich, anzahl_bins):
+    '''
+    Zählt, wie viele  werte  in jedes von  anzahl_bins  gleich breiten Bins im  bereich  fallen.
+    Statt wie np.histogram() die Bin-Kanten zu durchsuchen, wird jeder Wert direkt auf seinen Bin-Index skaliert
+    und mit np.bincount() gezählt, also O(N). Werte außerhalb von  bereich  werden ignoriert, die obere Grenze 
+    gehört (wie bei np.histogram()) noch zum letzten Bin.
+    
+    
+    Argumente
+    ---------
+    werte : np.ndarray (number_like)
+    
+    bereich : tuple (untergrenze, obergrenze)
+    
+    anzahl_bins : int
+    
+    
+    Output
+    ------
+    zählungen : np.ndarray (np.int64), shape = (anzahl_bins,)
+    '''
+    
+    
+    untergrenze, obergrenze = bereich
+    werte      = np.ravel(werte)
+    werte      = werte[(werte >= untergrenze) & (werte <= obergrenze)]
+    skalierung = anzahl_bins / (obergrenze - untergrenze)
+    
+    indices = ((werte - untergrenze) * skalierung).astype(np.intp)
+    np.minimum(indices, anzahl_bins - 1, out = indices)   # Werte genau auf der Obergrenze
+    return np.bincount(indices, minlength = anzahl_bins)
+
+
+
+
+def histogramm_fit(werte, anzahl_bins = 100, bereich = None, parameter0 = None,
+                   print_resultate = True, output_chi_test = False, output_histogramm = False):
+    '''
+    Histogrammiert ungebinnte Messwerte, fittet eine Gaußverteilung (pap.func.gauss) an die Bins und bestimmt 
+    deren Halbwertsbreite. Fasst damit die übliche Kette  np.histogram() -> sqrt(N)-Fehler -> pap.odr_fit() 
+    -> pap.fwhm()  in einer Funktion zusammen.
+    
+    Die Werte können auch als Folge von Teil-Arrays (zB. ein Generator, der eine große Datei stückweise liest, 
+    oder eine Liste von Arrays) übergeben werden. Dann werden die Zählungen Stück für Stück aufaddiert, ohne alle Werte im Speicher zu halten.
+    
+    
+    Argumente
+    ---------
+    werte : array_like (number_like), Iterator oder list (von np.ndarrays)
+        Ungebinnte Messwerte, beliebige Form. Listen, Tupel und Zahlen werden mit np.asarray() umgewandelt.
+        Bei einer Folge von Teil-Arrays (Iterator bzw. Generator oder list von np.ndarrays) muss  bereich  
+        angegeben werden.
+    
+    anzahl_bins : int, optional
+    
+    bereich : tuple (untergrenze, obergrenze), optional
+        Standardmäßig (min(werte), max(werte)).
+    
+    parameter0 : array_like (1D, [A0, μ, σ]), optional
+        Startwerte des Fits. Werden standardmäßig aus dem Histogramm geschätzt:
+        A0 = Anzahl Werte * Binbreite,  μ = Mittelwert,  σ = Standardabweichung.
+    
+    print_resultate : bool, optional
+        Printet die Ergebnisse des ODR-Fits und die Halbwertsbreite.
+    
+    output_chi_test : bool, string, optional
+        Wie bei pap.odr_fit().
+    
+    output_histogramm : bool, optional
+        Bei  True  werden auch die Bin-Mitten und Zählungen returned, zB. zum Plotten.
+    
+    
+    Output
+    ------
+    parameter : np.array ([A0, μ, σ])
+    
+    parameter_fehler : np.array ([A0_fehler, μ_fehler, σ_fehler])
+    
+    halbwertsbreite : np.array ([fwhm, fwhm_fehler])
+    
+    chi_quadrat_liste : list, optional
+        Siehe pap.odr_fit().
+    
+    histogramm : list, optional
+        [bin_mitten, zählungen]
+    
+    
+    Berechnung
+    ----------
+    * Die y-Fehler der Bins sind Poisson-Fehler sqrt(N). Leere Bins werden nicht gefittet, da pap.odr_fit() 
+      keine Fehler zulässt, die 0 sind.
+    * Als x-Fehler wird die Standardabweichung einer Gleichverteilung über die Binbreite benutzt, 
+      also Binbreite / sqrt(12).
+    
+    
+    Beispiel
+    --------
+    >>> werte = np.random.normal(5.0, 0.3, 10**6)
+    >>> parameter, parameter_fehler, halbwertsbreite = pap.histogramm_fit(werte, print_resultate = False)
+    '''
+    
+    
+    
+    # Zählen der Werte
+    '''Nur Iteratoren (zB. Generatoren) und Listen von Arrays sind Folgen von Teil-Arrays, alles andere 
+    (auch Listen von Zahlen) sind die Werte selbst.'''
+    einzeln = not (isinstance(werte, collections.abc.Iterator) 
+                   or (isinstance(werte, (list, tuple)) and len(werte) > 0 
+                       and all(isinstance(teil_werte, np.ndarray) for teil_werte in werte)))
+    if einzeln:
+        werte = np.asarray(werte)
+        if werte.size == 0:
+            return _eingabefehler('Eingabefehler: werte ist leer.\n')
+    if bereich == None:
+        if not einzeln:
+            return _eingabefehler('Eingabefehler: werte ist eine Folge von Teil-Arrays, aber bereich ist nicht angegeben.',
+                                  'Die Bin-Grenzen müssen vor dem Lesen der Werte feststehen.\n')
+        bereich = (np.min(werte), np.max(werte))
+    if not bereich[0] < bereich[1]:
+        return _eingabefehler(f'Eingabefehler: bereich = ({float(bereich[0])}, {float(bereich[1])})', 
+                              'Die obere Grenze von bereich muss größer als die untere sein, also mindestens zwei '
+                              'verschiedene Werte.\n')
+    
+    if einzeln:
+        zählungen = _histogramm_zählen(werte, bereich, anzahl_bins)
+    else:
+        zählungen = np.zeros(anzahl_bins, dtype = np.int64)
+        for teil_werte in werte:
+            zählungen += _histogramm_zählen(np.asarray(teil_werte), bereich, anzahl_bins)
+    
+    untergrenze, obergrenze = bereich
+    binbreite = (obergrenze - untergrenze) / anzahl_bins
+    bin_mitten = untergrenze + (np.arange(anzahl_bins) + 0.5) * binbreite
+    
+    anzahl_werte = np.sum(zählungen)
+    if anzahl_werte == 0:
+        return _eingabefehler(f'Eingabefehler: Es liegen keine Werte im bereich {bereich} \n')
+    
+    
+    # Schätzung der Startparameter
+    if parameter0 is None:
+        mu        = np.sum(zählungen * bin_mitten) / anzahl_werte
+        sigma     = np.sqrt(np.sum(zählungen * (bin_mitten - mu)**2) / anzahl_werte)
+        sigma     = sigma  if sigma > 0  else binbreite   # Falls alle Werte im selben Bin
+        parameter0 = [anzahl_werte * binbreite, mu, sigma]
     
     
+    # Fit an die nicht-leeren Bins
+    gefüllt    = zählungen > 0
+    messpunkte = arr([bin_mitten[gefüllt], zählungen[gefüllt]], dtype = np.float64)
+    messfehler = arr([np.full(np.sum(gefüllt), binbreite / np.sqrt(12)), np.sqrt(zählungen[gefüllt])])
     
-    # Printen der Tabelle
-    alle_strings = [*titel_strings, *vergleich_strings]
-    for zeile in alle_strings:
-        print(zeile)  
-    print('')   # Separieren von nachfolgenden Prints.
-        
+    return_list = odr_fit(func.gauss, messpunkte, messfehler, parameter0, 
+                          print_resultate = print_resultate, output_chi_test = output_chi_test)
+    if return_list is None:   # Eingabefehler, schon geprintet
+        return
+    parameter, parameter_fehler = return_list[:2]
+    
+    halbwertsbreite = fwhm(arr([np.abs(parameter[2]), parameter_fehler[2]]))
+    return_list.insert(2, halbwertsbreite)
+    if print_resultate == True and _printen():
+        _ausgeben(['', resultat_strings('Halbwertsbreite', halbwertsbreite[np.newaxis])[0]])
+    
+    if output_histogramm:
+        return_list.append([bin_mitten, zählungen])
+    
+    return return_list
 
 
-        
-        
-        
-# Funktionen fitten und χ^2-Tests machen
-        
-def odr_fit(funktion, messpunkte, messfehler, parameter0, 
-            print_resultate = True, output_chi_test = False, funktionstyp = 'x, *p'):
+
+
+
+def _fit_zeilen(titel, parameter, parameter_fehler, kovarianz, grund):
+    '''
+    Zeilen der Ergebnisse eines Likelihood-Fits im selben Stil wie  pprint()  aus scipy.odr.
     '''
-    Orthogonal Distance Regression - Fittet eine 1D-Funktion an fehlerbehaftete Messdaten an. Im Gegensatz 
-    zu curve_fit() aus scipy.stats werden hier auch Fehler in der x-Achse berücksichtigt. Eigentlich wird 
-    hier nur das scipy.odr-Paket in einer einfach zu bedienenden aber optionsärmeren Funktion verpackt.
     
-    Optional werden die Fit-Resultate angezeigt und returned, ebenso ein optionaler χ^2-Test.
+    return [f'Ergebnisse des {titel}:\n',
+            f'Beta: {parameter}',
+            f'Beta Std Error: {parameter_fehler}',
+            f'Beta Covariance: {kovarianz}',
+            'Reason(s) for Halting:',
+            '  ' + grund]
+
+
+
+
+def poisson_fit(funktion, bin_mitten, zählungen, parameter0, ableitung = None,
+                print_resultate = True, output_chi_test = False, funktionstyp = 'x, *p'):
+    '''
+    Binned Poisson-Maximum-Likelihood-Fit - Fittet eine Funktion an die Zählungen eines Histogramms. 
+    Im Gegensatz zu einem χ^2-Fit mit sqrt(N)-Fehlern (zB. pap.odr_fit()) ist dieser Fit auch bei kleinen 
+    Zählraten nicht verzerrt und leere Bins sind erlaubt.
+    
+    Argumente und Output sind wie bei pap.odr_fit() aufgebaut, damit beide Fits austauschbar sind.
     
     
     Argumente
     ---------
     funktion : function
-        Erlaubt sind mathematische |R -> |R Funktionen. Folgende Argumente-Reihenfolgen sind unterstützt:
-        funktion(x, *parameter)  also bspw. pap.func.quad(x, a, b, c)
-        funktion(x, parameter)   parameter : array_like
-        funktion(parameter, x)   parameter : array_like
-        Der verwendete Typ muss unter  funktionstyp  angegeben werden.
+        Erwartete Anzahl Einträge pro Bin, ausgewertet in der Bin-Mitte. Muss für die gefitteten Parameter
+        überall > 0 sein. Argumente-Reihenfolge wie bei pap.odr_fit(), siehe  funktionstyp.
     
-    messpunkte : np.array (2D, mit number_like Elementen)
-        Form: np.array([x_werte_liste, y_werte_liste])
-    
-    messfehler : np.array (2D, mit number_like Elementen > 0)
-        Form: np.array([x_fehler_liste, y_fehler_liste])
+    bin_mitten : np.ndarray (1D, number_like)
     
-    Natürlich müssen alle vier Listen gleich lang sein.
+    zählungen : np.ndarray (1D, number_like >= 0)
+        Anzahl Einträge pro Bin, darf auch 0 sein.
     
     parameter0 : array_like (1D, mit number_like Elementen)
-        Erste Schätzung, für was die gefitteten Parameter sein sollen.
-        Achtung! Eine schlechte Schätzung kann dazu führen, dass der Fit schief läuft.
+        Erste Schätzung der Parameter.
+    
+    ableitung : function, optional
+        Ableitungen von  funktion  nach den Parametern mit gleicher Argumente-Reihenfolge, Output-Form
+        (anzahl_parameter, len(bin_mitten)). Für die Funktionen aus pap.func wird sie automatisch aus 
+        pap.func.ABLEITUNGEN genommen. Fehlt sie, wird der Gradient numerisch bestimmt.
     
     print_resultate : bool, optional
-        Bei  True  wird eine Zusammenfassung der Fitergebnisse geprintet (pprint() aus scipy.odr),
-        siehe  Beispiele  und  Bedeutung des Fit-Resultates.
-        Bei  False  wird nichts geprintet.
+        Bei  True  wird eine Zusammenfassung der Fitergebnisse geprintet.
     
     output_chi_test : bool, string, optional
-        Bei  False  wird der χ^2-Wert des Fits nicht returned,
-        bei  True  schon.
-        Bei  'print'  wird ein χ^2-Test direkt ausgeführt und geprintet (pap.chi_quadrat_odr()),
-        siehe  Beispiele  und Dokumentation von  pap.chi_quadrat_odr()
+        Wie bei pap.odr_fit(). Als χ^2-Wert wird das Likelihood-Verhältnis von Baker und Cousins benutzt,
+        siehe "Berechnung".
     
     funktionstyp : string, optional
-        Ist standardmäßig auf  'x, *p',  also die Form  funktion(x, *parameter)  eingestellt.
-        Wähle  'x, p_list'  für Form  funktion(x, parameter)
-        oder   'p_list, x'  für Form  funktion(parameter, x).
+        Wie bei pap.odr_fit().
     
     
     Output
     ------
     parameter : np.array (1D, float Elemente)
-        Liste der Parameter der gefitteten Funktion
     
-    paramter_fehler : np.array (1D, float Elemente)
-        Liste von deren 1σ-Fehlern (Standardabweichungen)
+    parameter_fehler : np.array (1D, float Elemente)
+        1σ-Fehler aus der Fisher-Informationsmatrix.
     
     chi_quadrat_liste : list, optional
-        Besteht aus 
-        chi_quadrat : float, 
-        anzahl_messwerte : int,
-        anzahl_parameter : int
-        Kann man direkt in  pap.chi_quadrat_odr()  einfügen, siehe  Beispiele.
-        
-    
-    Beispiele
-    ---------
-    Hier werden sowohl Fit-Resultate als auch χ^2-Wert angezeigt:
-    >>> messpunkte = np.array([[0.9, 2.3, 4.5], [-2.0, -4.3, -8.6]])
-    >>> messfehler = np.array([[0.1, 0.05, 0.08], [0.1, 0.4, 0.3]])
-    >>> parameter_schätz  = [-2]
-    >>> parameter, parameter_fehler = pap.odr_fit(pap.func.prop, messpunkte, messfehler, 
-                                                  parameter_schätz,output_chi_test = 'print')
-      Ergebnisse des ODR-Fits:
-
-      Beta: [-1.93158386]
-      Beta Std Error: [0.05977981]
-      Beta Covariance: [[0.00435563]]
-      Residual Variance: 0.8204606240877614
-      Inverse Condition #: 1.0
-      Reason(s) for Halting:
-        Sum of squares convergence
-
-
-      Ergebnisse des χ^2-Tests:
-
-      χ^2_reduziert         = 0.82
-      Fitwahrscheinlichkeit = 44.0%
+        [chi_quadrat, anzahl_messwerte, anzahl_parameter], kann man direkt in  pap.chi_quadrat_odr()  einfügen.
     
     
-    Hier ohne Prints aber mit χ^2-Output:
-    >>> output = pap.odr_fit(pap.func.poly, messpunkte, messfehler, parameter_schätz, 
-                             print_resultate = False, output_chi_test = True, funktionstyp = 'x, p_list')
-    >>> parameter, parameter_fehler, chi_quadrat_liste = output
-    
-    Damit kann man dann den χ^2-Test separat ausführen:
-    >>> pap.chi_quadrat_odr(*chi_quadrat_liste)
-      Ergebnisse des χ^2-Tests:
-
-      χ^2_reduziert         = 0.82
-      Fitwahrscheinlichkeit = 44.0%
+    Berechnung
+    ----------
+    Mit λ_i = funktion(bin_mitten_i, *parameter) und n_i = zählungen_i wird minimiert
+        χ^2_λ = 2 Σ (λ_i - n_i + n_i ln(n_i / λ_i))      (für n_i = 0 ist der Summand λ_i)
+    Das ist bis auf eine Konstante die negative Poisson-Log-Likelihood und ist für große Zählraten 
+    χ^2-verteilt, deshalb ist es auch die Güte des Fits. Der Gradient ist
+        dχ^2_λ / dp = 2 Σ (1 - n_i / λ_i) dλ_i / dp
+    und die Kovarianzmatrix der Parameter ist das Inverse der Fisher-Information
+        I_ab = Σ (1 / λ_i) dλ_i / dp_a  dλ_i / dp_b.
     
     
-    Bedeutung des Fit-Resultates
-    ----------------------------
-      * "Beta" und "Beta Std Error" sind jeweils die Parameter und deren 1σ-Fehler der gefitteten 
-        Funktion. Sie heißen im Output  parameter  und  parameter_fehler.
-      * "Beta Covariance" ist die Kovarianz-Matrix der Parameter.
-      * "Residual Variance" ist der reduzierte χ^2-Wert des Fits. Er taucht auch im Ergebnis des χ^2-Testes
-        auf.
-      * "Reason(s) for Halting" kann Gründe angeben, warum ein Fit schiefgelaufen ist. 
-        "Sum of squares convergence" bedeutet, dass die Optimierfunktion auf einen bestimmten Wert 
-        konvergiert ist. Bedeutet aber nicht notwendigerweise, dass die die gefunden Parameter sinnvoll 
-        sind, dies sieht man besser mit einem Plot.
+    Beispiel
+    --------
+    >>> zählungen, kanten = np.histogram(np.random.normal(0, 1, 200), bins = 40)
+    >>> bin_mitten = (kanten[1:] + kanten[:-1]) / 2
+    >>> parameter, parameter_fehler = pap.poisson_fit(pap.func.gauss, bin_mitten, zählungen, [20, 0, 1])
     '''
     
     
     
     # Überprüfen und Anpassen der Argumente
-    x_werte,  y_werte  = messpunkte
-    x_fehler, y_fehler = messfehler
+    bin_mitten = np.asarray(bin_mitten, dtype = np.float64)
+    zählungen  = np.asarray(zählungen, dtype = np.float64)
+    if np.any(zählungen < 0):
+        return _eingabefehler('Eingabefehler: zählungen darf keine negativen Einträge enthalten.\n')
     
-    if messfehler[messfehler == 0].size != 0:
-        print('messfehler darf keine Fehler enthalten, die 0 sind!')
-        return
+    if ableitung == None:
+        ableitung = func.ABLEITUNGEN.get(funktion)
+    modell = _funktion_kompatibel(funktion, funktionstyp)
     
-    def funktion_kompatibel(parameter, x):
-        if funktionstyp == 'x, *p':
-            return funktion(x, *parameter)
-        elif funktionstyp == 'x, p_list':
-            return funktion(x, parameter)
-        elif funktionstyp == 'p_list, x':
-            return funktion(parameter, x)
-        else:
-            print('funktionstyp ist falsch angegeben. >:(')
-            return
+    from scipy import optimize
+    from scipy.special import xlogy
+    
+    
+    # χ^2_λ und sein Gradient
+    def chi_quadrat_lambda(parameter):
+        erwartung = modell(parameter, bin_mitten)
+        if np.any(erwartung <= 0):
+            return np.inf
+        return 2 * np.sum(erwartung - zählungen + xlogy(zählungen, zählungen / erwartung))
+    
+    if ableitung != None:
+        jacobi = _funktion_kompatibel(ableitung, funktionstyp)
+        
+        def gradient(parameter):
+            erwartung = modell(parameter, bin_mitten)
+            return 2 * jacobi(parameter, bin_mitten) @ (1 - zählungen / erwartung)
+    else:
+        gradient = None   # Numerischer Gradient
     
     
     # Berechnung des Fits
-    modell_funktion = odr.Model(funktion_kompatibel)
-    messdaten       = odr.RealData(x_werte, y_werte, x_fehler, y_fehler)
-    regression      = odr.ODR(messdaten, modell_funktion, beta0 = parameter0)
-    ergebnis        = regression.run()
+    ergebnis  = optimize.minimize(chi_quadrat_lambda, np.asarray(parameter0, dtype = np.float64), 
+                                  jac = gradient, method = 'BFGS')
+    parameter = ergebnis.x
+    
+    erwartung = modell(parameter, bin_mitten)
+    if ableitung != None:
+        ableitungen = jacobi(parameter, bin_mitten)
+    else:
+        ableitungen = optimize.approx_fprime(parameter, lambda p: modell(p, bin_mitten)).T
+    fisher           = (ableitungen / erwartung) @ ableitungen.T
+    kovarianz        = np.linalg.pinv(fisher)
+    parameter_fehler = np.sqrt(np.diag(kovarianz))
     
     
     # Einstellen des Outputs und Print-Inhaltes
-    return_list = []
-    return_list.append(ergebnis.beta)
-    return_list.append(ergebnis.sd_beta)
+    return_list = [parameter, parameter_fehler]
+    
+    ausgabe_zeilen = []
+    if print_resultate == True and _printen():
+        ausgabe_zeilen += _fit_zeilen('Poisson-Likelihood-Fits', parameter, parameter_fehler, kovarianz, 
+                                      ergebnis.message)
     
-    if print_resultate == True:
-        print('Ergebnisse des ODR-Fits:\n')
-        ergebnis.pprint()
-        
     if output_chi_test != False:
-        chi_quadrat = ergebnis.sum_square
-        anzahl_messwerte = np.shape(messpunkte)[1]
-        anzahl_parameter = len(ergebnis.beta)
-        chi_test_list = [chi_quadrat, anzahl_messwerte, anzahl_parameter]
+        chi_test_list = [ergebnis.fun, len(zählungen), len(parameter)]
         if output_chi_test == True:
             return_list.append(chi_test_list)
-        elif output_chi_test == 'print':
-            print('\n')
-            chi_quadrat_odr(*chi_test_list)
+        elif output_chi_test == 'print' and _printen():
+            ausgabe_zeilen += ['\n', *_chi_quadrat_zeilen(*chi_test_list)[2]]
     
+    if ausgabe_zeilen:
+        _ausgeben(ausgabe_zeilen)
     return return_list
 
 
-        
-        
-def _chi_quadrat_print(chi_quadrat, anzahl_messwerte, anzahl_parameter):
+
+
+
+def _dichte_gauss(x, parameter, bereich):
     '''
-    Berechnet χ^2_reduziert und die Fitwahrscheinlichkeit und printet sie als schönes Ergebnis.
+    Logarithmus der auf  bereich  normierten Gaußverteilung und seine Ableitungen nach (μ, σ).
+    Output: ln_dichte (shape wie x), ableitungen (shape = (2, *shape(x)))
     '''
     
-    freiheitsgrade         = anzahl_messwerte - anzahl_parameter
-    chi_quadrat_reduziert  = chi_quadrat / freiheitsgrade 
-    fit_wahrscheinlichkeit = (1 - chi2.cdf(chi_quadrat, freiheitsgrade)) * 100
+    from scipy.special import ndtr
     
-    print('Ergebnisse des χ^2-Tests:\n')
-    print(f"χ^2_reduziert         = {chi_quadrat_reduziert:.2f}") 
-    print(f"Fitwahrscheinlichkeit = {fit_wahrscheinlichkeit:.1f}%")
-        
+    mu, sigma  = parameter
+    a, b       = bereich
+    z          = (x - mu) / sigma
+    z_a, z_b   = (a - mu) / sigma, (b - mu) / sigma
+    phi_a      = np.exp(-z_a**2 / 2) / np.sqrt(2 * np.pi)   # Bei unendlichen Grenzen einfach 0
+    phi_b      = np.exp(-z_b**2 / 2) / np.sqrt(2 * np.pi)
+    zphi_a     = z_a * phi_a  if np.isfinite(z_a)  else 0.0
+    zphi_b     = z_b * phi_b  if np.isfinite(z_b)  else 0.0
+    normierung = ndtr(z_b) - ndtr(z_a)   # Anteil der Gaußverteilung im bereich
+    
+    ln_dichte  = -z**2 / 2 - np.log(np.sqrt(2 * np.pi) * sigma * normierung)
+    d_mu       = z / sigma + (phi_b - phi_a) / (sigma * normierung)
+    d_sigma    = (z**2 - 1) / sigma + (zphi_b - zphi_a) / (sigma * normierung)
+    return ln_dichte, arr([d_mu, d_sigma])
 
-        
-        
-def chi_quadrat_test(fit_werte, werte, werte_fehler, anzahl_parameter): 
+
+
+
+def _dichte_exp(x, parameter, bereich):
+    '''
+    Logarithmus der auf  bereich  normierten Exponentialverteilung λ e^(λx) / (e^(λb) - e^(λa)) 
+    und seine Ableitung nach λ.
+    Output: ln_dichte (shape wie x), ableitungen (shape = (1, *shape(x)))
     '''
-    Printet den χ^2_reduziert-Wert und die Fitwahrscheinlichkeit.
     
+    lamb, = parameter
+    a, b  = bereich
+    y     = lamb * (b - a)
     
-    Argumente
-    ---------
-    fit_werte : np.array (1D, number_like)
-        die Werte, die die Fitfunktion ausgibt, also  fit_werte = fit_func(x_werte, *parameter)
+    # ln((e^y - 1) / y) und dessen Ableitung, numerisch stabil auch für y ≈ 0 und große |y|
+    if abs(y) < 1e-6:
+        ln_normierung, d_ln_normierung = y / 2, 0.5 + y / 12
+    elif y > 0:
+        ln_normierung   = y + np.log1p(-np.exp(-y)) - np.log(y)
+        d_ln_normierung = 1 / (1 - np.exp(-y)) - 1 / y
+    else:
+        ln_normierung   = np.log1p(-np.exp(y)) - np.log(-y)
+        d_ln_normierung = 1 / (1 - np.exp(-y)) - 1 / y
     
-    werte : np.array (1D, number_like)
-        y-Werte der Messdaten
+    ln_dichte = lamb * (x - a) - np.log(b - a) - ln_normierung
+    d_lamb    = (x - a) - (b - a) * d_ln_normierung
+    return ln_dichte, arr([d_lamb])
+
+
+
+
+def _dichte_konst(x, parameter, bereich):
+    '''
+    Logarithmus der Gleichverteilung auf  bereich  (keine Parameter).
+    '''
     
-    werte_fehler : np.array (1D, number_like)
-        y-Fehler der Messdaten
+    a, b = bereich
+    return np.full(np.shape(x), -np.log(b - a)), np.zeros((0, *np.shape(x)))
+
+
+
+
+LN_QUOTIENT_MAX = 50.0   # Obergrenze von ln(u / f) bzw. ln(s / f) im Gradienten bei anteil = 0 bzw. 1
+
+_DICHTEN = {func.gauss: (_dichte_gauss, 2), func.exp: (_dichte_exp, 1), func.konst: (_dichte_konst, 0)}
+# Normierte Form und Anzahl Form-Parameter der Funktionen, die pap.likelihood_fit() unterstützt.
+
+
+
+
+def _nll_block(block, parameter, signal, untergrund, bereich):
+    '''
+    Negative Log-Likelihood und deren Gradient für einen Block von Werten.
+    Ohne Untergrund ist die Dichte die normierte  signal-Form, mit Untergrund die Mischung
+    f = (1 - anteil) * signal + anteil * untergrund.
+    '''
     
-    anzahl_parameter : int (> 0)
-        Anzahl Parameter der Fitfunktion
-        
-        
-    Beispiel
-    --------
-    >>> x_werte = np.array([-8, -5.5, -1.2, 1, 1.4, 3.2, 4.5])
-    >>> y_werte = np.array([40, 20.8, 3.1, 0.5, 1.5, 3, 6])
-    >>> y_fehler = np.array([0.5, 0.73, 0.42, 0.23, 0.23, 0.41, 0.44])
-    >>> fitparameter = [0.46721214, -1.01681483, 1.45102103]
-    >>> pap.chi_quadrat_test(pap.func.quad(x_werte, *fitparameter), y_werte, y_fehler, 3)
-      Ergebnisse des χ^2-Tests:
+    dichte_s, anzahl_s = _DICHTEN[signal]
+    ln_s, d_ln_s       = dichte_s(block, parameter[:anzahl_s], bereich)
+    if untergrund == None:
+        return -np.sum(ln_s), -np.sum(d_ln_s, axis = 1)
+    
+    dichte_u, anzahl_u = _DICHTEN[untergrund]
+    ln_u, d_ln_u       = dichte_u(block, parameter[anzahl_s:anzahl_s + anzahl_u], bereich)
+    anteil             = parameter[-1]
+    
+    # Rechnung mit Logarithmen, damit weit entfernte Werte (s oder u ≈ 0) und anteil = 0 oder 1 stabil bleiben.
+    with np.errstate(divide = 'ignore'):
+        ln_s_gewichtet = np.log(1 - anteil) + ln_s
+        ln_u_gewichtet = np.log(anteil) + ln_u
+    ln_f    = np.logaddexp(ln_s_gewichtet, ln_u_gewichtet)
+    w_s     = np.exp(ln_s_gewichtet - ln_f)   # Wahrscheinlichkeit, dass ein Wert vom Signal stammt
+    w_u     = np.exp(ln_u_gewichtet - ln_f)
+    if 0 < anteil < 1:
+        d_anteil = w_u / anteil - w_s / (1 - anteil)   # (u - s) / f, beschränkt durch 1 / anteil bzw. 1 / (1 - anteil)
+    else:
+        d_anteil = (np.exp(np.minimum(ln_u - ln_f, LN_QUOTIENT_MAX)) 
+                    - np.exp(np.minimum(ln_s - ln_f, LN_QUOTIENT_MAX)))
+        # Am Rand kann f viel kleiner als u bzw. s sein, ohne Begrenzung würde der Gradient unendlich.
+    
+    gradient = np.concatenate([-np.sum(w_s * d_ln_s, axis = 1), -np.sum(w_u * d_ln_u, axis = 1),
+                               [-np.sum(d_anteil)]])
+    return -np.sum(ln_f), gradient
 
-      χ^2_reduziert         = 2.79
-      Fitwahrscheinlichkeit = 2.5%
+
+
+
+def likelihood_fit(funktion, werte, parameter0, bereich = None, untergrund = None, workers = 1,
+                   print_resultate = True):
     '''
+    Unbinned Maximum-Likelihood-Fit - Fittet die Form einer normierten Verteilung direkt an einzelne Messwerte,
+    ohne sie vorher zu histogrammieren. Optional mit einem Untergrund-Anteil.
     
+    Die negative Log-Likelihood und ihr analytischer Gradient werden blockweise (BLOCKGRÖSSE Werte pro Block) 
+    und vektorisiert berechnet, bei  workers > 1  auf mehreren Threads. So bleibt der Fit auch bei 10^7 Werten 
+    schnell und der Zwischenspeicher klein.
     
-    chi_quadrat = np.sum(((fit_werte - werte) / werte_fehler)**2)
     
-    _chi_quadrat_print(chi_quadrat, len(werte), anzahl_parameter)
+    Argumente
+    ---------
+    funktion : function
+        Form des Signals, darf nur sein:
+        pap.func.gauss  - Parameter (μ, σ)
+        pap.func.exp    - Parameter (λ)
+        Die Amplitude A wird nicht gefittet, da die Verteilung auf  bereich  normiert wird.
     
+    werte : np.ndarray (1D, number_like)
+        Einzelne Messwerte (Ereignisse).
     
+    parameter0 : array_like (1D, mit number_like Elementen)
+        Erste Schätzung der Parameter in der Reihenfolge
+        (Signal-Parameter, Untergrund-Parameter, Untergrund-Anteil),
+        zB. (μ, σ, λ_untergrund, anteil) für  funktion = pap.func.gauss, untergrund = pap.func.exp.
     
- 
-def chi_quadrat_odr(chi_quadrat, anzahl_messwerte, anzahl_parameter):
-    '''
-    Printet den χ^2_reduziert-Wert und die Fitwahrscheinlichkeit für einen ODR-Fit (siehe pap.odr_fit()).
-    Die drei Input-Argumente kann man sich von der pap.odr_fit-Funktion mithilfe der Angabe
-    output_chi_test = True  als drittes Output-Argument geben lassen.
+    bereich : tuple (untergrenze, obergrenze), optional
+        Bereich, auf den die Verteilungen normiert werden. Werte außerhalb werden ignoriert.
+        Standardmäßig (min(werte), max(werte)).
     
+    untergrund : function, optional
+        Form des Untergrunds, darf nur sein:
+        None            - kein Untergrund (Standard)
+        pap.func.konst  - flacher Untergrund, keine Parameter
+        pap.func.exp    - exponentieller Untergrund, Parameter (λ)
+        Mit Untergrund kommt der Untergrund-Anteil (zwischen 0 und 1) als letzter Parameter dazu.
     
-    Argumente
-    ---------
-    chi_quadrat : float (> 0)
+    workers : int, optional
+        Anzahl Threads, siehe pap.std(). Standardmäßig 1.
     
-    anzahl_messwerte : int (> 0)
-
-    anzahl_parameter : int (> 0)
+    print_resultate : bool, optional
+        Bei  True  wird eine Zusammenfassung der Fitergebnisse geprintet.
+    
+    
+    Output
+    ------
+    parameter : np.array (1D, float Elemente)
+    
+    parameter_fehler : np.array (1D, float Elemente)
+        1σ-Fehler aus der inversen Hesse-Matrix der negativen Log-Likelihood.
     
     
     Beispiel
     --------
-    >>> parameter, parameter_fehler, chi_test_liste = pap.odr_fit(... Argumente ..., output_chi_liste = True)
-      ... Geprintetes Ergebnis vom ODR-Fit ...
-    >>> pap.chi_quadrat_odr(*chi_test_liste)
-      Ergebnisse des χ^2-Tests:
-      
-      χ^2_reduziert         = 0.82
-      Fitwahrscheinlichkeit = 44.0%
+    >>> signal     = np.random.normal(3.0, 0.2, 10**6)
+    >>> untergrund = np.random.uniform(0, 10, 10**5)
+    >>> werte      = np.concatenate([signal, untergrund])
+    >>> parameter, parameter_fehler = pap.likelihood_fit(pap.func.gauss, werte, [2.5, 0.5, 0.2], bereich = (0, 10),
+                                                         untergrund = pap.func.konst, workers = -1)
     '''
     
     
-    _chi_quadrat_print(chi_quadrat, anzahl_messwerte, anzahl_parameter)
-   
+    
+    # Überprüfen und Anpassen der Argumente
+    if not funktion in [func.gauss, func.exp]:
+        return _eingabefehler('Eingabefehler: funktion darf nur pap.func.gauss oder pap.func.exp sein.\n')
+    if not untergrund in [None, func.konst, func.exp]:
+        return _eingabefehler('Eingabefehler: untergrund darf nur None, pap.func.konst oder pap.func.exp sein.\n')
+    
+    anzahl_parameter = _DICHTEN[funktion][1]
+    if untergrund != None:
+        anzahl_parameter += _DICHTEN[untergrund][1] + 1
+    parameter0 = np.asarray(parameter0, dtype = np.float64)
+    if len(parameter0) != anzahl_parameter:
+        return _eingabefehler(f'Eingabefehler: len(parameter0) = {len(parameter0)}, es werden aber '
+                              f'{anzahl_parameter} Parameter gefittet.\n')
+    
+    werte = np.ravel(werte)
+    if bereich == None:
+        bereich = (np.min(werte), np.max(werte))
+    else:
+        werte = werte[(werte >= bereich[0]) & (werte <= bereich[1])]
+    
+    anzahl_werte = len(werte)
+    workers      = _anzahl_workers(workers)
+    blöcke       = [werte[i:i + BLOCKGRÖSSE] for i in range(0, len(werte), BLOCKGRÖSSE)]   # Views
+    
+    
+    # Negative Log-Likelihood mit Gradient, blockweise und parallel aufsummiert
+    pool = ThreadPoolExecutor(max_workers = workers)  if workers > 1 and len(blöcke) > 1  else None
+    
+    def nll(parameter):
+        def block_nll(block):
+            return _nll_block(block, parameter, funktion, untergrund, bereich)
+        if pool != None:
+            teil_ergebnisse = list(pool.map(block_nll, blöcke))
+        else:
+            teil_ergebnisse = [block_nll(block) for block in blöcke]
+        wert     = sum(teil_nll for teil_nll, _ in teil_ergebnisse) / anzahl_werte
+        gradient = sum(teil_gradient for _, teil_gradient in teil_ergebnisse) / anzahl_werte
+        # Mittelwert statt Summe, damit die Abbruchkriterien des Minimierers nicht von der Anzahl Werte abhängen.
+        if not np.isfinite(wert):
+            return np.inf, np.zeros(len(parameter))
+        return wert, gradient
+    
+    # Grenzen: σ > 0, 0 <= anteil <= 1
+    grenzen = [(None, None)] * anzahl_parameter
+    if funktion == func.gauss:
+        grenzen[1] = (0, None)
+    if untergrund != None:
+        grenzen[-1] = (0, 1)
+    
+    
+    # Berechnung des Fits
+    from scipy import optimize
+    from scipy.special import expit, logit
+    
+    '''Der Minimierer sieht statt σ  ln σ  und statt des Untergrund-Anteils  logit(anteil), also 
+    anteil = 1 / (1 + e^-t), und braucht so keine Grenzen: An einer Grenze (σ = 0, anteil = 0 oder 1) wird die 
+    Log-Likelihood bzw. ihr Gradient unendlich und L-BFGS-B hält dann vorzeitig an. Der Gradient nach t ist 
+    anteil (1 - anteil) d/danteil und bleibt beschränkt, auch wenn der Anteil sehr nahe an 0 oder 1 liegt.'''
+    def parameter_aus(x):
+        parameter = x.copy()
+        if funktion == func.gauss:
+            parameter[1] = np.exp(x[1])
+        if untergrund != None:
+            parameter[-1] = expit(x[-1])
+        return parameter
+    
+    def nll_minimierer(x):
+        parameter      = parameter_aus(x)
+        wert, gradient = nll(parameter)
+        if funktion == func.gauss:
+            gradient[1]  *= parameter[1]
+        if untergrund != None:
+            gradient[-1] *= parameter[-1] * (1 - parameter[-1])
+        return wert, gradient
+    
+    start = parameter0.copy()
+    if funktion == func.gauss:
+        start[1] = np.log(abs(parameter0[1]))
+    if untergrund != None:
+        start[-1] = logit(np.clip(parameter0[-1], 1e-6, 1 - 1e-6))
+    
+    try:
+        ergebnis  = optimize.minimize(nll_minimierer, start, jac = True, method = 'L-BFGS-B')
+        parameter = parameter_aus(ergebnis.x)
+        
+        ## Hesse-Matrix durch Differenzen des analytischen Gradienten, zentral oder an den Grenzen einseitig
+        hesse = np.zeros((anzahl_parameter, anzahl_parameter))
+        for i, (untergrenze, obergrenze) in enumerate(grenzen):
+            schritt         = 1e-5 * max(abs(parameter[i]), 1e-3)
+            verschiebung    = np.zeros(anzahl_parameter)
+            verschiebung[i] = schritt
+            if untergrenze != None and parameter[i] - schritt < untergrenze:
+                hesse[i] = (nll(parameter + verschiebung)[1] - nll(parameter)[1]) / schritt
+            elif obergrenze != None and parameter[i] + schritt > obergrenze:
+                hesse[i] = (nll(parameter)[1] - nll(parameter - verschiebung)[1]) / schritt
+            else:
+                hesse[i] = (nll(parameter + verschiebung)[1] - nll(parameter - verschiebung)[1]) / (2 * schritt)
+    finally:
+        if pool != None:
+            pool.shutdown()
+    hesse            = (hesse + hesse.T) / 2 * anzahl_werte
+    kovarianz        = np.linalg.pinv(hesse)
+    parameter_fehler = np.sqrt(np.abs(np.diag(kovarianz)))
+    
+    
+    # Output
+    if print_resultate == True and _printen():
+        _ausgeben(_fit_zeilen('Likelihood-Fits', parameter, parameter_fehler, kovarianz, ergebnis.message))
+    
+    return [parameter, parameter_fehler]
+
+
+
+
+
+
+# Profil und Backend über die Umgebungsvariablen schon beim Importieren einstellen, erst hier, wenn alle Funktionen 
+# existieren.
+if os.environ.get(PROFIL_VARIABLE, '0') not in ('', '0'):
+    profil_einstellen()
+if os.environ.get(BACKEND_VARIABLE):
+    backend_einstellen(os.environ[BACKEND_VARIABLE])
@@ -0,0 +1,10 @@
+# Ermöglicht  python -m pap  als Kommandozeile der Pipeline, siehe pap.pipeline.
+
+import sys
+
+from pap.pipeline import main
+
+
+
+if __name__ == '__main__':
+    sys.exit(main())
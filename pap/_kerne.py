@@ -0,0 +1,140 @@
+# Docstring des _kerne-Moduls
+'''
+Schleifen-Kerne für die elementweisen Hilfsfunktionen von pap (Rundung, Nachkommastellen, erste Ziffer) und
+die Abweichungen von pap.vergleich(). Mit NumPy brauchen diese für jede Verzweigung und jeden Rechenschritt
+ein eigenes Zwischen-Array, als Schleife geht jedes Element nur einmal durch den Prozessor.
+
+Ist Numba installiert, werden die Kerne beim ersten Aufruf JIT-kompiliert (und in __pycache__ gespeichert),
+sonst bleiben sie normale Python-Funktionen. Benutzt werden sie nur mit  pap.backend_einstellen('numba'),
+ohne Numba rechnet pap weiter mit den NumPy-Versionen.
+
+Damit beide Backends bitgleich rechnen, benutzen die Kerne nur exakt gerundete Operationen (+ - * /, sqrt,
+floor, rint, Vergleiche). Logarithmen und Zehnerpotenzen kommen fertig von NumPy: Dessen SIMD-Versionen von
+log10 und power weichen in der letzten Stelle von denen der C-Bibliothek ab, die Numba benutzt.
+Tests/test_backends.py vergleicht beide Backends Bit für Bit, Benchmarks/backends.py misst sie.
+
+Alle Kerne nehmen und returnen 1D-Arrays (np.float64 bzw. np.int64 für Präzisionen).
+'''
+
+
+
+
+
+
+# Alle benötigten Pakete
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+
+def _jit(funktion):
+    '''Kompiliert  funktion  mit Numba, falls installiert.'''
+
+    if numba is None:
+        return funktion
+    return numba.njit(cache = True, nogil = True)(funktion)
+
+
+
+
+
+
+# Konstanten
+
+POTENZEN_KLEINSTE = -400   # Exponent von POTENZEN[0]
+with np.errstate(over = 'ignore'):
+    POTENZEN = 10.0**np.arange(POTENZEN_KLEINSTE, -POTENZEN_KLEINSTE + 1, dtype = np.float64)
+    # Genau wie  10**größenordnungen  in pap._erste_ziffer(), deckt alle Größenordnungen endlicher floats ab.
+
+
+
+
+
+
+# Kerne
+
+@_jit
+def rundung(werte, präzisionen, potenzen):
+    '''pap._rundung_einzel() für 1D-Arrays,  potenzen = pap.ZEHNERPOTENZEN.'''
+
+    letzte   = potenzen.size - 1
+    gerundet = np.empty(werte.size)
+    for i in range(werte.size):
+        präzision = präzisionen[i]
+        potenz    = potenzen[min(abs(präzision), letzte)]
+        if präzision >= 0:
+            gerundet[i] = np.rint(werte[i] * potenz) / potenz
+        else:
+            gerundet[i] = np.rint(werte[i] / potenz) * potenz
+    return gerundet
+
+
+
+
+@_jit
+def erste_ziffern(zahlen, logarithmen, potenzen):
+    '''
+    pap._erste_ziffer() (art = float) für 1D-Arrays.
+    logarithmen = np.log10(np.abs(zahlen)),  potenzen = POTENZEN.
+    '''
+
+    ziffern = np.empty(zahlen.size)
+    for i in range(zahlen.size):
+        größenordnung = 0.0  if zahlen[i] == 0  else np.floor(logarithmen[i])
+        index = größenordnung - POTENZEN_KLEINSTE
+        if 0 <= index < potenzen.size:
+            potenz = potenzen[int(index)]
+        else:   # nan oder inf
+            potenz = 10.0**größenordnung
+        ziffern[i] = abs(zahlen[i] / potenz)
+    return ziffern
+
+
+
+
+@_jit
+def nachkommastellen(zahlen, logarithmen, potenzen, sig_stellen, sig_grenze):
+    '''
+    pap._nachkommastelle() für 1D-Arrays.
+    logarithmen = np.log10(np.abs(zahlen)),  potenzen = POTENZEN,  sig_stellen  als float.
+    '''
+
+    stellen = np.empty(zahlen.size)
+    for i in range(zahlen.size):
+        größenordnung = 0.0  if zahlen[i] == 0  else np.floor(logarithmen[i])
+        index = größenordnung - POTENZEN_KLEINSTE
+        if 0 <= index < potenzen.size:
+            potenz = potenzen[int(index)]
+        else:   # nan oder inf
+            potenz = 10.0**größenordnung
+
+        signifikante_stellen = sig_stellen  if abs(zahlen[i] / potenz) >= sig_grenze  else sig_stellen + 1
+        stellen[i] = -größenordnung + signifikante_stellen - 1
+    return stellen
+
+
+
+
+@_jit
+def abweichungen(ex, ex_fehler, theo, theo_fehler):
+    '''
+    Die Abweichungen von pap.vergleich() für 1D-Arrays (fehlende Werte schon 0, Fehler schon positiv).
+    Returned  (abweichung_abs, abweichung_abs_fehler, abweichung_rel, abweichung_sig).
+    '''
+
+    anzahl     = ex.size
+    absolut    = np.empty(anzahl)
+    fehler     = np.empty(anzahl)
+    relativ    = np.empty(anzahl)
+    sigma      = np.empty(anzahl)
+    for i in range(anzahl):
+        absolut[i] = ex[i] - theo[i]
+        fehler[i]  = np.sqrt(theo_fehler[i] * theo_fehler[i] + ex_fehler[i] * ex_fehler[i])   # summen_fehler()
+        relativ[i] = absolut[i] / theo[i] * 100  if theo[i] != 0  else np.nan   # [%]
+        sigma[i]   = abs(absolut[i] / fehler[i])  if fehler[i] != 0  else np.nan
+    return absolut, fehler, relativ, sigma
@@ -0,0 +1,332 @@
+# Docstring des asynchron-Moduls
+'''
+Dieses Modul enthält async-Varianten der rechenintensiven Funktionen von pap, für Programme mit asyncio
+(zB. Web-Services). Die eigentliche Rechnung läuft in einem Thread- oder Prozess-Pool, sodass die Event-Loop
+währenddessen weiterläuft. Jeder Aufruf kann abgebrochen werden (Task.cancel()) oder ein Zeitlimit bekommen,
+und es laufen höchstens  max_gleichzeitig  Rechnungen auf einmal, damit viele gleichzeitige Anfragen die
+CPU-Kerne nicht überlasten.
+
+Die Funktionen haben dieselben Argumente wie ihre Vorbilder in pap, dazu das Schlüsselwort-Argument
+timeout  (Sekunden, überschreibt die Einstellung). Bei Überschreitung wird ein TimeoutError ausgelöst.
+
+Ein abgebrochener Aufruf, der schon rechnet, läuft im Hintergrund zu Ende (Threads lassen sich nicht
+abbrechen), sein Ergebnis wird verworfen. Bis dahin belegt er weiter einen der  max_gleichzeitig  Plätze,
+so bleibt die Anzahl wirklich laufender Rechnungen begrenzt. Noch wartende Aufrufe werden sofort entfernt.
+
+Die Ausgabe-Einstellung von pap (pap.ausgabe_einstellen()) gilt auch hier, in Services sinnvoll ist 'still'.
+Ein  with pap.ausgabe()-Block  gilt für die Aufrufe aus seiner eigenen Task, nicht für andere Tasks.
+Im Prozess-Pool wird der Modus übernommen, geschrieben wird dort immer nach sys.stdout.
+
+
+
+Übersicht der Funktionen
+------------------------
+* pap.asynchron.einstellen()          Pool (Threads oder Prozesse), maximale Gleichzeitigkeit, Standard-Zeitlimit
+
+* pap.asynchron.ausführen()           Beliebige Funktion async ausführen
+
+* pap.asynchron.odr_fit()             async pap.odr_fit()
+
+* pap.asynchron.odr_fits()            Viele pap.odr_fit() gleichzeitig, Ergebnisse in derselben Reihenfolge
+
+* pap.asynchron.likelihood_fit()      async pap.likelihood_fit()
+
+* pap.asynchron.poisson_fit()         async pap.poisson_fit()
+
+* pap.asynchron.histogramm_fit()      async pap.histogramm_fit()
+
+* pap.asynchron.chi_quadrat_tests()   async pap.chi_quadrat_tests()
+
+* pap.asynchron.vergleich()           async pap.vergleich()
+
+* pap.asynchron.std()                 async pap.std()
+
+* pap.asynchron.mittel_fehler()       async pap.mittel_fehler()
+
+
+
+Beispiel
+--------
+>>> pap.ausgabe_einstellen('still')
+>>> pap.asynchron.einstellen('prozesse', max_gleichzeitig = 4, timeout = 30)
+>>> async def anfrage(messpunkte, messfehler):
+...     parameter, fehler = await pap.asynchron.odr_fit(pap.func.lin, messpunkte, messfehler, [1, 0])
+...     return parameter.tolist(), fehler.tolist()
+'''
+
+
+
+
+
+
+# Alle benötigten Pakete
+
+import asyncio
+import contextvars
+import os
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import pap
+
+
+
+
+
+
+# Einstellungen
+
+EXECUTOR_ARTEN = ('threads', 'prozesse')
+_einstellungen = {'executor': None, 'eigener_executor': False, 'max_gleichzeitig': os.cpu_count() or 1,
+                  'timeout': None}
+_semaphoren    = weakref.WeakKeyDictionary()   # Eine pro Event-Loop, asyncio.Semaphore ist an ihre Loop gebunden.
+
+
+
+def einstellen(executor = 'threads', max_gleichzeitig = None, timeout = None):
+    '''
+    Legt fest, wo und wie viel gleichzeitig gerechnet wird.
+
+
+    Argumente
+    ---------
+    executor : str, concurrent.futures.Executor, optional
+        'threads'  - (Standard) Ein eigener ThreadPoolExecutor. Funktioniert mit allen Fitfunktionen,
+                     auch lambdas. Die Fits selbst halten aber meist den GIL, laufen also kaum parallel.
+        'prozesse' - Ein eigener ProcessPoolExecutor, rechnet wirklich parallel. Alle Argumente (auch die
+                     Fitfunktion) müssen sich pickeln lassen, was zB. für pap.func-Funktionen gilt.
+        Oder ein eigener Executor, der dann auch nicht von pap heruntergefahren wird.
+
+    max_gleichzeitig : int, optional
+        Höchstens so viele Rechnungen laufen gleichzeitig, standardmäßig so viele wie CPU-Kerne.
+
+    timeout : float, optional
+        Standard-Zeitlimit in Sekunden für jeden Aufruf, standardmäßig keines.
+    '''
+
+
+    if isinstance(executor, str) and executor not in EXECUTOR_ARTEN:
+        raise ValueError(f'executor = {executor!r}, erlaubt sind {list(EXECUTOR_ARTEN)} oder ein Executor.')
+    if not isinstance(executor, (str, Executor)):
+        raise ValueError(f'executor = {executor!r} ist kein concurrent.futures.Executor.')
+
+    max_gleichzeitig = max_gleichzeitig or os.cpu_count() or 1
+    if _einstellungen['eigener_executor']:
+        _einstellungen['executor'].shutdown()   # Wartet, bis schon angenommene Aufträge fertig sind
+
+    eigener_executor = isinstance(executor, str)
+    if executor == 'threads':
+        executor = ThreadPoolExecutor(max_workers = max_gleichzeitig, thread_name_prefix = 'pap')
+    elif executor == 'prozesse':
+        executor = ProcessPoolExecutor(max_workers = max_gleichzeitig)
+    _einstellungen.update({'executor': executor, 'eigener_executor': eigener_executor, 
+                           'max_gleichzeitig': max_gleichzeitig, 'timeout': timeout})
+    _semaphoren.clear()
+
+
+
+
+def _executor():
+    '''Der eingestellte Executor, beim ersten Gebrauch ein ThreadPoolExecutor.'''
+
+    if _einstellungen['executor'] is None:
+        einstellen('threads', _einstellungen['max_gleichzeitig'], _einstellungen['timeout'])
+    return _einstellungen['executor']
+
+
+
+
+def _semaphore():
+    '''Begrenzt die gleichzeitigen Rechnungen, eine Semaphore pro Event-Loop.'''
+
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphoren:
+        _semaphoren[loop] = asyncio.Semaphore(_einstellungen['max_gleichzeitig'])
+    return _semaphoren[loop]
+
+
+
+
+
+
+# Ausführen
+
+def _im_prozess(funktion, ausgabe_modus, args, kwargs):
+    '''Läuft im Prozess-Pool: übernimmt den Ausgabe-Modus des Hauptprozesses und ruft  funktion  auf.'''
+
+    with pap.ausgabe(ausgabe_modus):
+        return funktion(*args, **kwargs)
+
+
+
+
+async def ausführen(funktion, *args, timeout = None, **kwargs):
+    '''
+    Führt  funktion(*args, **kwargs)  im eingestellten Pool aus und wartet darauf, ohne die Event-Loop
+    zu blockieren.
+
+
+    Argumente
+    ---------
+    funktion : function
+        Bei Prozessen muss sie sich pickeln lassen (also zB. keine lambda sein).
+
+    timeout : float, optional
+        Zeitlimit in Sekunden, standardmäßig das von einstellen().
+
+
+    Output
+    ------
+    Das Ergebnis von  funktion.  Ausnahmen werden weitergereicht, bei Zeitüberschreitung TimeoutError.
+    '''
+
+
+    timeout = timeout  if timeout is not None  else _einstellungen['timeout']
+    return await asyncio.wait_for(_rechnen(funktion, args, kwargs), timeout)
+
+
+
+
+async def _rechnen(funktion, args, kwargs):
+    '''Wartet auf einen freien Platz, gibt die Rechnung an den Pool und wartet auf ihr Ergebnis.'''
+
+    executor  = _executor()
+    semaphore = _semaphore()
+    loop      = asyncio.get_running_loop()
+
+    await semaphore.acquire()
+    try:
+        if isinstance(executor, ProcessPoolExecutor):
+            auftrag = executor.submit(_im_prozess, funktion, pap._ausgabe_jetzt()['modus'], args, kwargs)
+        else:   # Im Kontext des Aufrufers, damit ein with pap.ausgabe()-Block der aufrufenden Task gilt
+            auftrag = executor.submit(contextvars.copy_context().run, funktion, *args, **kwargs)
+    except BaseException:
+        semaphore.release()
+        raise
+
+    # Der Platz wird erst frei, wenn die Rechnung wirklich fertig ist, auch nach einem Abbruch.
+    def platz_freigeben(_):
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:   # Event-Loop schon geschlossen
+            pass
+    auftrag.add_done_callback(platz_freigeben)
+
+    try:
+        return await asyncio.wrap_future(auftrag)
+    except asyncio.CancelledError:
+        auftrag.cancel()   # Entfernt noch nicht gestartete Aufträge aus dem Pool
+        raise
+
+
+
+
+async def _pap_ausführen(name, args, kwargs):
+    '''Führt die pap-Funktion  name  aus, im Prozess-Pool über ihren Namen, damit sie sich pickeln lässt.'''
+
+    timeout = kwargs.pop('timeout', None)
+    return await ausführen(getattr(pap, name), *args, timeout = timeout, **kwargs)
+
+
+
+
+
+
+# async-Varianten
+
+async def odr_fit(*args, **kwargs):
+    '''async pap.odr_fit(), gleiche Argumente plus  timeout.'''
+
+    return await _pap_ausführen('odr_fit', args, kwargs)
+
+
+
+
+async def odr_fits(aufträge, timeout = None, **kwargs):
+    '''
+    Viele pap.odr_fit() gleichzeitig (begrenzt durch max_gleichzeitig).
+
+
+    Argumente
+    ---------
+    aufträge : list (tuple)
+        Je ein Tupel der Positions-Argumente von pap.odr_fit(), also
+        (funktion, messpunkte, messfehler, parameter0).
+
+    timeout : float, optional
+        Zeitlimit pro Fit.
+
+    **kwargs
+        Gemeinsame Schlüsselwort-Argumente aller Fits, zB.  output_chi_test = True.
+
+
+    Output
+    ------
+    ergebnisse : list
+        Die Outputs von pap.odr_fit() in der Reihenfolge von  aufträge.  Schlägt ein Fit fehl, werden die
+        übrigen abgebrochen und die Ausnahme weitergereicht.
+    '''
+
+    tasks = [asyncio.ensure_future(odr_fit(*auftrag, timeout = timeout, **kwargs)) for auftrag in aufträge]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+
+
+async def likelihood_fit(*args, **kwargs):
+    '''async pap.likelihood_fit(), gleiche Argumente plus  timeout.'''
+
+    return await _pap_ausführen('likelihood_fit', args, kwargs)
+
+
+
+
+async def poisson_fit(*args, **kwargs):
+    '''async pap.poisson_fit(), gleiche Argumente plus  timeout.'''
+
+    return await _pap_ausführen('poisson_fit', args, kwargs)
+
+
+
+
+async def histogramm_fit(*args, **kwargs):
+    '''async pap.histogramm_fit(), gleiche Argumente plus  timeout.'''
+
+    return await _pap_ausführen('histogramm_fit', args, kwargs)
+
+
+
+
+async def chi_quadrat_tests(*args, **kwargs):
+    '''async pap.chi_quadrat_tests(), gleiche Argumente plus  timeout.'''
+
+    return await _pap_ausführen('chi_quadrat_tests', args, kwargs)
+
+
+
+
+async def vergleich(*args, **kwargs):
+    '''async pap.vergleich(), gleiche Argumente plus  timeout.'''
+
+    return await _pap_ausführen('vergleich', args, kwargs)
+
+
+
+
+async def std(*args, **kwargs):
+    '''async pap.std(), gleiche Argumente plus  timeout.'''
+
+    return await _pap_ausführen('std', args, kwargs)
+
+
+
+
+async def mittel_fehler(*args, **kwargs):
+    '''async pap.mittel_fehler(), gleiche Argumente plus  timeout.'''
+
+    return await _pap_ausführen('mittel_fehler', args, kwargs)
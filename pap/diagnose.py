@@ -0,0 +1,327 @@
+# Docstring des diagnose-Moduls
+'''
+Dieses Modul enthält Funktionen, um die Residuen eines Fits genauer zu untersuchen, als es eine einzelne
+χ^2-Zahl kann: Sind die normierten Residuen (Pulls) standardnormalverteilt, wechseln ihre Vorzeichen zufällig
+und sind benachbarte Residuen unkorreliert? Falls nicht, passt die Fitfunktion vermutlich nicht zu den Daten
+oder die Fehler sind falsch abgeschätzt.
+
+Alle Funktionen arbeiten entlang der letzten Achse und sind vektorisiert. Ein Array der shape
+(anzahl_fits, anzahl_messwerte) wird also als Stapel von Fits mit gleich vielen Messwerten auf einmal
+untersucht, das Ergebnis hat dann die shape (anzahl_fits,).
+
+Die Residuen eines ODR-Fits bekommt man mit  pap.odr_fit(..., output_residuen = True).
+
+
+
+Übersicht der Funktionen
+------------------------
+* pap.diagnose.pulls()             Normierte Residuen (Messwert - Fit) / Fehler
+
+* pap.diagnose.odr_pulls()         Pulls in x- und y-Richtung aus den Residuen eines ODR-Fits
+
+* pap.diagnose.runs_test()         Wald-Wolfowitz-Test auf zufällige Vorzeichenwechsel
+
+* pap.diagnose.autokorrelation()   Autokorrelation mit Verschiebung k
+
+* pap.diagnose.ljung_box_test()    Test auf Autokorrelation über mehrere Verschiebungen
+
+* pap.diagnose.normalität()        Mittelwert, Standardabweichung, Schiefe, Wölbung und Jarque-Bera-Test
+
+* pap.diagnose.residuen_diagnose() Alles oben auf einmal als strukturiertes Array (DIAGNOSE_DTYPE)
+
+* pap.diagnose.odr_diagnose()      residuen_diagnose() für die x- und y-Residuen eines ODR-Fits
+'''
+
+
+
+
+
+
+# Alle benötigten Pakete
+
+import numpy as np
+from numpy import array as arr
+from scipy.special import chdtrc, ndtr
+
+
+
+
+
+
+# Konstanten
+
+DIAGNOSE_FELDER = ('anzahl', 'mittel', 'std', 'schiefe', 'wölbung', 'jarque_bera_p',
+                   'runs', 'runs_z', 'runs_p', 'autokorrelation', 'ljung_box_p')
+DIAGNOSE_DTYPE  = np.dtype([(feld, np.float64) for feld in DIAGNOSE_FELDER])
+
+
+
+
+
+
+# Pulls
+
+def pulls(messwerte, fit_werte, fehler):
+    '''
+    Normierte Residuen (Pulls):
+    (messwerte - fit_werte) / fehler
+
+    Passt der Fit und stimmen die Fehler, sind sie standardnormalverteilt.
+    Alle Argumente werden gebroadcastet.
+    '''
+
+    return (np.asarray(messwerte) - fit_werte) / fehler
+
+
+
+
+def odr_pulls(residuen, messfehler):
+    '''
+    Pulls in x- und y-Richtung aus den Residuen eines ODR-Fits.
+
+
+    Argumente
+    ---------
+    residuen : np.ndarray, shape = (2, ..., anzahl_messwerte)
+        [delta, eps]  von  pap.odr_fit(..., output_residuen = True),  also die Abstände der Fitpunkte von den
+        Messpunkten in x- und y-Richtung. Für Stapel von Fits  np.stack(..., axis = 1).
+
+    messfehler : np.ndarray, shape = (2, ..., anzahl_messwerte)
+        [x_fehler, y_fehler]  wie bei pap.odr_fit().
+
+
+    Output
+    ------
+    x_pulls, y_pulls : np.ndarray
+        (Messwert - Fitpunkt) / Fehler
+    '''
+
+    delta, eps         = residuen
+    x_fehler, y_fehler = messfehler
+    return -np.asarray(delta) / x_fehler, -np.asarray(eps) / y_fehler
+
+
+
+
+
+
+# Tests
+
+def runs_test(pulls):
+    '''
+    Wald-Wolfowitz-Test: Zählt die Runs (Folgen gleicher Vorzeichen) der Pulls entlang der letzten Achse und
+    vergleicht sie mit der Erwartung bei zufälligen Vorzeichen. Zu wenige Runs deuten auf eine systematisch
+    falsche Fitfunktion hin (lange Bereiche über oder unter den Messwerten), zu viele auf Antikorrelation.
+    Pulls von genau 0 zählen als positiv.
+
+
+    Output
+    ------
+    anzahl_runs : np.ndarray (int)
+
+    z : np.ndarray (np.float64)
+        (anzahl_runs - Erwartung) / Standardabweichung, in Normal-Näherung
+
+    p_wert : np.ndarray (np.float64)
+        Zweiseitig. NaN, falls alle Pulls dasselbe Vorzeichen haben.
+    '''
+
+
+    positiv     = np.asarray(pulls) >= 0
+    anzahl      = positiv.shape[-1]
+    n_plus      = np.sum(positiv, axis = -1)
+    n_minus     = anzahl - n_plus
+    anzahl_runs = 1 + np.sum(positiv[..., 1:] != positiv[..., :-1], axis = -1)
+
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        erwartung = 2 * n_plus * n_minus / anzahl + 1
+        varianz   = (erwartung - 1) * (erwartung - 2) / (anzahl - 1)
+        z         = np.where(varianz > 0, (anzahl_runs - erwartung) / np.sqrt(varianz), np.nan)
+    p_wert = 2 * ndtr(-np.abs(z))
+
+    return [anzahl_runs, z, p_wert]
+
+
+
+
+def autokorrelation(pulls, verschiebung = 1):
+    '''
+    Autokorrelation der Pulls mit sich selbst, um  verschiebung  Messwerte verschoben, entlang der letzten Achse:
+    r_k = Σ (x_i - x̄)(x_{i+k} - x̄) / Σ (x_i - x̄)^2
+
+    Für unkorrelierte Pulls ist r_k ungefähr normalverteilt mit Mittelwert 0 und Standardabweichung 1/sqrt(n).
+
+
+    Argumente
+    ---------
+    pulls : np.ndarray (number_like)
+
+    verschiebung : int, list (int), optional
+        Bei einer Liste bekommt das Ergebnis eine zusätzliche letzte Achse mit einer r_k pro Verschiebung.
+    '''
+
+
+    abweichungen = np.asarray(pulls, dtype = np.float64)
+    abweichungen = abweichungen - np.mean(abweichungen, axis = -1, keepdims = True)
+    nenner       = np.sum(abweichungen**2, axis = -1)
+
+    verschiebungen = np.atleast_1d(verschiebung)
+    r = arr([np.sum(abweichungen[..., :abweichungen.shape[-1] - k] * abweichungen[..., k:], axis = -1)
+             for k in verschiebungen.tolist()])
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        r = r / nenner
+
+    return np.moveaxis(r, 0, -1)  if np.ndim(verschiebung) > 0  else r[0]
+
+
+
+
+def ljung_box_test(pulls, anzahl_verschiebungen = 5):
+    '''
+    Ljung-Box-Test auf Autokorrelation der Pulls bei den Verschiebungen 1 bis anzahl_verschiebungen:
+    Q = n (n + 2) Σ_k r_k^2 / (n - k),  ist ohne Korrelation χ^2-verteilt mit anzahl_verschiebungen Freiheitsgraden.
+
+
+    Output
+    ------
+    q : np.ndarray (np.float64)
+
+    p_wert : np.ndarray (np.float64)
+    '''
+
+
+    anzahl = np.shape(pulls)[-1]
+    anzahl_verschiebungen = min(anzahl_verschiebungen, anzahl - 1)
+    if anzahl_verschiebungen < 1:
+        nan = np.full(np.shape(pulls)[:-1], np.nan)
+        return [nan, nan]
+
+    verschiebungen = np.arange(1, anzahl_verschiebungen + 1)
+    r = autokorrelation(pulls, verschiebungen)
+    q = anzahl * (anzahl + 2) * np.sum(r**2 / (anzahl - verschiebungen), axis = -1)
+    return [q, chdtrc(anzahl_verschiebungen, q)]
+
+
+
+
+def normalität(pulls):
+    '''
+    Kennzahlen der Verteilung der Pulls entlang der letzten Achse, die für standardnormalverteilte Pulls
+    (0, 1, 0, 0) sein sollten, und der Jarque-Bera-Test, der Schiefe und Wölbung zusammen testet:
+    JB = n/6 (S^2 + K^2/4),  ist für normalverteilte Pulls näherungsweise χ^2-verteilt mit 2 Freiheitsgraden.
+
+
+    Output
+    ------
+    mittel : np.ndarray (np.float64)
+
+    std : np.ndarray (np.float64)
+        Experimentelle Standardabweichung (ddof = 1), wie pap.std()
+
+    schiefe : np.ndarray (np.float64)
+
+    wölbung : np.ndarray (np.float64)
+        Exzess-Kurtosis, also 0 für die Normalverteilung
+
+    jarque_bera_p : np.ndarray (np.float64)
+    '''
+
+
+    werte  = np.asarray(pulls, dtype = np.float64)
+    anzahl = werte.shape[-1]
+    mittel = np.mean(werte, axis = -1)
+
+    abweichungen = werte - mittel[..., np.newaxis]
+    m2 = np.mean(abweichungen**2, axis = -1)
+    m3 = np.mean(abweichungen**3, axis = -1)
+    m4 = np.mean(abweichungen**4, axis = -1)
+
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        std     = np.sqrt(m2 * anzahl / (anzahl - 1))
+        schiefe = m3 / m2**1.5
+        wölbung = m4 / m2**2 - 3
+    jarque_bera   = anzahl / 6 * (schiefe**2 + wölbung**2 / 4)
+    jarque_bera_p = np.exp(-jarque_bera / 2)   # χ^2-Überlebensfunktion bei 2 Freiheitsgraden
+
+    return [mittel, std, schiefe, wölbung, jarque_bera_p]
+
+
+
+
+
+
+# Zusammenfassungen
+
+def residuen_diagnose(pulls, anzahl_verschiebungen = 5):
+    '''
+    Führt alle Diagnosen für einen Fit oder einen Stapel von Fits auf einmal durch.
+
+
+    Argumente
+    ---------
+    pulls : np.ndarray (number_like), shape = (..., anzahl_messwerte)
+
+    anzahl_verschiebungen : int, optional
+        Für den Ljung-Box-Test
+
+
+    Output
+    ------
+    diagnose : np.ndarray (structured, dtype = pap.diagnose.DIAGNOSE_DTYPE), shape = np.shape(pulls)[:-1]
+        Felder (alle np.float64):
+        'anzahl'                                        - Anzahl Messwerte
+        'mittel', 'std', 'schiefe', 'wölbung'           - siehe normalität()
+        'jarque_bera_p'                                 - p-Wert des Jarque-Bera-Tests
+        'runs', 'runs_z', 'runs_p'                      - siehe runs_test()
+        'autokorrelation'                               - r_1, siehe autokorrelation()
+        'ljung_box_p'                                   - p-Wert des Ljung-Box-Tests
+
+
+    Beispiel
+    --------
+    >>> x = np.linspace(0, 10, 50)
+    >>> y = np.array([2 * x + 1 + np.random.normal(0, 0.5, 50) for _ in range(1000)])   # 1000 Messreihen
+    >>> parameter = np.polyfit(x, y.T, 1)
+    >>> diagnose  = pap.diagnose.residuen_diagnose(pap.diagnose.pulls(y, parameter[0][:, None] * x
+    ...                                                               + parameter[1][:, None], 0.5))
+    >>> np.mean(diagnose['runs_p'] < 0.05)   # Anteil auffälliger Fits, etwa 5 %
+    '''
+
+
+    pulls = np.asarray(pulls, dtype = np.float64)
+
+    diagnose = np.empty(pulls.shape[:-1], dtype = DIAGNOSE_DTYPE)
+    diagnose['anzahl'] = pulls.shape[-1]
+    for feld, werte in zip(['mittel', 'std', 'schiefe', 'wölbung', 'jarque_bera_p'], normalität(pulls)):
+        diagnose[feld] = werte
+    for feld, werte in zip(['runs', 'runs_z', 'runs_p'], runs_test(pulls)):
+        diagnose[feld] = werte
+    diagnose['autokorrelation'] = autokorrelation(pulls, 1)
+    diagnose['ljung_box_p']     = ljung_box_test(pulls, anzahl_verschiebungen)[1]
+
+    return diagnose
+
+
+
+
+def odr_diagnose(residuen, messfehler, anzahl_verschiebungen = 5):
+    '''
+    residuen_diagnose() für die x- und y-Pulls eines ODR-Fits (oder eines Stapels davon).
+    Argumente wie bei odr_pulls().
+
+
+    Output
+    ------
+    x_diagnose, y_diagnose : np.ndarray (structured, dtype = pap.diagnose.DIAGNOSE_DTYPE)
+
+
+    Beispiel
+    --------
+    >>> parameter, fehler, residuen = pap.odr_fit(pap.func.lin, messpunkte, messfehler, [1, 0],
+    ...                                           print_resultate = False, output_residuen = True)
+    >>> x_diagnose, y_diagnose = pap.diagnose.odr_diagnose(residuen, messfehler)
+    >>> y_diagnose['runs_p'], y_diagnose['jarque_bera_p']
+    '''
+
+    x_pulls, y_pulls = odr_pulls(residuen, messfehler)
+    return (residuen_diagnose(x_pulls, anzahl_verschiebungen), residuen_diagnose(y_pulls, anzahl_verschiebungen))
@@ -25,6 +25,15 @@ Funktionswert (bzw. Array von Werten).
 * pap.func.exp()     Exponentialfunktion      f(x) = A*e^(λx)
 
 * pap.func.gauss()   Gaußverteilung           f(x) = A / (sqrt(2π)σ) * exp(-(x - μ)^2 / (2σ^2))
+
+
+
+Ableitungen nach den Parametern
+-------------------------------
+Zu jeder Funktion gibt es eine Funktion  pap.func.blabla_ableitung(x, *jeweilige_parameter)  mit gleichen 
+Argumenten. Sie gibt die partiellen Ableitungen (Jacobi-Matrix) nach den Parametern zurück, als Array der 
+Form (anzahl_parameter, *np.shape(x)). Diese werden zB. von den Likelihood-Fits in pap benutzt.
+Das Dictionary  pap.func.ABLEITUNGEN  ordnet jeder Funktion ihre Ableitung zu.
 '''
 
 
@@ -125,3 +134,97 @@ def gauss(x, A0, mu, sigma):
     '''
     
     return A0 / (np.sqrt(2 * np.pi) *  sigma) * np.exp(-(x - mu)**2 / 2 / sigma**2)
+
+
+
+
+
+
+
+# Ableitungen nach den Parametern
+
+def konst_ableitung(x, c):
+    '''
+    Ableitung der Konstanten Funktion nach c:
+    df/dc = 1
+    '''
+    
+    return arr([np.ones(np.shape(x))])
+
+
+
+
+def prop_ableitung(x, a):
+    '''
+    Ableitung der Proportionalen Funktion nach a:
+    df/da = x
+    '''
+    
+    return arr([x * np.ones(np.shape(x))])
+
+
+
+
+def lin_ableitung(x, a, b):
+    '''
+    Ableitungen der Linearen Funktion nach (a, b):
+    (x, 1)
+    '''
+    
+    einsen = np.ones(np.shape(x))
+    return arr([x * einsen, einsen])
+
+
+
+
+def quad_ableitung(x, a, b, c):
+    '''
+    Ableitungen der Quadratischen Funktion nach (a, b, c):
+    (x^2, x, 1)
+    '''
+    
+    einsen = np.ones(np.shape(x))
+    return arr([x**2 * einsen, x * einsen, einsen])
+
+
+
+
+def poly_ableitung(x, parameter):
+    '''
+    Ableitungen des Polynoms nach (a_n, ..., a_0):
+    (x^n, ..., x^0)
+    '''
+    
+    n = len(parameter)
+    return arr([x**i * np.ones(np.shape(x)) for i in range(n - 1, -1, -1)])
+
+
+
+
+def exp_ableitung(x, A0, lamb):
+    '''
+    Ableitungen der Exponentiellen Funktion nach (A, λ):
+    (e^(λx), A x e^(λx))
+    '''
+    
+    e_funktion = np.exp(lamb * x)
+    return arr([e_funktion, A0 * x * e_funktion])
+
+
+
+
+def gauss_ableitung(x, A0, mu, sigma):
+    '''
+    Ableitungen der Gaußschen Glockenfunktion nach (A, μ, σ):
+    (f / A,  f (x - μ) / σ^2,  f ((x - μ)^2 / σ^3 - 1 / σ))
+    '''
+    
+    normiert = gauss(x, 1, mu, sigma)   # f / A, auch für A = 0 definiert
+    f        = A0 * normiert
+    return arr([normiert, f * (x - mu) / sigma**2, f * ((x - mu)**2 / sigma**3 - 1 / sigma)])
+
+
+
+
+ABLEITUNGEN = {konst: konst_ableitung, prop: prop_ableitung, lin: lin_ableitung, quad: quad_ableitung,
+               poly: poly_ableitung, exp: exp_ableitung, gauss: gauss_ableitung}
@@ -0,0 +1,467 @@
+# Docstring des pipeline-Moduls
+'''
+Dieses Modul wertet viele gleichartige Messungen (CSV-, .npy- oder .npz-Dateien) nach einer festen Vorschrift
+auf einmal aus, parallel auf mehreren Prozessen. Jede Datei durchläuft dieselben Stufen:
+
+    laden  ->  fehler  ->  fit  ->  chi2  ->  bericht
+    CSV       Zusatz-      pap.      χ^2-     pap.vergleichstabelle() bzw. pap.resultat_strings()
+              fehler       odr_fit() Test
+
+Jede Datei wird für sich ausgewertet: Schlägt eine fehl, wird das in ihrer Zeile der Zusammenfassung vermerkt
+und die übrigen laufen weiter. Zu jeder Stufe wird die Zeit gemessen.
+
+Von der Kommandozeile:
+    python -m pap auswertung.json messungen/*.csv --prozesse 8 --berichte berichte/ --zusammenfassung ergebnisse.csv
+
+
+
+Spezifikation
+-------------
+Die Auswertung wird in einer JSON-Datei beschrieben (oder als dict übergeben). Alles außer  funktion  und
+parameter0  ist optional, die Standardwerte stehen in  SPEZIFIKATION_STANDARD.
+
+{
+  "titel":            "Federkonstante",
+  "funktion":         "lin",                  Name einer Funktion aus pap.func
+  "funktionstyp":     "x, *p",                wie bei pap.odr_fit()
+  "parameter0":       [1, 0],
+  "parameter_namen":  ["k", "l_0"],
+  "einheit":          "",
+  "spalten":          {"x": 0, "y": 1, "x_fehler": 2, "y_fehler": 3},
+                                              Spaltennummern oder Namen aus der Kopfzeile (auch .npy/.npz,
+                                              siehe pap.spalten_laden()). Ist eine Fehlerspalte null,
+                                              gelten nur die Zusatzfehler.
+  "trennzeichen":     ",",
+  "kopfzeilen":       1,
+  "zusatzfehler":     {"x": 0, "y": 0},       absolute Fehler, quadratisch addiert (pap.summen_fehler())
+  "rel_zusatzfehler": {"x": 0, "y": 0},       relative Fehler, ebenso
+  "theorie":          {"werte": [2.0, 0.1], "fehler": [0, 0]}
+                                              Optional, dann enthält der Bericht eine pap.vergleichstabelle().
+}
+
+
+
+Übersicht der Funktionen
+------------------------
+* pap.pipeline.spezifikation_laden()      Liest und prüft eine Spezifikation
+
+* pap.pipeline.datei_auswerten()          Wertet eine Datei aus, ohne Ausnahmen
+
+* pap.pipeline.pipeline()                 Wertet viele Dateien parallel aus
+
+* pap.pipeline.zusammenfassung_layout()   Eine Zeile pro Datei, zum Export mit pap.exportieren()
+
+* pap.pipeline.stufen_zeiten()            Summe, Mittel und Maximum der Zeiten jeder Stufe
+
+* pap.pipeline.main()                     Kommandozeile,  python -m pap
+'''
+
+
+
+
+
+
+# Alle benötigten Pakete
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from numpy import array as arr
+
+import pap
+
+
+
+
+
+
+# Konstanten
+
+STUFEN = ('laden', 'fehler', 'fit', 'chi2', 'bericht')
+
+SPEZIFIKATION_STANDARD = {'titel': '', 'funktionstyp': 'x, *p', 'parameter_namen': None, 'einheit': '',
+                          'spalten': {'x': 0, 'y': 1, 'x_fehler': 2, 'y_fehler': 3},
+                          'trennzeichen': ',', 'kopfzeilen': 0,
+                          'zusatzfehler': {'x': 0, 'y': 0}, 'rel_zusatzfehler': {'x': 0, 'y': 0},
+                          'theorie': None}
+
+
+
+
+
+
+# Spezifikation
+
+def spezifikation_laden(spezifikation):
+    '''
+    Liest eine Spezifikation (siehe Modul-Docstring) und ergänzt fehlende Einträge mit den Standardwerten.
+
+
+    Argumente
+    ---------
+    spezifikation : str, dict
+        Pfad einer JSON-Datei oder schon ein dict.
+
+
+    Output
+    ------
+    spezifikation : dict
+        Vollständig, mit  parameter_namen  als Liste.
+    '''
+
+
+    if isinstance(spezifikation, str):
+        with open(spezifikation, encoding = 'utf-8') as datei:
+            spezifikation = json.load(datei)
+
+    fehlend = {'funktion', 'parameter0'} - set(spezifikation)
+    if fehlend:
+        raise ValueError(f'In der Spezifikation fehlt {sorted(fehlend)}.')
+    unbekannt = set(spezifikation) - set(SPEZIFIKATION_STANDARD) - {'funktion', 'parameter0'}
+    if unbekannt:
+        raise ValueError(f'Unbekannte Einträge in der Spezifikation: {sorted(unbekannt)}')
+    if not callable(getattr(pap.func, spezifikation['funktion'], None)):
+        raise ValueError(f'funktion = {spezifikation["funktion"]!r} ist keine Funktion aus pap.func.')
+
+    vollständig = {**SPEZIFIKATION_STANDARD, **spezifikation}
+    for eintrag in ['spalten', 'zusatzfehler', 'rel_zusatzfehler']:
+        vollständig[eintrag] = {**SPEZIFIKATION_STANDARD[eintrag], **spezifikation.get(eintrag, {})}
+    if vollständig['parameter_namen'] is None:
+        vollständig['parameter_namen'] = [f'p{i}' for i in range(len(vollständig['parameter0']))]
+    if len(vollständig['parameter_namen']) != len(vollständig['parameter0']):
+        raise ValueError('parameter_namen und parameter0 müssen gleich lang sein.')
+    return vollständig
+
+
+
+
+
+
+# Auswertung einer Datei
+
+def _spalten_lesen(datei, spezifikation):
+    '''
+    Liest die Spalten  x, y, x_fehler, y_fehler  mit pap.spalten_laden() (fehlende Fehlerspalten als 0).
+    Löst einen ValueError aus, falls die Datei keine Messwerte enthält oder eine Spalte nicht endlich ist.
+    '''
+
+    spalten = spezifikation['spalten']
+    namen   = [name for name in ['x', 'y', 'x_fehler', 'y_fehler'] if spalten.get(name) is not None]
+    if not {'x', 'y'} <= set(namen):
+        raise ValueError('In der Spezifikation fehlt die Spalte für x oder y.')
+
+    werte = pap.spalten_laden(datei, [spalten[name] for name in namen], spezifikation['trennzeichen'],
+                              spezifikation['kopfzeilen'])
+    werte = dict(zip(namen, werte))
+    if werte['x'].size == 0:
+        raise ValueError('Die Datei enthält keine Messwerte.')
+    for name, spalte in werte.items():   # Sonst liefert ODR stillschweigend NaN oder die Startwerte.
+        nicht_endlich = ~np.isfinite(spalte)
+        if np.any(nicht_endlich):
+            raise ValueError(f'{name} ist in {np.count_nonzero(nicht_endlich)} Zeilen nicht endlich (NaN oder inf), '
+                             f'zuerst in Zeile {np.argmax(nicht_endlich)} der Messwerte.')
+    return [werte.get(name, np.zeros(werte['x'].shape)) for name in ['x', 'y', 'x_fehler', 'y_fehler']]
+
+
+
+
+def datei_auswerten(datei, spezifikation):
+    '''
+    Wertet eine Datei nach der Spezifikation aus. Löst keine Ausnahmen aus, sondern vermerkt sie im Ergebnis.
+
+
+    Argumente
+    ---------
+    datei : str
+
+    spezifikation : dict
+        Von spezifikation_laden()
+
+
+    Output
+    ------
+    ergebnis : dict
+        'datei'            - str
+        'status'           - 'ok' oder die Fehlermeldung, mit der Stufe, in der sie auftrat. Auch eine Datei
+                             ohne Messwerte, nicht endliche Messwerte bzw. Fehler und nicht endliche
+                             Fit-Parameter sind Fehler.
+        'parameter'        - list (float), bzw. None
+        'parameter_fehler' - list (float), bzw. None
+        'chi_quadrat_reduziert', 'fit_wahrscheinlichkeit' - float (in %), bzw. None
+        'anzahl_messwerte' - int, bzw. None
+        'bericht'          - str, bzw. None
+        'zeiten'           - dict, Sekunden pro Stufe (nur die erreichten Stufen)
+    '''
+
+
+    ergebnis = {'datei': datei, 'status': 'ok', 'parameter': None, 'parameter_fehler': None,
+                'chi_quadrat_reduziert': None, 'fit_wahrscheinlichkeit': None, 'anzahl_messwerte': None,
+                'bericht': None, 'zeiten': {}}
+    stufe = STUFEN[0]
+    start = time.perf_counter()
+
+    def stufe_beenden(nächste_stufe):
+        nonlocal stufe, start
+        jetzt = time.perf_counter()
+        ergebnis['zeiten'][stufe] = jetzt - start
+        stufe, start = nächste_stufe, jetzt
+
+    try:
+        with pap.ausgabe('return'):   # Eingabefehler als Ausnahmen
+            x, y, x_fehler, y_fehler = _spalten_lesen(datei, spezifikation)
+            stufe_beenden('fehler')
+
+            zusatz, rel_zusatz = spezifikation['zusatzfehler'], spezifikation['rel_zusatzfehler']
+            x_fehler = pap.summen_fehler(arr([x_fehler, np.full(len(x), zusatz['x']), rel_zusatz['x'] * x]))
+            y_fehler = pap.summen_fehler(arr([y_fehler, np.full(len(y), zusatz['y']), rel_zusatz['y'] * y]))
+            stufe_beenden('fit')
+
+            funktion = getattr(pap.func, spezifikation['funktion'])
+            parameter, parameter_fehler, chi_liste = pap.odr_fit(
+                funktion, arr([x, y]), arr([x_fehler, y_fehler]), spezifikation['parameter0'],
+                print_resultate = False, output_chi_test = True, funktionstyp = spezifikation['funktionstyp'])
+            if not (np.all(np.isfinite(parameter)) and np.all(np.isfinite(parameter_fehler))):
+                raise ValueError(f'Der Fit ergibt nicht endliche Parameter {parameter.tolist()} '
+                                 f'bzw. Fehler {parameter_fehler.tolist()}.')
+            stufe_beenden('chi2')
+
+            chi_quadrat_reduziert, fit_wahrscheinlichkeit, chi_zeilen = pap._chi_quadrat_zeilen(*chi_liste)
+            stufe_beenden('bericht')
+
+            ergebnis['bericht'] = '\n'.join(_bericht_zeilen(datei, spezifikation, parameter, parameter_fehler)
+                                            + ['\n', *chi_zeilen]) + '\n'
+            stufe_beenden(None)
+    except Exception as fehler:
+        ergebnis['zeiten'][stufe] = time.perf_counter() - start
+        ergebnis['status'] = f'{stufe}: {type(fehler).__name__}: {fehler}'
+        return ergebnis
+
+    ergebnis.update({'parameter': parameter.tolist(), 'parameter_fehler': parameter_fehler.tolist(),
+                     'chi_quadrat_reduziert': chi_quadrat_reduziert, 'fit_wahrscheinlichkeit': fit_wahrscheinlichkeit,
+                     'anzahl_messwerte': len(x)})
+    return ergebnis
+
+
+
+
+def _bericht_zeilen(datei, spezifikation, parameter, parameter_fehler):
+    '''Zeilen der Ergebnisse: Vergleichstabelle mit der Theorie, falls angegeben, sonst die Resultate.'''
+
+    titel   = f'{spezifikation["titel"]}: {datei}'  if spezifikation['titel']  else datei
+    theorie = spezifikation['theorie']
+    if theorie is None:
+        zeilen = pap.resultat_strings(spezifikation['parameter_namen'], arr([parameter, parameter_fehler]).T,
+                                      spezifikation['einheit'])
+        return [titel, '', *zeilen]
+
+    theo_fehler = theorie.get('fehler', np.zeros(len(parameter)))
+    werte = arr([parameter, parameter_fehler, theorie['werte'], theo_fehler], dtype = np.float64)
+    return list(pap.vergleichstabelle_zeilen(werte, titel, spezifikation['einheit'], spezifikation['parameter_namen']))
+
+
+
+
+
+
+# Viele Dateien
+
+def pipeline(dateien, spezifikation, prozesse = None, berichte = None):
+    '''
+    Wertet alle Dateien nach derselben Spezifikation aus, verteilt auf mehrere Prozesse.
+
+
+    Argumente
+    ---------
+    dateien : list (str)
+
+    spezifikation : str, dict
+        Siehe spezifikation_laden().
+
+    prozesse : int, optional
+        Anzahl Prozesse, standardmäßig so viele wie CPU-Kerne. Bei 1 wird alles im aktuellen Prozess gerechnet.
+
+    berichte : str, optional
+        Ordner, in den der Bericht jeder erfolgreichen Datei als  <dateiname>.txt  geschrieben wird. Haben 
+        mehrere Dateien denselben Namen (zB. a/lauf1.csv, b/lauf1.csv und lauf1.npy), bekommen die späteren 
+        eine laufende Nummer:  lauf1_2.txt,  lauf1_3.txt  usw.
+
+
+    Output
+    ------
+    ergebnisse : list (dict)
+        Eines pro Datei in der Reihenfolge von  dateien,  siehe datei_auswerten().
+
+
+    Beispiel
+    --------
+    >>> ergebnisse = pap.pipeline.pipeline(glob.glob('messungen/*.csv'), 'auswertung.json')
+    >>> print(pap.exportieren(pap.pipeline.zusammenfassung_layout(ergebnisse), format = 'markdown'))
+    >>> pap.pipeline.stufen_zeiten(ergebnisse)['fit']
+    '''
+
+
+    spezifikation = spezifikation_laden(spezifikation)
+    prozesse      = prozesse or os.cpu_count() or 1
+
+    if prozesse == 1 or len(dateien) <= 1:
+        ergebnisse = [datei_auswerten(datei, spezifikation) for datei in dateien]
+    else:
+        with ProcessPoolExecutor(max_workers = min(prozesse, len(dateien)), initializer = _prozess_vorbereiten) as pool:
+            aufträge   = [pool.submit(datei_auswerten, datei, spezifikation) for datei in dateien]
+            ergebnisse = [_ergebnis_abholen(auftrag, datei) for auftrag, datei in zip(aufträge, dateien)]
+
+    if berichte is not None:
+        os.makedirs(berichte, exist_ok = True)
+        for ergebnis, name in zip(ergebnisse, _bericht_namen(dateien)):
+            if ergebnis['bericht'] is not None:
+                with open(os.path.join(berichte, name), 'w', encoding = 'utf-8') as datei:
+                    datei.write(ergebnis['bericht'])
+    return ergebnisse
+
+
+
+
+def _bericht_namen(dateien):
+    '''Eindeutige Namen der Berichte in der Reihenfolge von  dateien,  unabhängig davon, welche fehlschlagen.'''
+
+    namen, vergeben = [], set()
+    for datei in dateien:
+        stamm  = os.path.splitext(os.path.basename(datei))[0]
+        name   = stamm + '.txt'
+        nummer = 1
+        while name.lower() in vergeben:   # Auch auf Dateisystemen ohne Groß-/Kleinschreibung eindeutig
+            nummer += 1
+            name    = f'{stamm}_{nummer}.txt'
+        vergeben.add(name.lower())
+        namen.append(name)
+    return namen
+
+
+
+
+def _prozess_vorbereiten():
+    '''Importiert in jedem Prozess vorab, was pap erst beim ersten Gebrauch lädt, damit es nicht in die Zeit der 
+    ersten Datei eingeht.'''
+
+    import scipy.odr, scipy.special   # noqa: F401
+
+
+
+
+def _ergebnis_abholen(auftrag, datei):
+    '''Ergebnis eines Prozesses, auch wenn dieser abgestürzt ist.'''
+
+    try:
+        return auftrag.result()
+    except Exception as fehler:
+        return {'datei': datei, 'status': f'prozess: {type(fehler).__name__}: {fehler}', 'parameter': None,
+                'parameter_fehler': None, 'chi_quadrat_reduziert': None, 'fit_wahrscheinlichkeit': None,
+                'anzahl_messwerte': None, 'bericht': None, 'zeiten': {}}
+
+
+
+
+
+
+# Zusammenfassung
+
+def zusammenfassung_layout(ergebnisse, parameter_namen = None, titel = ''):
+    '''
+    Erstellt das Layout einer Tabelle mit einer Zeile pro Datei (Datei, Status, Parameter mit Fehlern, χ^2_red
+    und Fitwahrscheinlichkeit) zum Export mit pap.exportieren(). Parameter werden wie bei
+    pap.vergleichstabelle() gerundet.
+    '''
+
+
+    ok = arr([ergebnis['parameter'] is not None for ergebnis in ergebnisse], dtype = bool)
+    anzahl_parameter = max([len(ergebnis['parameter']) for ergebnis in ergebnisse if ergebnis['parameter']],
+                           default = 0)
+    if parameter_namen is None:
+        parameter_namen = [f'p{i}' for i in range(anzahl_parameter)]
+
+    def spalte(strings_ok):
+        strings = np.full(len(ergebnisse), '', dtype = object)
+        strings[ok] = strings_ok
+        return strings.astype(str)
+
+    spalten = [('Datei',  arr([ergebnis['datei'] for ergebnis in ergebnisse], dtype = str), None),
+               ('Status', arr([ergebnis['status'] for ergebnis in ergebnisse], dtype = str), None)]
+    if np.any(ok):
+        parameter = arr([ergebnis['parameter'] for ergebnis in ergebnisse if ergebnis['parameter'] is not None])
+        fehler    = arr([ergebnis['parameter_fehler'] for ergebnis in ergebnisse
+                         if ergebnis['parameter'] is not None])
+        for i, name in enumerate(parameter_namen):
+            werte_strings, fehler_strings = pap.formatieren(parameter[:, i], fehler[:, i])
+            spalten.append((name, spalte(werte_strings), spalte(fehler_strings)))
+        spalten.append(('χ^2_red', spalte([f'{ergebnis["chi_quadrat_reduziert"]:.2f}'
+                                           for ergebnis in ergebnisse if ergebnis['parameter'] is not None]), None))
+        spalten.append(('p [%]',   spalte([f'{ergebnis["fit_wahrscheinlichkeit"]:.1f}'
+                                           for ergebnis in ergebnisse if ergebnis['parameter'] is not None]), None))
+
+    return {'titel': titel, 'spalten': spalten, 'textspalten': 2}
+
+
+
+
+def stufen_zeiten(ergebnisse):
+    '''
+    Zeiten der Stufen über alle Dateien.
+
+
+    Output
+    ------
+    zeiten : dict
+        {stufe: {'summe': float, 'mittel': float, 'max': float, 'anzahl': int}}, in Sekunden
+    '''
+
+    zeiten = {}
+    for stufe in STUFEN:
+        stufen_zeiten = [ergebnis['zeiten'][stufe] for ergebnis in ergebnisse if stufe in ergebnis['zeiten']]
+        if stufen_zeiten:
+            zeiten[stufe] = {'summe': sum(stufen_zeiten), 'mittel': sum(stufen_zeiten) / len(stufen_zeiten),
+                             'max': max(stufen_zeiten), 'anzahl': len(stufen_zeiten)}
+    return zeiten
+
+
+
+
+
+
+# Kommandozeile
+
+def main(argumente = None):
+    '''
+    Kommandozeile von  python -m pap:  wertet die Dateien aus, printet die Zusammenfassung als Markdown-Tabelle
+    und die Zeiten der Stufen. Returned den Exit-Code (1, falls eine Datei fehlgeschlagen ist).
+    '''
+
+
+    parser = argparse.ArgumentParser(prog = 'python -m pap', description = 'Wertet viele Messdateien parallel aus.')
+    parser.add_argument('spezifikation', help = 'JSON-Datei mit der Auswertungsvorschrift')
+    parser.add_argument('dateien', nargs = '+', help = 'Messdateien (CSV, .npy, .npz)')
+    parser.add_argument('--prozesse', type = int, help = 'Anzahl Prozesse (Standard: CPU-Kerne)')
+    parser.add_argument('--berichte', help = 'Ordner für die Berichte der einzelnen Dateien')
+    parser.add_argument('--zusammenfassung', help = 'Datei für die Zusammenfassung (.csv, .tex, .md, .html)')
+    argumente = parser.parse_args(argumente)
+
+    start         = time.perf_counter()
+    spezifikation = spezifikation_laden(argumente.spezifikation)
+    ergebnisse    = pipeline(argumente.dateien, spezifikation, argumente.prozesse, argumente.berichte)
+    gesamtzeit    = time.perf_counter() - start
+
+    layout = zusammenfassung_layout(ergebnisse, spezifikation['parameter_namen'], spezifikation['titel'])
+    print(pap.exportieren(layout, format = 'markdown'))
+    if argumente.zusammenfassung:
+        pap.exportieren(layout, argumente.zusammenfassung)
+
+    print(f'\n{"Stufe":<8} {"Summe [s]":>10} {"Mittel [s]":>11} {"Max [s]":>10}')
+    for stufe, zeit in stufen_zeiten(ergebnisse).items():
+        print(f'{stufe:<8} {zeit["summe"]:>10.4f} {zeit["mittel"]:>11.2e} {zeit["max"]:>10.2e}')
+    anzahl_ok = sum(ergebnis['status'] == 'ok' for ergebnis in ergebnisse)
+    print(f'\n{anzahl_ok} von {len(ergebnisse)} Dateien ausgewertet in {gesamtzeit:.2f} s.')
+
+    return 0  if anzahl_ok == len(ergebnisse)  else 1